@@ -46,6 +46,7 @@ Background Characters:
 
 from personaut.individuals.individual import (
     Individual,
+    MemoryChanges,
     create_human,
     create_individual,
     create_nontracked_individual,
@@ -55,6 +56,7 @@ from personaut.individuals.physical import PhysicalFeatures
 
 __all__ = [
     "Individual",
+    "MemoryChanges",
     "PhysicalFeatures",
     "create_human",
     "create_individual",
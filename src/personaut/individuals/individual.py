@@ -44,6 +44,31 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class MemoryChanges:
+    """Memory mutations recorded by an :class:`Individual` since a version.
+
+    Attributes:
+        version: Memory version the changes bring a consumer up to.
+        upserted: Memories added or replaced, in mutation order.
+        removed: IDs of memories removed.
+        resync: True when removals after the requested version were
+            pruned from the log. ``upserted`` then holds every current
+            memory and the consumer should drop anything else it holds.
+
+    Example:
+        >>> changes = individual.memory_changes(since=last_version)
+        >>> for memory in changes.upserted:
+        ...     index.add(memory.id, memory.description)
+        >>> last_version = changes.version
+    """
+
+    version: int
+    upserted: list[Memory] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+    resync: bool = False
+
+
 @dataclass
 class Individual:
     """A simulated individual with personality, emotions, and memories.
@@ -97,7 +122,20 @@ class Individual:
     created_at: datetime = field(default_factory=datetime.now)
     updated_at: datetime = field(default_factory=datetime.now)
 
+    _memory_version: int = field(default=0, init=False, repr=False, compare=False)
+    # memory ID → (version of its last mutation, memory or None if removed),
+    # ordered by version
+    _memory_log: dict[str, tuple[int, Memory | None]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    # Identifies this object's log, so consumers notice a re-created individual
+    _memory_log_id: str = field(default_factory=lambda: uuid.uuid4().hex, init=False, repr=False, compare=False)
+    # Removal entries in the log, and the newest version whose removal was pruned
+    _memory_removals: int = field(default=0, init=False, repr=False, compare=False)
+    _memory_log_floor: int = field(default=0, init=False, repr=False, compare=False)
+
     MAX_NAME_LENGTH: ClassVar[int] = 255
+    MAX_LOGGED_REMOVALS: ClassVar[int] = 1000
 
     def __post_init__(self) -> None:
         """Validate individual constraints after dataclass construction."""
@@ -122,6 +160,9 @@ class Individual:
         if self.age is not None and self.age < MINIMUM_SIMULATION_AGE:
             raise AgeRestrictionError(self.age, name=self.name)
 
+        for memory in self.memories:
+            self._record_memory_change(memory.id, memory)
+
     # -- Emotional State Methods --
 
     def get_emotional_state(self) -> EmotionalState:
@@ -231,9 +272,11 @@ class Individual:
         for i, existing in enumerate(self.memories):
             if existing.id == memory.id:
                 self.memories[i] = memory
+                self._record_memory_change(memory.id, memory)
                 self._update_timestamp()
                 return
         self.memories.append(memory)
+        self._record_memory_change(memory.id, memory)
         self._update_timestamp()
 
     def remove_memory(self, memory_id: str) -> bool:
@@ -248,10 +291,23 @@ class Individual:
         for i, mem in enumerate(self.memories):
             if mem.id == memory_id:
                 self.memories.pop(i)
+                self._record_memory_change(memory_id, None)
                 self._update_timestamp()
                 return True
         return False
 
+    def get_memory(self, memory_id: str) -> Memory | None:
+        """Get a memory by ID.
+
+        Args:
+            memory_id: The ID of the memory.
+
+        Returns:
+            The memory, or None if this individual does not hold it.
+        """
+        entry = self._memory_log.get(memory_id)
+        return entry[1] if entry is not None else None
+
     def get_memories(
         self,
         limit: int | None = None,
@@ -287,6 +343,81 @@ class Individual:
         """Get the number of memories."""
         return len(self.memories)
 
+    @property
+    def memory_version(self) -> int:
+        """Counter bumped by every :meth:`add_memory` and :meth:`remove_memory`."""
+        return self._memory_version
+
+    @property
+    def memory_log_id(self) -> str:
+        """Identifier of this object's change log.
+
+        Versions are only comparable within one log. A consumer that
+        finds a different ID (e.g. after the individual was re-created
+        from storage) must rebuild from :meth:`memory_changes` with
+        ``since=0``.
+        """
+        return self._memory_log_id
+
+    def memory_changes(self, since: int = 0) -> MemoryChanges:
+        """Get the memories added, replaced or removed after a version.
+
+        Indexes built from this individual's memories can call this with
+        the ``version`` of the previous result and apply only what changed,
+        instead of rescanning every memory. Only the latest change to each
+        memory is reported, and the cost is proportional to the number of
+        memories changed. Edits made directly to :attr:`memories` are not
+        tracked.
+
+        Only the latest :attr:`MAX_LOGGED_REMOVALS` or so removals are
+        kept. A caller whose version predates the pruned ones gets every
+        current memory with ``resync`` set.
+
+        Args:
+            since: Version the caller has already applied (0 for everything).
+
+        Returns:
+            The changes, with the version they bring the caller up to.
+        """
+        if since < self._memory_log_floor:
+            current = [memory for _, memory in self._memory_log.values() if memory is not None]
+            return MemoryChanges(version=self._memory_version, upserted=current, resync=True)
+
+        changes = MemoryChanges(version=self._memory_version)
+        for memory_id, (version, memory) in reversed(self._memory_log.items()):
+            if version <= since:
+                break
+            if memory is None:
+                changes.removed.append(memory_id)
+            else:
+                changes.upserted.append(memory)
+        changes.upserted.reverse()
+        changes.removed.reverse()
+        return changes
+
+    def _record_memory_change(self, memory_id: str, memory: Memory | None) -> None:
+        """Log a memory mutation under the next memory version."""
+        self._memory_version += 1
+        previous = self._memory_log.pop(memory_id, None)
+        if previous is not None and previous[1] is None:
+            self._memory_removals -= 1
+        self._memory_log[memory_id] = (self._memory_version, memory)
+        if memory is None:
+            self._memory_removals += 1
+            if self._memory_removals > self.MAX_LOGGED_REMOVALS:
+                self._prune_memory_removals()
+
+    def _prune_memory_removals(self) -> None:
+        """Drop the oldest half of the logged removals, raising the resync floor."""
+        keep = self.MAX_LOGGED_REMOVALS // 2
+        for memory_id, (version, memory) in list(self._memory_log.items()):
+            if self._memory_removals <= keep:
+                break
+            if memory is None:
+                del self._memory_log[memory_id]
+                self._memory_removals -= 1
+                self._memory_log_floor = version
+
     # -- Mask Methods --
 
     def add_mask(self, mask: Mask) -> None:
@@ -772,6 +903,7 @@ def create_nontracked_individual(
 
 __all__ = [
     "Individual",
+    "MemoryChanges",
     "create_human",
     "create_individual",
     "create_nontracked_individual",
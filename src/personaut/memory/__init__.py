@@ -38,7 +38,14 @@ Classes:
     PrivateMemory: Trust-gated memory with access control.
     VectorStore: Protocol for vector storage implementations.
     InMemoryVectorStore: Simple in-memory vector store.
+    MatrixVectorStore: NumPy matrix-backed in-memory vector store.
+    IVFVectorStore: Approximate (inverted-file) in-memory vector store.
+    MemmapVectorStore: Memory-mapped snapshot store with an in-RAM delta.
     SQLiteVectorStore: Persistent SQLite-based vector store.
+    MemoryHit: Lightweight search result with lazy memory loading.
+    EmbeddingVector: An embedding as a list of floats or a 1D NumPy array.
+    BM25Index: Incremental BM25 keyword index.
+    LexicalSearch: Protocol for stores with keyword search.
 
 Functions:
     create_memory: Factory function for base Memory.
@@ -47,23 +54,45 @@ Functions:
     create_private_memory: Factory for PrivateMemory.
     generate_memory_emotional_state: LLM + trait-modulated emotion inference.
     search_memories: Search memories by text query.
+    search_memories_batch: Search memories for several text queries at once.
+    hybrid_search: Fuse keyword and vector rankings with reciprocal rank fusion.
+    reciprocal_rank_fusion: Fuse several rankings of IDs.
     get_relevant_memories: Get memories relevant to a situation.
+    write_snapshot: Write memories as a memory-mapped snapshot.
 """
 
 from __future__ import annotations
 
-from collections.abc import Callable
-from typing import TYPE_CHECKING
+import inspect
+from collections.abc import Callable, Sequence
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+from numpy.typing import NDArray
 
 from personaut.memory.individual import (
     IndividualMemory,
     create_individual_memory,
     generate_memory_emotional_state,
 )
+from personaut.memory.ivf_store import (
+    IVFVectorStore,
+    RecallReport,
+)
+from personaut.memory.lexical import (
+    DEFAULT_RRF_K,
+    BM25Index,
+    LexicalSearch,
+    reciprocal_rank_fusion,
+)
+from personaut.memory.matrix_store import (
+    MatrixVectorStore,
+)
 from personaut.memory.memory import (
     Memory,
     MemoryType,
     create_memory,
+    memory_from_dict,
 )
 from personaut.memory.private import (
     PrivateMemory,
@@ -73,11 +102,18 @@ from personaut.memory.shared import (
     SharedMemory,
     create_shared_memory,
 )
+from personaut.memory.snapshot_store import (
+    MemmapVectorStore,
+    write_snapshot,
+)
 from personaut.memory.sqlite_store import (
+    BulkWriteStats,
     SQLiteVectorStore,
 )
 from personaut.memory.vector_store import (
+    EmbeddingVector,
     InMemoryVectorStore,
+    MemoryHit,
     VectorStore,
 )
 
@@ -86,8 +122,11 @@ if TYPE_CHECKING:
     from personaut.facts.context import SituationalContext
 
 
-# Type alias for embedding functions
-EmbeddingFunc = Callable[[str], list[float]]
+# Type alias for embedding functions (e.g. ``EmbeddingModel.embed`` or ``embed_array``)
+EmbeddingFunc = Callable[[str], EmbeddingVector]
+
+# Type alias for batch embedding functions (e.g. ``EmbeddingModel.embed_batch`` or ``embed_batch_array``)
+BatchEmbeddingFunc = Callable[[list[str]], Sequence[Sequence[float]] | NDArray[np.floating[Any]]]
 
 
 def search_memories(
@@ -101,7 +140,10 @@ def search_memories(
     """Search memories by text query.
 
     This function embeds the query text and searches the store
-    for similar memories, filtering by owner and trust level.
+    for similar memories. Owner and trust filters are applied by the
+    store before it selects the top ``limit``, so up to ``limit``
+    accessible memories are returned. Stores whose ``search`` takes no
+    ``trust_level`` are over-fetched and filtered here instead.
 
     Args:
         store: The vector store to search.
@@ -128,9 +170,132 @@ def search_memories(
     query_embedding = embed_func(query)
 
     # Search the store
-    results = store.search(query_embedding, limit=limit * 2, owner_id=owner_id)
+    return _search_with_trust(store.search, query_embedding, limit, owner_id, trust_level)
+
+
+def search_memories_batch(
+    store: VectorStore,
+    queries: list[str],
+    embed_batch_func: BatchEmbeddingFunc,
+    limit: int = 10,
+    owner_ids: list[str | None] | None = None,
+    trust_level: float = 1.0,
+) -> list[list[tuple[Memory, float]]]:
+    """Search memories for several text queries at once.
+
+    All queries are embedded with a single ``embed_batch_func`` call and
+    scored together with the store's ``search_batch``.
+
+    Args:
+        store: The vector store to search.
+        queries: The text queries to search for.
+        embed_batch_func: Function that converts a list of texts to embeddings.
+        limit: Maximum number of results per query.
+        owner_ids: Optional owner filter per query, aligned with ``queries``.
+        trust_level: Trust level for accessing private memories.
+
+    Returns:
+        One list of (memory, similarity_score) tuples per query.
+
+    Example:
+        >>> per_persona = search_memories_batch(
+        ...     store=my_store,
+        ...     queries=["How was the trip?"] * len(personas),
+        ...     embed_batch_func=my_embedding_model.embed_batch,
+        ...     owner_ids=[p.id for p in personas],
+        ... )
+    """
+    if not queries:
+        return []
+
+    query_embeddings = embed_batch_func(queries)
+    if _accepts_trust_level(store.search_batch):
+        return store.search_batch(query_embeddings, limit=limit, owner_ids=owner_ids, trust_level=trust_level)
+    batches = store.search_batch(query_embeddings, limit=limit * 2, owner_ids=owner_ids)
+    return [_filter_by_trust(results, trust_level, limit) for results in batches]
+
+
+def hybrid_search(
+    store: VectorStore,
+    query: str,
+    embed_func: EmbeddingFunc | None = None,
+    limit: int = 10,
+    owner_id: str | None = None,
+    trust_level: float = 1.0,
+    rrf_k: int = DEFAULT_RRF_K,
+) -> list[tuple[Memory, float]]:
+    """Search memories by fusing keyword and vector rankings.
+
+    The store's BM25 keyword ranking (if it implements ``search_text``)
+    and its embedding ranking are combined with reciprocal rank fusion.
+    Without ``embed_func`` only the keyword ranking is used, so memories
+    stay searchable when no embedding model is installed.
+
+    Args:
+        store: The vector store to search.
+        query: The text query to search for.
+        embed_func: Optional function that converts text to embedding.
+        limit: Maximum number of results.
+        owner_id: Optional filter by owner ID.
+        trust_level: Trust level for accessing private memories.
+        rrf_k: Rank offset for reciprocal rank fusion.
+
+    Returns:
+        List of (memory, fused_score) tuples, best first.
+
+    Example:
+        >>> results = hybrid_search(
+        ...     store=my_store,
+        ...     query="coffee with Mike",
+        ...     embed_func=my_embedding_model.embed,
+        ...     owner_id="sarah_123",
+        ... )
+    """
+    # Each retriever contributes a deeper candidate list than the fused result
+    rankings: list[list[tuple[Memory, float]]] = []
+    if isinstance(store, LexicalSearch):
+        rankings.append(_search_with_trust(store.search_text, query, limit * 2, owner_id, trust_level))
+    if embed_func is not None:
+        rankings.append(_search_with_trust(store.search, embed_func(query), limit * 2, owner_id, trust_level))
+
+    memories = {memory.id: memory for ranking in rankings for memory, _ in ranking}
+    fused = reciprocal_rank_fusion([[memory.id for memory, _ in ranking] for ranking in rankings], k=rrf_k)
+
+    return [(memories[memory_id], score) for memory_id, score in fused[:limit]]
+
+
+def _accepts_trust_level(search: Callable[..., Any]) -> bool:
+    """Whether a store's search method takes the ``trust_level`` keyword.
 
-    # Filter by trust level for private memories
+    Stores written before trust filtering moved into the stores do not,
+    and are filtered by :func:`_filter_by_trust` after the search.
+    """
+    try:
+        parameters = inspect.signature(search).parameters.values()
+    except (TypeError, ValueError):
+        return False
+    return any(p.name == "trust_level" or p.kind is inspect.Parameter.VAR_KEYWORD for p in parameters)
+
+
+def _search_with_trust(
+    search: Callable[..., list[tuple[Memory, float]]],
+    query: Any,
+    limit: int,
+    owner_id: str | None,
+    trust_level: float,
+) -> list[tuple[Memory, float]]:
+    """Run a store search, filtering by trust afterwards if the store cannot."""
+    if _accepts_trust_level(search):
+        return search(query, limit=limit, owner_id=owner_id, trust_level=trust_level)
+    return _filter_by_trust(search(query, limit=limit * 2, owner_id=owner_id), trust_level, limit)
+
+
+def _filter_by_trust(
+    results: list[tuple[Memory, float]],
+    trust_level: float,
+    limit: int,
+) -> list[tuple[Memory, float]]:
+    """Drop private memories the trust level cannot access, keeping ``limit`` results."""
     filtered_results: list[tuple[Memory, float]] = []
     for memory, score in results:
         if isinstance(memory, PrivateMemory) and not memory.can_access(trust_level):
@@ -288,6 +453,7 @@ __all__ = [
     "PrivateMemory",
     # Factory functions
     "create_memory",
+    "memory_from_dict",
     "create_individual_memory",
     "create_shared_memory",
     "create_private_memory",
@@ -296,12 +462,27 @@ __all__ = [
     # Vector stores
     "VectorStore",
     "InMemoryVectorStore",
+    "MatrixVectorStore",
+    "IVFVectorStore",
+    "RecallReport",
+    "MemmapVectorStore",
+    "write_snapshot",
     "SQLiteVectorStore",
+    "BulkWriteStats",
+    "MemoryHit",
+    # Keyword search
+    "BM25Index",
+    "LexicalSearch",
+    "reciprocal_rank_fusion",
     # Search functions
     "search_memories",
+    "search_memories_batch",
+    "hybrid_search",
     "get_relevant_memories",
     "extract_and_search",
     "filter_accessible_memories",
     # Types
     "EmbeddingFunc",
+    "BatchEmbeddingFunc",
+    "EmbeddingVector",
 ]
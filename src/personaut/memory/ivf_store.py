@@ -0,0 +1,530 @@
+"""Approximate nearest-neighbour vector store for Personaut PDK.
+
+This module provides an inverted-file (IVF) index built on NumPy only.
+Embeddings are clustered with spherical k-means, and each query only
+scores the memories in the ``n_probe`` clusters whose centroids are
+closest to it. Search cost then grows with the size of a few clusters
+instead of with the whole corpus.
+
+Example:
+    >>> from personaut.memory import IVFVectorStore
+    >>>
+    >>> store = IVFVectorStore(n_probe=8)
+    >>> for memory, embedding in corpus:
+    ...     store.store(memory, embedding)
+    >>> results = store.search(query_embedding, limit=5)
+    >>> print(store.recall_at_k(sample_queries, k=10).recall)
+    >>> store.save("memories.ivf.npz")
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from personaut.memory.matrix_store import (
+    DEFAULT_COMPACT_RATIO,
+    DEFAULT_INITIAL_CAPACITY,
+    MatrixVectorStore,
+    _normalize,
+)
+from personaut.memory.memory import memory_from_dict
+from personaut.memory.vector_store import _batch_owners, _normalize_rows, _required_trust
+
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+    from personaut.memory.memory import Memory
+    from personaut.memory.vector_store import EmbeddingVector
+
+
+# Memories stored before the index trains itself
+DEFAULT_TRAIN_SIZE = 1024
+
+# Clusters scanned per query
+DEFAULT_N_PROBE = 8
+
+# Lloyd iterations per training run
+DEFAULT_KMEANS_ITERATIONS = 10
+
+# Training sample size per centroid
+MAX_TRAINING_POINTS_PER_LIST = 256
+
+# Rows scored per matrix product when assigning rows to clusters
+_ASSIGN_CHUNK = 65536
+
+
+def _nearest_centroids(data: NDArray[np.float32], centroids: NDArray[np.float32]) -> NDArray[np.intp]:
+    """Return the index of the most similar centroid for each row."""
+    labels = np.empty(len(data), dtype=np.intp)
+    for start in range(0, len(data), _ASSIGN_CHUNK):
+        chunk = data[start : start + _ASSIGN_CHUNK]
+        labels[start : start + len(chunk)] = np.argmax(chunk @ centroids.T, axis=1)
+    return labels
+
+
+def _spherical_kmeans(
+    data: NDArray[np.float32],
+    k: int,
+    iterations: int,
+    rng: np.random.Generator,
+) -> NDArray[np.float32]:
+    """Cluster normalized rows into ``k`` unit-length centroids."""
+    centroids = data[rng.choice(len(data), size=k, replace=False)].copy()
+    for _ in range(iterations):
+        labels = _nearest_centroids(data, centroids)
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, labels, data)
+        empty = np.bincount(labels, minlength=k) == 0
+        if empty.any():
+            # Re-seed empty clusters from random rows
+            sums[empty] = data[rng.choice(len(data), size=int(empty.sum()), replace=False)]
+        centroids = _normalize_rows(sums)
+    return np.asarray(centroids, dtype=np.float32)
+
+
+@dataclass
+class RecallReport:
+    """Recall of the approximate search against exact search.
+
+    Attributes:
+        k: Number of neighbours compared per query.
+        queries: Number of queries evaluated.
+        recall: Mean fraction of the exact top-k found by the index.
+        approximate_ms: Mean latency of the approximate search.
+        exact_ms: Mean latency of the exact search.
+    """
+
+    k: int
+    queries: int
+    recall: float
+    approximate_ms: float
+    exact_ms: float
+
+    @property
+    def speedup(self) -> float:
+        """Exact latency divided by approximate latency."""
+        if self.approximate_ms == 0:
+            return 0.0
+        return self.exact_ms / self.approximate_ms
+
+
+class IVFVectorStore(MatrixVectorStore):
+    """Approximate vector store using an inverted-file index.
+
+    Memories are kept in the same normalized matrix as
+    :class:`MatrixVectorStore`. Once ``train_size`` memories have been
+    stored, the index trains spherical k-means centroids and files every
+    row under its nearest centroid. Later inserts are filed incrementally.
+    Until then, and for owners small enough that a full scan is cheaper,
+    searches are exact.
+
+    ``n_probe`` trades recall for latency and can be changed at any time.
+    Call :meth:`train` again after the corpus has grown a lot to
+    rebalance the clusters.
+
+    Attributes:
+        n_lists: Number of clusters, or None for ``sqrt(count)`` at training.
+        n_probe: Number of clusters scanned per query.
+        train_size: Memory count that triggers automatic training.
+        kmeans_iterations: Lloyd iterations per training run.
+        seed: Seed for centroid initialization.
+
+    Example:
+        >>> store = IVFVectorStore(dimensions=384, n_lists=256, n_probe=16)
+        >>> store.store(memory, [0.1, 0.2, ...])
+        >>> results = store.search([0.1, 0.2, ...], limit=5)
+    """
+
+    def __init__(
+        self,
+        dimensions: int | None = None,
+        n_lists: int | None = None,
+        n_probe: int = DEFAULT_N_PROBE,
+        train_size: int = DEFAULT_TRAIN_SIZE,
+        kmeans_iterations: int = DEFAULT_KMEANS_ITERATIONS,
+        seed: int = 0,
+        initial_capacity: int = DEFAULT_INITIAL_CAPACITY,
+        compact_ratio: float = DEFAULT_COMPACT_RATIO,
+    ) -> None:
+        """Initialize the IVF store.
+
+        Args:
+            dimensions: Embedding dimensionality. Inferred from the first
+                stored embedding if None.
+            n_lists: Number of clusters. Defaults to ``sqrt(count)``.
+            n_probe: Number of clusters scanned per query.
+            train_size: Memory count that triggers automatic training.
+            kmeans_iterations: Lloyd iterations per training run.
+            seed: Seed for centroid initialization.
+            initial_capacity: Number of rows to preallocate.
+            compact_ratio: Fraction of dead rows that triggers compaction.
+        """
+        super().__init__(dimensions, initial_capacity, compact_ratio)
+        self.n_lists = n_lists
+        self.n_probe = n_probe
+        self.train_size = train_size
+        self.kmeans_iterations = kmeans_iterations
+        self.seed = seed
+
+        self._centroids: NDArray[np.float32] | None = None
+        self._assignments: NDArray[np.intp] = np.zeros(0, dtype=np.intp)
+        self._owner_codes: NDArray[np.int32] = np.zeros(0, dtype=np.int32)
+        self._codes: dict[str | None, int] = {}
+        self._lists: list[list[int]] = []
+        self._list_arrays: dict[int, NDArray[np.intp]] = {}
+        self._reset_index()
+
+    # ── Protocol methods ────────────────────────────────────────────────
+
+    def store(self, memory: Memory, embedding: EmbeddingVector) -> None:
+        """Store a memory and file it under its nearest cluster."""
+        super().store(memory, embedding)
+        row = self._rows[memory.id]
+        self._owner_codes[row] = self._owner_code(getattr(memory, "owner_id", None))
+
+        if self._centroids is not None:
+            self._file_row(row)
+        elif len(self._memories) >= self.train_size:
+            self.train()
+
+    def search(
+        self,
+        query_embedding: EmbeddingVector,
+        limit: int = 10,
+        owner_id: str | None = None,
+        *,
+        trust_level: float | None = None,
+    ) -> list[tuple[Memory, float]]:
+        """Search the ``n_probe`` nearest clusters for similar memories."""
+        if self._centroids is None or limit <= 0 or not self._memories:
+            return super().search(query_embedding, limit, owner_id, trust_level=trust_level)
+
+        query = np.asarray(query_embedding, dtype=np.float32)
+        if query.shape != (self.dimensions,):
+            return []
+        query = _normalize(query)
+
+        if owner_id is not None:
+            owned = len(self._owner_rows.get(owner_id, ())) + len(self._owner_rows.get(None, ()))
+            if owned <= self._expected_candidates():
+                return super().search(query_embedding, limit, owner_id, trust_level=trust_level)
+
+        n_probe = max(1, min(self.n_probe, len(self._centroids)))
+        centroid_scores = self._centroids @ query
+        probes = np.argpartition(-centroid_scores, n_probe - 1)[:n_probe]
+        rows = np.concatenate([self._list_array(int(p)) for p in probes])
+        keep = self._alive[rows]
+        if owner_id is not None:
+            codes = self._owner_codes[rows]
+            keep &= (codes == self._codes.get(owner_id, -1)) | (codes == self._codes[None])
+        if trust_level is not None:
+            keep &= self._trust[rows] <= trust_level
+        rows = rows[keep]
+        if len(rows) == 0:
+            return []
+
+        scores = self._matrix[rows] @ query
+        k = min(limit, len(rows))
+        top = np.argpartition(-scores, k - 1)[:k] if k < len(rows) else np.arange(len(rows))
+        top = top[np.argsort(-scores[top], kind="stable")]
+
+        results: list[tuple[Memory, float]] = []
+        for idx in top:
+            memory_id = self._row_ids[int(rows[idx])]
+            if memory_id is not None:
+                results.append((self._memories[memory_id], float(scores[idx])))
+        return results
+
+    def search_batch(
+        self,
+        query_embeddings: Sequence[Sequence[float]] | NDArray[np.floating[Any]],
+        limit: int = 10,
+        owner_ids: Sequence[str | None] | None = None,
+        *,
+        trust_level: float | None = None,
+    ) -> list[list[tuple[Memory, float]]]:
+        """Search several queries, probing each query's nearest clusters.
+
+        Untrained stores score the whole batch with one matrix-matrix product.
+        """
+        if self._centroids is None:
+            return super().search_batch(query_embeddings, limit, owner_ids, trust_level=trust_level)
+        owners = _batch_owners(owner_ids, len(query_embeddings))
+        return [
+            self.search(query, limit, owner_id, trust_level=trust_level)
+            for query, owner_id in zip(query_embeddings, owners)
+        ]
+
+    def update_embedding(self, memory_id: str, embedding: EmbeddingVector) -> bool:
+        """Update a memory's embedding and move it to its new cluster."""
+        if not super().update_embedding(memory_id, embedding):
+            return False
+        if self._centroids is not None:
+            self._file_row(self._rows[memory_id])
+        return True
+
+    # ── Index management ────────────────────────────────────────────────
+
+    @property
+    def is_trained(self) -> bool:
+        """Whether the index has centroids and searches approximately."""
+        return self._centroids is not None
+
+    def train(self, n_lists: int | None = None) -> None:
+        """Cluster the stored embeddings and rebuild the inverted lists.
+
+        Args:
+            n_lists: Number of clusters. Defaults to the store's
+                ``n_lists``, or ``sqrt(count)`` when that is None.
+        """
+        live = np.flatnonzero(self._alive[: self._size])
+        if len(live) == 0:
+            return
+
+        k = n_lists or self.n_lists or round(math.sqrt(len(live)))
+        k = max(1, min(k, len(live)))
+        data = self._matrix[live]
+
+        rng = np.random.default_rng(self.seed)
+        sample = data
+        if len(data) > k * MAX_TRAINING_POINTS_PER_LIST:
+            sample = data[rng.choice(len(data), size=k * MAX_TRAINING_POINTS_PER_LIST, replace=False)]
+
+        self._centroids = _spherical_kmeans(sample, k, self.kmeans_iterations, rng)
+        self._assignments[live] = _nearest_centroids(data, self._centroids)
+        self._rebuild_lists()
+
+    def recall_at_k(
+        self,
+        queries: Sequence[Sequence[float]] | NDArray[np.float32],
+        k: int = 10,
+        owner_id: str | None = None,
+    ) -> RecallReport:
+        """Measure recall and latency of :meth:`search` against an exact scan.
+
+        Args:
+            queries: Query embeddings to evaluate.
+            k: Number of neighbours to compare per query.
+            owner_id: Optional owner filter applied to both searches.
+
+        Returns:
+            A RecallReport averaged over the queries.
+        """
+        recalls: list[float] = []
+        approximate_seconds = 0.0
+        exact_seconds = 0.0
+
+        for query in queries:
+            start = time.perf_counter()
+            approximate = self.search(query, limit=k, owner_id=owner_id)
+            approximate_seconds += time.perf_counter() - start
+
+            start = time.perf_counter()
+            exact = MatrixVectorStore.search(self, query, limit=k, owner_id=owner_id)
+            exact_seconds += time.perf_counter() - start
+
+            if exact:
+                found = {memory.id for memory, _ in approximate}
+                recalls.append(sum(memory.id in found for memory, _ in exact) / len(exact))
+
+        n = len(queries)
+        return RecallReport(
+            k=k,
+            queries=n,
+            recall=float(np.mean(recalls)) if recalls else 1.0,
+            approximate_ms=1000 * approximate_seconds / n if n else 0.0,
+            exact_ms=1000 * exact_seconds / n if n else 0.0,
+        )
+
+    # ── Persistence ─────────────────────────────────────────────────────
+
+    def save(self, path: str | Path) -> None:
+        """Write the memories, embeddings and index to a ``.npz`` file.
+
+        Args:
+            path: Destination file path.
+        """
+        live = np.flatnonzero(self._alive[: self._size])
+        ids = [self._row_ids[int(row)] for row in live]
+        memories = [self._memories[memory_id] for memory_id in ids if memory_id is not None]
+        vectors = np.asarray([m.embedding for m in memories], dtype=np.float32).reshape(
+            len(memories), self.dimensions or 0
+        )
+        records = [json.dumps({k: v for k, v in m.to_dict().items() if k != "embedding"}) for m in memories]
+        config = {
+            "dimensions": self.dimensions,
+            "n_lists": self.n_lists,
+            "n_probe": self.n_probe,
+            "train_size": self.train_size,
+            "kmeans_iterations": self.kmeans_iterations,
+            "seed": self.seed,
+            "compact_ratio": self.compact_ratio,
+        }
+        centroids = self._centroids if self._centroids is not None else np.zeros((0, vectors.shape[1]), np.float32)
+
+        with Path(path).open("wb") as f:
+            np.savez(
+                f,
+                config=np.array(json.dumps(config)),
+                memories=np.array(records, dtype=str),
+                vectors=vectors,
+                assignments=self._assignments[live],
+                centroids=centroids,
+            )
+
+    @classmethod
+    def load(cls, path: str | Path) -> IVFVectorStore:
+        """Open a store written by :meth:`save`.
+
+        Args:
+            path: Path to the saved ``.npz`` file.
+
+        Returns:
+            A store with the saved memories, clusters and settings.
+        """
+        with np.load(Path(path), allow_pickle=False) as data:
+            config = json.loads(str(data["config"]))
+            records = [str(record) for record in data["memories"]]
+            vectors = np.asarray(data["vectors"], dtype=np.float32)
+            assignments = np.asarray(data["assignments"], dtype=np.intp)
+            centroids = np.asarray(data["centroids"], dtype=np.float32)
+
+        store = cls(**config)
+        if not records:
+            return store
+
+        store.dimensions = vectors.shape[1]
+        n = len(records)
+        store._matrix = np.zeros((max(store._initial_capacity, n), vectors.shape[1]), dtype=np.float32)
+        store._matrix[:n] = _normalize_rows(vectors)
+        store._alive = np.zeros(len(store._matrix), dtype=bool)
+        store._alive[:n] = True
+        store._trust = np.zeros(len(store._matrix), dtype=np.float64)
+        store._size = n
+        store._row_ids = [None] * len(store._matrix)
+        store._assignments = np.full(len(store._matrix), -1, dtype=np.intp)
+        store._owner_codes = np.zeros(len(store._matrix), dtype=np.int32)
+
+        for row, record in enumerate(records):
+            memory = memory_from_dict(json.loads(record))
+            memory.embedding = vectors[row].tolist()
+            owner_id = getattr(memory, "owner_id", None)
+            store._memories[memory.id] = memory
+            store._rows[memory.id] = row
+            store._row_ids[row] = memory.id
+            store._owner_rows.setdefault(owner_id, set()).add(row)
+            store._trust[row] = _required_trust(memory)
+            store._text_index.add(memory.id, memory.description, owner_id, getattr(memory, "trust_threshold", None))
+            store._owner_codes[row] = store._owner_code(owner_id)
+
+        if len(centroids):
+            store._centroids = centroids
+            store._assignments[:n] = assignments
+            store._rebuild_lists()
+        return store
+
+    # ── MatrixVectorStore hooks ─────────────────────────────────────────
+
+    def clear(self) -> None:
+        """Clear all memories and the trained index."""
+        super().clear()
+        self._reset_index()
+
+    def compact(self) -> None:
+        """Drop tombstoned rows and renumber the inverted lists."""
+        if self._tombstones == 0:
+            return
+
+        live = np.flatnonzero(self._alive[: self._size])
+        assignments = self._assignments[live]
+        owner_codes = self._owner_codes[live]
+        super().compact()
+
+        self._assignments = np.full(len(self._matrix), -1, dtype=np.intp)
+        self._assignments[: len(live)] = assignments
+        self._owner_codes = np.zeros(len(self._matrix), dtype=np.int32)
+        self._owner_codes[: len(live)] = owner_codes
+        if self._centroids is not None:
+            self._rebuild_lists()
+
+    def _append_row(self) -> int:
+        """Reserve a matrix row and grow the per-row index arrays with it."""
+        row = super()._append_row()
+        capacity = len(self._matrix)
+        if len(self._assignments) < capacity:
+            assignments = np.full(capacity, -1, dtype=np.intp)
+            assignments[: len(self._assignments)] = self._assignments
+            owner_codes = np.zeros(capacity, dtype=np.int32)
+            owner_codes[: len(self._owner_codes)] = self._owner_codes
+            self._assignments = assignments
+            self._owner_codes = owner_codes
+        self._assignments[row] = -1
+        return row
+
+    # ── Internals ───────────────────────────────────────────────────────
+
+    def _reset_index(self) -> None:
+        """Drop the centroids, inverted lists and per-row index arrays."""
+        self._centroids = None
+        self._assignments = np.full(len(self._matrix), -1, dtype=np.intp)
+        self._owner_codes = np.zeros(len(self._matrix), dtype=np.int32)
+        self._codes = {None: 0}
+        self._lists = []
+        self._list_arrays = {}
+
+    def _owner_code(self, owner_id: str | None) -> int:
+        """Return the integer code for an owner, assigning one if new."""
+        return self._codes.setdefault(owner_id, len(self._codes))
+
+    def _file_row(self, row: int) -> None:
+        """Move a row into the inverted list of its nearest centroid."""
+        assert self._centroids is not None
+        label = int(np.argmax(self._centroids @ self._matrix[row]))
+        previous = int(self._assignments[row])
+        if previous == label:
+            return
+        if previous >= 0:
+            self._lists[previous].remove(row)
+            self._list_arrays.pop(previous, None)
+        self._lists[label].append(row)
+        self._list_arrays.pop(label, None)
+        self._assignments[row] = label
+
+    def _rebuild_lists(self) -> None:
+        """Regroup live rows into inverted lists from their assignments."""
+        assert self._centroids is not None
+        live = np.flatnonzero(self._alive[: self._size])
+        labels = self._assignments[live]
+        order = np.argsort(labels, kind="stable")
+        rows = live[order]
+        bounds = np.searchsorted(labels[order], np.arange(len(self._centroids) + 1))
+        self._lists = [rows[bounds[i] : bounds[i + 1]].tolist() for i in range(len(self._centroids))]
+        self._list_arrays = {}
+
+    def _list_array(self, list_id: int) -> NDArray[np.intp]:
+        """Return an inverted list as a cached row-index array."""
+        rows = self._list_arrays.get(list_id)
+        if rows is None:
+            rows = np.asarray(self._lists[list_id], dtype=np.intp)
+            self._list_arrays[list_id] = rows
+        return rows
+
+    def _expected_candidates(self) -> float:
+        """Average number of rows a probed search scores."""
+        assert self._centroids is not None
+        return self.n_probe * len(self._memories) / len(self._centroids)
+
+
+__all__ = [
+    "IVFVectorStore",
+    "RecallReport",
+]
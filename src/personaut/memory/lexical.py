@@ -0,0 +1,270 @@
+"""Lexical (keyword) retrieval for Personaut PDK.
+
+This module provides an incremental BM25 inverted index for the
+in-memory vector stores, and reciprocal rank fusion for combining
+keyword and embedding rankings into one hybrid ranking.
+
+Example:
+    >>> from personaut.memory import BM25Index, reciprocal_rank_fusion
+    >>>
+    >>> index = BM25Index()
+    >>> index.add("mem_1", "Had coffee at the cafe", owner_id="sarah_123")
+    >>> index.search("coffee", limit=5)
+    [('mem_1', 0.28...)]
+    >>> reciprocal_rank_fusion([["mem_1", "mem_2"], ["mem_2"]])
+    [('mem_2', 0.0325...), ('mem_1', 0.0163...)]
+"""
+
+from __future__ import annotations
+
+import heapq
+import math
+import re
+from collections import Counter
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Protocol, runtime_checkable
+
+
+if TYPE_CHECKING:
+    from personaut.memory.memory import Memory
+
+
+# BM25 term-frequency saturation
+DEFAULT_K1 = 1.2
+
+# BM25 document-length normalization
+DEFAULT_B = 0.75
+
+# Rank offset used by reciprocal rank fusion
+DEFAULT_RRF_K = 60
+
+# Runs of letters and digits; underscores separate tokens as in unicode61
+_TOKEN_PATTERN = re.compile(r"[^\W_]+")
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into lowercase alphanumeric tokens.
+
+    Matches SQLite's ``unicode61`` FTS5 tokenizer closely enough that the
+    in-memory and SQLite indexes agree on what a term is.
+
+    Example:
+        >>> tokenize("Coffee at Joe's, 9am")
+        ['coffee', 'at', 'joe', 's', '9am']
+    """
+    return _TOKEN_PATTERN.findall(text.lower())
+
+
+@runtime_checkable
+class LexicalSearch(Protocol):
+    """Protocol for stores that can rank memories by keyword relevance.
+
+    Implemented by :class:`InMemoryVectorStore`, :class:`MatrixVectorStore`
+    (BM25) and :class:`SQLiteVectorStore` (FTS5).
+    """
+
+    def search_text(
+        self,
+        query: str,
+        limit: int = 10,
+        owner_id: str | None = None,
+        *,
+        trust_level: float | None = None,
+    ) -> list[tuple[Memory, float]]:
+        """Search memory descriptions by keywords.
+
+        Args:
+            query: Free text; it is tokenized, never parsed as a query language.
+            limit: Maximum number of results to return.
+            owner_id: Optional filter by owner ID.
+            trust_level: Optional trust level; memories requiring more are
+                excluded before ranking.
+
+        Returns:
+            List of (memory, bm25_score) tuples, best first.
+        """
+        ...
+
+
+class BM25Index:
+    """Incremental BM25 inverted index over short documents.
+
+    Only the postings of the query's terms are visited, so a search costs
+    time proportional to the matching documents rather than the corpus.
+    Owner filtering follows the vector stores: documents added without
+    an owner match every owner-filtered query. Documents may carry a
+    trust threshold that trust-filtered searches compare against.
+
+    Attributes:
+        k1: Term-frequency saturation parameter.
+        b: Document-length normalization parameter.
+
+    Example:
+        >>> index = BM25Index()
+        >>> index.add("mem_1", "Walked to the park", owner_id="sarah_123")
+        >>> index.search("park walk", owner_id="sarah_123")
+        [('mem_1', 0.28...)]
+    """
+
+    def __init__(self, k1: float = DEFAULT_K1, b: float = DEFAULT_B) -> None:
+        """Initialize an empty index.
+
+        Args:
+            k1: Term-frequency saturation parameter.
+            b: Document-length normalization parameter.
+        """
+        self.k1 = k1
+        self.b = b
+        self._postings: dict[str, dict[str, int]] = {}
+        self._lengths: dict[str, int] = {}
+        self._terms: dict[str, list[str]] = {}
+        self._owners: dict[str, str | None] = {}
+        self._trust: dict[str, float] = {}
+        self._total_length = 0
+
+    def __len__(self) -> int:
+        """Number of indexed documents."""
+        return len(self._lengths)
+
+    def __contains__(self, doc_id: object) -> bool:
+        """Whether a document ID is indexed."""
+        return doc_id in self._lengths
+
+    def add(
+        self,
+        doc_id: str,
+        text: str,
+        owner_id: str | None = None,
+        trust_threshold: float | None = None,
+    ) -> None:
+        """Index a document, replacing any previous version.
+
+        Args:
+            doc_id: Document (memory) ID.
+            text: Text to index.
+            owner_id: Owner the document belongs to, if any.
+            trust_threshold: Trust level required to see the document, if any.
+        """
+        self.remove(doc_id)
+        terms = Counter(tokenize(text))
+        for term, frequency in terms.items():
+            self._postings.setdefault(term, {})[doc_id] = frequency
+        length = sum(terms.values())
+        self._lengths[doc_id] = length
+        self._terms[doc_id] = list(terms)
+        self._owners[doc_id] = owner_id
+        if trust_threshold is not None:
+            self._trust[doc_id] = trust_threshold
+        self._total_length += length
+
+    def remove(self, doc_id: str) -> bool:
+        """Remove a document from the index.
+
+        Returns:
+            True if the document was indexed.
+        """
+        length = self._lengths.pop(doc_id, None)
+        if length is None:
+            return False
+        del self._owners[doc_id]
+        self._trust.pop(doc_id, None)
+        self._total_length -= length
+        for term in self._terms.pop(doc_id):
+            docs = self._postings[term]
+            del docs[doc_id]
+            if not docs:
+                del self._postings[term]
+        return True
+
+    def clear(self) -> None:
+        """Remove every document."""
+        self._postings.clear()
+        self._lengths.clear()
+        self._terms.clear()
+        self._owners.clear()
+        self._trust.clear()
+        self._total_length = 0
+
+    def search(
+        self,
+        query: str,
+        limit: int = 10,
+        owner_id: str | None = None,
+        trust_level: float | None = None,
+    ) -> list[tuple[str, float]]:
+        """Rank documents by BM25 relevance to a free-text query.
+
+        Args:
+            query: Query text.
+            limit: Maximum number of results.
+            owner_id: Only rank documents owned by this owner (or unowned).
+            trust_level: Skip documents whose trust threshold exceeds it.
+
+        Returns:
+            List of (doc_id, score) tuples, best first. Documents sharing
+            no term with the query are not returned.
+        """
+        if limit <= 0 or not self._lengths:
+            return []
+
+        n_docs = len(self._lengths)
+        average_length = self._total_length / n_docs or 1.0
+        scores: dict[str, float] = {}
+        for term in set(tokenize(query)):
+            docs = self._postings.get(term)
+            if not docs:
+                continue
+            idf = math.log(1.0 + (n_docs - len(docs) + 0.5) / (len(docs) + 0.5))
+            for doc_id, frequency in docs.items():
+                if owner_id is not None and self._owners[doc_id] not in (owner_id, None):
+                    continue
+                if trust_level is not None and self._trust.get(doc_id, trust_level) > trust_level:
+                    continue
+                norm = self.k1 * (1.0 - self.b + self.b * self._lengths[doc_id] / average_length)
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * frequency * (self.k1 + 1.0) / (frequency + norm)
+
+        return heapq.nlargest(limit, scores.items(), key=lambda item: item[1])
+
+
+def reciprocal_rank_fusion(
+    rankings: Sequence[Sequence[str]],
+    k: int = DEFAULT_RRF_K,
+    weights: Sequence[float] | None = None,
+) -> list[tuple[str, float]]:
+    """Fuse several rankings of IDs with reciprocal rank fusion.
+
+    Each ID scores ``weight / (k + rank)`` per ranking it appears in
+    (ranks start at 1). Only ranks are used, so rankings with
+    incomparable scores (BM25, cosine similarity) combine cleanly.
+
+    Args:
+        rankings: ID lists, each ordered best first.
+        k: Rank offset; larger values flatten the head of each ranking.
+        weights: Optional weight per ranking (defaults to 1.0 each).
+
+    Returns:
+        List of (id, fused_score) tuples, best first. Ties keep the
+        order in which IDs were first seen.
+
+    Raises:
+        ValueError: If ``weights`` is not aligned with ``rankings``.
+    """
+    if weights is None:
+        weights = [1.0] * len(rankings)
+    elif len(weights) != len(rankings):
+        msg = f"Got {len(weights)} weights for {len(rankings)} rankings"
+        raise ValueError(msg)
+
+    fused: dict[str, float] = {}
+    for ranking, weight in zip(rankings, weights):
+        for rank, item_id in enumerate(ranking, start=1):
+            fused[item_id] = fused.get(item_id, 0.0) + weight / (k + rank)
+    return sorted(fused.items(), key=lambda item: item[1], reverse=True)
+
+
+__all__ = [
+    "BM25Index",
+    "LexicalSearch",
+    "reciprocal_rank_fusion",
+    "tokenize",
+]
@@ -0,0 +1,366 @@
+"""NumPy matrix-backed vector store for Personaut PDK.
+
+This module provides an in-memory vector store that keeps all
+embeddings in a single contiguous, pre-normalized float32 matrix.
+Queries are answered with one matrix-vector product followed by a
+partial top-k selection, instead of a per-memory Python loop.
+
+Example:
+    >>> from personaut.memory import MatrixVectorStore
+    >>>
+    >>> store = MatrixVectorStore()
+    >>> store.store(memory, embedding)
+    >>> results = store.search(query_embedding, limit=5, owner_id="sarah_123")
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from personaut.memory.lexical import BM25Index
+from personaut.memory.vector_store import (
+    EmbeddingVector,
+    _batch_owners,
+    _embedding_value,
+    _normalize_rows,
+    _required_trust,
+    _top_k,
+)
+
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+    from personaut.memory.memory import Memory
+
+
+# Initial row capacity of the embedding matrix
+DEFAULT_INITIAL_CAPACITY = 64
+
+# Fraction of dead rows that triggers compaction
+DEFAULT_COMPACT_RATIO = 0.25
+
+
+def _normalize(vector: NDArray[np.float32]) -> NDArray[np.float32]:
+    """L2-normalize a vector, leaving zero vectors untouched."""
+    norm = float(np.linalg.norm(vector))
+    if norm == 0.0:
+        return vector
+    return vector / norm
+
+
+class MatrixVectorStore:
+    """In-memory vector store backed by a NumPy embedding matrix.
+
+    Embeddings are L2-normalized on insert and kept as rows of a
+    float32 matrix, so cosine similarity for every stored memory is a
+    single matrix-vector product. An ``owner_id`` index restricts
+    owner-filtered queries to that owner's rows up front.
+
+    The matrix grows by doubling its capacity. Deleted rows are
+    tombstoned and reclaimed by compaction once they exceed
+    ``compact_ratio`` of the used rows. Descriptions are kept in a BM25
+    index for keyword search with :meth:`search_text`. A per-row array of
+    required trust levels lets trust-filtered searches mask private
+    memories before top-k selection.
+
+    Owner filtering follows :class:`InMemoryVectorStore`: memories
+    without an ``owner_id`` attribute (e.g. ``SharedMemory``) are
+    visible to every owner-filtered query.
+
+    Attributes:
+        dimensions: Dimensionality of stored embeddings, fixed by the
+            first stored embedding when not given.
+        compact_ratio: Fraction of tombstoned rows that triggers compaction.
+
+    Example:
+        >>> store = MatrixVectorStore(dimensions=384)
+        >>> store.store(memory, [0.1, 0.2, ...])
+        >>> results = store.search([0.1, 0.2, ...], limit=5)
+    """
+
+    def __init__(
+        self,
+        dimensions: int | None = None,
+        initial_capacity: int = DEFAULT_INITIAL_CAPACITY,
+        compact_ratio: float = DEFAULT_COMPACT_RATIO,
+    ) -> None:
+        """Initialize the matrix store.
+
+        Args:
+            dimensions: Embedding dimensionality. Inferred from the first
+                stored embedding if None.
+            initial_capacity: Number of rows to preallocate.
+            compact_ratio: Fraction of dead rows that triggers compaction.
+        """
+        self.dimensions = dimensions
+        self.compact_ratio = compact_ratio
+        self._initial_capacity = max(1, initial_capacity)
+
+        self._matrix: NDArray[np.float32] = np.zeros((0, dimensions or 0), dtype=np.float32)
+        self._alive: NDArray[np.bool_] = np.zeros(0, dtype=bool)
+        self._trust: NDArray[np.float64] = np.zeros(0, dtype=np.float64)
+        self._size = 0
+        self._tombstones = 0
+
+        self._memories: dict[str, Memory] = {}
+        self._rows: dict[str, int] = {}
+        self._row_ids: list[str | None] = []
+        self._owner_rows: dict[str | None, set[int]] = {}
+        self._text_index = BM25Index()
+
+    # ── Protocol methods ────────────────────────────────────────────────
+
+    def store(self, memory: Memory, embedding: EmbeddingVector) -> None:
+        """Store a memory with its embedding.
+
+        Re-storing an existing memory ID overwrites its row in place.
+
+        Raises:
+            ValueError: If the embedding dimension does not match the store.
+        """
+        vector = self._prepare(embedding)
+        owner_id = getattr(memory, "owner_id", None)
+
+        row = self._rows.get(memory.id)
+        if row is None:
+            row = self._append_row()
+            self._rows[memory.id] = row
+            self._row_ids[row] = memory.id
+        else:
+            self._owner_rows[self._owner_of(memory.id)].discard(row)
+
+        self._matrix[row] = vector
+        self._trust[row] = _required_trust(memory)
+        self._owner_rows.setdefault(owner_id, set()).add(row)
+        self._memories[memory.id] = memory
+        self._text_index.add(memory.id, memory.description, owner_id, getattr(memory, "trust_threshold", None))
+        memory.embedding = _embedding_value(embedding)
+
+    def search(
+        self,
+        query_embedding: EmbeddingVector,
+        limit: int = 10,
+        owner_id: str | None = None,
+        *,
+        trust_level: float | None = None,
+    ) -> list[tuple[Memory, float]]:
+        """Search for similar memories using cosine similarity."""
+        if limit <= 0 or not self._memories:
+            return []
+
+        query = np.asarray(query_embedding, dtype=np.float32)
+        if query.shape != (self.dimensions,):
+            return []
+        query = _normalize(query)
+
+        if owner_id is None:
+            scores = self._matrix[: self._size] @ query
+            scores[~self._alive[: self._size]] = -np.inf
+            if trust_level is not None:
+                scores[self._trust[: self._size] > trust_level] = -np.inf
+            rows = None
+        else:
+            candidate_rows = self._owner_rows.get(owner_id, set()) | self._owner_rows.get(None, set())
+            rows = np.fromiter(candidate_rows, dtype=np.intp, count=len(candidate_rows))
+            if trust_level is not None:
+                rows = rows[self._trust[rows] <= trust_level]
+            if len(rows) == 0:
+                return []
+            scores = self._matrix[rows] @ query
+
+        k = min(limit, len(scores) if rows is not None else len(self._memories))
+        if k < len(scores):
+            top = np.argpartition(-scores, k - 1)[:k]
+        else:
+            top = np.arange(len(scores))
+        top = top[np.argsort(-scores[top], kind="stable")]
+
+        results: list[tuple[Memory, float]] = []
+        for idx in top:
+            score = float(scores[idx])
+            if score == -np.inf:
+                break
+            row = int(idx) if rows is None else int(rows[idx])
+            memory_id = self._row_ids[row]
+            if memory_id is not None:
+                results.append((self._memories[memory_id], score))
+        return results
+
+    def search_batch(
+        self,
+        query_embeddings: Sequence[Sequence[float]] | NDArray[np.floating[Any]],
+        limit: int = 10,
+        owner_ids: Sequence[str | None] | None = None,
+        *,
+        trust_level: float | None = None,
+    ) -> list[list[tuple[Memory, float]]]:
+        """Score several queries against the matrix with one matrix-matrix product."""
+        owners = _batch_owners(owner_ids, len(query_embeddings))
+        if limit <= 0 or not owners or not self._memories:
+            return [[] for _ in owners]
+
+        queries = np.asarray(query_embeddings, dtype=np.float32).reshape(len(owners), -1)
+        if queries.shape[1] != self.dimensions:
+            return [[] for _ in owners]
+        scores = _normalize_rows(queries) @ self._matrix[: self._size].T
+        scores[:, ~self._alive[: self._size]] = -np.inf
+        if trust_level is not None:
+            scores[:, self._trust[: self._size] > trust_level] = -np.inf
+
+        masks: dict[str, NDArray[np.bool_]] = {}
+        results: list[list[tuple[Memory, float]]] = []
+        for row, owner_id in zip(scores, owners):
+            if owner_id is not None:
+                if owner_id not in masks:
+                    mask = np.zeros(self._size, dtype=bool)
+                    mask[list(self._owner_rows.get(owner_id, set()) | self._owner_rows.get(None, set()))] = True
+                    masks[owner_id] = mask
+                row = np.where(masks[owner_id], row, -np.inf)
+            results.append(
+                [
+                    (self._memories[memory_id], float(row[i]))
+                    for i in _top_k(row, limit)
+                    if row[i] != -np.inf and (memory_id := self._row_ids[i]) is not None
+                ]
+            )
+        return results
+
+    def get(self, memory_id: str) -> Memory | None:
+        """Retrieve a memory by ID."""
+        return self._memories.get(memory_id)
+
+    def delete(self, memory_id: str) -> bool:
+        """Delete a memory by ID, tombstoning its row."""
+        row = self._rows.get(memory_id)
+        if row is None:
+            return False
+
+        self._owner_rows[self._owner_of(memory_id)].discard(row)
+        del self._rows[memory_id]
+        del self._memories[memory_id]
+        self._text_index.remove(memory_id)
+        self._row_ids[row] = None
+        self._alive[row] = False
+        self._tombstones += 1
+
+        if self._tombstones > self.compact_ratio * self._size:
+            self.compact()
+        return True
+
+    def update_embedding(self, memory_id: str, embedding: EmbeddingVector) -> bool:
+        """Update a memory's embedding in place."""
+        row = self._rows.get(memory_id)
+        if row is None:
+            return False
+
+        self._matrix[row] = self._prepare(embedding)
+        self._memories[memory_id].embedding = _embedding_value(embedding)
+        return True
+
+    def count(self, owner_id: str | None = None) -> int:
+        """Count memories in the store."""
+        if owner_id is None:
+            return len(self._memories)
+        return len(self._owner_rows.get(owner_id, ()))
+
+    # ── Extras matching InMemoryVectorStore ─────────────────────────────
+
+    def search_text(
+        self,
+        query: str,
+        limit: int = 10,
+        owner_id: str | None = None,
+        *,
+        trust_level: float | None = None,
+    ) -> list[tuple[Memory, float]]:
+        """Search memory descriptions by keywords, ranked by BM25."""
+        ranked = self._text_index.search(query, limit, owner_id, trust_level)
+        return [(self._memories[i], score) for i, score in ranked]
+
+    def clear(self) -> None:
+        """Clear all memories from the store."""
+        self._matrix = np.zeros((0, self.dimensions or 0), dtype=np.float32)
+        self._alive = np.zeros(0, dtype=bool)
+        self._trust = np.zeros(0, dtype=np.float64)
+        self._size = 0
+        self._tombstones = 0
+        self._memories.clear()
+        self._rows.clear()
+        self._row_ids.clear()
+        self._owner_rows.clear()
+        self._text_index.clear()
+
+    def get_all(self) -> list[Memory]:
+        """Get all memories in the store."""
+        return list(self._memories.values())
+
+    def compact(self) -> None:
+        """Drop tombstoned rows and renumber the remaining ones."""
+        if self._tombstones == 0:
+            return
+
+        live = np.flatnonzero(self._alive[: self._size])
+        capacity = max(self._initial_capacity, len(live))
+        matrix = np.zeros((capacity, self._matrix.shape[1]), dtype=np.float32)
+        matrix[: len(live)] = self._matrix[live]
+        trust = np.zeros(capacity, dtype=np.float64)
+        trust[: len(live)] = self._trust[live]
+
+        remap = {int(old): new for new, old in enumerate(live)}
+        self._row_ids = [self._row_ids[int(old)] for old in live]
+        self._row_ids.extend([None] * (capacity - len(live)))
+        self._rows = {memory_id: remap[row] for memory_id, row in self._rows.items()}
+        self._owner_rows = {owner: {remap[row] for row in rows} for owner, rows in self._owner_rows.items() if rows}
+
+        self._matrix = matrix
+        self._trust = trust
+        self._alive = np.zeros(capacity, dtype=bool)
+        self._alive[: len(live)] = True
+        self._size = len(live)
+        self._tombstones = 0
+
+    # ── Internals ───────────────────────────────────────────────────────
+
+    def _prepare(self, embedding: EmbeddingVector) -> NDArray[np.float32]:
+        """Validate an embedding and return it normalized as float32."""
+        vector = np.asarray(embedding, dtype=np.float32).reshape(-1)
+        if self.dimensions is None:
+            self.dimensions = int(vector.shape[0])
+            self._matrix = np.zeros((0, self.dimensions), dtype=np.float32)
+        if vector.shape[0] != self.dimensions:
+            msg = f"Embedding has {vector.shape[0]} dimensions, store expects {self.dimensions}"
+            raise ValueError(msg)
+        return _normalize(vector)
+
+    def _append_row(self) -> int:
+        """Reserve the next matrix row, doubling capacity when full."""
+        if self._size == self._matrix.shape[0]:
+            capacity = max(self._initial_capacity, 2 * self._matrix.shape[0])
+            matrix = np.zeros((capacity, self._matrix.shape[1]), dtype=np.float32)
+            matrix[: self._size] = self._matrix[: self._size]
+            alive = np.zeros(capacity, dtype=bool)
+            alive[: self._size] = self._alive[: self._size]
+            trust = np.zeros(capacity, dtype=np.float64)
+            trust[: self._size] = self._trust[: self._size]
+            self._matrix = matrix
+            self._alive = alive
+            self._trust = trust
+            self._row_ids.extend([None] * (capacity - len(self._row_ids)))
+
+        row = self._size
+        self._alive[row] = True
+        self._size += 1
+        return row
+
+    def _owner_of(self, memory_id: str) -> str | None:
+        """Return the owner key a stored memory is indexed under."""
+        return getattr(self._memories[memory_id], "owner_id", None)
+
+
+__all__ = [
+    "MatrixVectorStore",
+]
@@ -24,8 +24,12 @@ from datetime import datetime
 from enum import Enum
 from typing import TYPE_CHECKING, Any
 
+import numpy as np
+
 
 if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
     from personaut.emotions.state import EmotionalState
     from personaut.facts.context import SituationalContext
 
@@ -92,7 +96,9 @@ class Memory:
         memory_type: The type of memory (individual, shared, private).
         emotional_state: Optional emotional state at time of memory.
         context: Optional situational context with structured facts.
-        embedding: Optional pre-computed embedding vector.
+        embedding: Optional pre-computed embedding vector. Stores given a
+            NumPy array keep it as a float32 array; it is excluded from
+            equality comparisons.
         metadata: Additional metadata storage.
 
     Example:
@@ -110,7 +116,7 @@ class Memory:
     created_at: datetime = field(default_factory=datetime.now)
     emotional_state: EmotionalState | None = None
     context: SituationalContext | None = None
-    embedding: list[float] | None = None
+    embedding: list[float] | NDArray[np.float32] | None = field(default=None, compare=False)
     metadata: dict[str, Any] = field(default_factory=dict)
 
     def to_embedding_text(self) -> str:
@@ -209,7 +215,8 @@ class Memory:
             result["context"] = self.context.to_dict()
 
         if self.embedding is not None:
-            result["embedding"] = self.embedding
+            embedding = self.embedding
+            result["embedding"] = embedding.tolist() if isinstance(embedding, np.ndarray) else embedding
 
         return result
 
@@ -290,8 +297,43 @@ def create_memory(
     )
 
 
+def memory_from_dict(data: dict[str, Any]) -> Memory:
+    """Create the Memory subclass named by a serialized memory's type.
+
+    Inverse of ``to_dict()`` for any memory type, as used by the
+    vector stores that persist memories.
+
+    Args:
+        data: Dictionary from a memory's ``to_dict()``.
+
+    Returns:
+        An IndividualMemory, SharedMemory, PrivateMemory or Memory.
+
+    Example:
+        >>> memory = memory_from_dict(stored.to_dict())
+        >>> type(memory) is type(stored)
+        True
+    """
+    # Imported here since the subclass modules import this one
+    from personaut.memory.individual import IndividualMemory
+    from personaut.memory.private import PrivateMemory
+    from personaut.memory.shared import SharedMemory
+
+    memory_type = data.get("memory_type", "individual")
+
+    if memory_type == "individual":
+        return IndividualMemory.from_dict(data)
+    elif memory_type == "shared":
+        return SharedMemory.from_dict(data)
+    elif memory_type == "private":
+        return PrivateMemory.from_dict(data)
+    else:
+        return Memory.from_dict(data)
+
+
 __all__ = [
     "Memory",
     "MemoryType",
     "create_memory",
+    "memory_from_dict",
 ]
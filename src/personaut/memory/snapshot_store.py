@@ -0,0 +1,550 @@
+"""Memory-mapped embedding snapshots for Personaut PDK.
+
+This module provides a read-mostly vector store whose embeddings live
+in a float32 ``.npy`` file opened with ``np.memmap``. Every process
+that opens the same snapshot (uvicorn workers, simulation processes)
+shares one page-cached copy of the embeddings instead of loading its
+own.
+
+A snapshot is a directory holding:
+
+- ``embeddings-<generation>.npy``: L2-normalized float32 rows.
+- ``memories-<generation>.jsonl``: one serialized memory per row.
+- ``index.json``: the sidecar mapping rows to memory IDs, owners,
+  trust thresholds and byte offsets into the memories file.
+
+The memories file is memory-mapped too, and each record is decoded
+only when a search or lookup returns it.
+
+Memories stored after the snapshot was written go into an in-RAM delta
+segment. :meth:`MemmapVectorStore.merge` folds the delta into the next
+snapshot generation.
+
+Writers take an exclusive lock on ``index.lock`` while they pick the
+next generation and publish it, and every file is written under a
+temporary name and renamed into place, so concurrent or interrupted
+writers never leave a partial generation behind.
+
+Example:
+    >>> from personaut.memory import MemmapVectorStore, write_snapshot
+    >>>
+    >>> write_snapshot("data/snapshot", matrix_store.get_all())
+    >>> store = MemmapVectorStore("data/snapshot")  # in each worker
+    >>> results = store.search(query_embedding, limit=5, owner_id="sarah_123")
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import mmap
+import os
+import re
+import sys
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from personaut.memory.matrix_store import MatrixVectorStore, _normalize
+from personaut.memory.memory import memory_from_dict
+from personaut.memory.vector_store import _batch_owners, _normalize_rows, _top_k
+from personaut.types.exceptions import MemoryError as MemoryStoreError
+
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+    from personaut.memory.memory import Memory
+    from personaut.memory.vector_store import EmbeddingVector
+
+
+# Name of the sidecar file inside a snapshot directory
+INDEX_FILE = "index.json"
+
+# File locked by writers while they pick and publish a generation
+LOCK_FILE = "index.lock"
+
+# Version of the snapshot layout written by this module
+SNAPSHOT_FORMAT = 2
+
+# Times a reader re-reads the sidecar when a generation it read is removed under it
+_OPEN_ATTEMPTS = 3
+
+# Per-generation data files, kept for the current and previous generation
+_GENERATION_FILE = re.compile(r"^(?:embeddings|memories)-(\d+)\.(?:npy|jsonl)$")
+
+
+def write_snapshot(
+    path: str | Path,
+    memories: Iterable[Memory],
+    embeddings: Sequence[EmbeddingVector] | NDArray[np.floating[Any]] | None = None,
+    *,
+    expected_generation: int | None = None,
+) -> Path:
+    """Write memories and their embeddings as a snapshot directory.
+
+    The embeddings and memories files are written under a new
+    generation number, each renamed into place once complete, and the
+    sidecar is swapped in last. Writers hold the directory's lock file
+    from choosing the generation until the sidecar is swapped. The
+    previous generation's files stay on disk, so processes that just
+    read the old sidecar can still open it; older generations are
+    removed.
+
+    Args:
+        path: Snapshot directory, created if missing.
+        memories: Memories to include.
+        embeddings: One embedding per memory. Defaults to each memory's
+            ``embedding`` attribute.
+        expected_generation: Generation the caller built the snapshot
+            from (0 for none). If another writer has published a
+            different one since, nothing is written.
+
+    Returns:
+        Path to the written embeddings file.
+
+    Raises:
+        ValueError: If a memory has no embedding, or the embeddings do
+            not all have the same dimension.
+        MemoryStoreError: If the directory is not at ``expected_generation``.
+    """
+    directory = Path(path)
+    directory.mkdir(parents=True, exist_ok=True)
+    memories = list(memories)
+
+    if embeddings is None:
+        missing = [memory.id for memory in memories if memory.embedding is None]
+        if missing:
+            msg = f"Memories without embeddings cannot be snapshotted: {missing[:5]}"
+            raise ValueError(msg)
+        embeddings = [memory.embedding for memory in memories if memory.embedding is not None]
+
+    try:
+        matrix = np.asarray(embeddings, dtype=np.float32)
+    except ValueError as e:
+        msg = "Snapshot embeddings must all have the same dimension"
+        raise ValueError(msg) from e
+    if len(memories) == 0:
+        matrix = matrix.reshape(0, 0)
+    if matrix.ndim != 2 or len(matrix) != len(memories):
+        msg = f"Expected {len(memories)} embeddings, got array of shape {matrix.shape}"
+        raise ValueError(msg)
+
+    lines = [
+        json.dumps({k: v for k, v in memory.to_dict().items() if k != "embedding"}).encode("utf-8") + b"\n"
+        for memory in memories
+    ]
+    offsets = [0]
+    for line in lines:
+        offsets.append(offsets[-1] + len(line))
+
+    with _writer_lock(directory):
+        previous = _read_index(directory)
+        current = previous["generation"] if previous else 0
+        if expected_generation is not None and current != expected_generation:
+            msg = (
+                f"Snapshot {directory} is at generation {current}, expected {expected_generation}: "
+                "another writer published first; refresh and merge again"
+            )
+            raise MemoryStoreError(msg, operation="write_snapshot")
+        generation = current + 1
+        embeddings_name = f"embeddings-{generation}.npy"
+        records_name = f"memories-{generation}.jsonl"
+        index = {
+            "format": SNAPSHOT_FORMAT,
+            "generation": generation,
+            "embeddings": embeddings_name,
+            "memories": records_name,
+            "dimensions": int(matrix.shape[1]),
+            "ids": [memory.id for memory in memories],
+            "owners": [getattr(memory, "owner_id", None) for memory in memories],
+            "trust": [getattr(memory, "trust_threshold", None) for memory in memories],
+            "offsets": offsets,
+        }
+        try:
+            _write_atomic(directory / embeddings_name, lambda f: np.save(f, _normalize_rows(matrix)))
+            _write_atomic(directory / records_name, lambda f: f.writelines(lines))
+            _write_atomic(directory / INDEX_FILE, lambda f: f.write(json.dumps(index).encode("utf-8")))
+        except BaseException:
+            # The generation was never published, so nothing can have mapped its files
+            for name in (embeddings_name, records_name):
+                with contextlib.suppress(OSError):
+                    (directory / name).unlink(missing_ok=True)
+            raise
+
+        # Readers that already mapped an old file keep it alive until they close it.
+        # Platforms that refuse to unlink mapped files leave it for the next write.
+        for stale in directory.iterdir():
+            match = _GENERATION_FILE.match(stale.name)
+            if match and int(match.group(1)) < generation - 1:
+                with contextlib.suppress(OSError):
+                    stale.unlink(missing_ok=True)
+    return directory / embeddings_name
+
+
+@contextlib.contextmanager
+def _writer_lock(directory: Path) -> Iterator[None]:
+    """Hold the snapshot directory's exclusive writer lock, waiting for other writers."""
+    with open(directory / LOCK_FILE, "a+b") as f:
+        if sys.platform == "win32":
+            import msvcrt
+
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+def _write_atomic(path: Path, write: Callable[[Any], object]) -> None:
+    """Write a file under a temporary name and rename it into place once flushed to disk."""
+    tmp = path.with_name(f".{path.name}.tmp")
+    try:
+        with open(tmp, "wb") as f:
+            write(f)
+            f.flush()
+            os.fsync(f.fileno())
+        tmp.replace(path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            tmp.unlink(missing_ok=True)
+        raise
+
+
+def _read_index(directory: Path) -> dict[str, Any] | None:
+    """Read a snapshot sidecar, or None if the directory has no snapshot."""
+    try:
+        index: dict[str, Any] = json.loads((directory / INDEX_FILE).read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return None
+    if index.get("format") != SNAPSHOT_FORMAT:
+        msg = f"Unsupported snapshot format {index.get('format')!r} in {directory}"
+        raise ValueError(msg)
+    return index
+
+
+def _map_file(path: Path) -> mmap.mmap | bytes:
+    """Memory-map a file read-only (empty files cannot be mapped)."""
+    with open(path, "rb") as f:
+        if f.seek(0, 2) == 0:
+            return b""
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+class MemmapVectorStore:
+    """Vector store over a memory-mapped snapshot plus an in-RAM delta.
+
+    Snapshot rows are scored straight from the memory map and are never
+    modified. Writes go to a :class:`MatrixVectorStore` delta segment;
+    deleting or re-storing a snapshot memory tombstones its row. Search
+    results from both segments are merged by score.
+
+    Memories are decoded from the mapped memories file the first time a
+    search or :meth:`get` returns them. Their ``embedding`` is the normalized
+    snapshot row.
+
+    Attributes:
+        path: Snapshot directory.
+        generation: Generation of the snapshot currently mapped, or 0.
+
+    Example:
+        >>> store = MemmapVectorStore("data/snapshot")
+        >>> store.store(new_memory, embedding)  # goes to the delta
+        >>> store.merge()  # writes the next snapshot generation
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """Open a snapshot directory.
+
+        Args:
+            path: Snapshot directory. A missing snapshot opens as empty.
+        """
+        self.path = Path(path)
+        self.generation = 0
+        self._delta = MatrixVectorStore()
+        self._deleted: set[str] = set()
+        self._open()
+
+    # ── Protocol methods ────────────────────────────────────────────────
+
+    def store(self, memory: Memory, embedding: EmbeddingVector) -> None:
+        """Store a memory in the delta segment, shadowing any snapshot copy."""
+        self._tombstone(memory.id)
+        self._delta.store(memory, embedding)
+
+    def search(
+        self,
+        query_embedding: EmbeddingVector,
+        limit: int = 10,
+        owner_id: str | None = None,
+        *,
+        trust_level: float | None = None,
+    ) -> list[tuple[Memory, float]]:
+        """Search the snapshot and the delta, merging results by score."""
+        if limit <= 0:
+            return []
+
+        results = self._delta.search(query_embedding, limit, owner_id, trust_level=trust_level)
+
+        query = np.asarray(query_embedding, dtype=np.float32)
+        if query.shape == (self._dimensions,) and len(self._ids):
+            query = _normalize(query)
+            if owner_id is None:
+                # Score the whole map in place rather than gathering live rows
+                rows = np.arange(len(self._ids))
+                scores = self._embeddings @ query
+                scores[self._hidden(trust_level)] = -np.inf
+            else:
+                rows = np.concatenate([self._owner_rows.get(owner_id, _NO_ROWS), self._owner_rows.get(None, _NO_ROWS)])
+                rows = rows[~self._hidden(trust_level)[rows]]
+                scores = self._embeddings[rows] @ query
+            k = min(limit, len(rows))
+            if k:
+                top = np.argpartition(-scores, k - 1)[:k] if k < len(rows) else np.arange(len(rows))
+                results.extend((self._load(int(rows[i])), float(scores[i])) for i in top if scores[i] != -np.inf)
+
+        results.sort(key=lambda x: x[1], reverse=True)
+        return results[:limit]
+
+    def search_batch(
+        self,
+        query_embeddings: Sequence[Sequence[float]] | NDArray[np.floating[Any]],
+        limit: int = 10,
+        owner_ids: Sequence[str | None] | None = None,
+        *,
+        trust_level: float | None = None,
+    ) -> list[list[tuple[Memory, float]]]:
+        """Search several queries, scoring each owner group with one matrix product."""
+        owners = _batch_owners(owner_ids, len(query_embeddings))
+        if limit <= 0 or not owners:
+            return [[] for _ in owners]
+
+        results = self._delta.search_batch(query_embeddings, limit, owners, trust_level=trust_level)
+        queries = np.asarray(query_embeddings, dtype=np.float32).reshape(len(owners), -1)
+        if queries.shape[1] == self._dimensions and len(self._ids):
+            queries = _normalize_rows(queries)
+            hidden = self._hidden(trust_level)
+            groups: dict[str | None, list[int]] = {}
+            for i, owner_id in enumerate(owners):
+                groups.setdefault(owner_id, []).append(i)
+
+            for owner_id, indexes in groups.items():
+                if owner_id is None:
+                    rows = np.arange(len(self._ids))
+                    scores = queries[indexes] @ self._embeddings.T
+                    scores[:, hidden] = -np.inf
+                else:
+                    rows = np.concatenate(
+                        [self._owner_rows.get(owner_id, _NO_ROWS), self._owner_rows.get(None, _NO_ROWS)]
+                    )
+                    rows = rows[~hidden[rows]]
+                    scores = queries[indexes] @ self._embeddings[rows].T
+                for i, row in zip(indexes, scores):
+                    results[i].extend(
+                        (self._load(int(rows[j])), float(row[j])) for j in _top_k(row, limit) if row[j] != -np.inf
+                    )
+
+        for batch in results:
+            batch.sort(key=lambda x: x[1], reverse=True)
+            del batch[limit:]
+        return results
+
+    def get(self, memory_id: str) -> Memory | None:
+        """Retrieve a memory by ID from the delta or the snapshot."""
+        memory = self._delta.get(memory_id)
+        if memory is not None:
+            return memory
+        row = self._rows.get(memory_id)
+        if row is None or self._dead[row]:
+            return None
+        return self._load(row)
+
+    def delete(self, memory_id: str) -> bool:
+        """Delete a memory from the delta or tombstone its snapshot row."""
+        deleted = self._delta.delete(memory_id)
+        return self._tombstone(memory_id) or deleted
+
+    def update_embedding(self, memory_id: str, embedding: EmbeddingVector) -> bool:
+        """Update an embedding, moving snapshot memories into the delta."""
+        if self._delta.update_embedding(memory_id, embedding):
+            return True
+        memory = self.get(memory_id)
+        if memory is None:
+            return False
+        self.store(memory, embedding)
+        return True
+
+    def count(self, owner_id: str | None = None) -> int:
+        """Count live memories in the snapshot and the delta."""
+        if owner_id is None:
+            snapshot = int((~self._dead).sum())
+        else:
+            snapshot = int((~self._dead[self._owner_rows.get(owner_id, _NO_ROWS)]).sum())
+        return snapshot + self._delta.count(owner_id)
+
+    # ── Snapshot management ─────────────────────────────────────────────
+
+    @property
+    def delta_size(self) -> int:
+        """Number of memories waiting in the delta segment."""
+        return self._delta.count()
+
+    def get_all(self) -> list[Memory]:
+        """Get all live memories, deserializing snapshot rows as needed."""
+        snapshot = [self._load(int(row)) for row in np.flatnonzero(~self._dead)]
+        return snapshot + self._delta.get_all()
+
+    def merge(self, path: str | Path | None = None) -> Path:
+        """Write live snapshot rows and the delta as the next snapshot.
+
+        Args:
+            path: Target directory. Defaults to this store's snapshot,
+                which is then reopened with an empty delta.
+
+        Returns:
+            Path to the written embeddings file.
+
+        Raises:
+            MemoryStoreError: If another writer merged into this store's
+                snapshot after it was mapped; :meth:`refresh` and merge
+                again to fold this delta into the newer generation.
+        """
+        live = np.flatnonzero(~self._dead)
+        delta = self._delta.get_all()
+        memories = [self._load(int(row)) for row in live] + delta
+        embeddings = [self._embeddings[int(row)] for row in live] + [m.embedding for m in delta]
+        in_place = path is None or Path(path) == self.path
+        written = write_snapshot(
+            path or self.path,
+            memories,
+            embeddings,
+            expected_generation=self.generation if in_place else None,
+        )
+
+        if in_place:
+            self._delta.clear()
+            self._deleted.clear()
+            self._open()
+        return written
+
+    def refresh(self) -> bool:
+        """Remap the snapshot if another process wrote a newer generation.
+
+        The delta segment and deletions are kept and applied on top of
+        the new snapshot.
+
+        Returns:
+            True if a newer generation was mapped.
+        """
+        index = _read_index(self.path)
+        if index is None or index["generation"] == self.generation:
+            return False
+        self._open(index)
+        return True
+
+    # ── Internals ───────────────────────────────────────────────────────
+
+    def _open(self, index: dict[str, Any] | None = None) -> None:
+        """Map the snapshot's files and rebuild the row indexes."""
+        index = index or _read_index(self.path)
+        self._loaded: dict[int, Memory] = {}
+        for attempt in range(_OPEN_ATTEMPTS):
+            if index is None:
+                break
+            try:
+                embeddings = np.load(self.path / index["embeddings"], mmap_mode="r")
+                records = _map_file(self.path / index["memories"])
+                break
+            except FileNotFoundError:
+                # A writer removed this generation after we read its sidecar
+                if attempt == _OPEN_ATTEMPTS - 1:
+                    raise
+                index = _read_index(self.path)
+
+        if index is None:
+            self.generation = 0
+            self._dimensions: int | None = None
+            self._embeddings: NDArray[np.float32] = np.zeros((0, 0), dtype=np.float32)
+            self._records: mmap.mmap | bytes = b""
+            self._offsets: list[int] = [0]
+            self._ids: list[str] = []
+            self._rows: dict[str, int] = {}
+            self._owner_rows: dict[str | None, NDArray[np.intp]] = {}
+            self._trust: NDArray[np.float64] = np.zeros(0, dtype=np.float64)
+            self._dead: NDArray[np.bool_] = np.zeros(0, dtype=bool)
+            return
+
+        self.generation = index["generation"]
+        self._dimensions = index["dimensions"]
+        self._embeddings = embeddings
+        self._records = records
+        self._offsets = index["offsets"]
+        self._ids = index["ids"]
+        self._rows = {memory_id: row for row, memory_id in enumerate(self._ids)}
+
+        # Group row offsets by owner with one sort instead of a scan per owner
+        codes: dict[str | None, int] = {}
+        labels = np.fromiter(
+            (codes.setdefault(owner or None, len(codes)) for owner in index["owners"]),
+            dtype=np.intp,
+            count=len(self._ids),
+        )
+        order = np.argsort(labels, kind="stable")
+        bounds = np.searchsorted(labels[order], np.arange(len(codes) + 1))
+        self._owner_rows = {owner: order[bounds[code] : bounds[code + 1]] for owner, code in codes.items()}
+        self._trust = np.array(
+            [-np.inf if trust is None else trust for trust in index["trust"]],
+            dtype=np.float64,
+        ).reshape(-1)
+
+        self._dead = np.zeros(len(self._ids), dtype=bool)
+        for memory_id in self._deleted | {memory.id for memory in self._delta.get_all()}:
+            row = self._rows.get(memory_id)
+            if row is not None:
+                self._dead[row] = True
+
+    def _hidden(self, trust_level: float | None) -> NDArray[np.bool_]:
+        """Mask of snapshot rows that are deleted or need more trust than given."""
+        if trust_level is None:
+            return self._dead
+        return self._dead | (self._trust > trust_level)
+
+    def _tombstone(self, memory_id: str) -> bool:
+        """Hide a snapshot row, returning whether it was live."""
+        row = self._rows.get(memory_id)
+        if row is None or self._dead[row]:
+            return False
+        self._dead[row] = True
+        self._deleted.add(memory_id)
+        return True
+
+    def _load(self, row: int) -> Memory:
+        """Decode a snapshot row's memory, caching the result."""
+        memory = self._loaded.get(row)
+        if memory is None:
+            record = self._records[self._offsets[row] : self._offsets[row + 1]]
+            memory = memory_from_dict(json.loads(record))
+            memory.embedding = self._embeddings[row].tolist()
+            self._loaded[row] = memory
+        return memory
+
+
+_NO_ROWS: NDArray[np.intp] = np.zeros(0, dtype=np.intp)
+
+
+__all__ = [
+    "MemmapVectorStore",
+    "write_snapshot",
+]
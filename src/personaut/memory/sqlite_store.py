@@ -13,15 +13,152 @@ Example:
 
 from __future__ import annotations
 
+import functools
+import hashlib
 import json
+import logging
+import re
 import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import Any, ParamSpec, TypeVar
 
-from personaut.memory.individual import IndividualMemory
-from personaut.memory.memory import Memory
-from personaut.memory.private import PrivateMemory
-from personaut.memory.shared import SharedMemory
+import numpy as np
+
+from personaut.memory.lexical import BM25Index, tokenize
+from personaut.memory.memory import Memory, MemoryType, memory_from_dict
+from personaut.memory.vector_store import (
+    EmbeddingVector,
+    MemoryHit,
+    _batch_owners,
+    _embedding_value,
+    _normalize_rows,
+    _top_k,
+)
+
+
+logger = logging.getLogger(__name__)
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+# sqlite-vec rejects KNN queries with k above this value
+VEC_MAX_K = 4096
+
+# Oldest sqlite-vec with partition keys, metadata columns and distance_metric, used by the index
+MIN_SQLITE_VEC_VERSION = (0, 1, 6)
+
+# Default number of (owner, type, dimension) matrices kept by the brute-force cache
+DEFAULT_MATRIX_CACHE_SIZE = 64
+
+# Supported compact encodings for the vector index and search cache
+QUANTIZATIONS = ("int8", "binary")
+
+# Candidates retrieved from quantized codes per requested result
+DEFAULT_RERANK_FACTOR = 4
+
+# Trust threshold recorded in the vector index for memories that are not trust-gated
+UNGATED_TRUST = -1.0
+
+# Set-bit count of every byte value, for Hamming distances on packed codes
+_POPCOUNT = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+
+def _to_blob(embedding: Sequence[float] | np.ndarray) -> bytes:
+    """Pack an embedding as native float32 bytes.
+
+    The same bytes are stored in ``memories.embedding_blob`` and
+    passed to sqlite-vec, which reads float32 blobs directly.
+    """
+    return np.asarray(embedding, dtype=np.float32).tobytes()
+
+
+def _from_blob(blob: bytes) -> list[float]:
+    """Unpack a float32 blob into a list of floats."""
+    return list(np.frombuffer(blob, dtype=np.float32).tolist())
+
+
+def _text_rowid(memory_id: str) -> int:
+    """Derive a stable FTS5 rowid from a memory ID.
+
+    ``memories`` has no INTEGER PRIMARY KEY, so its implicit rowids may
+    change on VACUUM; hashing the ID keeps the keyword index addressable.
+    """
+    return int.from_bytes(hashlib.blake2b(memory_id.encode(), digest_size=8).digest(), "big") >> 1
+
+
+def _vec_version_supported(version: str) -> bool:
+    """Check a ``vec_version()`` string such as ``"v0.1.6"`` against the minimum."""
+    parts = tuple(int(part) for part in re.findall(r"\d+", version)[:3])
+    return parts >= MIN_SQLITE_VEC_VERSION
+
+
+def _quantize_rows(matrix: np.ndarray, quantization: str | None) -> np.ndarray:
+    """Encode normalized rows as int8 (scaled by 127) or packed sign bits."""
+    if quantization == "int8":
+        return np.round(matrix * 127).astype(np.int8)
+    if quantization == "binary":
+        return np.packbits(matrix > 0, axis=-1)
+    return matrix
+
+
+def _blobs_to_matrix(blobs: Sequence[bytes], dimensions: int) -> np.ndarray:
+    """Decode equal-length float32 blobs into a normalized matrix."""
+    if not blobs:
+        return np.zeros((0, dimensions), dtype=np.float32)
+    matrix = np.frombuffer(b"".join(blobs), dtype=np.float32).reshape(len(blobs), dimensions)
+    return _normalize_rows(matrix)
+
+
+def _serialized_write(method: Callable[P, R]) -> Callable[P, R]:
+    """Run a store method while holding the store's writer lock."""
+
+    @functools.wraps(method)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        store = args[0]
+        assert isinstance(store, SQLiteVectorStore)
+        with store._write_lock:
+            return method(*args, **kwargs)
+
+    return wrapper
+
+
+@dataclass
+class _CachedMatrix:
+    """Decoded embeddings for one (owner, type, dimension) slice."""
+
+    ids: list[str]
+    matrix: np.ndarray
+    rows: dict[str, int] = field(default_factory=dict)
+    trust: np.ndarray = field(default_factory=lambda: np.zeros(0))
+
+
+@dataclass
+class BulkWriteStats:
+    """Throughput report for a bulk write on a vector store.
+
+    Attributes:
+        rows: Number of memories written, updated, or deleted.
+        seconds: Wall-clock time spent in the transaction.
+
+    Example:
+        >>> stats = store.store_many(memories, embeddings)
+        >>> print(f"{stats.rows} rows at {stats.rows_per_second:.0f} rows/s")
+    """
+
+    rows: int
+    seconds: float
+
+    @property
+    def rows_per_second(self) -> float:
+        """Write throughput in rows per second."""
+        if self.seconds <= 0:
+            return float(self.rows)
+        return self.rows / self.seconds
 
 
 class SQLiteVectorStore:
@@ -30,15 +167,41 @@ class SQLiteVectorStore:
     This implementation stores memories in SQLite and uses the
     sqlite-vec extension for efficient vector similarity search.
 
+    With ``quantization="int8"`` or ``"binary"`` the sqlite-vec index and
+    the brute-force cache hold compact codes instead of float32 vectors
+    (4x or 32x smaller). Candidates are retrieved from the codes, using
+    Hamming distance for binary codes, and re-ranked with the full
+    precision ``embedding_blob``.
+
+    Private memories' ``trust_threshold`` is kept in an indexed column
+    (and in the sqlite-vec index), so searches given a ``trust_level``
+    drop inaccessible memories before selecting the top results.
+
+    Descriptions are also indexed in an FTS5 table for BM25 keyword
+    search with :meth:`search_text`. SQLite builds without FTS5 fall back
+    to ranking a scan of the descriptions.
+
+    By default the store uses a single connection owned by the thread
+    that opened it. With ``pooled=True`` the database is switched to WAL
+    journaling and every thread gets its own connection, so searches
+    from many threads run in parallel with each other and with writes.
+    Writes from all threads are serialized by a store-wide lock.
+
     Attributes:
         db_path: Path to the SQLite database file.
         dimensions: Dimensionality of embedding vectors.
+        quantization: Index encoding: None, ``"int8"`` or ``"binary"``.
+        rerank_factor: Quantized candidates re-ranked per result.
+        pooled: Whether each thread uses its own WAL-mode connection.
 
     Example:
         >>> store = SQLiteVectorStore("data/memories.db", dimensions=384)
         >>> store.store(memory, [0.1, 0.2, ...])
         >>> results = store.search([0.1, 0.2, ...], limit=5)
         >>> store.close()
+
+        >>> # Shared by a threadpool of request handlers
+        >>> store = SQLiteVectorStore("data/memories.db", pooled=True)
     """
 
     def __init__(
@@ -46,6 +209,10 @@ class SQLiteVectorStore:
         db_path: str | Path,
         dimensions: int = 384,
         auto_create: bool = True,
+        matrix_cache_size: int = DEFAULT_MATRIX_CACHE_SIZE,
+        pooled: bool = False,
+        quantization: str | None = None,
+        rerank_factor: int = DEFAULT_RERANK_FACTOR,
     ) -> None:
         """Initialize the SQLite vector store.
 
@@ -53,37 +220,106 @@ class SQLiteVectorStore:
             db_path: Path to the SQLite database file.
             dimensions: Dimensionality of embedding vectors.
             auto_create: Whether to create tables automatically.
+            matrix_cache_size: Number of decoded embedding matrices the
+                brute-force search keeps (0 to disable caching).
+            pooled: Give each thread its own connection and enable WAL.
+            quantization: Store compact ``"int8"`` or ``"binary"`` codes
+                in the index and cache, re-ranking with full precision.
+            rerank_factor: Candidates fetched from the codes per result.
+
+        Raises:
+            ValueError: If the quantization is unknown, or binary
+                quantization is used with dimensions not divisible by 8.
         """
+        if quantization is not None and quantization not in QUANTIZATIONS:
+            msg = f"Unknown quantization {quantization!r}, expected one of {QUANTIZATIONS}"
+            raise ValueError(msg)
+        if quantization == "binary" and dimensions % 8:
+            msg = f"Binary quantization needs dimensions divisible by 8, got {dimensions}"
+            raise ValueError(msg)
+
         self.db_path = Path(db_path)
         self.dimensions = dimensions
+        self.matrix_cache_size = matrix_cache_size
+        self.pooled = pooled
+        self.quantization = quantization
+        self.rerank_factor = max(1, rerank_factor)
         self._conn: sqlite3.Connection | None = None
+        self._local = threading.local()
+        self._pool: list[sqlite3.Connection] = []
+        self._pool_lock = threading.Lock()
+        self._write_lock = threading.RLock()
+
+        self._matrix_cache: OrderedDict[tuple[str | None, str | None, int], _CachedMatrix] = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._cache_generation = 0
+        # Last PRAGMA data_version seen per connection (values are only comparable per connection)
+        self._data_versions: dict[sqlite3.Connection, int] = {}
+        self._fts_enabled = False
+        # None until the first connection has checked the sqlite-vec version
+        self._vec_enabled: bool | None = None
 
         if auto_create:
             self._ensure_tables()
 
     def _get_connection(self) -> sqlite3.Connection:
-        """Get or create the database connection."""
-        if self._conn is None:
-            # Ensure parent directory exists
-            self.db_path.parent.mkdir(parents=True, exist_ok=True)
-
-            self._conn = sqlite3.connect(str(self.db_path))
-            self._conn.row_factory = sqlite3.Row
-
-            # Try to load sqlite-vec extension
+        """Get or create the database connection for the calling thread."""
+        if not self.pooled:
+            if self._conn is None:
+                self._conn = self._connect()
+            return self._conn
+
+        conn: sqlite3.Connection | None = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._connect()
+            self._local.conn = conn
+            with self._pool_lock:
+                self._pool.append(conn)
+        return conn
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a new database connection with sqlite-vec loaded."""
+        # Ensure parent directory exists
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Pooled connections may be closed from another thread by close()
+        conn = sqlite3.connect(str(self.db_path), check_same_thread=not self.pooled)
+        conn.row_factory = sqlite3.Row
+
+        if self.pooled:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+
+        # Try to load sqlite-vec extension, unless an earlier connection ruled it out
+        if self._vec_enabled is not False:
             try:
                 import sqlite_vec
 
-                self._conn.enable_load_extension(True)
-                sqlite_vec.load(self._conn)
-                self._conn.enable_load_extension(False)
-                self._vec_enabled = True
+                conn.enable_load_extension(True)
+                sqlite_vec.load(conn)
+                conn.enable_load_extension(False)
             except (ImportError, Exception):
                 # Fall back to non-vector mode
                 self._vec_enabled = False
+            else:
+                if self._vec_enabled is None:
+                    self._vec_enabled = self._check_vec_version(conn)
+
+        return conn
+
+    def _check_vec_version(self, conn: sqlite3.Connection) -> bool:
+        """Check once per store that sqlite-vec supports the index schema."""
+        version = str(conn.execute("SELECT vec_version()").fetchone()[0])
+        if _vec_version_supported(version):
+            return True
+        logger.warning(
+            "sqlite-vec %s is older than %s, using brute-force search",
+            version,
+            ".".join(map(str, MIN_SQLITE_VEC_VERSION)),
+        )
+        return False
 
-        return self._conn
-
+    @_serialized_write
     def _ensure_tables(self) -> None:
         """Create database tables if they don't exist."""
         conn = self._get_connection()
@@ -97,10 +333,20 @@ class SQLiteVectorStore:
                 owner_id TEXT,
                 created_at TEXT NOT NULL,
                 data TEXT NOT NULL,
-                embedding_blob BLOB
+                embedding_blob BLOB,
+                trust_threshold REAL
             )
         """)
 
+        # Databases written by older versions lack the trust column
+        columns = {row["name"] for row in conn.execute("PRAGMA table_info(memories)")}
+        if "trust_threshold" not in columns:
+            conn.execute("ALTER TABLE memories ADD COLUMN trust_threshold REAL")
+            conn.execute(
+                "UPDATE memories SET trust_threshold = json_extract(data, '$.trust_threshold') "
+                "WHERE memory_type = 'private'"
+            )
+
         # Index for owner_id lookups
         conn.execute("""
             CREATE INDEX IF NOT EXISTS idx_memories_owner
@@ -113,23 +359,161 @@ class SQLiteVectorStore:
             ON memories(memory_type)
         """)
 
+        # Index for trust-filtered lookups
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_memories_trust
+            ON memories(trust_threshold)
+        """)
+
         # Virtual table for vector search (if sqlite-vec is available)
-        if getattr(self, "_vec_enabled", False):
+        if self._vec_enabled:
             try:
-                conn.execute(f"""
-                    CREATE VIRTUAL TABLE IF NOT EXISTS memory_embeddings
-                    USING vec0(
-                        memory_id TEXT PRIMARY KEY,
-                        embedding FLOAT[{self.dimensions}]
-                    )
-                """)
-            except sqlite3.OperationalError:
-                # Virtual table may already exist with different dimensions
-                pass
+                self._ensure_vector_table(conn)
+            except sqlite3.OperationalError as e:
+                logger.warning("Could not create vector index, using brute-force search: %s", e)
+                self._vec_enabled = False
+
+        # Keyword index (if this SQLite build has FTS5)
+        try:
+            self._ensure_text_table(conn)
+            self._fts_enabled = True
+        except sqlite3.OperationalError as e:
+            logger.warning("Could not create FTS5 keyword index, using a description scan: %s", e)
 
         conn.commit()
 
-    def store(self, memory: Memory, embedding: list[float]) -> None:
+    def _ensure_text_table(self, conn: sqlite3.Connection) -> None:
+        """Create the FTS5 keyword index, populating it from ``memories``.
+
+        Databases written by older versions have no keyword index; it is
+        built from the existing descriptions the first time they are opened.
+        """
+        if conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'memories_fts'").fetchone() is not None:
+            return
+        conn.execute("CREATE VIRTUAL TABLE memories_fts USING fts5(memory_id UNINDEXED, description)")
+        rows = conn.execute("SELECT id, description FROM memories").fetchall()
+        self._write_text(conn, [(row["id"], row["description"]) for row in rows])
+
+    def _vector_table_sql(self) -> str:
+        """Return the expected definition of the sqlite-vec index.
+
+        ``owner_id`` is a partition key, so owner-filtered KNN queries
+        only scan that owner's vectors. ``memory_type`` and
+        ``trust_threshold`` are metadata columns that can be filtered
+        inside the KNN query. Quantized
+        indexes store int8 or bit vectors; bit vectors use Hamming distance.
+        """
+        if self.quantization == "binary":
+            column = f"BIT[{self.dimensions}]"
+        elif self.quantization == "int8":
+            column = f"INT8[{self.dimensions}] distance_metric=cosine"
+        else:
+            column = f"FLOAT[{self.dimensions}] distance_metric=cosine"
+        return f"""
+            CREATE VIRTUAL TABLE memory_embeddings
+            USING vec0(
+                memory_id TEXT PRIMARY KEY,
+                owner_id TEXT PARTITION KEY,
+                memory_type TEXT,
+                trust_threshold FLOAT,
+                embedding {column}
+            )
+        """
+
+    def _vector_sql(self, value: str) -> str:
+        """Wrap a float32 blob SQL expression in the index's quantizer."""
+        if self.quantization == "binary":
+            return f"vec_quantize_binary({value})"
+        if self.quantization == "int8":
+            return f"vec_quantize_int8(vec_normalize({value}), 'unit')"
+        return value
+
+    def _ensure_vector_table(self, conn: sqlite3.Connection) -> None:
+        """Create the vector index, rebuilding it if its schema is outdated.
+
+        Databases written by older versions declare the index without a
+        cosine metric or owner partitioning (or with other dimensions).
+        Those tables are dropped and repopulated from the ``memories`` table.
+        """
+        row = conn.execute("SELECT sql FROM sqlite_master WHERE name = 'memory_embeddings'").fetchone()
+        if row is not None:
+            if " ".join(row["sql"].split()).lower() == " ".join(self._vector_table_sql().split()).lower():
+                return
+            logger.info("Migrating memory_embeddings vector index in %s", self.db_path)
+
+        self._rebuild_vector_table(conn)
+
+    def _rebuild_vector_table(self, conn: sqlite3.Connection) -> None:
+        """Drop, recreate and repopulate the vector index."""
+        conn.execute("DROP TABLE IF EXISTS memory_embeddings")
+        conn.execute(self._vector_table_sql())
+        conn.execute(
+            f"""
+            INSERT INTO memory_embeddings (memory_id, owner_id, memory_type, trust_threshold, embedding)
+            SELECT id, owner_id, memory_type, COALESCE(trust_threshold, ?), {self._vector_sql("embedding_blob")}
+            FROM memories
+            WHERE length(embedding_blob) = ?
+            """,
+            (UNGATED_TRUST, 4 * self.dimensions),
+        )
+
+    @_serialized_write
+    def rebuild_vector_index(self) -> None:
+        """Rebuild the sqlite-vec index from the ``memories`` table.
+
+        Outdated indexes are migrated automatically when the store opens;
+        call this to force a rebuild, e.g. after restoring a backup of
+        the ``memories`` table alone. Does nothing if sqlite-vec is not
+        available.
+        """
+        conn = self._get_connection()
+        if not self._vec_enabled:
+            return
+        try:
+            self._rebuild_vector_table(conn)
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+
+    def _write_vectors(self, conn: sqlite3.Connection, memory_ids: list[str]) -> None:
+        """Copy the given memories' embeddings into the vector index.
+
+        Must run after the ``memories`` rows are written. vec0 tables do
+        not support ``INSERT OR REPLACE``, so existing rows are deleted first.
+        """
+        if not self._vec_enabled or not memory_ids:
+            return
+        params = [(memory_id,) for memory_id in memory_ids]
+        conn.executemany("DELETE FROM memory_embeddings WHERE memory_id = ?", params)
+        conn.executemany(
+            f"""
+            INSERT INTO memory_embeddings (memory_id, owner_id, memory_type, trust_threshold, embedding)
+            SELECT id, owner_id, memory_type, COALESCE(trust_threshold, {UNGATED_TRUST}),
+                {self._vector_sql("embedding_blob")}
+            FROM memories
+            WHERE id = ? AND length(embedding_blob) = {4 * self.dimensions}
+            """,
+            params,
+        )
+
+    def _write_text(self, conn: sqlite3.Connection, documents: list[tuple[str, str]]) -> None:
+        """Index (memory_id, description) pairs for keyword search, replacing old entries."""
+        if not documents:
+            return
+        conn.executemany("DELETE FROM memories_fts WHERE rowid = ?", [(_text_rowid(i),) for i, _ in documents])
+        conn.executemany(
+            "INSERT INTO memories_fts (rowid, memory_id, description) VALUES (?, ?, ?)",
+            [(_text_rowid(i), i, description) for i, description in documents],
+        )
+
+    def _delete_text(self, conn: sqlite3.Connection, memory_ids: Sequence[str]) -> None:
+        """Remove memories from the keyword index."""
+        if self._fts_enabled:
+            conn.executemany("DELETE FROM memories_fts WHERE rowid = ?", [(_text_rowid(i),) for i in memory_ids])
+
+    @_serialized_write
+    def store(self, memory: Memory, embedding: EmbeddingVector) -> None:
         """Store a memory with its embedding."""
         conn = self._get_connection()
 
@@ -142,17 +526,15 @@ class SQLiteVectorStore:
         data = memory.to_dict()
         data_json = json.dumps(data)
 
-        # Serialize embedding as blob
-        import struct
-
-        embedding_blob = struct.pack(f"{len(embedding)}f", *embedding)
+        # Serialize embedding as float32 blob
+        embedding_blob = _to_blob(embedding)
 
         # Insert or replace memory
         conn.execute(
             """
             INSERT OR REPLACE INTO memories
-            (id, description, memory_type, owner_id, created_at, data, embedding_blob)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
+            (id, description, memory_type, owner_id, created_at, data, embedding_blob, trust_threshold)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
             """,
             (
                 memory.id,
@@ -162,132 +544,522 @@ class SQLiteVectorStore:
                 memory.created_at.isoformat(),
                 data_json,
                 embedding_blob,
+                getattr(memory, "trust_threshold", None),
             ),
         )
 
-        # Store in vector index if available
-        if self._vec_enabled:
-            try:
-                conn.execute(
-                    """
-                    INSERT OR REPLACE INTO memory_embeddings (memory_id, embedding)
-                    VALUES (?, ?)
-                    """,
-                    (memory.id, json.dumps(embedding)),
-                )
-            except sqlite3.OperationalError:
-                pass  # Vector table may not exist
+        # Store in vector and keyword indexes if available
+        self._write_vectors(conn, [memory.id])
+        if self._fts_enabled:
+            self._write_text(conn, [(memory.id, memory.description)])
 
         conn.commit()
+        self._invalidate_cache([memory.id], [owner_id])
 
         # Also store embedding in memory object
-        memory.embedding = embedding
+        memory.embedding = _embedding_value(embedding)
 
     def search(
         self,
-        query_embedding: list[float],
+        query_embedding: EmbeddingVector,
         limit: int = 10,
         owner_id: str | None = None,
+        memory_type: MemoryType | str | None = None,
+        *,
+        trust_level: float | None = None,
     ) -> list[tuple[Memory, float]]:
-        """Search for similar memories."""
+        """Search for similar memories.
+
+        Args:
+            query_embedding: The query embedding vector.
+            limit: Maximum number of results to return.
+            owner_id: Optional filter by owner ID.
+            memory_type: Optional filter by memory type.
+            trust_level: Optional trust level. Private memories requiring
+                more are excluded before the top results are selected.
+
+        Returns:
+            List of (memory, similarity_score) tuples, sorted by
+            similarity in descending order.
+        """
         conn = self._get_connection()
+        return self._load_memories(
+            conn,
+            self._rank(conn, query_embedding, limit, owner_id, memory_type, trust_level),
+        )
 
-        # Try vector search first
-        if self._vec_enabled:
-            try:
-                return self._vector_search(conn, query_embedding, limit, owner_id)
-            except sqlite3.OperationalError:
-                pass
+    def search_batch(
+        self,
+        query_embeddings: Sequence[Sequence[float]] | np.ndarray,
+        limit: int = 10,
+        owner_ids: Sequence[str | None] | None = None,
+        *,
+        trust_level: float | None = None,
+    ) -> list[list[tuple[Memory, float]]]:
+        """Search for several queries at once.
+
+        Queries are grouped by owner and each group is scored against
+        that owner's cached embedding matrix with one matrix-matrix
+        product. Memories returned by several queries are deserialized once.
+        Quantized stores rank each query separately.
+
+        Args:
+            query_embeddings: One embedding per query.
+            limit: Maximum number of results per query.
+            owner_ids: Optional owner filter per query.
+            trust_level: Optional trust level applied to every query.
+
+        Returns:
+            One list of (memory, similarity_score) tuples per query.
+
+        Raises:
+            ValueError: If ``owner_ids`` is not aligned with the queries.
+        """
+        owners = _batch_owners(owner_ids, len(query_embeddings))
+        if limit <= 0 or not owners:
+            return [[] for _ in owners]
+
+        conn = self._get_connection()
+        queries = np.asarray(query_embeddings, dtype=np.float32).reshape(len(owners), -1)
+        ranked: list[list[tuple[str, float]]] = [[] for _ in owners]
+
+        if self.quantization is not None:
+            ranked = [self._rank(conn, query, limit, owner, None, trust_level) for query, owner in zip(queries, owners)]
+        else:
+            groups: dict[str | None, list[int]] = {}
+            for i, owner in enumerate(owners):
+                groups.setdefault(owner or None, []).append(i)
+            queries = _normalize_rows(queries)
+            for owner, indexes in groups.items():
+                cached = self._get_matrix(conn, owner, None, queries.shape[1])
+                if not cached.ids:
+                    continue
+                scores = queries[indexes] @ cached.matrix.T
+                if trust_level is not None:
+                    scores[:, cached.trust > trust_level] = -np.inf
+                for i, row in zip(indexes, scores):
+                    ranked[i] = [(cached.ids[j], float(row[j])) for j in _top_k(row, limit) if row[j] != -np.inf]
+
+        ids = list(dict.fromkeys(memory_id for results in ranked for memory_id, _ in results))
+        rows = self._fetch_rows(conn, "id, data", ids)
+        memories = {memory_id: memory_from_dict(json.loads(row["data"])) for memory_id, row in rows.items()}
+        return [[(memories[i], score) for i, score in results if i in memories] for results in ranked]
+
+    def search_hits(
+        self,
+        query_embedding: EmbeddingVector,
+        limit: int = 10,
+        owner_id: str | None = None,
+        memory_type: MemoryType | str | None = None,
+        *,
+        trust_level: float | None = None,
+    ) -> list[MemoryHit]:
+        """Search for similar memories without deserializing them.
+
+        Same ranking as :meth:`search`, but each result is a
+        :class:`MemoryHit` read from indexed columns. The full memory is
+        only loaded when ``hit.memory`` is accessed.
+
+        Args:
+            query_embedding: The query embedding vector.
+            limit: Maximum number of results to return.
+            owner_id: Optional filter by owner ID.
+            memory_type: Optional filter by memory type.
+            trust_level: Optional trust level. Private memories requiring
+                more are excluded before the top results are selected.
+
+        Returns:
+            List of hits sorted by similarity in descending order.
+
+        Example:
+            >>> hits = store.search_hits(query_embedding, limit=10, owner_id="sarah_123")
+            >>> relevant = [hit.memory for hit in hits if hit.score > 0.15]
+        """
+        conn = self._get_connection()
+        ranked = self._rank(conn, query_embedding, limit, owner_id, memory_type, trust_level)
+        rows = self._fetch_rows(
+            conn,
+            "id, description, memory_type, owner_id, trust_threshold",
+            [memory_id for memory_id, _ in ranked],
+        )
+        return [
+            MemoryHit(
+                id=memory_id,
+                score=score,
+                description=rows[memory_id]["description"],
+                memory_type=MemoryType(rows[memory_id]["memory_type"]),
+                owner_id=rows[memory_id]["owner_id"],
+                trust_threshold=rows[memory_id]["trust_threshold"],
+                _loader=self.get,
+            )
+            for memory_id, score in ranked
+            if memory_id in rows
+        ]
+
+    def search_text(
+        self,
+        query: str,
+        limit: int = 10,
+        owner_id: str | None = None,
+        memory_type: MemoryType | str | None = None,
+        *,
+        trust_level: float | None = None,
+    ) -> list[tuple[Memory, float]]:
+        """Search memory descriptions by keywords, ranked by BM25.
+
+        The query is tokenized and its terms are OR-ed, so FTS5 query
+        syntax in user text is matched literally rather than parsed.
+
+        Args:
+            query: Free-text query.
+            limit: Maximum number of results to return.
+            owner_id: Optional filter by owner ID.
+            memory_type: Optional filter by memory type.
+            trust_level: Optional trust level; private memories requiring
+                more are excluded.
+
+        Returns:
+            List of (memory, bm25_score) tuples, best first. Memories
+            sharing no term with the query are not returned.
+
+        Example:
+            >>> results = store.search_text("coffee downtown", limit=5, owner_id="sarah_123")
+        """
+        conn = self._get_connection()
+        type_value = memory_type.value if isinstance(memory_type, MemoryType) else memory_type
+        return self._load_memories(conn, self._text_ranking(conn, query, limit, owner_id, type_value, trust_level))
+
+    def _text_ranking(
+        self,
+        conn: sqlite3.Connection,
+        query: str,
+        limit: int,
+        owner_id: str | None,
+        memory_type: str | None,
+        trust_level: float | None = None,
+    ) -> list[tuple[str, float]]:
+        """Rank memory IDs by BM25, preferring the FTS5 index."""
+        terms = list(dict.fromkeys(tokenize(query)))
+        if limit <= 0 or not terms:
+            return []
+
+        filters = ""
+        params: list[Any] = []
+        if owner_id:
+            filters += " AND m.owner_id = ?"
+            params.append(owner_id)
+        if memory_type:
+            filters += " AND m.memory_type = ?"
+            params.append(memory_type)
+        if trust_level is not None:
+            filters += " AND (m.trust_threshold IS NULL OR m.trust_threshold <= ?)"
+            params.append(trust_level)
+
+        if not self._fts_enabled:
+            index = BM25Index()
+            for row in conn.execute(f"SELECT m.id, m.description FROM memories m WHERE 1{filters}", params):
+                index.add(row["id"], row["description"])
+            return index.search(query, limit)
+
+        # FTS5's rank is the negated BM25 score
+        rows = conn.execute(
+            f"""
+            SELECT f.memory_id AS id, -f.rank AS score
+            FROM memories_fts f
+            JOIN memories m ON m.id = f.memory_id
+            WHERE memories_fts MATCH ?{filters}
+            ORDER BY f.rank
+            LIMIT ?
+            """,
+            [" OR ".join(f'"{term}"' for term in terms), *params, limit],
+        ).fetchall()
+        return [(row["id"], float(row["score"])) for row in rows]
+
+    def _rank(
+        self,
+        conn: sqlite3.Connection,
+        query_embedding: EmbeddingVector,
+        limit: int,
+        owner_id: str | None,
+        memory_type: MemoryType | str | None,
+        trust_level: float | None = None,
+    ) -> list[tuple[str, float]]:
+        """Rank memory IDs by similarity, preferring the sqlite-vec index."""
+        type_value = memory_type.value if isinstance(memory_type, MemoryType) else memory_type
+
+        # Use the vector index when the store's sqlite-vec supports it
+        if self._vec_enabled and limit <= VEC_MAX_K:
+            return self._vector_ranking(conn, query_embedding, limit, owner_id, type_value, trust_level)
 
         # Fall back to brute force
-        return self._brute_force_search(conn, query_embedding, limit, owner_id)
+        return self._brute_force_ranking(conn, query_embedding, limit, owner_id, type_value, trust_level)
 
     def _vector_search(
         self,
         conn: sqlite3.Connection,
-        query_embedding: list[float],
+        query_embedding: EmbeddingVector,
         limit: int,
         owner_id: str | None,
+        memory_type: str | None = None,
+        trust_level: float | None = None,
     ) -> list[tuple[Memory, float]]:
         """Perform vector search using sqlite-vec."""
-        query_json = json.dumps(query_embedding)
-
-        if owner_id:
-            # Filter by owner
-            rows = conn.execute(
-                """
-                SELECT m.data, v.distance
-                FROM memory_embeddings v
-                JOIN memories m ON m.id = v.memory_id
-                WHERE m.owner_id = ?
-                ORDER BY v.embedding <-> ?
-                LIMIT ?
-                """,
-                (owner_id, query_json, limit),
-            ).fetchall()
-        else:
-            rows = conn.execute(
-                """
-                SELECT m.data, v.distance
-                FROM memory_embeddings v
-                JOIN memories m ON m.id = v.memory_id
-                ORDER BY v.embedding <-> ?
-                LIMIT ?
-                """,
-                (query_json, limit),
-            ).fetchall()
-
-        results: list[tuple[Memory, float]] = []
-        for row in rows:
-            data = json.loads(row["data"])
-            memory = self._memory_from_dict(data)
-            # Convert distance to similarity (1 - distance for L2, or use cosine)
-            similarity = max(0.0, 1.0 - row["distance"])
-            results.append((memory, similarity))
-
-        return results
+        return self._load_memories(
+            conn,
+            self._vector_ranking(conn, query_embedding, limit, owner_id, memory_type, trust_level),
+        )
 
     def _brute_force_search(
         self,
         conn: sqlite3.Connection,
-        query_embedding: list[float],
+        query_embedding: EmbeddingVector,
         limit: int,
         owner_id: str | None,
+        memory_type: str | None = None,
+        trust_level: float | None = None,
     ) -> list[tuple[Memory, float]]:
         """Perform brute force similarity search."""
-        import struct
+        return self._load_memories(
+            conn,
+            self._brute_force_ranking(conn, query_embedding, limit, owner_id, memory_type, trust_level),
+        )
+
+    def _vector_ranking(
+        self,
+        conn: sqlite3.Connection,
+        query_embedding: EmbeddingVector,
+        limit: int,
+        owner_id: str | None,
+        memory_type: str | None = None,
+        trust_level: float | None = None,
+    ) -> list[tuple[str, float]]:
+        """Rank memories using the sqlite-vec cosine index.
+
+        Owner, type and trust filters are applied inside the KNN query, so only
+        the owner's partition is scanned. Candidates' scores are recomputed
+        from ``embedding_blob`` so they match the brute-force path exactly.
+        Quantized indexes fetch ``rerank_factor`` candidates per result.
+        """
+        k = limit
+        if self.quantization is not None:
+            k = min(limit * self.rerank_factor, VEC_MAX_K)
 
+        filters = ""
+        params: list[Any] = [_to_blob(query_embedding), k]
         if owner_id:
-            rows = conn.execute(
-                "SELECT data, embedding_blob FROM memories WHERE owner_id = ?",
-                (owner_id,),
-            ).fetchall()
+            filters += " AND owner_id = ?"
+            params.append(owner_id)
+        if memory_type:
+            filters += " AND memory_type = ?"
+            params.append(memory_type)
+        if trust_level is not None:
+            filters += " AND trust_threshold <= ?"
+            params.append(trust_level)
+
+        rows = conn.execute(
+            f"""
+            WITH knn AS (
+                SELECT memory_id, distance
+                FROM memory_embeddings
+                WHERE embedding MATCH {self._vector_sql("?")} AND k = ?{filters}
+            )
+            SELECT m.id, m.embedding_blob
+            FROM knn
+            JOIN memories m ON m.id = knn.memory_id
+            WHERE m.embedding_blob IS NOT NULL
+            ORDER BY knn.distance
+            """,
+            params,
+        ).fetchall()
+
+        query = np.asarray(query_embedding, dtype=np.float32)
+        rows = [row for row in rows if len(row["embedding_blob"]) == query.nbytes]
+        if not rows:
+            return []
+        scores = _blobs_to_matrix([row["embedding_blob"] for row in rows], len(query)) @ _normalize_rows(query)
+
+        ranked = [(row["id"], float(score)) for row, score in zip(rows, scores)]
+        ranked.sort(key=lambda x: x[1], reverse=True)
+        return ranked[:limit]
+
+    def _brute_force_ranking(
+        self,
+        conn: sqlite3.Connection,
+        query_embedding: EmbeddingVector,
+        limit: int,
+        owner_id: str | None,
+        memory_type: str | None = None,
+        trust_level: float | None = None,
+    ) -> list[tuple[str, float]]:
+        """Rank memories by scanning their embeddings.
+
+        Embeddings are decoded into a normalized matrix that is cached per
+        owner and type, and scored with one matrix-vector product. Stored
+        embeddings whose dimension differs from the query are skipped.
+        Memories requiring more than ``trust_level`` are masked out before
+        the top-k selection.
+
+        Quantized stores cache int8 or packed binary codes instead, take
+        ``rerank_factor`` candidates per result from the codes, and
+        re-rank them with the full precision embeddings.
+        """
+        query = np.asarray(query_embedding, dtype=np.float32)
+        if limit <= 0 or query.ndim != 1 or len(query) == 0:
+            return []
+
+        cached = self._get_matrix(conn, owner_id or None, memory_type or None, len(query))
+        if not cached.ids:
+            return []
+
+        query = _normalize_rows(query)
+        k = limit
+        if self.quantization == "binary":
+            k = limit * self.rerank_factor
+            distances = _POPCOUNT[cached.matrix ^ _quantize_rows(query, "binary")].sum(axis=1, dtype=np.int32)
+            scores = -distances.astype(np.float32)
         else:
-            rows = conn.execute("SELECT data, embedding_blob FROM memories").fetchall()
+            if self.quantization == "int8":
+                k = limit * self.rerank_factor
+            scores = cached.matrix @ query
+        if trust_level is not None:
+            scores[cached.trust > trust_level] = -np.inf
 
-        results: list[tuple[Memory, float]] = []
-        for row in rows:
-            if row["embedding_blob"] is None:
-                continue
+        top = _top_k(scores, k)
+        top = top[scores[top] != -np.inf]
 
-            # Deserialize embedding
-            blob = row["embedding_blob"]
-            n_floats = len(blob) // 4
-            stored_embedding = list(struct.unpack(f"{n_floats}f", blob))
+        if self.quantization is not None:
+            return self._rerank(conn, [cached.ids[i] for i in top], query, limit)
+        return [(cached.ids[i], float(scores[i])) for i in top]
 
-            # Compute similarity
-            similarity = self._cosine_similarity(query_embedding, stored_embedding)
+    def _rerank(
+        self,
+        conn: sqlite3.Connection,
+        candidate_ids: list[str],
+        query: np.ndarray,
+        limit: int,
+    ) -> list[tuple[str, float]]:
+        """Score candidates with their full precision embeddings and keep the top ``limit``."""
+        rows = self._fetch_rows(conn, "id, embedding_blob", candidate_ids)
+        ids = [memory_id for memory_id in candidate_ids if memory_id in rows]
+        if not ids:
+            return []
+        scores = _blobs_to_matrix([rows[memory_id]["embedding_blob"] for memory_id in ids], len(query)) @ query
+        order = np.argsort(-scores, kind="stable")[:limit]
+        return [(ids[i], float(scores[i])) for i in order]
+
+    def _load_memories(
+        self,
+        conn: sqlite3.Connection,
+        ranked: list[tuple[str, float]],
+    ) -> list[tuple[Memory, float]]:
+        """Deserialize ranked memory IDs into (memory, score) tuples."""
+        rows = self._fetch_rows(conn, "id, data", [memory_id for memory_id, _ in ranked])
+        return [
+            (memory_from_dict(json.loads(rows[memory_id]["data"])), score)
+            for memory_id, score in ranked
+            if memory_id in rows
+        ]
 
-            # Deserialize memory
-            data = json.loads(row["data"])
-            memory = self._memory_from_dict(data)
+    @staticmethod
+    def _fetch_rows(
+        conn: sqlite3.Connection,
+        columns: str,
+        memory_ids: list[str],
+    ) -> dict[str, sqlite3.Row]:
+        """Fetch ``memories`` rows by ID, keyed by ID."""
+        rows: dict[str, sqlite3.Row] = {}
+        # Stay well below SQLite's host-parameter limit
+        for start in range(0, len(memory_ids), 500):
+            chunk = memory_ids[start : start + 500]
+            placeholders = ", ".join("?" * len(chunk))
+            for row in conn.execute(f"SELECT {columns} FROM memories WHERE id IN ({placeholders})", chunk):
+                rows[row["id"]] = row
+        return rows
+
+    def _get_matrix(
+        self,
+        conn: sqlite3.Connection,
+        owner_id: str | None,
+        memory_type: str | None,
+        dimensions: int,
+    ) -> _CachedMatrix:
+        """Return the decoded embedding matrix for a search slice.
+
+        Cached matrices are dropped by this store's writes and whenever
+        another connection commits to the database. A connection's first
+        search also drops them: its ``data_version`` cannot tell what was
+        committed before it was opened, so it has no baseline to compare.
+        """
+        data_version = conn.execute("PRAGMA data_version").fetchone()[0]
+        key = (owner_id, memory_type, dimensions)
+        with self._cache_lock:
+            if self._data_versions.get(conn) != data_version:
+                self._data_versions[conn] = data_version
+                self._matrix_cache.clear()
+                self._cache_generation += 1
+
+            cached = self._matrix_cache.get(key)
+            if cached is not None:
+                self._matrix_cache.move_to_end(key)
+                return cached
+            generation = self._cache_generation
+
+        clauses = ["length(embedding_blob) = ?"]
+        params: list[Any] = [4 * dimensions]
+        if owner_id:
+            clauses.append("owner_id = ?")
+            params.append(owner_id)
+        if memory_type:
+            clauses.append("memory_type = ?")
+            params.append(memory_type)
 
-            results.append((memory, similarity))
+        rows = conn.execute(
+            f"SELECT id, embedding_blob, trust_threshold FROM memories WHERE {' AND '.join(clauses)}",
+            params,
+        ).fetchall()
+        ids = [row["id"] for row in rows]
+        cached = _CachedMatrix(
+            ids=ids,
+            matrix=_quantize_rows(
+                _blobs_to_matrix([row["embedding_blob"] for row in rows], dimensions),
+                self.quantization,
+            ),
+            rows={memory_id: i for i, memory_id in enumerate(ids)},
+            trust=np.array(
+                [-np.inf if row["trust_threshold"] is None else row["trust_threshold"] for row in rows],
+                dtype=np.float64,
+            ),
+        )
 
-        # Sort by similarity descending
-        results.sort(key=lambda x: x[1], reverse=True)
+        with self._cache_lock:
+            # Skip caching if a write invalidated the cache while decoding
+            if self.matrix_cache_size > 0 and generation == self._cache_generation:
+                self._matrix_cache[key] = cached
+                while len(self._matrix_cache) > self.matrix_cache_size:
+                    self._matrix_cache.popitem(last=False)
+        return cached
 
-        return results[:limit]
+    def _invalidate_cache(
+        self,
+        memory_ids: Iterable[str],
+        owner_ids: Iterable[str | None] = (),
+    ) -> None:
+        """Drop cached matrices affected by a write.
+
+        Args:
+            memory_ids: IDs that were written, updated or deleted.
+            owner_ids: Owners of newly written memories, whose slices
+                (and the unfiltered slices) gain rows.
+        """
+        ids = set(memory_ids)
+        owners = {owner or None for owner in owner_ids}
+        with self._cache_lock:
+            self._cache_generation += 1
+            for key in list(self._matrix_cache):
+                cached_owner = key[0]
+                gains_rows = bool(owners) and (cached_owner is None or cached_owner in owners)
+                if gains_rows or not ids.isdisjoint(self._matrix_cache[key].rows):
+                    del self._matrix_cache[key]
 
     def get(self, memory_id: str) -> Memory | None:
         """Retrieve a memory by ID."""
@@ -302,8 +1074,9 @@ class SQLiteVectorStore:
             return None
 
         data = json.loads(row["data"])
-        return self._memory_from_dict(data)
+        return memory_from_dict(data)
 
+    @_serialized_write
     def delete(self, memory_id: str) -> bool:
         """Delete a memory by ID."""
         conn = self._get_connection()
@@ -312,48 +1085,179 @@ class SQLiteVectorStore:
             "DELETE FROM memories WHERE id = ?",
             (memory_id,),
         )
+        self._delete_text(conn, [memory_id])
 
         if self._vec_enabled:
-            try:
-                conn.execute(
-                    "DELETE FROM memory_embeddings WHERE memory_id = ?",
-                    (memory_id,),
-                )
-            except sqlite3.OperationalError:
-                pass
+            conn.execute(
+                "DELETE FROM memory_embeddings WHERE memory_id = ?",
+                (memory_id,),
+            )
 
         conn.commit()
+        self._invalidate_cache([memory_id])
 
         return cursor.rowcount > 0
 
-    def update_embedding(self, memory_id: str, embedding: list[float]) -> bool:
+    @_serialized_write
+    def update_embedding(self, memory_id: str, embedding: EmbeddingVector) -> bool:
         """Update a memory's embedding."""
         conn = self._get_connection()
-        import struct
-
-        embedding_blob = struct.pack(f"{len(embedding)}f", *embedding)
+        embedding_blob = _to_blob(embedding)
 
         cursor = conn.execute(
             "UPDATE memories SET embedding_blob = ? WHERE id = ?",
             (embedding_blob, memory_id),
         )
 
-        if self._vec_enabled:
-            try:
-                conn.execute(
-                    """
-                    INSERT OR REPLACE INTO memory_embeddings (memory_id, embedding)
-                    VALUES (?, ?)
-                    """,
-                    (memory_id, json.dumps(embedding)),
-                )
-            except sqlite3.OperationalError:
-                pass
+        if cursor.rowcount > 0:
+            self._write_vectors(conn, [memory_id])
 
         conn.commit()
+        self._invalidate_cache([memory_id])
 
         return cursor.rowcount > 0
 
+    @_serialized_write
+    def store_many(
+        self,
+        memories: Sequence[Memory],
+        embeddings: Sequence[Sequence[float]] | np.ndarray,
+    ) -> BulkWriteStats:
+        """Store many memories with their embeddings in one transaction.
+
+        Args:
+            memories: The memories to store.
+            embeddings: One embedding per memory, as a list of vectors or
+                a 2D NumPy array of shape ``(len(memories), dimensions)``.
+
+        Returns:
+            BulkWriteStats with the number of rows written and throughput.
+
+        Raises:
+            ValueError: If the number of embeddings does not match.
+
+        Example:
+            >>> stats = store.store_many(memories, embed_model.embed_batch(texts))
+            >>> print(f"{stats.rows_per_second:.0f} rows/s")
+        """
+        matrix = self._as_matrix(embeddings, len(memories))
+        conn = self._get_connection()
+        started = time.perf_counter()
+
+        memory_rows = []
+        for memory, vector in zip(memories, matrix):
+            embedding_blob = vector.tobytes()
+            memory_rows.append(
+                (
+                    memory.id,
+                    memory.description,
+                    memory.memory_type.value,
+                    getattr(memory, "owner_id", None),
+                    memory.created_at.isoformat(),
+                    json.dumps(memory.to_dict()),
+                    embedding_blob,
+                    getattr(memory, "trust_threshold", None),
+                )
+            )
+
+        try:
+            conn.executemany(
+                """
+                INSERT OR REPLACE INTO memories
+                (id, description, memory_type, owner_id, created_at, data, embedding_blob, trust_threshold)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                memory_rows,
+            )
+            self._write_vectors(conn, [row[0] for row in memory_rows])
+            if self._fts_enabled:
+                self._write_text(conn, [(row[0], row[1]) for row in memory_rows])
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            self._invalidate_cache([row[0] for row in memory_rows], [row[3] for row in memory_rows])
+
+        # Only once committed; array input stays NumPy-native, with each memory owning a copy of its row
+        keep_arrays = isinstance(embeddings, np.ndarray)
+        for memory, vector in zip(memories, matrix):
+            memory.embedding = vector.copy() if keep_arrays else vector.tolist()
+
+        return self._bulk_stats("store_many", len(memory_rows), started)
+
+    @_serialized_write
+    def update_embeddings_many(
+        self,
+        memory_ids: Sequence[str],
+        embeddings: Sequence[Sequence[float]] | np.ndarray,
+    ) -> BulkWriteStats:
+        """Update many embeddings in one transaction.
+
+        Args:
+            memory_ids: IDs of the memories to update.
+            embeddings: One embedding per ID, as a list of vectors or a
+                2D NumPy array.
+
+        Returns:
+            BulkWriteStats where ``rows`` counts the memories that existed.
+
+        Raises:
+            ValueError: If the number of embeddings does not match.
+        """
+        matrix = self._as_matrix(embeddings, len(memory_ids))
+        conn = self._get_connection()
+        started = time.perf_counter()
+
+        try:
+            found = self._fetch_rows(conn, "id", list(memory_ids))
+            rows = [
+                (vector.tobytes(), memory_id) for memory_id, vector in zip(memory_ids, matrix) if memory_id in found
+            ]
+            existing = [memory_id for _, memory_id in rows]
+            conn.executemany("UPDATE memories SET embedding_blob = ? WHERE id = ?", rows)
+
+            self._write_vectors(conn, existing)
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            self._invalidate_cache(memory_ids)
+
+        return self._bulk_stats("update_embeddings_many", len(existing), started)
+
+    @_serialized_write
+    def delete_many(self, memory_ids: Sequence[str]) -> BulkWriteStats:
+        """Delete many memories in one transaction.
+
+        Args:
+            memory_ids: IDs of the memories to delete.
+
+        Returns:
+            BulkWriteStats where ``rows`` counts the memories deleted.
+        """
+        conn = self._get_connection()
+        started = time.perf_counter()
+        params = [(memory_id,) for memory_id in memory_ids]
+
+        try:
+            before = conn.total_changes
+            conn.executemany("DELETE FROM memories WHERE id = ?", params)
+            deleted = conn.total_changes - before
+            self._delete_text(conn, memory_ids)
+
+            if self._vec_enabled:
+                conn.executemany("DELETE FROM memory_embeddings WHERE memory_id = ?", params)
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            self._invalidate_cache(memory_ids)
+
+        return self._bulk_stats("delete_many", deleted, started)
+
     def count(self, owner_id: str | None = None) -> int:
         """Count memories in the store."""
         conn = self._get_connection()
@@ -390,14 +1294,23 @@ class SQLiteVectorStore:
             (owner_id, limit),
         ).fetchall()
 
-        return [self._memory_from_dict(json.loads(row["data"])) for row in rows]
+        return [memory_from_dict(json.loads(row["data"])) for row in rows]
 
     def close(self) -> None:
-        """Close the database connection."""
+        """Close the database connection, or every pooled connection."""
         if self._conn is not None:
             self._conn.close()
             self._conn = None
 
+        with self._pool_lock:
+            for conn in self._pool:
+                conn.close()
+            self._pool.clear()
+            self._local = threading.local()
+
+        with self._cache_lock:
+            self._data_versions.clear()
+
     def __enter__(self) -> SQLiteVectorStore:
         """Context manager entry."""
         return self
@@ -406,36 +1319,29 @@ class SQLiteVectorStore:
         """Context manager exit."""
         self.close()
 
-    @staticmethod
-    def _memory_from_dict(data: dict[str, Any]) -> Memory:
-        """Create the appropriate Memory subclass from dictionary."""
-        memory_type = data.get("memory_type", "individual")
-
-        if memory_type == "individual":
-            return IndividualMemory.from_dict(data)
-        elif memory_type == "shared":
-            return SharedMemory.from_dict(data)
-        elif memory_type == "private":
-            return PrivateMemory.from_dict(data)
-        else:
-            return Memory.from_dict(data)
+    def _as_matrix(
+        self,
+        embeddings: Sequence[Sequence[float]] | np.ndarray,
+        expected_rows: int,
+    ) -> np.ndarray:
+        """Convert embeddings to a contiguous float32 matrix."""
+        matrix = np.ascontiguousarray(embeddings, dtype=np.float32)
+        if expected_rows == 0:
+            return matrix.reshape(0, self.dimensions)
+        if matrix.ndim != 2 or matrix.shape[0] != expected_rows:
+            msg = f"Expected {expected_rows} embeddings, got array of shape {matrix.shape}"
+            raise ValueError(msg)
+        return matrix
 
     @staticmethod
-    def _cosine_similarity(a: list[float], b: list[float]) -> float:
-        """Compute cosine similarity between two vectors."""
-        if len(a) != len(b):
-            return 0.0
-
-        dot_product = sum(x * y for x, y in zip(a, b))
-        norm_a = sum(x * x for x in a) ** 0.5
-        norm_b = sum(x * x for x in b) ** 0.5
-
-        if norm_a == 0 or norm_b == 0:
-            return 0.0
-
-        return float(dot_product / (norm_a * norm_b))
+    def _bulk_stats(operation: str, rows: int, started: float) -> BulkWriteStats:
+        """Build and log throughput stats for a bulk write."""
+        stats = BulkWriteStats(rows=rows, seconds=time.perf_counter() - started)
+        logger.debug("%s: %d rows in %.3fs (%.0f rows/s)", operation, stats.rows, stats.seconds, stats.rows_per_second)
+        return stats
 
 
 __all__ = [
+    "BulkWriteStats",
     "SQLiteVectorStore",
 ]
@@ -17,11 +17,122 @@ Example:
 from __future__ import annotations
 
 from abc import abstractmethod
-from typing import TYPE_CHECKING, Protocol, runtime_checkable
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
+
+import numpy as np
+from numpy.typing import NDArray
+
+from personaut.memory.lexical import BM25Index
+from personaut.types.exceptions import MemoryError as MemoryStoreError
 
 
 if TYPE_CHECKING:
-    from personaut.memory.memory import Memory
+    from personaut.memory.memory import Memory, MemoryType
+
+
+# An embedding as a list of floats or a 1D NumPy array
+EmbeddingVector = Sequence[float] | NDArray[np.floating[Any]]
+
+
+def _embedding_value(embedding: EmbeddingVector) -> list[float] | NDArray[np.float32]:
+    """Return the value a store keeps for an embedding.
+
+    Arrays stay arrays (as float32, copied only if the dtype differs), so
+    NumPy-native callers never materialize per-element Python floats;
+    other sequences are kept as lists.
+    """
+    if isinstance(embedding, np.ndarray):
+        return np.asarray(embedding, dtype=np.float32).reshape(-1)
+    return list(embedding)
+
+
+def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    """L2-normalize each row, leaving zero rows untouched."""
+    norms = np.linalg.norm(matrix, axis=-1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return np.asarray(matrix / norms, dtype=np.float32)
+
+
+def _top_k(scores: np.ndarray, k: int) -> NDArray[np.intp]:
+    """Return the indices of the ``k`` highest scores, best first."""
+    k = min(k, len(scores))
+    if k <= 0:
+        return np.zeros(0, dtype=np.intp)
+    top = np.argpartition(-scores, k - 1)[:k] if k < len(scores) else np.arange(len(scores))
+    return np.asarray(top[np.argsort(-scores[top], kind="stable")], dtype=np.intp)
+
+
+def _batch_owners(owner_ids: Sequence[str | None] | None, n_queries: int) -> list[str | None]:
+    """Expand ``search_batch`` owner filters to one entry per query.
+
+    Raises:
+        ValueError: If ``owner_ids`` is not aligned with the queries.
+    """
+    if owner_ids is None:
+        return [None] * n_queries
+    if len(owner_ids) != n_queries:
+        msg = f"Got {len(owner_ids)} owner_ids for {n_queries} queries"
+        raise ValueError(msg)
+    return list(owner_ids)
+
+
+def _required_trust(memory: Memory) -> float:
+    """Return the trust level a memory requires, or -inf if it is not trust-gated."""
+    threshold = getattr(memory, "trust_threshold", None)
+    return -np.inf if threshold is None else float(threshold)
+
+
+@dataclass
+class MemoryHit:
+    """Lightweight search result that loads the full memory on demand.
+
+    Holds the columns needed to rank and filter results without
+    deserializing the memory. Accessing :attr:`memory` loads and
+    caches the full ``Memory`` object.
+
+    Attributes:
+        id: The memory ID.
+        score: Similarity score.
+        description: The memory description.
+        memory_type: The type of memory.
+        owner_id: Owner ID, or None for memories without an owner.
+        trust_threshold: Trust required to access a private memory,
+            or None for other memory types.
+
+    Example:
+        >>> hits = store.search_hits(query_embedding, limit=10)
+        >>> relevant = [hit.memory for hit in hits if hit.score > 0.15]
+    """
+
+    id: str
+    score: float
+    description: str
+    memory_type: MemoryType
+    owner_id: str | None = None
+    trust_threshold: float | None = None
+    _loader: Callable[[str], Memory | None] | None = field(default=None, repr=False, compare=False)
+    _memory: Memory | None = field(default=None, repr=False, compare=False)
+
+    @property
+    def memory(self) -> Memory:
+        """The full memory, loaded on first access.
+
+        Raises:
+            MemoryError: If the memory was deleted since the search.
+        """
+        if self._memory is None:
+            loaded = self._loader(self.id) if self._loader is not None else None
+            if loaded is None:
+                msg = "Memory no longer exists"
+                raise MemoryStoreError(msg, operation="load", memory_id=self.id)
+            self._memory = loaded
+        return self._memory
+
+    def can_access(self, trust_level: float) -> bool:
+        """Check if the given trust level allows access to this memory."""
+        return self.trust_threshold is None or trust_level >= self.trust_threshold
 
 
 @runtime_checkable
@@ -38,12 +149,13 @@ class VectorStore(Protocol):
     """
 
     @abstractmethod
-    def store(self, memory: Memory, embedding: list[float]) -> None:
+    def store(self, memory: Memory, embedding: EmbeddingVector) -> None:
         """Store a memory with its embedding vector.
 
         Args:
             memory: The memory to store.
-            embedding: The embedding vector for similarity search.
+            embedding: The embedding vector for similarity search, as a
+                list of floats or a 1D NumPy array.
 
         Example:
             >>> store.store(memory, [0.1, 0.2, 0.3, ...])
@@ -53,16 +165,22 @@ class VectorStore(Protocol):
     @abstractmethod
     def search(
         self,
-        query_embedding: list[float],
+        query_embedding: EmbeddingVector,
         limit: int = 10,
         owner_id: str | None = None,
+        *,
+        trust_level: float | None = None,
     ) -> list[tuple[Memory, float]]:
         """Search for similar memories.
 
         Args:
-            query_embedding: The query embedding vector.
+            query_embedding: The query embedding vector (list or 1D array).
             limit: Maximum number of results to return.
             owner_id: Optional filter by owner ID.
+            trust_level: Optional trust level. Private memories whose
+                ``trust_threshold`` exceeds it are excluded before the
+                top ``limit`` are selected, so up to ``limit`` accessible
+                memories are returned.
 
         Returns:
             List of (memory, similarity_score) tuples, sorted by
@@ -75,6 +193,38 @@ class VectorStore(Protocol):
         """
         ...
 
+    @abstractmethod
+    def search_batch(
+        self,
+        query_embeddings: Sequence[Sequence[float]] | NDArray[np.floating[Any]],
+        limit: int = 10,
+        owner_ids: list[str | None] | None = None,
+        *,
+        trust_level: float | None = None,
+    ) -> list[list[tuple[Memory, float]]]:
+        """Search for several queries at once.
+
+        Implementations should score all queries together (e.g. with one
+        matrix-matrix product) rather than running :meth:`search` per query.
+
+        Args:
+            query_embeddings: One embedding per query, or a 2D array with
+                one row per query.
+            limit: Maximum number of results per query.
+            owner_ids: Optional owner filter per query, aligned with
+                ``query_embeddings``.
+            trust_level: Optional trust level applied to every query, as in
+                :meth:`search`.
+
+        Returns:
+            One result list per query, each as :meth:`search` returns it.
+
+        Example:
+            >>> batches = store.search_batch([q1, q2], limit=5, owner_ids=["alice", "bob"])
+            >>> alice_results, bob_results = batches
+        """
+        ...
+
     @abstractmethod
     def get(self, memory_id: str) -> Memory | None:
         """Retrieve a memory by its ID.
@@ -109,7 +259,7 @@ class VectorStore(Protocol):
         ...
 
     @abstractmethod
-    def update_embedding(self, memory_id: str, embedding: list[float]) -> bool:
+    def update_embedding(self, memory_id: str, embedding: EmbeddingVector) -> bool:
         """Update a memory's embedding vector.
 
         Args:
@@ -138,7 +288,9 @@ class InMemoryVectorStore:
     """Simple in-memory vector store for testing and development.
 
     This implementation stores memories in a dictionary and
-    performs brute-force similarity search.
+    performs brute-force similarity search. Descriptions are also kept
+    in a BM25 index for :meth:`search_text`, and each memory's required
+    trust level alongside its embedding for trust-filtered searches.
 
     Not recommended for production with large datasets.
 
@@ -151,20 +303,32 @@ class InMemoryVectorStore:
     def __init__(self) -> None:
         """Initialize the in-memory store."""
         self._memories: dict[str, Memory] = {}
-        self._embeddings: dict[str, list[float]] = {}
+        self._embeddings: dict[str, list[float] | NDArray[np.float32]] = {}
+        self._trust: dict[str, float] = {}
+        self._text_index = BM25Index()
 
-    def store(self, memory: Memory, embedding: list[float]) -> None:
+    def store(self, memory: Memory, embedding: EmbeddingVector) -> None:
         """Store a memory with its embedding."""
+        embedding = _embedding_value(embedding)
         self._memories[memory.id] = memory
         self._embeddings[memory.id] = embedding
+        self._trust[memory.id] = _required_trust(memory)
+        self._text_index.add(
+            memory.id,
+            memory.description,
+            getattr(memory, "owner_id", None),
+            getattr(memory, "trust_threshold", None),
+        )
         # Also store embedding in the memory itself
         memory.embedding = embedding
 
     def search(
         self,
-        query_embedding: list[float],
+        query_embedding: EmbeddingVector,
         limit: int = 10,
         owner_id: str | None = None,
+        *,
+        trust_level: float | None = None,
     ) -> list[tuple[Memory, float]]:
         """Search for similar memories using cosine similarity."""
         results: list[tuple[Memory, float]] = []
@@ -174,6 +338,10 @@ class InMemoryVectorStore:
             if owner_id is not None and hasattr(memory, "owner_id") and memory.owner_id != owner_id:
                 continue
 
+            # Filter out memories the trust level cannot access
+            if trust_level is not None and self._trust[memory_id] > trust_level:
+                continue
+
             embedding = self._embeddings.get(memory_id)
             if embedding is None:
                 continue
@@ -186,6 +354,56 @@ class InMemoryVectorStore:
 
         return results[:limit]
 
+    def search_text(
+        self,
+        query: str,
+        limit: int = 10,
+        owner_id: str | None = None,
+        *,
+        trust_level: float | None = None,
+    ) -> list[tuple[Memory, float]]:
+        """Search memory descriptions by keywords, ranked by BM25."""
+        ranked = self._text_index.search(query, limit, owner_id, trust_level)
+        return [(self._memories[i], score) for i, score in ranked]
+
+    def search_batch(
+        self,
+        query_embeddings: Sequence[Sequence[float]] | NDArray[np.floating[Any]],
+        limit: int = 10,
+        owner_ids: Sequence[str | None] | None = None,
+        *,
+        trust_level: float | None = None,
+    ) -> list[list[tuple[Memory, float]]]:
+        """Search for several queries with one matrix-matrix product.
+
+        Stored embeddings whose dimension differs from the queries are skipped.
+        """
+        owners = _batch_owners(owner_ids, len(query_embeddings))
+        if limit <= 0 or not owners or not self._memories:
+            return [[] for _ in owners]
+
+        queries = _normalize_rows(np.asarray(query_embeddings, dtype=np.float32).reshape(len(owners), -1))
+        ids = [
+            memory_id
+            for memory_id, emb in self._embeddings.items()
+            if len(emb) == queries.shape[1] and (trust_level is None or self._trust[memory_id] <= trust_level)
+        ]
+        if not ids:
+            return [[] for _ in owners]
+        scores = queries @ _normalize_rows(np.asarray([self._embeddings[i] for i in ids], dtype=np.float32)).T
+
+        masks: dict[str, NDArray[np.bool_]] = {}
+        results: list[list[tuple[Memory, float]]] = []
+        for row, owner_id in zip(scores, owners):
+            if owner_id is not None:
+                if owner_id not in masks:
+                    masks[owner_id] = np.array(
+                        [getattr(self._memories[i], "owner_id", owner_id) == owner_id for i in ids]
+                    )
+                row = np.where(masks[owner_id], row, -np.inf)
+            results.append([(self._memories[ids[i]], float(row[i])) for i in _top_k(row, limit) if row[i] != -np.inf])
+        return results
+
     def get(self, memory_id: str) -> Memory | None:
         """Retrieve a memory by ID."""
         return self._memories.get(memory_id)
@@ -195,12 +413,15 @@ class InMemoryVectorStore:
         if memory_id in self._memories:
             del self._memories[memory_id]
             self._embeddings.pop(memory_id, None)
+            self._trust.pop(memory_id, None)
+            self._text_index.remove(memory_id)
             return True
         return False
 
-    def update_embedding(self, memory_id: str, embedding: list[float]) -> bool:
+    def update_embedding(self, memory_id: str, embedding: EmbeddingVector) -> bool:
         """Update a memory's embedding."""
         if memory_id in self._memories:
+            embedding = _embedding_value(embedding)
             self._embeddings[memory_id] = embedding
             self._memories[memory_id].embedding = embedding
             return True
@@ -221,17 +442,25 @@ class InMemoryVectorStore:
         """Clear all memories from the store."""
         self._memories.clear()
         self._embeddings.clear()
+        self._trust.clear()
+        self._text_index.clear()
 
     def get_all(self) -> list[Memory]:
         """Get all memories in the store."""
         return list(self._memories.values())
 
     @staticmethod
-    def _cosine_similarity(a: list[float], b: list[float]) -> float:
+    def _cosine_similarity(a: EmbeddingVector, b: EmbeddingVector) -> float:
         """Compute cosine similarity between two vectors."""
         if len(a) != len(b):
             return 0.0
 
+        if isinstance(a, np.ndarray) or isinstance(b, np.ndarray):
+            a_arr = np.asarray(a, dtype=np.float32)
+            b_arr = np.asarray(b, dtype=np.float32)
+            norms = float(np.linalg.norm(a_arr) * np.linalg.norm(b_arr))
+            return float(a_arr @ b_arr) / norms if norms else 0.0
+
         dot_product = sum(x * y for x, y in zip(a, b))
         norm_a = sum(x * x for x in a) ** 0.5
         norm_b = sum(x * x for x in b) ** 0.5
@@ -243,6 +472,8 @@ class InMemoryVectorStore:
 
 
 __all__ = [
+    "EmbeddingVector",
     "InMemoryVectorStore",
+    "MemoryHit",
     "VectorStore",
 ]
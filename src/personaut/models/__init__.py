@@ -38,11 +38,27 @@ Provider Examples:
     >>> from personaut.models import OllamaModel
     >>> ollama = OllamaModel(model="llama3.2")
 
+Async Generation:
+    >>> from personaut.models import get_async_llm
+    >>>
+    >>> # Async<Provider>Model classes use each SDK's async client
+    >>> async with get_async_llm("openai") as llm:
+    ...     results = await asyncio.gather(*(llm.generate(p) for p in prompts))
+
+Rate Limits and Retries:
+    >>> from personaut.models import RateLimitedModel
+    >>>
+    >>> # Pace requests per provider key and retry rate-limit/transient errors
+    >>> llm = RateLimitedModel(get_llm(), requests_per_minute=500, tokens_per_minute=200_000)
+
 Configuration:
     Environment variables:
     - PERSONAUT_LLM_PROVIDER: Default LLM provider (gemini, openai, anthropic, bedrock, ollama)
     - PERSONAUT_LLM_MODEL: Default model name
     - PERSONAUT_EMBEDDING_MODEL: Embedding model (default: all-MiniLM-L6-v2)
+    - PERSONAUT_EMBEDDING_CACHE: Path of a persistent embedding cache (optional)
+    - PERSONAUT_EMBEDDING_WORKERS: Embed in this many worker processes (optional)
+    - PERSONAUT_LLM_CACHE: Path of a persistent LLM response cache used by get_cached_llm and with_response_cache (optional)
 
     Provider-specific:
     - GOOGLE_API_KEY: For Gemini
@@ -53,6 +69,8 @@ Configuration:
 
 # Base interfaces
 # Embedding interfaces
+from personaut.models.batching_embedding import BatchingEmbedding, BatchingStats
+from personaut.models.embedding_cache import EmbeddingCacheStats, LRUEmbeddingCache, SQLiteEmbeddingCache
 from personaut.models.embeddings import (
     DEFAULT_MODEL_LARGE,
     DEFAULT_MODEL_SMALL,
@@ -66,6 +84,7 @@ from personaut.models.embeddings import (
 )
 
 # Local embedding
+from personaut.models.hashing_embedding import HashingEmbedding
 from personaut.models.local_embedding import (
     LocalEmbedding,
     create_local_embedding,
@@ -73,6 +92,7 @@ from personaut.models.local_embedding import (
 from personaut.models.model import (
     AsyncModel,
     AuthenticationError,
+    BatchGenerationResult,
     GenerationResult,
     InvalidRequestError,
     Model,
@@ -80,130 +100,185 @@ from personaut.models.model import (
     ModelError,
     RateLimitError,
 )
+from personaut.models.process_embedding import ProcessPoolEmbedding
+from personaut.models.rate_limit import AsyncRateLimitedModel, RateLimitedModel, RateLimiter, RetryPolicy
+from personaut.models.response_cache import CachedModel, ResponseCacheStats, SQLiteResponseCache
 
 
 # LLM Providers (imported lazily to avoid requiring all dependencies)
 # Use try/except to allow imports without all providers installed
 
 
-def _lazy_import_gemini() -> tuple[type, object, str, list[str]]:
+def _lazy_import_gemini() -> tuple[type, object, str, list[str], type]:
     from personaut.models.gemini import (
         AVAILABLE_GEMINI_MODELS,
         DEFAULT_GEMINI_MODEL,
+        AsyncGeminiModel,
         GeminiModel,
         create_gemini_model,
     )
 
-    return GeminiModel, create_gemini_model, DEFAULT_GEMINI_MODEL, AVAILABLE_GEMINI_MODELS
+    return GeminiModel, create_gemini_model, DEFAULT_GEMINI_MODEL, AVAILABLE_GEMINI_MODELS, AsyncGeminiModel
 
 
-def _lazy_import_openai() -> tuple[type, object, str, list[str]]:
+def _lazy_import_openai() -> tuple[type, object, str, list[str], type]:
     from personaut.models.openai import (
         AVAILABLE_OPENAI_MODELS,
         DEFAULT_OPENAI_MODEL,
+        AsyncOpenAIModel,
         OpenAIModel,
         create_openai_model,
     )
 
-    return OpenAIModel, create_openai_model, DEFAULT_OPENAI_MODEL, AVAILABLE_OPENAI_MODELS
+    return OpenAIModel, create_openai_model, DEFAULT_OPENAI_MODEL, AVAILABLE_OPENAI_MODELS, AsyncOpenAIModel
 
 
-def _lazy_import_bedrock() -> tuple[type, object, dict[str, str], str]:
+def _lazy_import_bedrock() -> tuple[type, object, dict[str, str], str, type]:
     from personaut.models.bedrock import (
         BEDROCK_MODELS,
         DEFAULT_BEDROCK_MODEL,
+        AsyncBedrockModel,
         BedrockModel,
         create_bedrock_model,
     )
 
-    return BedrockModel, create_bedrock_model, BEDROCK_MODELS, DEFAULT_BEDROCK_MODEL
+    return BedrockModel, create_bedrock_model, BEDROCK_MODELS, DEFAULT_BEDROCK_MODEL, AsyncBedrockModel
 
 
-def _lazy_import_ollama() -> tuple[type, object, str, str]:
+def _lazy_import_ollama() -> tuple[type, object, str, str, type]:
     from personaut.models.ollama import (
         DEFAULT_OLLAMA_HOST,
         DEFAULT_OLLAMA_MODEL,
+        AsyncOllamaModel,
         OllamaModel,
         create_ollama_model,
     )
 
-    return OllamaModel, create_ollama_model, DEFAULT_OLLAMA_MODEL, DEFAULT_OLLAMA_HOST
+    return OllamaModel, create_ollama_model, DEFAULT_OLLAMA_MODEL, DEFAULT_OLLAMA_HOST, AsyncOllamaModel
 
 
-def _lazy_import_anthropic() -> tuple[type, object, str, list[str]]:
+def _lazy_import_anthropic() -> tuple[type, object, str, list[str], type]:
     from personaut.models.anthropic import (
         AVAILABLE_ANTHROPIC_MODELS,
         DEFAULT_ANTHROPIC_MODEL,
         AnthropicModel,
+        AsyncAnthropicModel,
         create_anthropic_model,
     )
 
-    return AnthropicModel, create_anthropic_model, DEFAULT_ANTHROPIC_MODEL, AVAILABLE_ANTHROPIC_MODELS
+    return (
+        AnthropicModel,
+        create_anthropic_model,
+        DEFAULT_ANTHROPIC_MODEL,
+        AVAILABLE_ANTHROPIC_MODELS,
+        AsyncAnthropicModel,
+    )
 
 
 # Registry
 from personaut.models.registry import (
+    ENV_EMBEDDING_CACHE,
     ENV_EMBEDDING_MODEL,
+    ENV_EMBEDDING_WORKERS,
+    ENV_LLM_CACHE,
     ENV_LLM_MODEL,
     ENV_LLM_PROVIDER,
     ModelRegistry,
     Provider,
+    get_async_llm,
+    get_cached_llm,
     get_embedding,
     get_llm,
     get_registry,
+    with_response_cache,
 )
 
 
 # Lazy loading for provider classes
 def __getattr__(name: str) -> object:
     """Lazy load provider classes."""
-    if name in ("GeminiModel", "create_gemini_model", "DEFAULT_GEMINI_MODEL", "AVAILABLE_GEMINI_MODELS"):
+    if name in (
+        "GeminiModel",
+        "AsyncGeminiModel",
+        "create_gemini_model",
+        "DEFAULT_GEMINI_MODEL",
+        "AVAILABLE_GEMINI_MODELS",
+    ):
         gemini_exports = _lazy_import_gemini()
         gemini_mapping: dict[str, object] = {
             "GeminiModel": gemini_exports[0],
             "create_gemini_model": gemini_exports[1],
             "DEFAULT_GEMINI_MODEL": gemini_exports[2],
             "AVAILABLE_GEMINI_MODELS": gemini_exports[3],
+            "AsyncGeminiModel": gemini_exports[4],
         }
         return gemini_mapping[name]
 
-    elif name in ("OpenAIModel", "create_openai_model", "DEFAULT_OPENAI_MODEL", "AVAILABLE_OPENAI_MODELS"):
+    elif name in (
+        "OpenAIModel",
+        "AsyncOpenAIModel",
+        "create_openai_model",
+        "DEFAULT_OPENAI_MODEL",
+        "AVAILABLE_OPENAI_MODELS",
+    ):
         openai_exports = _lazy_import_openai()
         openai_mapping: dict[str, object] = {
             "OpenAIModel": openai_exports[0],
             "create_openai_model": openai_exports[1],
             "DEFAULT_OPENAI_MODEL": openai_exports[2],
             "AVAILABLE_OPENAI_MODELS": openai_exports[3],
+            "AsyncOpenAIModel": openai_exports[4],
         }
         return openai_mapping[name]
 
-    elif name in ("BedrockModel", "create_bedrock_model", "BEDROCK_MODELS", "DEFAULT_BEDROCK_MODEL"):
+    elif name in (
+        "BedrockModel",
+        "AsyncBedrockModel",
+        "create_bedrock_model",
+        "BEDROCK_MODELS",
+        "DEFAULT_BEDROCK_MODEL",
+    ):
         bedrock_exports = _lazy_import_bedrock()
         bedrock_mapping: dict[str, object] = {
             "BedrockModel": bedrock_exports[0],
             "create_bedrock_model": bedrock_exports[1],
             "BEDROCK_MODELS": bedrock_exports[2],
             "DEFAULT_BEDROCK_MODEL": bedrock_exports[3],
+            "AsyncBedrockModel": bedrock_exports[4],
         }
         return bedrock_mapping[name]
 
-    elif name in ("AnthropicModel", "create_anthropic_model", "DEFAULT_ANTHROPIC_MODEL", "AVAILABLE_ANTHROPIC_MODELS"):
+    elif name in (
+        "AnthropicModel",
+        "AsyncAnthropicModel",
+        "create_anthropic_model",
+        "DEFAULT_ANTHROPIC_MODEL",
+        "AVAILABLE_ANTHROPIC_MODELS",
+    ):
         anthropic_exports = _lazy_import_anthropic()
         anthropic_mapping: dict[str, object] = {
             "AnthropicModel": anthropic_exports[0],
             "create_anthropic_model": anthropic_exports[1],
             "DEFAULT_ANTHROPIC_MODEL": anthropic_exports[2],
             "AVAILABLE_ANTHROPIC_MODELS": anthropic_exports[3],
+            "AsyncAnthropicModel": anthropic_exports[4],
         }
         return anthropic_mapping[name]
 
-    elif name in ("OllamaModel", "create_ollama_model", "DEFAULT_OLLAMA_MODEL", "DEFAULT_OLLAMA_HOST"):
+    elif name in (
+        "OllamaModel",
+        "AsyncOllamaModel",
+        "create_ollama_model",
+        "DEFAULT_OLLAMA_MODEL",
+        "DEFAULT_OLLAMA_HOST",
+    ):
         ollama_exports = _lazy_import_ollama()
         ollama_mapping: dict[str, object] = {
             "OllamaModel": ollama_exports[0],
             "create_ollama_model": ollama_exports[1],
             "DEFAULT_OLLAMA_MODEL": ollama_exports[2],
             "DEFAULT_OLLAMA_HOST": ollama_exports[3],
+            "AsyncOllamaModel": ollama_exports[4],
         }
         return ollama_mapping[name]
 
@@ -216,6 +291,16 @@ __all__ = [
     "AsyncModel",
     "ModelConfig",
     "GenerationResult",
+    "BatchGenerationResult",
+    # Response cache
+    "CachedModel",
+    "SQLiteResponseCache",
+    "ResponseCacheStats",
+    # Rate limiting and retries
+    "RateLimitedModel",
+    "AsyncRateLimitedModel",
+    "RateLimiter",
+    "RetryPolicy",
     # Model errors
     "ModelError",
     "RateLimitError",
@@ -234,37 +319,55 @@ __all__ = [
     # Local embedding
     "LocalEmbedding",
     "create_local_embedding",
+    "SQLiteEmbeddingCache",
+    "LRUEmbeddingCache",
+    "EmbeddingCacheStats",
+    "BatchingEmbedding",
+    "BatchingStats",
+    "ProcessPoolEmbedding",
+    "HashingEmbedding",
     # Registry
     "ModelRegistry",
     "Provider",
     "get_registry",
     "get_llm",
+    "get_cached_llm",
+    "with_response_cache",
+    "get_async_llm",
     "get_embedding",
     "ENV_LLM_PROVIDER",
     "ENV_LLM_MODEL",
     "ENV_EMBEDDING_MODEL",
+    "ENV_EMBEDDING_CACHE",
+    "ENV_EMBEDDING_WORKERS",
+    "ENV_LLM_CACHE",
     # Gemini (lazy)
     "GeminiModel",
+    "AsyncGeminiModel",
     "create_gemini_model",
     "DEFAULT_GEMINI_MODEL",
     "AVAILABLE_GEMINI_MODELS",
     # OpenAI (lazy)
     "OpenAIModel",
+    "AsyncOpenAIModel",
     "create_openai_model",
     "DEFAULT_OPENAI_MODEL",
     "AVAILABLE_OPENAI_MODELS",
     # Bedrock (lazy)
     "BedrockModel",
+    "AsyncBedrockModel",
     "create_bedrock_model",
     "BEDROCK_MODELS",
     "DEFAULT_BEDROCK_MODEL",
     # Anthropic (lazy)
     "AnthropicModel",
+    "AsyncAnthropicModel",
     "create_anthropic_model",
     "DEFAULT_ANTHROPIC_MODEL",
     "AVAILABLE_ANTHROPIC_MODELS",
     # Ollama (lazy)
     "OllamaModel",
+    "AsyncOllamaModel",
     "create_ollama_model",
     "DEFAULT_OLLAMA_MODEL",
     "DEFAULT_OLLAMA_HOST",
@@ -9,6 +9,10 @@ Example:
     >>> model = AnthropicModel()  # Uses ANTHROPIC_API_KEY env var
     >>> result = model.generate("Write a story about robots")
     >>> print(result.text)
+    >>>
+    >>> # Async, on the SDK's AsyncAnthropic client
+    >>> async with AsyncAnthropicModel() as model:
+    ...     results = await asyncio.gather(*(model.generate(p) for p in prompts))
 """
 
 from __future__ import annotations
@@ -20,6 +24,7 @@ from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, NoReturn, TypeVar
 
 from personaut.models.model import (
+    AsyncModel,
     AuthenticationError,
     GenerationResult,
     InvalidRequestError,
@@ -31,7 +36,7 @@ from personaut.models.model import (
 
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import AsyncIterator, Iterator
 
 logger = logging.getLogger(__name__)
 
@@ -155,56 +160,17 @@ class AnthropicModel(Model):
             ModelError: If generation fails.
         """
         client = self._ensure_client()
-
-        # Handle system message if provided
-        system = kwargs.pop("system", None)
-
-        # Build generation parameters
-        gen_kwargs: dict[str, Any] = {
-            "model": self.model,
-            "messages": [{"role": "user", "content": prompt}],
-            "max_tokens": max_tokens or self.config.max_tokens or 2048,
-        }
-
-        if system:
-            gen_kwargs["system"] = system
-
-        gen_kwargs["temperature"] = temperature if temperature is not None else self.config.temperature
-
-        if self.config.top_p and self.config.top_p != 0.95:
-            gen_kwargs["top_p"] = self.config.top_p
-
-        if self.config.top_k and self.config.top_k != 40:
-            gen_kwargs["top_k"] = self.config.top_k
-
-        if stop_sequences or self.config.stop_sequences:
-            gen_kwargs["stop_sequences"] = stop_sequences or self.config.stop_sequences
+        gen_kwargs = self._message_kwargs(
+            prompt,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            stop_sequences=stop_sequences,
+            system=kwargs.pop("system", None),
+        )
 
         try:
             response = client.messages.create(**gen_kwargs)
-
-            # Extract text from content blocks
-            text = ""
-            for block in response.content:
-                if hasattr(block, "text"):
-                    text += block.text
-
-            # Get usage
-            usage = {}
-            if response.usage:
-                usage = {
-                    "prompt_tokens": response.usage.input_tokens,
-                    "completion_tokens": response.usage.output_tokens,
-                    "total_tokens": response.usage.input_tokens + response.usage.output_tokens,
-                }
-
-            return GenerationResult(
-                text=text,
-                finish_reason=response.stop_reason or "stop",
-                usage=usage,
-                model=response.model,
-                raw_response=response,
-            )
+            return self._to_result(response)
 
         except Exception as e:
             self._handle_error(e)
@@ -234,36 +200,13 @@ class AnthropicModel(Model):
             ModelError: If generation or parsing fails.
         """
         # Manual JSON parsing (Claude API doesn't have native structured output like OpenAI)
-        schema_prompt = f"""
-{prompt}
-
-Respond ONLY with valid JSON matching this schema:
-{self._schema_to_json_schema(schema)}
-
-Output JSON only, no other text.
-"""
-
         result = self.generate(
-            schema_prompt,
+            self._structured_prompt(prompt, schema),
             temperature=temperature or 0.3,
             max_tokens=max_tokens,
             **kwargs,
         )
-
-        try:
-            text = result.text.strip()
-            if text.startswith("```"):
-                text = text.split("\n", 1)[1]
-            if text.endswith("```"):
-                text = text.rsplit("```", 1)[0]
-            text = text.strip()
-
-            data = json.loads(text)
-            return schema(**data)
-
-        except (json.JSONDecodeError, TypeError) as e:
-            msg = f"Failed to parse response as {schema.__name__}: {result.text[:100]}"
-            raise InvalidRequestError(msg, provider="anthropic", model=self.model, cause=e) from e
+        return self._parse_structured(result.text, schema)
 
     def generate_stream(
         self,
@@ -306,6 +249,90 @@ Output JSON only, no other text.
         except Exception as e:
             self._handle_error(e)
 
+    def _message_kwargs(
+        self,
+        prompt: str,
+        *,
+        temperature: float | None,
+        max_tokens: int | None,
+        stop_sequences: list[str] | None,
+        system: str | None,
+    ) -> dict[str, Any]:
+        """Build Messages API parameters for a prompt."""
+        gen_kwargs: dict[str, Any] = {
+            "model": self.model,
+            "messages": [{"role": "user", "content": prompt}],
+            "max_tokens": max_tokens or self.config.max_tokens or 2048,
+        }
+
+        if system:
+            gen_kwargs["system"] = system
+
+        gen_kwargs["temperature"] = temperature if temperature is not None else self.config.temperature
+
+        if self.config.top_p and self.config.top_p != 0.95:
+            gen_kwargs["top_p"] = self.config.top_p
+
+        if self.config.top_k and self.config.top_k != 40:
+            gen_kwargs["top_k"] = self.config.top_k
+
+        if stop_sequences or self.config.stop_sequences:
+            gen_kwargs["stop_sequences"] = stop_sequences or self.config.stop_sequences
+
+        return gen_kwargs
+
+    def _to_result(self, response: Any) -> GenerationResult:
+        """Convert a Messages API response to a GenerationResult."""
+        # Extract text from content blocks
+        text = ""
+        for block in response.content:
+            if hasattr(block, "text"):
+                text += block.text
+
+        usage = {}
+        if response.usage:
+            usage = {
+                "prompt_tokens": response.usage.input_tokens,
+                "completion_tokens": response.usage.output_tokens,
+                "total_tokens": response.usage.input_tokens + response.usage.output_tokens,
+            }
+
+        return GenerationResult(
+            text=text,
+            finish_reason=response.stop_reason or "stop",
+            usage=usage,
+            model=response.model,
+            raw_response=response,
+        )
+
+    def _structured_prompt(self, prompt: str, schema: type) -> str:
+        """Wrap a prompt with instructions to answer in JSON matching a schema."""
+        return f"""
+{prompt}
+
+Respond ONLY with valid JSON matching this schema:
+{self._schema_to_json_schema(schema)}
+
+Output JSON only, no other text.
+"""
+
+    def _parse_structured(self, text: str, schema: type[T]) -> T:
+        """Parse a JSON response (optionally in a code fence) into the schema type."""
+        try:
+            cleaned = text.strip()
+            if cleaned.startswith("```"):
+                cleaned = cleaned.split("\n", 1)[1]
+            if cleaned.endswith("```"):
+                cleaned = cleaned.rsplit("```", 1)[0]
+            cleaned = cleaned.strip()
+
+            data = json.loads(cleaned)
+            return schema(**data)
+
+        except (json.JSONDecodeError, TypeError) as e:
+            msg = f"Failed to parse response as {schema.__name__}: {text[:100]}"
+            raise InvalidRequestError(msg, provider="anthropic", model=self.model, cause=e) from e
+
     def _schema_to_json_schema(self, schema: type) -> str:
         """Convert a dataclass or Pydantic model to JSON schema description."""
         import dataclasses
@@ -337,6 +364,181 @@ Output JSON only, no other text.
             raise ModelError(str(e), provider="anthropic", model=self.model, cause=e) from e
 
 
+@dataclass
+class AsyncAnthropicModel(AsyncModel):
+    """Anthropic (Claude) model implementation on the SDK's ``AsyncAnthropic`` client.
+
+    Requests and responses are handled exactly as in :class:`AnthropicModel`,
+    but every call is awaited on a pooled async HTTP client, so a single
+    event loop can keep hundreds of generations in flight. The client is
+    bound to the event loop it was first used on.
+
+    Attributes:
+        api_key: Anthropic API key. If None, uses ANTHROPIC_API_KEY env var.
+        model: Anthropic model name.
+        config: Model configuration.
+
+    Example:
+        >>> async with AsyncAnthropicModel() as model:
+        ...     result = await model.generate("Explain neural networks")
+    """
+
+    api_key: str | None = None
+    model: str = DEFAULT_ANTHROPIC_MODEL
+    config: ModelConfig = field(default_factory=lambda: ModelConfig(model_name=DEFAULT_ANTHROPIC_MODEL))
+
+    # Private fields
+    _sync: AnthropicModel = field(init=False, repr=False, compare=False)
+    _client: Any = field(default=None, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Resolve credentials and configuration as AnthropicModel does."""
+        self._sync = AnthropicModel(api_key=self.api_key, model=self.model, config=self.config)
+        self.api_key = self._sync.api_key
+        self.config = self._sync.config
+
+    @property
+    def model_name(self) -> str:
+        """The name/identifier of the model."""
+        return self.model
+
+    @property
+    def provider(self) -> str:
+        """The provider name."""
+        return "anthropic"
+
+    def _ensure_client(self) -> Any:
+        """Ensure the async Anthropic client is initialized."""
+        if self._client is not None:
+            return self._client
+
+        try:
+            from anthropic import AsyncAnthropic
+        except ImportError as e:
+            msg = "anthropic is required for Anthropic models. Install with: pip install anthropic"
+            raise ModelError(msg, provider="anthropic", cause=e) from e
+
+        self._client = AsyncAnthropic(
+            api_key=self.api_key,
+            timeout=self.config.timeout,
+        )
+        return self._client
+
+    async def generate(
+        self,
+        prompt: str,
+        *,
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+        stop_sequences: list[str] | None = None,
+        **kwargs: Any,
+    ) -> GenerationResult:
+        """Generate text from a prompt asynchronously.
+
+        Args:
+            prompt: The input prompt.
+            temperature: Override default temperature.
+            max_tokens: Override default max tokens.
+            stop_sequences: Sequences that stop generation.
+            **kwargs: Additional options.
+
+        Returns:
+            GenerationResult with the generated text.
+
+        Raises:
+            ModelError: If generation fails.
+        """
+        client = self._ensure_client()
+        gen_kwargs = self._sync._message_kwargs(
+            prompt,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            stop_sequences=stop_sequences,
+            system=kwargs.pop("system", None),
+        )
+
+        try:
+            response = await client.messages.create(**gen_kwargs)
+            return self._sync._to_result(response)
+
+        except Exception as e:
+            self._sync._handle_error(e)
+
+    async def generate_structured(
+        self,
+        prompt: str,
+        schema: type[T],
+        *,
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+        **kwargs: Any,
+    ) -> T:
+        """Generate structured output matching a schema asynchronously.
+
+        Args:
+            prompt: The input prompt.
+            schema: A dataclass or Pydantic model to parse into.
+            temperature: Override default temperature.
+            max_tokens: Override default max tokens.
+            **kwargs: Additional options.
+
+        Returns:
+            An instance of the schema type.
+
+        Raises:
+            ModelError: If generation or parsing fails.
+        """
+        result = await self.generate(
+            self._sync._structured_prompt(prompt, schema),
+            temperature=temperature or 0.3,
+            max_tokens=max_tokens,
+            **kwargs,
+        )
+        return self._sync._parse_structured(result.text, schema)
+
+    async def generate_stream(
+        self,
+        prompt: str,
+        *,
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[str]:
+        """Generate text with async streaming.
+
+        Args:
+            prompt: The input prompt.
+            temperature: Override default temperature.
+            max_tokens: Override default max tokens.
+            **kwargs: Additional options.
+
+        Yields:
+            Text chunks as they are generated.
+        """
+        client = self._ensure_client()
+        gen_kwargs = self._sync._message_kwargs(
+            prompt,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            stop_sequences=None,
+            system=kwargs.pop("system", None),
+        )
+
+        try:
+            async with client.messages.stream(**gen_kwargs) as stream:
+                async for text in stream.text_stream:
+                    yield text
+
+        except Exception as e:
+            self._sync._handle_error(e)
+
+    async def aclose(self) -> None:
+        """Close the async client and its connection pool."""
+        client, self._client = self._client, None
+        if client is not None:
+            await client.close()
+
+
 def create_anthropic_model(
     model: str = DEFAULT_ANTHROPIC_MODEL,
     api_key: str | None = None,
@@ -373,6 +575,7 @@ def create_anthropic_model(
 __all__ = [
     "AVAILABLE_ANTHROPIC_MODELS",
     "DEFAULT_ANTHROPIC_MODEL",
+    "AsyncAnthropicModel",
     "AnthropicModel",
     "create_anthropic_model",
 ]
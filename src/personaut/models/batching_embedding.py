@@ -0,0 +1,264 @@
+"""Micro-batching embedding front-end for Personaut PDK.
+
+Concurrent request handlers each embed one short text (the incoming
+message) per search. Run one by one, those calls become batch-size-1
+forward passes competing for the same model. :class:`BatchingEmbedding`
+wraps any :class:`EmbeddingModel` and coalesces single-text calls made
+from many threads or coroutines: the first request of a batch waits up
+to ``max_wait`` seconds (or until ``max_batch_size`` requests are
+queued), then one ``embed_batch_array`` call serves them all.
+
+Example:
+    >>> from personaut.models import BatchingEmbedding, LocalEmbedding
+    >>>
+    >>> embed = BatchingEmbedding(LocalEmbedding(), max_wait=0.005)
+    >>> vector = embed.embed("Hello")  # from any thread
+    >>> vector = await embed.aembed("Hello")  # from a coroutine
+    >>> embed.stats().mean_batch_size
+    1.0
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+from numpy.typing import NDArray
+
+from personaut.models.embeddings import EmbeddingError, EmbeddingModel
+
+
+logger = logging.getLogger(__name__)
+
+# Seconds the first request of a batch waits for more requests
+DEFAULT_MAX_WAIT = 0.005
+
+# Requests per batch when the wrapped model has no batch_size
+DEFAULT_MAX_BATCH_SIZE = 32
+
+
+@dataclass(frozen=True)
+class BatchingStats:
+    """Snapshot of a :class:`BatchingEmbedding`'s counters.
+
+    Attributes:
+        requests: Single-text requests served.
+        batches: Batched model calls made for them.
+    """
+
+    requests: int
+    batches: int
+
+    @property
+    def mean_batch_size(self) -> float:
+        """Average requests per model call (0.0 before any batch)."""
+        return self.requests / self.batches if self.batches else 0.0
+
+
+@dataclass
+class _Request:
+    """A queued single-text embedding request."""
+
+    text: str
+    future: Future[NDArray[np.float32]]
+
+
+class BatchingEmbedding(EmbeddingModel):
+    """Embedding model that coalesces concurrent single-text calls.
+
+    :meth:`embed`, :meth:`embed_array`, :meth:`aembed` and
+    :meth:`aembed_array` enqueue the text and wait for a background
+    thread, which gathers queued requests into batches and embeds each
+    batch with one call to the wrapped model. Identical texts within a
+    batch are embedded once. :meth:`embed_batch` and
+    :meth:`embed_batch_array` are already batched and go straight to the
+    wrapped model.
+
+    The worker thread starts on the first request; call :meth:`close` (or
+    use the instance as a context manager) to stop it.
+
+    Attributes:
+        model: The wrapped embedding model.
+        max_batch_size: Most requests per model call (defaults to the
+            wrapped model's ``batch_size``, else 32).
+        max_wait: Seconds the first request of a batch waits for others.
+
+    Example:
+        >>> with BatchingEmbedding(LocalEmbedding()) as embed:
+        ...     with ThreadPoolExecutor(8) as pool:
+        ...         vectors = list(pool.map(embed.embed, messages))
+    """
+
+    def __init__(
+        self,
+        model: EmbeddingModel,
+        max_batch_size: int | None = None,
+        max_wait: float = DEFAULT_MAX_WAIT,
+    ) -> None:
+        """Wrap an embedding model.
+
+        Args:
+            model: The embedding model to batch calls for.
+            max_batch_size: Most requests per model call.
+            max_wait: Seconds the first request of a batch waits for others.
+
+        Raises:
+            ValueError: If ``max_batch_size`` is below 1 or ``max_wait`` is negative.
+        """
+        if max_batch_size is None:
+            max_batch_size = getattr(model, "batch_size", DEFAULT_MAX_BATCH_SIZE)
+        if max_batch_size < 1:
+            msg = f"max_batch_size must be at least 1, got {max_batch_size}"
+            raise ValueError(msg)
+        if max_wait < 0:
+            msg = f"max_wait must not be negative, got {max_wait}"
+            raise ValueError(msg)
+        self.model = model
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self._queue: queue.SimpleQueue[_Request | None] = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._worker: threading.Thread | None = None
+        self._closed = False
+        self._requests = 0
+        self._batches = 0
+
+    def __enter__(self) -> BatchingEmbedding:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    @property
+    def dimension(self) -> int:
+        """The dimensionality of the wrapped model's vectors."""
+        return self.model.dimension
+
+    @property
+    def model_name(self) -> str:
+        """The name/identifier of the wrapped model."""
+        return self.model.model_name
+
+    def is_loaded(self) -> bool:
+        """Check if the wrapped model is loaded."""
+        return self.model.is_loaded()
+
+    def submit(self, text: str) -> Future[NDArray[np.float32]]:
+        """Queue a text for the next batch without waiting for it.
+
+        Args:
+            text: The input text to embed.
+
+        Returns:
+            A future resolving to the text's float32 vector.
+
+        Raises:
+            EmbeddingError: If the instance has been closed.
+        """
+        future: Future[NDArray[np.float32]] = Future()
+        with self._lock:
+            if self._closed:
+                msg = "Cannot embed after the batching front-end was closed"
+                raise EmbeddingError(msg, model=self.model_name)
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._run, name="personaut-embedding-batcher", daemon=True)
+                self._worker.start()
+            self._queue.put(_Request(text, future))
+        return future
+
+    def embed(self, text: str) -> list[float]:
+        """Embed a text as part of the next batch, blocking until it is ready."""
+        return list(self.embed_array(text).tolist())
+
+    def embed_array(self, text: str) -> NDArray[np.float32]:
+        """Embed a text as part of the next batch, as a float32 array."""
+        return self.submit(text).result()
+
+    async def aembed(self, text: str) -> list[float]:
+        """Embed a text as part of the next batch without blocking the event loop."""
+        return list((await self.aembed_array(text)).tolist())
+
+    async def aembed_array(self, text: str) -> NDArray[np.float32]:
+        """Embed a text as part of the next batch, as a float32 array, without blocking."""
+        return await asyncio.wrap_future(self.submit(text))
+
+    def embed_batch(self, texts: list[str]) -> list[list[float]]:
+        """Embed texts with one call to the wrapped model."""
+        return self.model.embed_batch(texts)
+
+    def embed_batch_array(self, texts: list[str]) -> NDArray[np.float32]:
+        """Embed texts with one call to the wrapped model, as a float32 matrix."""
+        return self.model.embed_batch_array(texts)
+
+    def stats(self) -> BatchingStats:
+        """Get a snapshot of the request and batch counters."""
+        with self._lock:
+            return BatchingStats(requests=self._requests, batches=self._batches)
+
+    def close(self) -> None:
+        """Serve the requests already queued, then stop the worker thread."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            worker = self._worker
+            self._queue.put(None)
+        if worker is not None:
+            worker.join()
+
+    def _run(self) -> None:
+        """Worker loop: gather requests into batches until closed."""
+        while True:
+            first = self._queue.get()
+            if first is None:
+                return
+            batch = [first]
+            stopping = False
+            deadline = time.monotonic() + self.max_wait
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                try:
+                    request = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if request is None:
+                    stopping = True
+                    break
+                batch.append(request)
+            self._serve(batch)
+            if stopping:
+                return
+
+    def _serve(self, batch: list[_Request]) -> None:
+        """Embed one batch and resolve its futures."""
+        live = [request for request in batch if request.future.set_running_or_notify_cancel()]
+        if not live:
+            return
+        texts = list(dict.fromkeys(request.text for request in live))
+        try:
+            vectors = np.asarray(self.model.embed_batch_array(texts), dtype=np.float32)
+        except Exception as e:
+            logger.warning("Batched embedding of %d texts failed: %s", len(texts), e)
+            for request in live:
+                request.future.set_exception(e)
+            return
+        with self._lock:
+            self._requests += len(live)
+            self._batches += 1
+        rows = {text: vectors[i] for i, text in enumerate(texts)}
+        for request in live:
+            request.future.set_result(rows[request.text])
+
+
+__all__ = [
+    "DEFAULT_MAX_WAIT",
+    "BatchingEmbedding",
+    "BatchingStats",
+]
@@ -10,16 +10,23 @@ Example:
     >>> model = BedrockModel()  # Uses default AWS credentials
     >>> result = model.generate("Explain machine learning")
     >>> print(result.text)
+    >>>
+    >>> # Async (boto3 calls on a dedicated thread pool)
+    >>> async with AsyncBedrockModel() as model:
+    ...     results = await asyncio.gather(*(model.generate(p) for p in prompts))
 """
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, NoReturn, TypeVar
 
 from personaut.models.model import (
+    AsyncModel,
     AuthenticationError,
     GenerationResult,
     InvalidRequestError,
@@ -60,6 +67,10 @@ BEDROCK_MODELS = {
 }
 
 
+# Requests an AsyncBedrockModel keeps in flight at once
+DEFAULT_BEDROCK_MAX_CONCURRENCY = 64
+
+
 def _get_model_id(model: str) -> str:
     """Resolve model name to full Bedrock model ID."""
     # If it's already a full model ID, use it
@@ -182,16 +193,7 @@ class BedrockModel(Model):
         )
 
         try:
-            response = client.invoke_model(
-                modelId=self._model_id,
-                body=json.dumps(body),
-                contentType="application/json",
-                accept="application/json",
-            )
-
-            # Parse response based on model type
-            response_body = json.loads(response["body"].read())
-            return self._parse_response(response_body)
+            return self._invoke(client, body)
 
         except Exception as e:
             self._handle_error(e)
@@ -220,38 +222,13 @@ class BedrockModel(Model):
         Raises:
             ModelError: If generation or parsing fails.
         """
-        # Build a prompt asking for JSON output
-        schema_prompt = f"""
-{prompt}
-
-Respond ONLY with valid JSON matching this schema:
-{self._schema_to_json_schema(schema)}
-
-Output JSON only, no other text.
-"""
-
         result = self.generate(
-            schema_prompt,
+            self._structured_prompt(prompt, schema),
             temperature=temperature or 0.3,
             max_tokens=max_tokens,
             **kwargs,
         )
-
-        # Parse the response
-        try:
-            text = result.text.strip()
-            if text.startswith("```"):
-                text = text.split("\n", 1)[1]
-            if text.endswith("```"):
-                text = text.rsplit("```", 1)[0]
-            text = text.strip()
-
-            data = json.loads(text)
-            return schema(**data)
-
-        except (json.JSONDecodeError, TypeError) as e:
-            msg = f"Failed to parse response as {schema.__name__}: {result.text[:100]}"
-            raise InvalidRequestError(msg, provider="bedrock", model=self._model_id, cause=e) from e
+        return self._parse_structured(result.text, schema)
 
     def generate_stream(
         self,
@@ -301,6 +278,19 @@ Output JSON only, no other text.
         except Exception as e:
             self._handle_error(e)
 
+    def _invoke(self, client: Any, body: dict[str, Any]) -> GenerationResult:
+        """Invoke the model with a request body and parse its response."""
+        response = client.invoke_model(
+            modelId=self._model_id,
+            body=json.dumps(body),
+            contentType="application/json",
+            accept="application/json",
+        )
+
+        # Parse response based on model type
+        response_body = json.loads(response["body"].read())
+        return self._parse_response(response_body)
+
     def _build_request_body(
         self,
         prompt: str,
@@ -412,6 +402,34 @@ Output JSON only, no other text.
             return str(outputs[0].get("text", "")) if outputs else ""
         return ""
 
+    def _structured_prompt(self, prompt: str, schema: type) -> str:
+        """Wrap a prompt with instructions to answer in JSON matching a schema."""
+        return f"""
+{prompt}
+
+Respond ONLY with valid JSON matching this schema:
+{self._schema_to_json_schema(schema)}
+
+Output JSON only, no other text.
+"""
+
+    def _parse_structured(self, text: str, schema: type[T]) -> T:
+        """Parse a JSON response (optionally in a code fence) into the schema type."""
+        try:
+            cleaned = text.strip()
+            if cleaned.startswith("```"):
+                cleaned = cleaned.split("\n", 1)[1]
+            if cleaned.endswith("```"):
+                cleaned = cleaned.rsplit("```", 1)[0]
+            cleaned = cleaned.strip()
+
+            data = json.loads(cleaned)
+            return schema(**data)
+
+        except (json.JSONDecodeError, TypeError) as e:
+            msg = f"Failed to parse response as {schema.__name__}: {text[:100]}"
+            raise InvalidRequestError(msg, provider="bedrock", model=self._model_id, cause=e) from e
+
     def _schema_to_json_schema(self, schema: type) -> str:
         """Convert a dataclass or Pydantic model to JSON schema description."""
         import dataclasses
@@ -442,6 +460,165 @@ Output JSON only, no other text.
             raise ModelError(str(e), provider="bedrock", model=self._model_id, cause=e) from e
 
 
+@dataclass
+class AsyncBedrockModel(AsyncModel):
+    """AWS Bedrock model implementation for asyncio callers.
+
+    boto3 has no asyncio client, so each ``invoke_model`` call runs on a
+    thread pool owned by this model, against one boto3 client whose HTTP
+    connection pool is sized to match. Up to ``max_concurrency`` requests
+    are in flight at once and further calls wait their turn without
+    blocking the event loop. Requests and responses are handled exactly
+    as in :class:`BedrockModel`. Streaming yields the full text once.
+
+    Attributes:
+        model: Bedrock model name or shorthand.
+        region: AWS region for Bedrock.
+        config: Model configuration.
+        max_concurrency: Most requests in flight at once.
+
+    Example:
+        >>> async with AsyncBedrockModel(model="claude-3-5-sonnet") as model:
+        ...     results = await asyncio.gather(*(model.generate(p) for p in prompts))
+    """
+
+    model: str = DEFAULT_BEDROCK_MODEL
+    region: str = "us-east-1"
+    config: ModelConfig = field(default_factory=lambda: ModelConfig(model_name=DEFAULT_BEDROCK_MODEL))
+    max_concurrency: int = DEFAULT_BEDROCK_MAX_CONCURRENCY
+
+    # Private fields
+    _sync: BedrockModel = field(init=False, repr=False, compare=False)
+    _client: Any = field(default=None, repr=False, compare=False)
+    _executor: ThreadPoolExecutor | None = field(default=None, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Resolve the model ID and configuration as BedrockModel does.
+
+        Raises:
+            ValueError: If ``max_concurrency`` is below 1.
+        """
+        if self.max_concurrency < 1:
+            msg = f"max_concurrency must be at least 1, got {self.max_concurrency}"
+            raise ValueError(msg)
+        self._sync = BedrockModel(model=self.model, region=self.region, config=self.config)
+        self.config = self._sync.config
+
+    @property
+    def model_name(self) -> str:
+        """The name/identifier of the model."""
+        return self._sync.model_name
+
+    @property
+    def provider(self) -> str:
+        """The provider name."""
+        return "bedrock"
+
+    def _ensure_client(self) -> Any:
+        """Ensure the boto3 client and its thread pool are initialized."""
+        if self._client is not None:
+            return self._client
+
+        try:
+            import boto3
+            from botocore.config import Config
+        except ImportError as e:
+            msg = "boto3 is required for Bedrock models. Install with: pip install personaut[bedrock]"
+            raise ModelError(msg, provider="bedrock", cause=e) from e
+
+        try:
+            self._client = boto3.client(
+                "bedrock-runtime",
+                region_name=self.region,
+                config=Config(max_pool_connections=self.max_concurrency),
+            )
+        except Exception as e:
+            msg = f"Failed to initialize Bedrock client: {e}"
+            raise AuthenticationError(msg, provider="bedrock", model=self.model_name, cause=e) from e
+        self._executor = ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="bedrock")
+        return self._client
+
+    async def generate(
+        self,
+        prompt: str,
+        *,
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+        stop_sequences: list[str] | None = None,
+        **kwargs: Any,
+    ) -> GenerationResult:
+        """Generate text from a prompt asynchronously.
+
+        Args:
+            prompt: The input prompt.
+            temperature: Override default temperature.
+            max_tokens: Override default max tokens.
+            stop_sequences: Sequences that stop generation.
+            **kwargs: Additional options.
+
+        Returns:
+            GenerationResult with the generated text.
+
+        Raises:
+            ModelError: If generation fails.
+        """
+        client = self._ensure_client()
+        body = self._sync._build_request_body(
+            prompt=prompt,
+            temperature=temperature or self.config.temperature,
+            max_tokens=max_tokens or self.config.max_tokens,
+            stop_sequences=stop_sequences or self.config.stop_sequences,
+        )
+
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, self._sync._invoke, client, body)
+
+        except Exception as e:
+            self._sync._handle_error(e)
+
+    async def generate_structured(
+        self,
+        prompt: str,
+        schema: type[T],
+        *,
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+        **kwargs: Any,
+    ) -> T:
+        """Generate structured output matching a schema asynchronously.
+
+        Args:
+            prompt: The input prompt.
+            schema: A dataclass or Pydantic model to parse into.
+            temperature: Override default temperature.
+            max_tokens: Override default max tokens.
+            **kwargs: Additional options.
+
+        Returns:
+            An instance of the schema type.
+
+        Raises:
+            ModelError: If generation or parsing fails.
+        """
+        result = await self.generate(
+            self._sync._structured_prompt(prompt, schema),
+            temperature=temperature or 0.3,
+            max_tokens=max_tokens,
+            **kwargs,
+        )
+        return self._sync._parse_structured(result.text, schema)
+
+    async def aclose(self) -> None:
+        """Close the boto3 client and shut its thread pool down."""
+        client, self._client = self._client, None
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+        if client is not None:
+            client.close()
+
+
 def create_bedrock_model(
     model: str = "claude-3-5-haiku",
     region: str = "us-east-1",
@@ -477,7 +654,9 @@ def create_bedrock_model(
 
 __all__ = [
     "BEDROCK_MODELS",
+    "DEFAULT_BEDROCK_MAX_CONCURRENCY",
     "DEFAULT_BEDROCK_MODEL",
+    "AsyncBedrockModel",
     "BedrockModel",
     "create_bedrock_model",
 ]
@@ -0,0 +1,357 @@
+"""Embedding caches for Personaut PDK.
+
+This module provides the two cache tiers used by :class:`LocalEmbedding`:
+
+- :class:`LRUEmbeddingCache`: an in-process least-recently-used cache
+  bounded by entry count and approximate bytes, with hit-rate statistics.
+- :class:`SQLiteEmbeddingCache`: an on-disk, content-addressed cache keyed
+  by (model name, normalize flag, SHA-256 of the text), so every process
+  pointing at the same file - the API server, the UI server and
+  simulation workers - reuses vectors any of them has computed, and a
+  restarted process starts warm.
+
+Example:
+    >>> from personaut.models import LocalEmbedding, SQLiteEmbeddingCache
+    >>>
+    >>> cache = SQLiteEmbeddingCache("data/embeddings.db")
+    >>> embed = LocalEmbedding(disk_cache=cache)
+    >>> embed.embed_batch(["Hello", "World"])  # computed once, then read from disk
+    >>> embed.cache_stats.hit_rate
+    0.0
+"""
+
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+import sys
+import threading
+from collections import OrderedDict
+from collections.abc import Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+
+# Keys per SELECT, below SQLite's default bound-parameter limit
+_LOOKUP_CHUNK = 500
+
+# Default memory bound of the in-process cache (64 MiB)
+DEFAULT_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+
+def _text_digest(text: str) -> bytes:
+    """SHA-256 digest of a text, used as its cache key."""
+    return hashlib.sha256(text.encode("utf-8")).digest()
+
+
+def _entry_bytes(key: str, embedding: NDArray[Any]) -> int:
+    """Memory held by one cache entry (key string and array with its data)."""
+    return sys.getsizeof(key) + sys.getsizeof(embedding)
+
+
+@dataclass(frozen=True)
+class EmbeddingCacheStats:
+    """Snapshot of an :class:`LRUEmbeddingCache`'s counters.
+
+    Attributes:
+        hits: Lookups answered from the cache.
+        misses: Lookups that found nothing.
+        evictions: Entries dropped to stay within the bounds.
+        entries: Entries currently cached.
+        bytes: Approximate memory held by the cached entries.
+        max_entries: Entry bound.
+        max_bytes: Byte bound (None if unbounded).
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    bytes: int
+    max_entries: int
+    max_bytes: int | None
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups that hit (0.0 before any lookup)."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class LRUEmbeddingCache:
+    """In-process least-recently-used cache of embedding vectors.
+
+    Every hit moves the entry to the most-recent end, and inserts evict
+    from the least-recent end until both the entry bound and the byte
+    bound hold, so frequently repeated texts survive a stream of one-off
+    ones. Vectors are held as read-only NumPy arrays that own their data,
+    so the byte bound counts exactly what the cache keeps alive and hits
+    can be handed out without copying.
+
+    The instance is safe to share between threads.
+
+    Example:
+        >>> cache = LRUEmbeddingCache(max_entries=2)
+        >>> cache.put("a", [0.1])
+        >>> cache.put("b", [0.2])
+        >>> cache.get("a")
+        array([0.1])
+        >>> cache.put("c", [0.3])  # evicts "b", the least recently used
+        >>> "b" in cache
+        False
+    """
+
+    def __init__(self, max_entries: int = 1000, max_bytes: int | None = DEFAULT_CACHE_MAX_BYTES) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            max_entries: Maximum number of entries.
+            max_bytes: Maximum approximate bytes held (None for no byte bound).
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, NDArray[Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def __getitem__(self, key: str) -> NDArray[Any]:
+        with self._lock:
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+    def __setitem__(self, key: str, embedding: ArrayLike) -> None:
+        self.put(key, embedding)
+
+    def get(self, key: str) -> NDArray[Any] | None:
+        """Look up an entry, counting a hit or miss and refreshing its recency."""
+        with self._lock:
+            embedding = self._entries.get(key)
+            if embedding is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+            self._entries.move_to_end(key)
+            return embedding
+
+    def put(self, key: str, embedding: ArrayLike) -> None:
+        """Insert or replace an entry, evicting least-recently-used ones to fit.
+
+        The vector is copied into a read-only array, so callers may reuse
+        their buffer (e.g. a row of a batch output) afterwards. Entries
+        larger than ``max_bytes`` on their own are not cached.
+        """
+        embedding = np.array(embedding)
+        embedding.flags.writeable = False
+        size = _entry_bytes(key, embedding)
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= _entry_bytes(key, old)
+            if self.max_bytes is not None and size > self.max_bytes:
+                return
+            self._entries[key] = embedding
+            self._bytes += size
+            while len(self._entries) > self.max_entries or (
+                self.max_bytes is not None and self._bytes > self.max_bytes
+            ):
+                evicted_key, evicted = self._entries.popitem(last=False)
+                self._bytes -= _entry_bytes(evicted_key, evicted)
+                self._evictions += 1
+
+    def clear(self) -> None:
+        """Drop every entry; the hit, miss and eviction counters are kept."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> EmbeddingCacheStats:
+        """Get a snapshot of the cache's counters."""
+        with self._lock:
+            return EmbeddingCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=len(self._entries),
+                bytes=self._bytes,
+                max_entries=self.max_entries,
+                max_bytes=self.max_bytes,
+            )
+
+
+class SQLiteEmbeddingCache:
+    """Embedding cache stored in a SQLite database.
+
+    Vectors are stored as float32 blobs in a ``WITHOUT ROWID`` table whose
+    primary key is (model_name, normalize, text_hash). The database uses
+    WAL journaling, so several processes can read while one writes.
+    Lookups and write-backs are batched: :meth:`get_many` issues one query
+    per 500 texts and :meth:`put_many` writes all rows in one transaction.
+
+    The instance is safe to share between threads.
+
+    Attributes:
+        path: Path to the database file.
+
+    Example:
+        >>> cache = SQLiteEmbeddingCache("embeddings.db")
+        >>> cache.put_many("all-MiniLM-L6-v2", True, ["Hi"], [[0.6, 0.8]])
+        >>> cache.get_many("all-MiniLM-L6-v2", True, ["Hi", "Bye"])
+        [[0.6000000238418579, 0.800000011920929], None]
+    """
+
+    def __init__(self, path: str | Path, timeout: float = 30.0) -> None:
+        """Open (or create) the cache database.
+
+        Args:
+            path: Path to the database file. Parent directories are created.
+            timeout: Seconds to wait for another process's write lock.
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), timeout=timeout, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS embeddings (
+                model_name TEXT NOT NULL,
+                normalize INTEGER NOT NULL,
+                text_hash BLOB NOT NULL,
+                vector BLOB NOT NULL,
+                PRIMARY KEY (model_name, normalize, text_hash)
+            ) WITHOUT ROWID
+            """
+        )
+        self._conn.commit()
+
+    def __enter__(self) -> SQLiteEmbeddingCache:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def get_many(
+        self,
+        model_name: str,
+        normalize: bool,
+        texts: Sequence[str],
+    ) -> list[list[float] | None]:
+        """Look up cached embeddings.
+
+        Args:
+            model_name: Embedding model the vectors were computed with.
+            normalize: Whether the vectors were L2-normalized.
+            texts: Texts to look up.
+
+        Returns:
+            One entry per text: the cached vector, or None on a miss.
+        """
+        return [
+            None if vector is None else vector.tolist() for vector in self.get_many_arrays(model_name, normalize, texts)
+        ]
+
+    def get_many_arrays(
+        self,
+        model_name: str,
+        normalize: bool,
+        texts: Sequence[str],
+    ) -> list[NDArray[np.float32] | None]:
+        """Look up cached embeddings as float32 arrays read from the blobs.
+
+        Args:
+            model_name: Embedding model the vectors were computed with.
+            normalize: Whether the vectors were L2-normalized.
+            texts: Texts to look up.
+
+        Returns:
+            One entry per text: the cached vector, or None on a miss.
+        """
+        digests = [_text_digest(text) for text in texts]
+        found: dict[bytes, NDArray[np.float32]] = {}
+        unique = list(dict.fromkeys(digests))
+        with self._lock:
+            for start in range(0, len(unique), _LOOKUP_CHUNK):
+                chunk = unique[start : start + _LOOKUP_CHUNK]
+                placeholders = ", ".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    "SELECT text_hash, vector FROM embeddings "
+                    f"WHERE model_name = ? AND normalize = ? AND text_hash IN ({placeholders})",
+                    [model_name, int(normalize), *chunk],
+                ).fetchall()
+                for digest, blob in rows:
+                    found[digest] = np.frombuffer(blob, dtype=np.float32)
+        return [found.get(digest) for digest in digests]
+
+    def put_many(
+        self,
+        model_name: str,
+        normalize: bool,
+        texts: Sequence[str],
+        embeddings: Sequence[Sequence[float]] | NDArray[np.floating[Any]],
+    ) -> None:
+        """Store embeddings in a single transaction, replacing existing entries.
+
+        Args:
+            model_name: Embedding model the vectors were computed with.
+            normalize: Whether the vectors were L2-normalized.
+            texts: Texts the vectors belong to.
+            embeddings: One vector per text, or a 2D array with one row per text.
+
+        Raises:
+            ValueError: If ``texts`` and ``embeddings`` differ in length.
+        """
+        if len(texts) != len(embeddings):
+            msg = f"Got {len(embeddings)} embeddings for {len(texts)} texts"
+            raise ValueError(msg)
+        rows = [
+            (model_name, int(normalize), _text_digest(text), np.asarray(embedding, dtype=np.float32).tobytes())
+            for text, embedding in zip(texts, embeddings)
+        ]
+        with self._lock, self._conn:
+            self._conn.executemany("INSERT OR REPLACE INTO embeddings VALUES (?, ?, ?, ?)", rows)
+
+    def count(self, model_name: str | None = None) -> int:
+        """Count cached embeddings, optionally for one model."""
+        with self._lock:
+            if model_name is None:
+                row = self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()
+            else:
+                row = self._conn.execute(
+                    "SELECT COUNT(*) FROM embeddings WHERE model_name = ?", [model_name]
+                ).fetchone()
+        return int(row[0])
+
+    def clear(self, model_name: str | None = None) -> None:
+        """Delete cached embeddings, optionally only one model's."""
+        with self._lock, self._conn:
+            if model_name is None:
+                self._conn.execute("DELETE FROM embeddings")
+            else:
+                self._conn.execute("DELETE FROM embeddings WHERE model_name = ?", [model_name])
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+__all__ = [
+    "DEFAULT_CACHE_MAX_BYTES",
+    "EmbeddingCacheStats",
+    "LRUEmbeddingCache",
+    "SQLiteEmbeddingCache",
+]
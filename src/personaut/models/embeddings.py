@@ -19,6 +19,9 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 
+import numpy as np
+from numpy.typing import NDArray
+
 
 @dataclass
 class EmbeddingConfig:
@@ -124,6 +127,36 @@ class EmbeddingModel(ABC):
         """
         ...
 
+    def embed_array(self, text: str) -> NDArray[np.float32]:
+        """Generate an embedding for a single text as a float32 array.
+
+        The default converts :meth:`embed`'s list; implementations that
+        compute with NumPy should override it to skip the list entirely.
+
+        Args:
+            text: The input text to embed.
+
+        Returns:
+            A 1D float32 array of length :attr:`dimension`.
+        """
+        return np.asarray(self.embed(text), dtype=np.float32)
+
+    def embed_batch_array(self, texts: list[str]) -> NDArray[np.float32]:
+        """Generate embeddings for multiple texts as one float32 matrix.
+
+        The default converts :meth:`embed_batch`'s lists; implementations
+        that compute with NumPy should override it.
+
+        Args:
+            texts: List of input texts to embed.
+
+        Returns:
+            A float32 array of shape ``(len(texts), dimension)``.
+        """
+        if not texts:
+            return np.zeros((0, self.dimension), dtype=np.float32)
+        return np.asarray(self.embed_batch(texts), dtype=np.float32)
+
     def is_loaded(self) -> bool:
         """Check if the model is loaded and ready.
 
@@ -9,6 +9,10 @@ Example:
     >>> model = GeminiModel()  # Uses GOOGLE_API_KEY env var
     >>> result = model.generate("Explain quantum computing")
     >>> print(result.text)
+    >>>
+    >>> # Async, on the SDK's client.aio interface
+    >>> async with AsyncGeminiModel() as model:
+    ...     results = await asyncio.gather(*(model.generate(p) for p in prompts))
 """
 
 from __future__ import annotations
@@ -20,6 +24,7 @@ from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, NoReturn, TypeVar
 
 from personaut.models.model import (
+    AsyncModel,
     AuthenticationError,
     GenerationResult,
     InvalidRequestError,
@@ -31,7 +36,7 @@ from personaut.models.model import (
 
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import AsyncIterator, Iterator
 
 logger = logging.getLogger(__name__)
 
@@ -149,17 +154,11 @@ class GeminiModel(Model):
         Raises:
             ModelError: If generation fails.
         """
-        from google.genai import types
-
         client = self._ensure_client()
-
-        # Build generation config
-        gen_config = types.GenerateContentConfig(
-            temperature=temperature or self.config.temperature,
-            max_output_tokens=max_tokens or self.config.max_tokens,
-            top_p=self.config.top_p,
-            top_k=self.config.top_k,
-            stop_sequences=stop_sequences or self.config.stop_sequences or None,
+        gen_config = self._generation_config(
+            temperature=temperature,
+            max_tokens=max_tokens,
+            stop_sequences=stop_sequences,
         )
 
         try:
@@ -168,33 +167,7 @@ class GeminiModel(Model):
                 contents=prompt,
                 config=gen_config,
             )
-
-            # Extract text and metadata
-            text = response.text if hasattr(response, "text") else ""
-
-            # Get usage if available
-            usage = {}
-            if hasattr(response, "usage_metadata") and response.usage_metadata:
-                usage = {
-                    "prompt_tokens": getattr(response.usage_metadata, "prompt_token_count", 0),
-                    "completion_tokens": getattr(response.usage_metadata, "candidates_token_count", 0),
-                    "total_tokens": getattr(response.usage_metadata, "total_token_count", 0),
-                }
-
-            # Get finish reason
-            finish_reason = "stop"
-            if hasattr(response, "candidates") and response.candidates:
-                candidate = response.candidates[0]
-                if hasattr(candidate, "finish_reason"):
-                    finish_reason = str(candidate.finish_reason).lower()
-
-            return GenerationResult(
-                text=text,
-                finish_reason=finish_reason,
-                usage=usage,
-                model=self.model,
-                raw_response=response,
-            )
+            return self._to_result(response)
 
         except Exception as e:
             self._handle_error(e)
@@ -223,39 +196,13 @@ class GeminiModel(Model):
         Raises:
             ModelError: If generation or parsing fails.
         """
-        # Build a prompt asking for JSON output
-        schema_prompt = f"""
-{prompt}
-
-Respond ONLY with valid JSON matching this schema:
-{self._schema_to_json_schema(schema)}
-
-Output JSON only, no other text.
-"""
-
         result = self.generate(
-            schema_prompt,
+            self._structured_prompt(prompt, schema),
             temperature=temperature or 0.3,  # Lower temp for structured output
             max_tokens=max_tokens,
             **kwargs,
         )
-
-        # Parse the response
-        try:
-            # Clean up the response (remove markdown code blocks if present)
-            text = result.text.strip()
-            if text.startswith("```"):
-                text = text.split("\n", 1)[1]
-            if text.endswith("```"):
-                text = text.rsplit("```", 1)[0]
-            text = text.strip()
-
-            data = json.loads(text)
-            return schema(**data)
-
-        except (json.JSONDecodeError, TypeError) as e:
-            msg = f"Failed to parse response as {schema.__name__}: {result.text[:100]}"
-            raise InvalidRequestError(msg, provider="gemini", model=self.model, cause=e) from e
+        return self._parse_structured(result.text, schema)
 
     def generate_stream(
         self,
@@ -297,6 +244,80 @@ Output JSON only, no other text.
         except Exception as e:
             self._handle_error(e)
 
+    def _generation_config(
+        self,
+        *,
+        temperature: float | None,
+        max_tokens: int | None,
+        stop_sequences: list[str] | None,
+    ) -> Any:
+        """Build the GenerateContentConfig for a request."""
+        from google.genai import types
+
+        return types.GenerateContentConfig(
+            temperature=temperature or self.config.temperature,
+            max_output_tokens=max_tokens or self.config.max_tokens,
+            top_p=self.config.top_p,
+            top_k=self.config.top_k,
+            stop_sequences=stop_sequences or self.config.stop_sequences or None,
+        )
+
+    def _to_result(self, response: Any) -> GenerationResult:
+        """Convert a generate_content response to a GenerationResult."""
+        text = response.text if hasattr(response, "text") else ""
+
+        # Get usage if available
+        usage = {}
+        if hasattr(response, "usage_metadata") and response.usage_metadata:
+            usage = {
+                "prompt_tokens": getattr(response.usage_metadata, "prompt_token_count", 0),
+                "completion_tokens": getattr(response.usage_metadata, "candidates_token_count", 0),
+                "total_tokens": getattr(response.usage_metadata, "total_token_count", 0),
+            }
+
+        # Get finish reason
+        finish_reason = "stop"
+        if hasattr(response, "candidates") and response.candidates:
+            candidate = response.candidates[0]
+            if hasattr(candidate, "finish_reason"):
+                finish_reason = str(candidate.finish_reason).lower()
+
+        return GenerationResult(
+            text=text,
+            finish_reason=finish_reason,
+            usage=usage,
+            model=self.model,
+            raw_response=response,
+        )
+
+    def _structured_prompt(self, prompt: str, schema: type) -> str:
+        """Wrap a prompt with instructions to answer in JSON matching a schema."""
+        return f"""
+{prompt}
+
+Respond ONLY with valid JSON matching this schema:
+{self._schema_to_json_schema(schema)}
+
+Output JSON only, no other text.
+"""
+
+    def _parse_structured(self, text: str, schema: type[T]) -> T:
+        """Parse a JSON response (optionally in a code fence) into the schema type."""
+        try:
+            cleaned = text.strip()
+            if cleaned.startswith("```"):
+                cleaned = cleaned.split("\n", 1)[1]
+            if cleaned.endswith("```"):
+                cleaned = cleaned.rsplit("```", 1)[0]
+            cleaned = cleaned.strip()
+
+            data = json.loads(cleaned)
+            return schema(**data)
+
+        except (json.JSONDecodeError, TypeError) as e:
+            msg = f"Failed to parse response as {schema.__name__}: {text[:100]}"
+            raise InvalidRequestError(msg, provider="gemini", model=self.model, cause=e) from e
+
     def _schema_to_json_schema(self, schema: type) -> str:
         """Convert a dataclass or Pydantic model to JSON schema description."""
         import dataclasses
@@ -329,6 +350,184 @@ Output JSON only, no other text.
             raise ModelError(str(e), provider="gemini", model=self.model, cause=e) from e
 
 
+@dataclass
+class AsyncGeminiModel(AsyncModel):
+    """Google Gemini model implementation on the SDK's async (``client.aio``) interface.
+
+    Requests and responses are handled exactly as in :class:`GeminiModel`,
+    but every call is awaited on the SDK's pooled async HTTP client, so a
+    single event loop can keep hundreds of generations in flight. The
+    client is bound to the event loop it was first used on.
+
+    Attributes:
+        api_key: Google API key. If None, uses GOOGLE_API_KEY env var.
+        model: Gemini model name.
+        config: Model configuration.
+
+    Example:
+        >>> async with AsyncGeminiModel() as model:
+        ...     result = await model.generate("Write a haiku about AI")
+    """
+
+    api_key: str | None = None
+    model: str = DEFAULT_GEMINI_MODEL
+    config: ModelConfig = field(default_factory=lambda: ModelConfig(model_name=DEFAULT_GEMINI_MODEL))
+
+    # Private fields
+    _sync: GeminiModel = field(init=False, repr=False, compare=False)
+    _client: Any = field(default=None, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Resolve credentials and configuration as GeminiModel does."""
+        self._sync = GeminiModel(api_key=self.api_key, model=self.model, config=self.config)
+        self.api_key = self._sync.api_key
+        self.config = self._sync.config
+
+    @property
+    def model_name(self) -> str:
+        """The name/identifier of the model."""
+        return self.model
+
+    @property
+    def provider(self) -> str:
+        """The provider name."""
+        return "gemini"
+
+    def _ensure_client(self) -> Any:
+        """Ensure the async Gemini client (``genai.Client(...).aio``) is initialized."""
+        if self._client is not None:
+            return self._client
+
+        try:
+            from google import genai
+        except ImportError as e:
+            msg = "google-genai is required for Gemini models. Install with: pip install google-genai"
+            raise ModelError(msg, provider="gemini", cause=e) from e
+
+        self._client = genai.Client(api_key=self.api_key).aio
+        return self._client
+
+    async def generate(
+        self,
+        prompt: str,
+        *,
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+        stop_sequences: list[str] | None = None,
+        **kwargs: Any,
+    ) -> GenerationResult:
+        """Generate text from a prompt asynchronously.
+
+        Args:
+            prompt: The input prompt.
+            temperature: Override default temperature.
+            max_tokens: Override default max tokens.
+            stop_sequences: Sequences that stop generation.
+            **kwargs: Additional options.
+
+        Returns:
+            GenerationResult with the generated text.
+
+        Raises:
+            ModelError: If generation fails.
+        """
+        client = self._ensure_client()
+        gen_config = self._sync._generation_config(
+            temperature=temperature,
+            max_tokens=max_tokens,
+            stop_sequences=stop_sequences,
+        )
+
+        try:
+            response = await client.models.generate_content(
+                model=self.model,
+                contents=prompt,
+                config=gen_config,
+            )
+            return self._sync._to_result(response)
+
+        except Exception as e:
+            self._sync._handle_error(e)
+
+    async def generate_structured(
+        self,
+        prompt: str,
+        schema: type[T],
+        *,
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+        **kwargs: Any,
+    ) -> T:
+        """Generate structured output matching a schema asynchronously.
+
+        Args:
+            prompt: The input prompt.
+            schema: A dataclass or Pydantic model to parse into.
+            temperature: Override default temperature.
+            max_tokens: Override default max tokens.
+            **kwargs: Additional options.
+
+        Returns:
+            An instance of the schema type.
+
+        Raises:
+            ModelError: If generation or parsing fails.
+        """
+        result = await self.generate(
+            self._sync._structured_prompt(prompt, schema),
+            temperature=temperature or 0.3,  # Lower temp for structured output
+            max_tokens=max_tokens,
+            **kwargs,
+        )
+        return self._sync._parse_structured(result.text, schema)
+
+    async def generate_stream(
+        self,
+        prompt: str,
+        *,
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[str]:
+        """Generate text with async streaming.
+
+        Args:
+            prompt: The input prompt.
+            temperature: Override default temperature.
+            max_tokens: Override default max tokens.
+            **kwargs: Additional options.
+
+        Yields:
+            Text chunks as they are generated.
+        """
+        client = self._ensure_client()
+        gen_config = self._sync._generation_config(
+            temperature=temperature,
+            max_tokens=max_tokens,
+            stop_sequences=None,
+        )
+
+        try:
+            stream = await client.models.generate_content_stream(
+                model=self.model,
+                contents=prompt,
+                config=gen_config,
+            )
+            async for chunk in stream:
+                if hasattr(chunk, "text") and chunk.text:
+                    yield chunk.text
+
+        except Exception as e:
+            self._sync._handle_error(e)
+
+    async def aclose(self) -> None:
+        """Close the async client's connections (on SDK versions that support it)."""
+        client, self._client = self._client, None
+        close = getattr(client, "aclose", None)
+        if close is not None:
+            await close()
+
+
 def create_gemini_model(
     model: str = DEFAULT_GEMINI_MODEL,
     api_key: str | None = None,
@@ -365,6 +564,7 @@ def create_gemini_model(
 __all__ = [
     "AVAILABLE_GEMINI_MODELS",
     "DEFAULT_GEMINI_MODEL",
+    "AsyncGeminiModel",
     "GeminiModel",
     "create_gemini_model",
 ]
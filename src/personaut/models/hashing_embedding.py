@@ -0,0 +1,211 @@
+"""Hashing embedding model for Personaut PDK.
+
+This module provides :class:`HashingEmbedding`, an embedding model that
+needs nothing but NumPy. Texts are split into word n-grams and
+character n-grams, each feature is hashed to one of ``dimension``
+columns with a hashed sign, and the counts are optionally weighted by
+inverse document frequencies fitted on a corpus, then L2-normalized.
+
+There is no model to download or load, so it suits CI, benchmarks and
+small deployments without sentence-transformers, and it plugs into
+every ``VectorStore`` like any other ``EmbeddingModel``. Vectors capture
+shared vocabulary and spelling rather than meaning.
+
+Example:
+    >>> from personaut.models import HashingEmbedding
+    >>>
+    >>> embed = HashingEmbedding(dimension=256)
+    >>> embed.fit([m.description for m in memories])  # optional IDF weighting
+    >>> matrix = embed.embed_batch_array(["coffee with Alex", "walk in the park"])
+    >>> matrix.shape
+    (2, 256)
+"""
+
+from __future__ import annotations
+
+import functools
+import zlib
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+
+import numpy as np
+from numpy.typing import NDArray
+
+from personaut.memory.lexical import tokenize
+from personaut.models.embeddings import EmbeddingModel
+
+
+# Default number of hashed feature columns
+DEFAULT_HASHING_DIMENSION = 512
+
+# Distinct (feature, dimension) pairs whose hash is memoized
+_FEATURE_CACHE_SIZE = 1 << 16
+
+
+@functools.lru_cache(maxsize=_FEATURE_CACHE_SIZE)
+def _hash_feature(feature: str, dimension: int) -> tuple[int, float]:
+    """Map a feature to a (column, sign) pair.
+
+    CRC-32 is stable across processes (unlike ``hash()``), so vectors
+    written by one process can be searched from another.
+    """
+    digest = zlib.crc32(feature.encode("utf-8"))
+    return digest % dimension, 1.0 if digest & 0x80000000 else -1.0
+
+
+@functools.lru_cache(maxsize=_FEATURE_CACHE_SIZE)
+def _word_features(
+    word: str,
+    dimension: int,
+    char_ngrams: tuple[int, int] | None,
+) -> tuple[tuple[int, ...], tuple[float, ...]]:
+    """Columns and signs of a word and its character n-grams.
+
+    Words repeat across texts far more than n-grams of words do, so a
+    word's features are hashed once and reused.
+    """
+    features = [word]
+    if char_ngrams is not None:
+        low, high = char_ngrams
+        padded = f"<{word}>"
+        for n in range(low, min(high, len(padded)) + 1):
+            features.extend(f"#{padded[i : i + n]}" for i in range(len(padded) - n + 1))
+    hashed = [_hash_feature(feature, dimension) for feature in features]
+    return tuple(column for column, _ in hashed), tuple(sign for _, sign in hashed)
+
+
+@dataclass
+class HashingEmbedding(EmbeddingModel):
+    """Embedding model built from hashed word and character n-grams.
+
+    Attributes:
+        dimension: Number of hashed feature columns.
+        word_ngrams: Longest word n-gram used (1 for single words).
+        char_ngrams: Inclusive (min, max) character n-gram lengths taken
+            within each word, or None to use words only. They make
+            inflections and typos ("coffee", "coffees") share features.
+        use_idf: Whether :meth:`fit` weights features by inverse
+            document frequency.
+
+    Example:
+        >>> embed = HashingEmbedding()
+        >>> vector = embed.embed("Met Alex at the cafe")
+        >>> len(vector)
+        512
+    """
+
+    dimension: int = DEFAULT_HASHING_DIMENSION
+    word_ngrams: int = 2
+    char_ngrams: tuple[int, int] | None = (3, 4)
+    use_idf: bool = True
+
+    # Private fields
+    _idf: NDArray[np.float32] | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Validate the configuration.
+
+        Raises:
+            ValueError: If a size is below 1.
+        """
+        if self.dimension < 1:
+            msg = f"dimension must be at least 1, got {self.dimension}"
+            raise ValueError(msg)
+        if self.word_ngrams < 1:
+            msg = f"word_ngrams must be at least 1, got {self.word_ngrams}"
+            raise ValueError(msg)
+        if self.char_ngrams is not None and not 1 <= self.char_ngrams[0] <= self.char_ngrams[1]:
+            msg = f"char_ngrams must be an increasing pair of positive lengths, got {self.char_ngrams}"
+            raise ValueError(msg)
+
+    @property
+    def model_name(self) -> str:
+        """The name/identifier of the embedding model."""
+        return f"hashing-{self.dimension}"
+
+    @property
+    def is_fitted(self) -> bool:
+        """Whether IDF weights have been fitted."""
+        return self._idf is not None
+
+    def fit(self, texts: Iterable[str]) -> HashingEmbedding:
+        """Fit IDF weights on a corpus (e.g. the memory descriptions).
+
+        Uses the smoothed weight ``ln((1 + n) / (1 + df)) + 1``. Vectors
+        computed before fitting are not comparable with later ones, so
+        re-embed stored memories after calling this.
+
+        Args:
+            texts: Corpus documents.
+
+        Returns:
+            This model, for chaining.
+        """
+        counts = self._counts(list(texts))
+        n_docs = counts.shape[0]
+        document_frequency = np.count_nonzero(counts, axis=0)
+        self._idf = np.asarray(np.log((1.0 + n_docs) / (1.0 + document_frequency)) + 1.0, dtype=np.float32)
+        return self
+
+    def embed(self, text: str) -> list[float]:
+        """Generate an embedding for a single text."""
+        return list(self.embed_batch_array([text])[0].tolist())
+
+    def embed_array(self, text: str) -> NDArray[np.float32]:
+        """Generate an embedding for a single text as a float32 array."""
+        row: NDArray[np.float32] = self.embed_batch_array([text])[0]
+        return row
+
+    def embed_batch(self, texts: list[str]) -> list[list[float]]:
+        """Generate embeddings for multiple texts."""
+        return [list(row) for row in self.embed_batch_array(texts).tolist()]
+
+    def embed_batch_array(self, texts: list[str]) -> NDArray[np.float32]:
+        """Generate embeddings for multiple texts as one float32 matrix.
+
+        Args:
+            texts: List of input texts to embed.
+
+        Returns:
+            A ``(len(texts), dimension)`` array of unit-length rows (rows of
+            texts without any feature are zero).
+        """
+        matrix = self._counts(texts)
+        if self.use_idf and self._idf is not None:
+            matrix *= self._idf
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        matrix /= norms
+        return matrix
+
+    def _counts(self, texts: list[str]) -> NDArray[np.float32]:
+        """Signed hashed feature counts, one row per text, built with one bincount."""
+        columns: list[int] = []
+        signs: list[float] = []
+        lengths: list[int] = []
+        for text in texts:
+            words = tokenize(text)
+            start = len(columns)
+            for word in words:
+                word_columns, word_signs = _word_features(word, self.dimension, self.char_ngrams)
+                columns.extend(word_columns)
+                signs.extend(word_signs)
+            for n in range(2, self.word_ngrams + 1):
+                for i in range(len(words) - n + 1):
+                    column, sign = _hash_feature(" ".join(words[i : i + n]), self.dimension)
+                    columns.append(column)
+                    signs.append(sign)
+            lengths.append(len(columns) - start)
+        rows = np.repeat(np.arange(len(texts), dtype=np.int64), lengths)
+        flat = np.bincount(
+            rows * self.dimension + np.asarray(columns, dtype=np.int64),
+            weights=np.asarray(signs, dtype=np.float64),
+            minlength=len(texts) * self.dimension,
+        )
+        return flat.reshape(len(texts), self.dimension).astype(np.float32)
+
+
+__all__ = [
+    "DEFAULT_HASHING_DIMENSION",
+    "HashingEmbedding",
+]
@@ -13,6 +13,12 @@ Example:
     >>> # Use a specific model
     >>> embed = LocalEmbedding("BAAI/bge-large-en-v1.5")
     >>> vectors = embed.embed_batch(["Text 1", "Text 2"])
+    >>>
+    >>> # Float32 matrix for bulk ingestion, no Python lists involved
+    >>> matrix = embed.embed_batch_array(["Text 1", "Text 2"])
+    >>>
+    >>> # Share computed vectors across processes and restarts
+    >>> embed = LocalEmbedding(disk_cache="data/embeddings.db")
 """
 
 from __future__ import annotations
@@ -20,8 +26,18 @@ from __future__ import annotations
 import hashlib
 import logging
 from dataclasses import dataclass, field
+from pathlib import Path
 from typing import Any
 
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from personaut.models.embedding_cache import (
+    DEFAULT_CACHE_MAX_BYTES,
+    EmbeddingCacheStats,
+    LRUEmbeddingCache,
+    SQLiteEmbeddingCache,
+)
 from personaut.models.embeddings import (
     DEFAULT_MODEL_SMALL,
     EMBEDDING_MODELS,
@@ -63,6 +79,8 @@ class LocalEmbedding(EmbeddingModel):
 
     This class provides embedding generation using locally-running models.
     It supports lazy loading, caching, and automatic device selection.
+    Embeddings are looked up in the in-process cache first, then in the
+    optional on-disk cache, and only the remaining texts reach the model.
 
     Attributes:
         model_path: HuggingFace model identifier or local path.
@@ -70,6 +88,10 @@ class LocalEmbedding(EmbeddingModel):
         batch_size: Maximum batch size for embedding.
         normalize: Whether to L2-normalize embeddings.
         cache_size: Number of embeddings to cache (0 to disable).
+        cache_max_bytes: Approximate memory bound of the cache (None for
+            no byte bound). Least recently used entries are evicted first.
+        disk_cache: Persistent cache shared across processes, or a path
+            to open one at (None to disable).
 
     Example:
         >>> embed = LocalEmbedding()
@@ -87,11 +109,13 @@ class LocalEmbedding(EmbeddingModel):
     batch_size: int = 32
     normalize: bool = True
     cache_size: int = 1000
+    cache_max_bytes: int | None = DEFAULT_CACHE_MAX_BYTES
+    disk_cache: SQLiteEmbeddingCache | str | Path | None = None
 
     # Private fields
     _model: Any = field(default=None, repr=False, compare=False)
     _dimension: int = field(default=0, repr=False, compare=False)
-    _cache: dict[str, list[float]] = field(default_factory=dict, repr=False, compare=False)
+    _cache: LRUEmbeddingCache = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         """Initialize the embedding model."""
@@ -103,6 +127,10 @@ class LocalEmbedding(EmbeddingModel):
         if self.model_path in EMBEDDING_MODELS:
             self._dimension = EMBEDDING_MODELS[self.model_path]
 
+        self._cache = LRUEmbeddingCache(max_entries=self.cache_size, max_bytes=self.cache_max_bytes)
+        if isinstance(self.disk_cache, (str, Path)):
+            self.disk_cache = SQLiteEmbeddingCache(self.disk_cache)
+
     @property
     def dimension(self) -> int:
         """The dimensionality of the embedding vectors."""
@@ -159,31 +187,23 @@ class LocalEmbedding(EmbeddingModel):
         Raises:
             EmbeddingError: If embedding generation fails.
         """
-        # Check cache
-        if self.cache_size > 0:
-            cache_key = _hash_text(text)
-            if cache_key in self._cache:
-                return self._cache[cache_key]
+        return list(self._embed_one(text).tolist())
 
-        self._ensure_loaded()
+    def embed_array(self, text: str) -> NDArray[np.float32]:
+        """Generate an embedding for a single text as a float32 array.
 
-        try:
-            embedding = self._model.encode(
-                text,
-                normalize_embeddings=self.normalize,
-                convert_to_numpy=True,
-            )
-            result: list[float] = list(embedding.tolist())
+        Cached vectors are returned without copying, as read-only arrays.
 
-            # Update cache
-            if self.cache_size > 0:
-                self._update_cache(cache_key, result)
+        Args:
+            text: The input text to embed.
 
-            return result
+        Returns:
+            A 1D float32 array.
 
-        except Exception as e:
-            msg = "Failed to generate embedding for text"
-            raise EmbeddingError(msg, model=self.model_path, cause=e) from e
+        Raises:
+            EmbeddingError: If embedding generation fails.
+        """
+        return np.asarray(self._embed_one(text), dtype=np.float32)
 
     def embed_batch(self, texts: list[str]) -> list[list[float]]:
         """Generate embeddings for multiple texts.
@@ -194,63 +214,156 @@ class LocalEmbedding(EmbeddingModel):
         Returns:
             List of embedding vectors, one per input text.
 
+        Raises:
+            EmbeddingError: If embedding generation fails.
+        """
+        return [row.tolist() for row in self._embed_rows(texts)]
+
+    def embed_batch_array(self, texts: list[str]) -> NDArray[np.float32]:
+        """Generate embeddings for multiple texts as one float32 matrix.
+
+        The vectors never pass through Python lists, so the matrix can go
+        straight to :meth:`SQLiteVectorStore.store_many` or a NumPy store.
+
+        Args:
+            texts: List of input texts to embed.
+
+        Returns:
+            A ``(len(texts), dimension)`` float32 array.
+
         Raises:
             EmbeddingError: If embedding generation fails.
         """
+        if not texts:
+            return np.zeros((0, self._dimension), dtype=np.float32)
+        return np.asarray(np.stack(self._embed_rows(texts)), dtype=np.float32)
+
+    def _embed_one(self, text: str) -> NDArray[Any]:
+        """Embed one text through the memory cache, disk cache and model."""
+        # Check cache
+        if self.cache_size > 0:
+            cache_key = _hash_text(text)
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        stored = self._disk_lookup([text])[0]
+        if stored is not None:
+            if self.cache_size > 0:
+                self._update_cache(cache_key, stored)
+            return stored
+
+        self._ensure_loaded()
+
+        try:
+            embedding = np.asarray(
+                self._model.encode(
+                    text,
+                    normalize_embeddings=self.normalize,
+                    convert_to_numpy=True,
+                )
+            )
+        except Exception as e:
+            msg = "Failed to generate embedding for text"
+            raise EmbeddingError(msg, model=self.model_path, cause=e) from e
+
+        # Update cache
+        if self.cache_size > 0:
+            self._update_cache(cache_key, embedding)
+        self._disk_store([text], embedding[np.newaxis])
+
+        return embedding
+
+    def _embed_rows(self, texts: list[str]) -> list[NDArray[Any]]:
+        """Embed texts through the memory cache, disk cache and model, one array per text."""
         if not texts:
             return []
 
         # Check cache for existing embeddings
-        results: list[list[float] | None] = [None] * len(texts)
+        results: list[NDArray[Any] | None] = [None] * len(texts)
         texts_to_embed: list[tuple[int, str]] = []
 
         if self.cache_size > 0:
             for i, text in enumerate(texts):
-                cache_key = _hash_text(text)
-                if cache_key in self._cache:
-                    results[i] = self._cache[cache_key]
+                cached = self._cache.get(_hash_text(text))
+                if cached is not None:
+                    results[i] = cached
                 else:
                     texts_to_embed.append((i, text))
         else:
             texts_to_embed = list(enumerate(texts))
 
+        # Check the disk cache for texts missing from memory
+        if texts_to_embed:
+            stored = self._disk_lookup([t for _, t in texts_to_embed])
+            remaining: list[tuple[int, str]] = []
+            for (i, text), embedding in zip(texts_to_embed, stored):
+                if embedding is None:
+                    remaining.append((i, text))
+                    continue
+                results[i] = embedding
+                if self.cache_size > 0:
+                    self._update_cache(_hash_text(text), embedding)
+            texts_to_embed = remaining
+
         # Embed texts not in cache
         if texts_to_embed:
             self._ensure_loaded()
 
             try:
                 uncached_texts = [t for _, t in texts_to_embed]
-                embeddings = self._model.encode(
-                    uncached_texts,
-                    normalize_embeddings=self.normalize,
-                    convert_to_numpy=True,
-                    batch_size=self.batch_size,
-                    show_progress_bar=len(uncached_texts) > 100,
+                embeddings = np.asarray(
+                    self._model.encode(
+                        uncached_texts,
+                        normalize_embeddings=self.normalize,
+                        convert_to_numpy=True,
+                        batch_size=self.batch_size,
+                        show_progress_bar=len(uncached_texts) > 100,
+                    )
                 )
-
-                for j, (i, text) in enumerate(texts_to_embed):
-                    embedding = embeddings[j].tolist()
-                    results[i] = embedding
-
-                    # Update cache
-                    if self.cache_size > 0:
-                        cache_key = _hash_text(text)
-                        self._update_cache(cache_key, embedding)
-
             except Exception as e:
                 msg = "Failed to generate batch embeddings"
                 raise EmbeddingError(msg, model=self.model_path, cause=e) from e
 
+            for j, (i, text) in enumerate(texts_to_embed):
+                results[i] = embeddings[j]
+
+                # Update cache
+                if self.cache_size > 0:
+                    self._update_cache(_hash_text(text), embeddings[j])
+
+            self._disk_store(uncached_texts, embeddings)
+
         # Type narrowing - all results should be populated now
         return [r for r in results if r is not None]
 
-    def _update_cache(self, key: str, embedding: list[float]) -> None:
+    def _disk_lookup(self, texts: list[str]) -> list[NDArray[np.float32] | None]:
+        """Look texts up in the disk cache; a failing cache counts as misses."""
+        if not isinstance(self.disk_cache, SQLiteEmbeddingCache):
+            return [None] * len(texts)
+        try:
+            return self.disk_cache.get_many_arrays(self.model_path, self.normalize, texts)
+        except Exception as e:
+            logger.warning("Embedding disk cache lookup failed: %s", e)
+            return [None] * len(texts)
+
+    def _disk_store(self, texts: list[str], embeddings: NDArray[Any]) -> None:
+        """Write computed embeddings back to the disk cache in one transaction."""
+        if not isinstance(self.disk_cache, SQLiteEmbeddingCache) or not texts:
+            return
+        try:
+            self.disk_cache.put_many(self.model_path, self.normalize, texts, embeddings)
+        except Exception as e:
+            logger.warning("Embedding disk cache write failed: %s", e)
+
+    def _update_cache(self, key: str, embedding: ArrayLike) -> None:
         """Update the embedding cache with LRU eviction."""
-        if len(self._cache) >= self.cache_size:
-            # Simple FIFO eviction (not true LRU but good enough)
-            oldest_key = next(iter(self._cache))
-            del self._cache[oldest_key]
-        self._cache[key] = embedding
+        self._cache.put(key, embedding)
+
+    @property
+    def cache_stats(self) -> EmbeddingCacheStats:
+        """Hits, misses, evictions and bytes of the in-process cache."""
+        return self._cache.stats()
 
     def clear_cache(self) -> None:
         """Clear the embedding cache."""
@@ -271,6 +384,8 @@ def create_local_embedding(
     batch_size: int = 32,
     normalize: bool = True,
     cache_size: int = 1000,
+    cache_max_bytes: int | None = DEFAULT_CACHE_MAX_BYTES,
+    disk_cache: SQLiteEmbeddingCache | str | Path | None = None,
 ) -> LocalEmbedding:
     """Create a local embedding model.
 
@@ -280,6 +395,8 @@ def create_local_embedding(
         batch_size: Maximum batch size for embedding.
         normalize: Whether to L2-normalize embeddings.
         cache_size: Number of embeddings to cache.
+        cache_max_bytes: Approximate memory bound of the cache.
+        disk_cache: Persistent cache, or a path to open one at.
 
     Returns:
         Configured LocalEmbedding instance.
@@ -294,6 +411,8 @@ def create_local_embedding(
         batch_size=batch_size,
         normalize=normalize,
         cache_size=cache_size,
+        cache_max_bytes=cache_max_bytes,
+        disk_cache=disk_cache,
     )
 
 
@@ -15,17 +15,22 @@ Example:
 
 from __future__ import annotations
 
+import asyncio
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, TypeVar
 
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncIterator, Iterator
+    from collections.abc import AsyncIterator, Iterator, Sequence
 
 
 T = TypeVar("T")
 
+# Requests generate_many keeps in flight when no limit is given
+DEFAULT_MAX_CONCURRENCY = 8
+
 
 @dataclass
 class ModelConfig:
@@ -83,6 +88,56 @@ class GenerationResult:
     raw_response: Any = None
 
 
+@dataclass
+class BatchGenerationResult:
+    """Results of :meth:`Model.generate_many`, in prompt order.
+
+    Attributes:
+        results: One result per prompt (None where the prompt failed).
+        errors: One entry per prompt: the exception it raised, or None.
+        usage: Token usage summed over the successful results.
+
+    Example:
+        >>> batch = model.generate_many(prompts, max_concurrency=4)
+        >>> for text, error in zip(batch.texts, batch.errors):
+        ...     print(text if error is None else f"failed: {error}")
+    """
+
+    results: list[GenerationResult | None]
+    errors: list[Exception | None]
+    usage: dict[str, int] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(self.results)
+
+    @property
+    def texts(self) -> list[str | None]:
+        """Generated text per prompt (None where the prompt failed)."""
+        return [None if result is None else result.text for result in self.results]
+
+    @property
+    def failed(self) -> int:
+        """Number of prompts that raised an error."""
+        return sum(error is not None for error in self.errors)
+
+
+def _collect_batch(outcomes: list[GenerationResult | Exception]) -> BatchGenerationResult:
+    """Split per-prompt outcomes into results and errors and sum the usage."""
+    results: list[GenerationResult | None] = []
+    errors: list[Exception | None] = []
+    usage: dict[str, int] = {}
+    for outcome in outcomes:
+        if isinstance(outcome, Exception):
+            results.append(None)
+            errors.append(outcome)
+            continue
+        results.append(outcome)
+        errors.append(None)
+        for key, value in outcome.usage.items():
+            usage[key] = usage.get(key, 0) + value
+    return BatchGenerationResult(results=results, errors=errors, usage=usage)
+
+
 class Model(ABC):
     """Abstract base class for LLM text generation models.
 
@@ -191,13 +246,74 @@ class Model(ABC):
         )
         yield result.text
 
+    def generate_many(
+        self,
+        prompts: Sequence[str],
+        *,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+        stop_sequences: list[str] | None = None,
+        **kwargs: Any,
+    ) -> BatchGenerationResult:
+        """Generate text for independent prompts in parallel.
+
+        Up to ``max_concurrency`` :meth:`generate` calls run at once on a
+        thread pool; the provider clients release the GIL while waiting on
+        the network. A failing prompt does not stop the others: its
+        exception is recorded in ``errors``.
+
+        Args:
+            prompts: The input prompts.
+            max_concurrency: Most requests in flight at once.
+            temperature: Override default temperature.
+            max_tokens: Override default max tokens.
+            stop_sequences: Sequences that stop generation.
+            **kwargs: Additional provider-specific options, applied to every prompt.
+
+        Returns:
+            BatchGenerationResult with one entry per prompt, in order.
+
+        Raises:
+            ValueError: If ``max_concurrency`` is below 1.
+        """
+        if max_concurrency < 1:
+            msg = f"max_concurrency must be at least 1, got {max_concurrency}"
+            raise ValueError(msg)
+
+        def generate_one(prompt: str) -> GenerationResult | Exception:
+            try:
+                return self.generate(
+                    prompt, temperature=temperature, max_tokens=max_tokens, stop_sequences=stop_sequences, **kwargs
+                )
+            except Exception as e:
+                return e
+
+        workers = min(max_concurrency, len(prompts))
+        if workers <= 1:
+            return _collect_batch([generate_one(prompt) for prompt in prompts])
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="generate-many") as pool:
+            return _collect_batch(list(pool.map(generate_one, prompts)))
+
 
 class AsyncModel(ABC):
     """Abstract base class for async LLM text generation models.
 
-    Use this for providers that support async operations.
+    Use this for providers that support async operations. Implementations
+    hold pooled async clients; close them with :meth:`aclose` or by using
+    the model as an async context manager.
+
+    Example:
+        >>> async with AsyncOpenAIModel() as model:
+        ...     results = await asyncio.gather(*(model.generate(p) for p in prompts))
     """
 
+    async def __aenter__(self) -> AsyncModel:
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.aclose()
+
     @property
     @abstractmethod
     def model_name(self) -> str:
@@ -252,6 +368,56 @@ class AsyncModel(ABC):
         )
         yield result.text
 
+    async def generate_many(
+        self,
+        prompts: Sequence[str],
+        *,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+        **kwargs: Any,
+    ) -> BatchGenerationResult:
+        """Generate text for independent prompts concurrently.
+
+        Up to ``max_concurrency`` :meth:`generate` calls are awaited at
+        once, bounded by a semaphore. A failing prompt does not stop the
+        others: its exception is recorded in ``errors``.
+
+        Args:
+            prompts: The input prompts.
+            max_concurrency: Most requests in flight at once.
+            temperature: Override default temperature.
+            max_tokens: Override default max tokens.
+            **kwargs: Additional provider-specific options, applied to every prompt.
+
+        Returns:
+            BatchGenerationResult with one entry per prompt, in order.
+
+        Raises:
+            ValueError: If ``max_concurrency`` is below 1.
+        """
+        if max_concurrency < 1:
+            msg = f"max_concurrency must be at least 1, got {max_concurrency}"
+            raise ValueError(msg)
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def generate_one(prompt: str) -> GenerationResult | Exception:
+            async with semaphore:
+                try:
+                    return await self.generate(prompt, temperature=temperature, max_tokens=max_tokens, **kwargs)
+                except Exception as e:
+                    return e
+
+        return _collect_batch(list(await asyncio.gather(*(generate_one(prompt) for prompt in prompts))))
+
+    async def aclose(self) -> None:
+        """Release the model's client connections.
+
+        Default implementation does nothing. Override in subclasses that
+        hold a client.
+        """
+        return None
+
 
 class ModelError(Exception):
     """Base exception for model-related errors."""
@@ -294,6 +460,8 @@ __all__ = [
     # Config and results
     "ModelConfig",
     "GenerationResult",
+    "BatchGenerationResult",
+    "DEFAULT_MAX_CONCURRENCY",
     # Exceptions
     "ModelError",
     "RateLimitError",
@@ -9,16 +9,23 @@ Example:
     >>> model = OllamaModel()  # Connects to localhost:11434
     >>> result = model.generate("Explain gravity")
     >>> print(result.text)
+    >>>
+    >>> # Async, on a pooled httpx.AsyncClient
+    >>> async with AsyncOllamaModel() as model:
+    ...     results = await asyncio.gather(*(model.generate(p) for p in prompts))
 """
 
 from __future__ import annotations
 
 import json
 import logging
+import threading
+import time
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, NoReturn, TypeVar
 
 from personaut.models.model import (
+    AsyncModel,
     GenerationResult,
     InvalidRequestError,
     Model,
@@ -28,7 +35,7 @@ from personaut.models.model import (
 
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import AsyncIterator, Iterator
 
 logger = logging.getLogger(__name__)
 
@@ -38,6 +45,15 @@ T = TypeVar("T")
 DEFAULT_OLLAMA_HOST = "http://localhost:11434"
 DEFAULT_OLLAMA_MODEL = "llama3.2"
 
+# Most connections a model keeps open to the server
+DEFAULT_OLLAMA_MAX_CONNECTIONS = 100
+
+# Seconds an idle keep-alive connection stays in the pool
+DEFAULT_OLLAMA_KEEPALIVE_EXPIRY = 30.0
+
+# Seconds before an unreachable server is probed again
+DEFAULT_OLLAMA_HEALTH_CHECK_INTERVAL = 5.0
+
 
 @dataclass
 class OllamaModel(Model):
@@ -45,11 +61,21 @@ class OllamaModel(Model):
 
     This class provides access to locally-running models via Ollama.
     It auto-detects the Ollama server and supports streaming responses.
+    Requests share one long-lived ``httpx.Client`` whose keep-alive
+    connections are reused across calls and threads; call :meth:`close`
+    to release them.
 
     Attributes:
         model: Ollama model name (e.g., "llama3.2", "mistral").
         host: Ollama server URL.
         config: Model configuration.
+        max_connections: Most concurrent connections to the server;
+            further requests wait for a free one.
+        max_keepalive_connections: Most idle connections kept open for
+            reuse (None for ``max_connections``).
+        keepalive_expiry: Seconds an idle connection is kept open.
+        health_check_interval: Seconds before :meth:`is_available` probes
+            an unreachable server again.
 
     Example:
         >>> model = OllamaModel()
@@ -63,12 +89,30 @@ class OllamaModel(Model):
     model: str = DEFAULT_OLLAMA_MODEL
     host: str = DEFAULT_OLLAMA_HOST
     config: ModelConfig = field(default_factory=lambda: ModelConfig(model_name=DEFAULT_OLLAMA_MODEL))
+    max_connections: int = DEFAULT_OLLAMA_MAX_CONNECTIONS
+    max_keepalive_connections: int | None = None
+    keepalive_expiry: float = DEFAULT_OLLAMA_KEEPALIVE_EXPIRY
+    health_check_interval: float = DEFAULT_OLLAMA_HEALTH_CHECK_INTERVAL
 
     # Private fields
     _available: bool | None = field(default=None, repr=False, compare=False)
+    _checked_at: float = field(default=0.0, repr=False, compare=False)
+    _client: Any = field(default=None, repr=False, compare=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+    _slots: threading.BoundedSemaphore = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
-        """Initialize configuration."""
+        """Initialize configuration.
+
+        Raises:
+            ValueError: If ``max_connections`` is below 1.
+        """
+        if self.max_connections < 1:
+            msg = f"max_connections must be at least 1, got {self.max_connections}"
+            raise ValueError(msg)
+        # Requests beyond the pool wait here rather than inside httpx's pool,
+        # whose sync waiters can be handed a connection another thread closed
+        self._slots = threading.BoundedSemaphore(self.max_connections)
         self.config = ModelConfig(
             model_name=self.model,
             temperature=self.config.temperature,
@@ -90,24 +134,87 @@ class OllamaModel(Model):
         """The provider name."""
         return "ollama"
 
+    def _http_limits(self) -> Any:
+        """Connection pool limits shared by the sync and async clients."""
+        import httpx
+
+        keepalive = self.max_keepalive_connections
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_connections if keepalive is None else keepalive,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+    def _ensure_client(self) -> Any:
+        """Ensure the pooled HTTP client is initialized."""
+        if self._client is not None:
+            return self._client
+
+        try:
+            import httpx
+        except ImportError as e:
+            msg = "httpx is required for Ollama. Install with: pip install httpx"
+            raise ModelError(msg, provider="ollama", cause=e) from e
+
+        with self._lock:
+            if self._client is None:
+                self._client = httpx.Client(
+                    base_url=self.host,
+                    # Waiting for a pooled connection is queueing, not a failure
+                    timeout=httpx.Timeout(self.config.timeout, pool=None),
+                    limits=self._http_limits(),
+                )
+        return self._client
+
+    def close(self) -> None:
+        """Close the HTTP client and its pooled connections."""
+        with self._lock:
+            client, self._client = self._client, None
+        if client is not None:
+            client.close()
+
     def is_available(self) -> bool:
         """Check if Ollama server is available.
 
+        A reachable server is remembered until a request to it fails. An
+        unreachable one is probed again once ``health_check_interval``
+        seconds have passed, so a server started later is picked up.
+
         Returns:
             True if the server is reachable.
         """
-        if self._available is not None:
-            return self._available
+        cached = self._cached_health()
+        if cached is not None:
+            return cached
 
         try:
-            import httpx
-
-            response = httpx.get(f"{self.host}/api/version", timeout=5.0)
-            self._available = response.status_code == 200
+            with self._slots:
+                response = self._ensure_client().get("/api/version", timeout=5.0)
+            available = response.status_code == 200
         except Exception:
-            self._available = False
+            available = False
+        return self._record_health(available)
+
+    def _cached_health(self) -> bool | None:
+        """Return the remembered server status, or None if it should be probed."""
+        if self._available is not None and (
+            self._available or time.monotonic() - self._checked_at < self.health_check_interval
+        ):
+            return self._available
+        return None
+
+    def _record_health(self, available: bool) -> bool:
+        """Remember the result of a health probe."""
+        self._available = available
+        self._checked_at = time.monotonic()
+        return available
 
-        return self._available
+    def _connection_failed(self, error: Exception) -> None:
+        """Forget a cached healthy status after a connection-level failure."""
+        import httpx
+
+        if isinstance(error, httpx.TransportError):
+            self._available = None
 
     def list_models(self) -> list[str]:
         """List available models on the Ollama server.
@@ -118,14 +225,11 @@ class OllamaModel(Model):
         Raises:
             ModelError: If the request fails.
         """
-        try:
-            import httpx
-        except ImportError as e:
-            msg = "httpx is required for Ollama. Install with: pip install httpx"
-            raise ModelError(msg, provider="ollama", cause=e) from e
+        client = self._ensure_client()
 
         try:
-            response = httpx.get(f"{self.host}/api/tags", timeout=30.0)
+            with self._slots:
+                response = client.get("/api/tags", timeout=30.0)
             response.raise_for_status()
             data = response.json()
             return [m["name"] for m in data.get("models", [])]
@@ -163,49 +267,25 @@ class OllamaModel(Model):
             msg = "httpx is required for Ollama. Install with: pip install httpx"
             raise ModelError(msg, provider="ollama", cause=e) from e
 
-        # Build request body
-        body: dict[str, Any] = {
-            "model": self.model,
-            "prompt": prompt,
-            "stream": False,
-            "options": {
-                "temperature": temperature or self.config.temperature,
-            },
-        }
-
-        if max_tokens or self.config.max_tokens:
-            body["options"]["num_predict"] = max_tokens or self.config.max_tokens
-        if stop_sequences or self.config.stop_sequences:
-            body["options"]["stop"] = stop_sequences or self.config.stop_sequences
-
-        # Handle system message
-        system = kwargs.pop("system", None)
-        if system:
-            body["system"] = system
+        client = self._ensure_client()
+        body = self._request_body(
+            prompt,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            stop_sequences=stop_sequences,
+            system=kwargs.pop("system", None),
+        )
 
         try:
-            response = httpx.post(
-                f"{self.host}/api/generate",
-                json=body,
-                timeout=self.config.timeout,
-            )
+            with self._slots:
+                response = client.post("/api/generate", json=body)
             response.raise_for_status()
-            data = response.json()
-
-            return GenerationResult(
-                text=data.get("response", ""),
-                finish_reason="stop" if data.get("done") else "length",
-                usage={
-                    "prompt_tokens": data.get("prompt_eval_count", 0),
-                    "completion_tokens": data.get("eval_count", 0),
-                },
-                model=self.model,
-                raw_response=data,
-            )
+            return self._to_result(response.json())
 
         except httpx.HTTPStatusError as e:
             self._handle_error(e)
         except Exception as e:
+            self._connection_failed(e)
             msg = f"Ollama request failed: {e}"
             raise ModelError(msg, provider="ollama", model=self.model, cause=e) from e
 
@@ -233,36 +313,13 @@ class OllamaModel(Model):
         Raises:
             ModelError: If generation or parsing fails.
         """
-        schema_prompt = f"""
-{prompt}
-
-Respond ONLY with valid JSON matching this schema:
-{self._schema_to_json_schema(schema)}
-
-Output JSON only, no other text.
-"""
-
         result = self.generate(
-            schema_prompt,
+            self._structured_prompt(prompt, schema),
             temperature=temperature or 0.3,
             max_tokens=max_tokens,
             **kwargs,
         )
-
-        try:
-            text = result.text.strip()
-            if text.startswith("```"):
-                text = text.split("\n", 1)[1]
-            if text.endswith("```"):
-                text = text.rsplit("```", 1)[0]
-            text = text.strip()
-
-            data = json.loads(text)
-            return schema(**data)
-
-        except (json.JSONDecodeError, TypeError) as e:
-            msg = f"Failed to parse response as {schema.__name__}: {result.text[:100]}"
-            raise InvalidRequestError(msg, provider="ollama", model=self.model, cause=e) from e
+        return self._parse_structured(result.text, schema)
 
     def generate_stream(
         self,
@@ -283,12 +340,6 @@ Output JSON only, no other text.
         Yields:
             Text chunks as they are generated.
         """
-        try:
-            import httpx
-        except ImportError as e:
-            msg = "httpx is required for Ollama. Install with: pip install httpx"
-            raise ModelError(msg, provider="ollama", cause=e) from e
-
         body: dict[str, Any] = {
             "model": self.model,
             "prompt": prompt,
@@ -305,13 +356,10 @@ Output JSON only, no other text.
         if system:
             body["system"] = system
 
+        client = self._ensure_client()
+
         try:
-            with httpx.stream(
-                "POST",
-                f"{self.host}/api/generate",
-                json=body,
-                timeout=self.config.timeout,
-            ) as response:
+            with self._slots, client.stream("POST", "/api/generate", json=body) as response:
                 response.raise_for_status()
                 for line in response.iter_lines():
                     if line:
@@ -322,9 +370,81 @@ Output JSON only, no other text.
                             break
 
         except Exception as e:
+            self._connection_failed(e)
             msg = f"Ollama streaming failed: {e}"
             raise ModelError(msg, provider="ollama", model=self.model, cause=e) from e
 
+    def _request_body(
+        self,
+        prompt: str,
+        *,
+        temperature: float | None,
+        max_tokens: int | None,
+        stop_sequences: list[str] | None,
+        system: str | None,
+        stream: bool = False,
+    ) -> dict[str, Any]:
+        """Build the /api/generate request body for a prompt."""
+        body: dict[str, Any] = {
+            "model": self.model,
+            "prompt": prompt,
+            "stream": stream,
+            "options": {
+                "temperature": temperature or self.config.temperature,
+            },
+        }
+
+        if max_tokens or self.config.max_tokens:
+            body["options"]["num_predict"] = max_tokens or self.config.max_tokens
+        if stop_sequences or self.config.stop_sequences:
+            body["options"]["stop"] = stop_sequences or self.config.stop_sequences
+
+        if system:
+            body["system"] = system
+
+        return body
+
+    def _to_result(self, data: dict[str, Any]) -> GenerationResult:
+        """Convert an /api/generate response body to a GenerationResult."""
+        return GenerationResult(
+            text=data.get("response", ""),
+            finish_reason="stop" if data.get("done") else "length",
+            usage={
+                "prompt_tokens": data.get("prompt_eval_count", 0),
+                "completion_tokens": data.get("eval_count", 0),
+            },
+            model=self.model,
+            raw_response=data,
+        )
+
+    def _structured_prompt(self, prompt: str, schema: type) -> str:
+        """Wrap a prompt with instructions to answer in JSON matching a schema."""
+        return f"""
+{prompt}
+
+Respond ONLY with valid JSON matching this schema:
+{self._schema_to_json_schema(schema)}
+
+Output JSON only, no other text.
+"""
+
+    def _parse_structured(self, text: str, schema: type[T]) -> T:
+        """Parse a JSON response (optionally in a code fence) into the schema type."""
+        try:
+            cleaned = text.strip()
+            if cleaned.startswith("```"):
+                cleaned = cleaned.split("\n", 1)[1]
+            if cleaned.endswith("```"):
+                cleaned = cleaned.rsplit("```", 1)[0]
+            cleaned = cleaned.strip()
+
+            data = json.loads(cleaned)
+            return schema(**data)
+
+        except (json.JSONDecodeError, TypeError) as e:
+            msg = f"Failed to parse response as {schema.__name__}: {text[:100]}"
+            raise InvalidRequestError(msg, provider="ollama", model=self.model, cause=e) from e
+
     def _schema_to_json_schema(self, schema: type) -> str:
         """Convert a dataclass or Pydantic model to JSON schema description."""
         import dataclasses
@@ -352,6 +472,243 @@ Output JSON only, no other text.
             raise ModelError(str(e), provider="ollama", model=self.model, cause=e) from e
 
 
+@dataclass
+class AsyncOllamaModel(AsyncModel):
+    """Ollama local model implementation on ``httpx.AsyncClient``.
+
+    Requests and responses are handled exactly as in :class:`OllamaModel`,
+    but every call is awaited on one pooled async client. Requests beyond
+    ``max_connections`` wait for a free connection without timing out, so
+    a single event loop can submit hundreds of generations and let the
+    Ollama server schedule them. The client is bound to the event loop it
+    was first used on.
+
+    Attributes:
+        model: Ollama model name (e.g., "llama3.2", "mistral").
+        host: Ollama server URL.
+        config: Model configuration.
+        max_connections: Most concurrent connections to the server.
+        max_keepalive_connections: Most idle connections kept open for
+            reuse (None for ``max_connections``).
+        keepalive_expiry: Seconds an idle connection is kept open.
+        health_check_interval: Seconds before :meth:`is_available` probes
+            an unreachable server again.
+
+    Example:
+        >>> async with AsyncOllamaModel(model="mistral") as model:
+        ...     results = await asyncio.gather(*(model.generate(p) for p in prompts))
+    """
+
+    model: str = DEFAULT_OLLAMA_MODEL
+    host: str = DEFAULT_OLLAMA_HOST
+    config: ModelConfig = field(default_factory=lambda: ModelConfig(model_name=DEFAULT_OLLAMA_MODEL))
+    max_connections: int = DEFAULT_OLLAMA_MAX_CONNECTIONS
+    max_keepalive_connections: int | None = None
+    keepalive_expiry: float = DEFAULT_OLLAMA_KEEPALIVE_EXPIRY
+    health_check_interval: float = DEFAULT_OLLAMA_HEALTH_CHECK_INTERVAL
+
+    # Private fields
+    _sync: OllamaModel = field(init=False, repr=False, compare=False)
+    _client: Any = field(default=None, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Resolve configuration as OllamaModel does.
+
+        Raises:
+            ValueError: If ``max_connections`` is below 1.
+        """
+        self._sync = OllamaModel(
+            model=self.model,
+            host=self.host,
+            config=self.config,
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+            health_check_interval=self.health_check_interval,
+        )
+        self.config = self._sync.config
+
+    @property
+    def model_name(self) -> str:
+        """The name/identifier of the model."""
+        return self.model
+
+    @property
+    def provider(self) -> str:
+        """The provider name."""
+        return "ollama"
+
+    def _ensure_client(self) -> Any:
+        """Ensure the pooled async HTTP client is initialized."""
+        if self._client is not None:
+            return self._client
+
+        try:
+            import httpx
+        except ImportError as e:
+            msg = "httpx is required for Ollama. Install with: pip install httpx"
+            raise ModelError(msg, provider="ollama", cause=e) from e
+
+        self._client = httpx.AsyncClient(
+            base_url=self.host,
+            # Waiting for a pooled connection is queueing, not a failure
+            timeout=httpx.Timeout(self.config.timeout, pool=None),
+            limits=self._sync._http_limits(),
+        )
+        return self._client
+
+    async def is_available(self) -> bool:
+        """Check if the Ollama server is available.
+
+        As in :meth:`OllamaModel.is_available`, a reachable server is
+        remembered until a request to it fails, and an unreachable one is
+        probed again once ``health_check_interval`` seconds have passed.
+
+        Returns:
+            True if the server is reachable.
+        """
+        cached = self._sync._cached_health()
+        if cached is not None:
+            return cached
+
+        try:
+            response = await self._ensure_client().get("/api/version", timeout=5.0)
+            available = response.status_code == 200
+        except Exception:
+            available = False
+        return self._sync._record_health(available)
+
+    async def generate(
+        self,
+        prompt: str,
+        *,
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+        stop_sequences: list[str] | None = None,
+        **kwargs: Any,
+    ) -> GenerationResult:
+        """Generate text from a prompt asynchronously.
+
+        Args:
+            prompt: The input prompt.
+            temperature: Override default temperature.
+            max_tokens: Override default max tokens.
+            stop_sequences: Sequences that stop generation.
+            **kwargs: Additional options.
+
+        Returns:
+            GenerationResult with the generated text.
+
+        Raises:
+            ModelError: If generation fails.
+        """
+        import httpx
+
+        client = self._ensure_client()
+        body = self._sync._request_body(
+            prompt,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            stop_sequences=stop_sequences,
+            system=kwargs.pop("system", None),
+        )
+
+        try:
+            response = await client.post("/api/generate", json=body)
+            response.raise_for_status()
+            return self._sync._to_result(response.json())
+
+        except httpx.HTTPStatusError as e:
+            self._sync._handle_error(e)
+        except Exception as e:
+            self._sync._connection_failed(e)
+            msg = f"Ollama request failed: {e}"
+            raise ModelError(msg, provider="ollama", model=self.model, cause=e) from e
+
+    async def generate_structured(
+        self,
+        prompt: str,
+        schema: type[T],
+        *,
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+        **kwargs: Any,
+    ) -> T:
+        """Generate structured output matching a schema asynchronously.
+
+        Args:
+            prompt: The input prompt.
+            schema: A dataclass or Pydantic model to parse into.
+            temperature: Override default temperature.
+            max_tokens: Override default max tokens.
+            **kwargs: Additional options.
+
+        Returns:
+            An instance of the schema type.
+
+        Raises:
+            ModelError: If generation or parsing fails.
+        """
+        result = await self.generate(
+            self._sync._structured_prompt(prompt, schema),
+            temperature=temperature or 0.3,
+            max_tokens=max_tokens,
+            **kwargs,
+        )
+        return self._sync._parse_structured(result.text, schema)
+
+    async def generate_stream(
+        self,
+        prompt: str,
+        *,
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[str]:
+        """Generate text with async streaming.
+
+        Args:
+            prompt: The input prompt.
+            temperature: Override default temperature.
+            max_tokens: Override default max tokens.
+            **kwargs: Additional options.
+
+        Yields:
+            Text chunks as they are generated.
+        """
+        client = self._ensure_client()
+        body = self._sync._request_body(
+            prompt,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            stop_sequences=None,
+            system=kwargs.pop("system", None),
+            stream=True,
+        )
+
+        try:
+            async with client.stream("POST", "/api/generate", json=body) as response:
+                response.raise_for_status()
+                async for line in response.aiter_lines():
+                    if line:
+                        data = json.loads(line)
+                        if text := data.get("response"):
+                            yield text
+                        if data.get("done"):
+                            break
+
+        except Exception as e:
+            self._sync._connection_failed(e)
+            msg = f"Ollama streaming failed: {e}"
+            raise ModelError(msg, provider="ollama", model=self.model, cause=e) from e
+
+    async def aclose(self) -> None:
+        """Close the async client and its connection pool."""
+        client, self._client = self._client, None
+        if client is not None:
+            await client.aclose()
+
+
 def create_ollama_model(
     model: str = DEFAULT_OLLAMA_MODEL,
     host: str = DEFAULT_OLLAMA_HOST,
@@ -386,8 +743,12 @@ def create_ollama_model(
 
 
 __all__ = [
+    "DEFAULT_OLLAMA_HEALTH_CHECK_INTERVAL",
     "DEFAULT_OLLAMA_HOST",
+    "DEFAULT_OLLAMA_KEEPALIVE_EXPIRY",
+    "DEFAULT_OLLAMA_MAX_CONNECTIONS",
     "DEFAULT_OLLAMA_MODEL",
+    "AsyncOllamaModel",
     "OllamaModel",
     "create_ollama_model",
 ]
@@ -9,6 +9,10 @@ Example:
     >>> model = OpenAIModel()  # Uses OPENAI_API_KEY env var
     >>> result = model.generate("Write a story about robots")
     >>> print(result.text)
+    >>>
+    >>> # Async, on the SDK's AsyncOpenAI client
+    >>> async with AsyncOpenAIModel() as model:
+    ...     results = await asyncio.gather(*(model.generate(p) for p in prompts))
 """
 
 from __future__ import annotations
@@ -20,6 +24,7 @@ from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, NoReturn, TypeVar
 
 from personaut.models.model import (
+    AsyncModel,
     AuthenticationError,
     GenerationResult,
     InvalidRequestError,
@@ -31,7 +36,7 @@ from personaut.models.model import (
 
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import AsyncIterator, Iterator
 
 logger = logging.getLogger(__name__)
 
@@ -163,56 +168,17 @@ class OpenAIModel(Model):
             ModelError: If generation fails.
         """
         client = self._ensure_client()
-
-        # Build messages
-        messages = [{"role": "user", "content": prompt}]
-
-        # Handle system message if provided
-        system = kwargs.pop("system", None)
-        if system:
-            messages.insert(0, {"role": "system", "content": system})
-
-        # Build generation parameters
-        gen_kwargs: dict[str, Any] = {
-            "model": self.model,
-            "messages": messages,
-        }
-
-        # o1 models don't support temperature or max_tokens the same way
-        if not self.model.startswith("o1"):
-            gen_kwargs["temperature"] = temperature or self.config.temperature
-            if max_tokens or self.config.max_tokens:
-                gen_kwargs["max_tokens"] = max_tokens or self.config.max_tokens
-            if stop_sequences or self.config.stop_sequences:
-                gen_kwargs["stop"] = stop_sequences or self.config.stop_sequences
-        else:
-            # o1 models use max_completion_tokens
-            if max_tokens or self.config.max_tokens:
-                gen_kwargs["max_completion_tokens"] = max_tokens or self.config.max_tokens
+        gen_kwargs = self._chat_kwargs(
+            prompt,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            stop_sequences=stop_sequences,
+            system=kwargs.pop("system", None),
+        )
 
         try:
             response = client.chat.completions.create(**gen_kwargs)
-
-            # Extract text and metadata
-            choice = response.choices[0]
-            text = choice.message.content or ""
-
-            # Get usage
-            usage = {}
-            if response.usage:
-                usage = {
-                    "prompt_tokens": response.usage.prompt_tokens,
-                    "completion_tokens": response.usage.completion_tokens,
-                    "total_tokens": response.usage.total_tokens,
-                }
-
-            return GenerationResult(
-                text=text,
-                finish_reason=choice.finish_reason or "stop",
-                usage=usage,
-                model=response.model,
-                raw_response=response,
-            )
+            return self._to_result(response)
 
         except Exception as e:
             self._handle_error(e)
@@ -261,36 +227,13 @@ class OpenAIModel(Model):
                 pass  # Fall back to manual parsing
 
         # Manual JSON parsing
-        schema_prompt = f"""
-{prompt}
-
-Respond ONLY with valid JSON matching this schema:
-{self._schema_to_json_schema(schema)}
-
-Output JSON only, no other text.
-"""
-
         result = self.generate(
-            schema_prompt,
+            self._structured_prompt(prompt, schema),
             temperature=temperature or 0.3,
             max_tokens=max_tokens,
             **kwargs,
         )
-
-        try:
-            text = result.text.strip()
-            if text.startswith("```"):
-                text = text.split("\n", 1)[1]
-            if text.endswith("```"):
-                text = text.rsplit("```", 1)[0]
-            text = text.strip()
-
-            data = json.loads(text)
-            return schema(**data)
-
-        except (json.JSONDecodeError, TypeError) as e:
-            msg = f"Failed to parse response as {schema.__name__}: {result.text[:100]}"
-            raise InvalidRequestError(msg, provider="openai", model=self.model, cause=e) from e
+        return self._parse_structured(result.text, schema)
 
     def generate_stream(
         self,
@@ -338,6 +281,88 @@ Output JSON only, no other text.
         except Exception as e:
             self._handle_error(e)
 
+    def _chat_kwargs(
+        self,
+        prompt: str,
+        *,
+        temperature: float | None,
+        max_tokens: int | None,
+        stop_sequences: list[str] | None,
+        system: str | None,
+    ) -> dict[str, Any]:
+        """Build chat completion parameters for a prompt."""
+        messages = [{"role": "user", "content": prompt}]
+        if system:
+            messages.insert(0, {"role": "system", "content": system})
+
+        gen_kwargs: dict[str, Any] = {
+            "model": self.model,
+            "messages": messages,
+        }
+
+        # o1 models don't support temperature or max_tokens the same way
+        if not self.model.startswith("o1"):
+            gen_kwargs["temperature"] = temperature or self.config.temperature
+            if max_tokens or self.config.max_tokens:
+                gen_kwargs["max_tokens"] = max_tokens or self.config.max_tokens
+            if stop_sequences or self.config.stop_sequences:
+                gen_kwargs["stop"] = stop_sequences or self.config.stop_sequences
+        else:
+            # o1 models use max_completion_tokens
+            if max_tokens or self.config.max_tokens:
+                gen_kwargs["max_completion_tokens"] = max_tokens or self.config.max_tokens
+
+        return gen_kwargs
+
+    def _to_result(self, response: Any) -> GenerationResult:
+        """Convert a chat completion response to a GenerationResult."""
+        choice = response.choices[0]
+        text = choice.message.content or ""
+
+        usage = {}
+        if response.usage:
+            usage = {
+                "prompt_tokens": response.usage.prompt_tokens,
+                "completion_tokens": response.usage.completion_tokens,
+                "total_tokens": response.usage.total_tokens,
+            }
+
+        return GenerationResult(
+            text=text,
+            finish_reason=choice.finish_reason or "stop",
+            usage=usage,
+            model=response.model,
+            raw_response=response,
+        )
+
+    def _structured_prompt(self, prompt: str, schema: type) -> str:
+        """Wrap a prompt with instructions to answer in JSON matching a schema."""
+        return f"""
+{prompt}
+
+Respond ONLY with valid JSON matching this schema:
+{self._schema_to_json_schema(schema)}
+
+Output JSON only, no other text.
+"""
+
+    def _parse_structured(self, text: str, schema: type[T]) -> T:
+        """Parse a JSON response (optionally in a code fence) into the schema type."""
+        try:
+            cleaned = text.strip()
+            if cleaned.startswith("```"):
+                cleaned = cleaned.split("\n", 1)[1]
+            if cleaned.endswith("```"):
+                cleaned = cleaned.rsplit("```", 1)[0]
+            cleaned = cleaned.strip()
+
+            data = json.loads(cleaned)
+            return schema(**data)
+
+        except (json.JSONDecodeError, TypeError) as e:
+            msg = f"Failed to parse response as {schema.__name__}: {text[:100]}"
+            raise InvalidRequestError(msg, provider="openai", model=self.model, cause=e) from e
+
     def _schema_to_json_schema(self, schema: type) -> str:
         """Convert a dataclass or Pydantic model to JSON schema description."""
         import dataclasses
@@ -369,6 +394,207 @@ Output JSON only, no other text.
             raise ModelError(str(e), provider="openai", model=self.model, cause=e) from e
 
 
+@dataclass
+class AsyncOpenAIModel(AsyncModel):
+    """OpenAI model implementation on the SDK's ``AsyncOpenAI`` client.
+
+    Requests and responses are handled exactly as in :class:`OpenAIModel`,
+    but every call is awaited on a pooled async HTTP client, so a single
+    event loop can keep hundreds of generations in flight. The client is
+    bound to the event loop it was first used on.
+
+    Attributes:
+        api_key: OpenAI API key. If None, uses OPENAI_API_KEY env var.
+        model: OpenAI model name.
+        config: Model configuration.
+        organization: Optional OpenAI organization ID.
+
+    Example:
+        >>> async with AsyncOpenAIModel(model="gpt-4o") as model:
+        ...     result = await model.generate("Explain neural networks")
+    """
+
+    api_key: str | None = None
+    model: str = DEFAULT_OPENAI_MODEL
+    config: ModelConfig = field(default_factory=lambda: ModelConfig(model_name=DEFAULT_OPENAI_MODEL))
+    organization: str | None = None
+
+    # Private fields
+    _sync: OpenAIModel = field(init=False, repr=False, compare=False)
+    _client: Any = field(default=None, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Resolve credentials and configuration as OpenAIModel does."""
+        self._sync = OpenAIModel(
+            api_key=self.api_key,
+            model=self.model,
+            config=self.config,
+            organization=self.organization,
+        )
+        self.api_key = self._sync.api_key
+        self.organization = self._sync.organization
+        self.config = self._sync.config
+
+    @property
+    def model_name(self) -> str:
+        """The name/identifier of the model."""
+        return self.model
+
+    @property
+    def provider(self) -> str:
+        """The provider name."""
+        return "openai"
+
+    def _ensure_client(self) -> Any:
+        """Ensure the async OpenAI client is initialized."""
+        if self._client is not None:
+            return self._client
+
+        try:
+            from openai import AsyncOpenAI
+        except ImportError as e:
+            msg = "openai is required for OpenAI models. Install with: pip install openai"
+            raise ModelError(msg, provider="openai", cause=e) from e
+
+        self._client = AsyncOpenAI(
+            api_key=self.api_key,
+            organization=self.organization,
+            timeout=self.config.timeout,
+        )
+        return self._client
+
+    async def generate(
+        self,
+        prompt: str,
+        *,
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+        stop_sequences: list[str] | None = None,
+        **kwargs: Any,
+    ) -> GenerationResult:
+        """Generate text from a prompt asynchronously.
+
+        Args:
+            prompt: The input prompt.
+            temperature: Override default temperature.
+            max_tokens: Override default max tokens.
+            stop_sequences: Sequences that stop generation.
+            **kwargs: Additional options.
+
+        Returns:
+            GenerationResult with the generated text.
+
+        Raises:
+            ModelError: If generation fails.
+        """
+        client = self._ensure_client()
+        gen_kwargs = self._sync._chat_kwargs(
+            prompt,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            stop_sequences=stop_sequences,
+            system=kwargs.pop("system", None),
+        )
+
+        try:
+            response = await client.chat.completions.create(**gen_kwargs)
+            return self._sync._to_result(response)
+
+        except Exception as e:
+            self._sync._handle_error(e)
+
+    async def generate_structured(
+        self,
+        prompt: str,
+        schema: type[T],
+        *,
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+        **kwargs: Any,
+    ) -> T:
+        """Generate structured output matching a schema asynchronously.
+
+        Args:
+            prompt: The input prompt.
+            schema: A dataclass or Pydantic model to parse into.
+            temperature: Override default temperature.
+            max_tokens: Override default max tokens.
+            **kwargs: Additional options.
+
+        Returns:
+            An instance of the schema type.
+
+        Raises:
+            ModelError: If generation or parsing fails.
+        """
+        client = self._ensure_client()
+
+        if hasattr(schema, "model_json_schema") and not self.model.startswith("o1"):
+            try:
+                response = await client.beta.chat.completions.parse(
+                    model=self.model,
+                    messages=[{"role": "user", "content": prompt}],
+                    response_format=schema,
+                    temperature=temperature or 0.3,
+                )
+                parsed = response.choices[0].message.parsed
+                if parsed is not None:
+                    return parsed  # type: ignore[no-any-return]
+            except Exception:
+                pass  # Fall back to manual parsing
+
+        result = await self.generate(
+            self._sync._structured_prompt(prompt, schema),
+            temperature=temperature or 0.3,
+            max_tokens=max_tokens,
+            **kwargs,
+        )
+        return self._sync._parse_structured(result.text, schema)
+
+    async def generate_stream(
+        self,
+        prompt: str,
+        *,
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[str]:
+        """Generate text with async streaming.
+
+        Args:
+            prompt: The input prompt.
+            temperature: Override default temperature.
+            max_tokens: Override default max tokens.
+            **kwargs: Additional options.
+
+        Yields:
+            Text chunks as they are generated.
+        """
+        client = self._ensure_client()
+        gen_kwargs = self._sync._chat_kwargs(
+            prompt,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            stop_sequences=None,
+            system=kwargs.pop("system", None),
+        )
+
+        try:
+            stream = await client.chat.completions.create(**gen_kwargs, stream=True)
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+
+        except Exception as e:
+            self._sync._handle_error(e)
+
+    async def aclose(self) -> None:
+        """Close the async client and its connection pool."""
+        client, self._client = self._client, None
+        if client is not None:
+            await client.close()
+
+
 def create_openai_model(
     model: str = DEFAULT_OPENAI_MODEL,
     api_key: str | None = None,
@@ -405,6 +631,7 @@ def create_openai_model(
 __all__ = [
     "AVAILABLE_OPENAI_MODELS",
     "DEFAULT_OPENAI_MODEL",
+    "AsyncOpenAIModel",
     "OpenAIModel",
     "create_openai_model",
 ]
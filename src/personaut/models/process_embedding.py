@@ -0,0 +1,315 @@
+"""Out-of-process embedding worker pool for Personaut PDK.
+
+Loading a sentence-transformers model inside a web server blocks the
+first request for seconds, and every forward pass then competes with
+request handling for the GIL. :class:`ProcessPoolEmbedding` moves the
+model into a pool of worker processes instead: each worker loads one
+model when it starts, batches are split across the workers, and the
+vectors come back through a shared-memory buffer rather than being
+pickled.
+
+Example:
+    >>> from personaut.models import ProcessPoolEmbedding
+    >>>
+    >>> embed = ProcessPoolEmbedding(workers=4)
+    >>> embed.preload()  # at server start: spawn the workers, load the models
+    >>> matrix = embed.embed_batch_array(["Hello", "World"])
+    >>> embed.close()
+"""
+
+from __future__ import annotations
+
+import functools
+import logging
+import math
+import multiprocessing
+import queue
+import sys
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future, ProcessPoolExecutor, wait
+from multiprocessing.shared_memory import SharedMemory
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from numpy.typing import NDArray
+
+from personaut.models.embeddings import DEFAULT_MODEL_SMALL, EmbeddingError, EmbeddingModel
+from personaut.models.local_embedding import LocalEmbedding
+
+
+logger = logging.getLogger(__name__)
+
+# Worker processes started when no count is given
+DEFAULT_EMBEDDING_WORKERS = 2
+
+# Text embedded by each worker at start-up so the first request finds a loaded model
+_WARM_UP_TEXT = "warm-up"
+
+# Seconds preload() waits on worker reports before checking whether the pool broke
+_READY_POLL_SECONDS = 0.5
+
+# The model held by the current worker process (set by _init_worker)
+_worker_model: EmbeddingModel | None = None
+
+
+def _attach(name: str) -> SharedMemory:
+    """Attach to a parent-owned shared-memory block without tracking it.
+
+    The parent unlinks the block; on Python 3.13+ the worker opts out of
+    resource tracking so the block is not reported as leaked.
+    """
+    if sys.version_info >= (3, 13):
+        return SharedMemory(name=name, track=False)
+    return SharedMemory(name=name)
+
+
+def _init_worker(factory: Callable[[], EmbeddingModel], ready: Any) -> None:
+    """Create and warm up the worker's model, reporting the outcome to the parent.
+
+    Each worker puts one entry on ``ready``: None once its model is
+    loaded, or the error that stopped it.
+    """
+    global _worker_model
+    try:
+        _worker_model = factory()
+        _worker_model.embed_array(_WARM_UP_TEXT)
+    except BaseException as e:
+        ready.put(repr(e))
+        raise
+    ready.put(None)
+
+
+def _worker_dimension() -> int:
+    """Report the dimension of the worker's model."""
+    assert _worker_model is not None
+    return _worker_model.dimension
+
+
+def _worker_embed(texts: list[str], shm_name: str, start_row: int, dimension: int) -> None:
+    """Embed texts and write them into rows of a shared float32 matrix."""
+    assert _worker_model is not None
+    vectors = _worker_model.embed_batch_array(texts)
+    shm = _attach(shm_name)
+    try:
+        rows = np.ndarray(
+            (len(texts), dimension),
+            dtype=np.float32,
+            buffer=shm.buf,
+            offset=start_row * dimension * np.dtype(np.float32).itemsize,
+        )
+        rows[:] = vectors
+        del rows
+    finally:
+        shm.close()
+
+
+class ProcessPoolEmbedding(EmbeddingModel):
+    """Embedding model that runs a model in each of several worker processes.
+
+    Batches are split into contiguous chunks of at most ``batch_size``
+    texts, spread over the workers, and written by the workers straight
+    into one shared-memory matrix that the caller copies out. Worker
+    processes are started on first use; call :meth:`preload` at server
+    start to spawn them and load their models ahead of the first request.
+
+    By default each worker holds a :class:`LocalEmbedding`; pass a
+    picklable ``model_factory`` (a top-level function or class, or a
+    ``functools.partial`` of one) to run another model.
+
+    Attributes:
+        model_path: Model identifier for the default ``LocalEmbedding`` workers.
+        workers: Number of worker processes.
+        batch_size: Most texts sent to one worker per task.
+        disk_cache: Path of a shared SQLite embedding cache the workers
+            open (None to disable).
+
+    Example:
+        >>> with ProcessPoolEmbedding("BAAI/bge-large-en-v1.5", workers=4) as embed:
+        ...     embed.preload()
+        ...     vectors = embed.embed_batch(texts)
+    """
+
+    def __init__(
+        self,
+        model_path: str = DEFAULT_MODEL_SMALL,
+        workers: int = DEFAULT_EMBEDDING_WORKERS,
+        batch_size: int = 32,
+        disk_cache: str | Path | None = None,
+        model_factory: Callable[[], EmbeddingModel] | None = None,
+        start_method: str = "spawn",
+        **model_kwargs: Any,
+    ) -> None:
+        """Configure the pool; no process is started yet.
+
+        Args:
+            model_path: Model identifier for the default ``LocalEmbedding`` workers.
+            workers: Number of worker processes.
+            batch_size: Most texts sent to one worker per task.
+            disk_cache: Path of a shared SQLite embedding cache for the workers.
+            model_factory: Picklable callable creating each worker's model.
+                Overrides ``model_path``, ``disk_cache`` and ``model_kwargs``.
+            start_method: multiprocessing start method. ``"spawn"`` keeps
+                workers independent of the server's threads and CUDA state.
+            **model_kwargs: Further ``LocalEmbedding`` arguments (e.g. ``device``).
+
+        Raises:
+            ValueError: If ``workers`` or ``batch_size`` is below 1.
+        """
+        if workers < 1:
+            msg = f"workers must be at least 1, got {workers}"
+            raise ValueError(msg)
+        if batch_size < 1:
+            msg = f"batch_size must be at least 1, got {batch_size}"
+            raise ValueError(msg)
+        if model_factory is None:
+            disk_path = None if disk_cache is None else str(disk_cache)
+            model_factory = functools.partial(
+                LocalEmbedding, model_path=model_path, disk_cache=disk_path, **model_kwargs
+            )
+        self.model_path = model_path
+        self.workers = workers
+        self.batch_size = batch_size
+        self.disk_cache = disk_cache
+        self.start_method = start_method
+        self._factory = model_factory
+        self._pool: ProcessPoolExecutor | None = None
+        self._ready: Any = None
+        self._ready_workers = 0
+        self._lock = threading.Lock()
+        self._dimension = 0
+
+    def __enter__(self) -> ProcessPoolEmbedding:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    @property
+    def dimension(self) -> int:
+        """The dimensionality of the embedding vectors, asked of a worker once."""
+        if self._dimension == 0:
+            self._dimension = self._submit(_worker_dimension).result()
+        return self._dimension
+
+    @property
+    def model_name(self) -> str:
+        """The name/identifier of the workers' model."""
+        return self.model_path
+
+    def is_loaded(self) -> bool:
+        """Check if the worker pool has been started."""
+        return self._pool is not None
+
+    def preload(self) -> None:
+        """Start every worker and wait until each has loaded its model.
+
+        Call at server start so no request pays for process start-up or
+        model loading.
+
+        Raises:
+            EmbeddingError: If a worker fails to start or load its model.
+        """
+        # One task per worker makes the executor spawn them all
+        futures = [self._submit(_worker_dimension) for _ in range(self.workers)]
+        # Each worker reports its own load, since one fast worker can run every task
+        while self._ready_workers < self.workers:
+            try:
+                error = self._ready.get(timeout=_READY_POLL_SECONDS)
+            except queue.Empty:
+                if any(future.done() and future.exception() is not None for future in futures):
+                    break
+                continue
+            if error is not None:
+                msg = f"Embedding worker failed to load its model: {error}"
+                raise EmbeddingError(msg, model=self.model_path)
+            self._ready_workers += 1
+        try:
+            self._dimension = futures[0].result()
+            for future in futures[1:]:
+                future.result()
+        except Exception as e:
+            msg = "Failed to start embedding workers"
+            raise EmbeddingError(msg, model=self.model_path, cause=e) from e
+        logger.info("Started %d embedding workers for %s", self.workers, self.model_path)
+
+    def embed(self, text: str) -> list[float]:
+        """Generate an embedding for a single text in a worker process."""
+        return list(self.embed_array(text).tolist())
+
+    def embed_array(self, text: str) -> NDArray[np.float32]:
+        """Generate an embedding for a single text as a float32 array."""
+        row: NDArray[np.float32] = self.embed_batch_array([text])[0]
+        return row
+
+    def embed_batch(self, texts: list[str]) -> list[list[float]]:
+        """Generate embeddings for multiple texts across the worker processes."""
+        return [list(row) for row in self.embed_batch_array(texts).tolist()]
+
+    def embed_batch_array(self, texts: list[str]) -> NDArray[np.float32]:
+        """Generate embeddings for multiple texts as one float32 matrix.
+
+        Args:
+            texts: List of input texts to embed.
+
+        Returns:
+            A ``(len(texts), dimension)`` float32 array.
+
+        Raises:
+            EmbeddingError: If a worker fails.
+        """
+        dimension = self.dimension
+        if not texts:
+            return np.zeros((0, dimension), dtype=np.float32)
+
+        chunk = max(1, min(self.batch_size, math.ceil(len(texts) / self.workers)))
+        shm = SharedMemory(create=True, size=len(texts) * dimension * np.dtype(np.float32).itemsize)
+        try:
+            futures = [
+                self._submit(_worker_embed, texts[start : start + chunk], shm.name, start, dimension)
+                for start in range(0, len(texts), chunk)
+            ]
+            # Let every task finish before the buffer is released
+            wait(futures)
+            for future in futures:
+                try:
+                    future.result()
+                except Exception as e:
+                    msg = "Failed to generate embeddings in worker process"
+                    raise EmbeddingError(msg, model=self.model_path, cause=e) from e
+            shared = np.ndarray((len(texts), dimension), dtype=np.float32, buffer=shm.buf)
+            result: NDArray[np.float32] = shared.copy()
+            del shared
+        finally:
+            shm.close()
+            shm.unlink()
+        return result
+
+    def close(self) -> None:
+        """Shut the worker processes down."""
+        with self._lock:
+            pool, self._pool = self._pool, None
+            self._ready, self._ready_workers = None, 0
+        if pool is not None:
+            pool.shutdown(wait=True)
+
+    def _submit(self, fn: Callable[..., Any], *args: Any) -> Future[Any]:
+        """Submit a task, starting the pool on first use."""
+        with self._lock:
+            if self._pool is None:
+                context = multiprocessing.get_context(self.start_method)
+                self._ready = context.Queue()
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=context,
+                    initializer=_init_worker,
+                    initargs=(self._factory, self._ready),
+                )
+            return self._pool.submit(fn, *args)
+
+
+__all__ = [
+    "DEFAULT_EMBEDDING_WORKERS",
+    "ProcessPoolEmbedding",
+]
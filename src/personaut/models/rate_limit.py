@@ -0,0 +1,702 @@
+"""Rate limiting and retries for LLM models in Personaut PDK.
+
+Providers raise :class:`RateLimitError` when a quota is exceeded, but
+nothing paces requests or tries them again, so bulk simulation runs
+either fail partway or keep hammering the API. This module wraps any
+:class:`Model` (or :class:`AsyncModel`) with:
+
+- Token buckets for requests per minute and tokens per minute, shared by
+  every wrapper using the same provider and API key, so concurrent
+  callers together stay under the provider's ceiling.
+- Retries with jittered exponential backoff on rate-limit and transient
+  errors (timeouts, dropped connections, 5xx responses), waiting as
+  long as the provider's ``Retry-After`` header asks when it sends one.
+
+Example:
+    >>> from personaut.models import RateLimitedModel, get_llm
+    >>>
+    >>> llm = RateLimitedModel(get_llm("openai"), requests_per_minute=500, tokens_per_minute=200_000)
+    >>> with ThreadPoolExecutor(32) as pool:
+    ...     results = list(pool.map(llm.generate, prompts))
+"""
+
+from __future__ import annotations
+
+import asyncio
+import email.utils
+import hashlib
+import logging
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from personaut.models.model import (
+    AsyncModel,
+    AuthenticationError,
+    GenerationResult,
+    InvalidRequestError,
+    Model,
+    RateLimitError,
+)
+
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Iterator
+
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Attempts after the first before an error is raised
+DEFAULT_MAX_RETRIES = 5
+
+# Backoff before the first retry, in seconds
+DEFAULT_INITIAL_DELAY = 1.0
+
+# Longest backoff between retries, in seconds
+DEFAULT_MAX_DELAY = 60.0
+
+# HTTP statuses worth retrying (timeout, conflict, rate limit, server errors, overloaded)
+_TRANSIENT_STATUSES = frozenset({408, 409, 429, 500, 502, 503, 504, 529})
+
+# Exception type name fragments that mark a transient failure
+_TRANSIENT_NAMES = ("timeout", "connect", "overloaded", "unavailable", "throttl", "internalserver")
+
+# Rough characters per token, used to reserve tokens before a request
+_CHARS_PER_TOKEN = 4
+
+# Limiters shared by provider and API key
+_limiters: dict[tuple[str, str], RateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """When and how long to wait before retrying a failed request.
+
+    Delays grow as ``initial_delay * multiplier ** attempt`` up to
+    ``max_delay``; with ``jitter`` each is drawn uniformly from zero to
+    that bound ("full jitter"), so callers that failed together do not
+    retry together. A ``Retry-After`` from the provider replaces the
+    computed delay.
+
+    Attributes:
+        max_retries: Attempts after the first before giving up.
+        initial_delay: Backoff bound before the first retry, in seconds.
+        max_delay: Largest backoff bound, in seconds.
+        multiplier: Growth of the bound per attempt.
+        jitter: Whether to randomize each delay.
+
+    Example:
+        >>> policy = RetryPolicy(max_retries=3, initial_delay=0.5)
+        >>> policy.backoff(2) <= 2.0
+        True
+    """
+
+    max_retries: int = DEFAULT_MAX_RETRIES
+    initial_delay: float = DEFAULT_INITIAL_DELAY
+    max_delay: float = DEFAULT_MAX_DELAY
+    multiplier: float = 2.0
+    jitter: bool = True
+
+    def backoff(self, attempt: int) -> float:
+        """Seconds to wait before retry number ``attempt`` (0-based)."""
+        bound = min(self.max_delay, self.initial_delay * self.multiplier**attempt)
+        return random.uniform(0.0, bound) if self.jitter else bound
+
+    def delay(self, attempt: int, error: BaseException) -> float | None:
+        """Seconds to wait before retrying after ``error``, or None to give up.
+
+        Args:
+            attempt: Retries already made for this request.
+            error: The error the last attempt raised.
+
+        Returns:
+            The delay, or None if the error is not retryable or retries
+            are exhausted.
+        """
+        if attempt >= self.max_retries or not is_retryable(error):
+            return None
+        requested = retry_after(error)
+        return requested if requested is not None else self.backoff(attempt)
+
+
+class TokenBucket:
+    """Thread-safe token bucket refilled at a steady rate.
+
+    Callers reserve capacity up front with :meth:`reserve`, which may
+    take the balance below zero, and wait the returned time. Later
+    callers queue behind the debt, so waiters are served in order and
+    the long-run rate never exceeds ``rate``.
+
+    Attributes:
+        rate: Tokens added per second.
+        capacity: Largest balance (the burst size).
+
+    Example:
+        >>> bucket = TokenBucket(rate=10.0, capacity=10.0)
+        >>> bucket.reserve(10)
+        0.0
+        >>> bucket.reserve(5)  # must wait for 5 tokens at 10/s
+        0.5
+    """
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        """Create a full bucket.
+
+        Args:
+            rate: Tokens added per second.
+            capacity: Largest balance.
+
+        Raises:
+            ValueError: If ``rate`` or ``capacity`` is not positive.
+        """
+        if rate <= 0 or capacity <= 0:
+            msg = f"rate and capacity must be positive, got {rate} and {capacity}"
+            raise ValueError(msg)
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, amount: float) -> float:
+        """Take ``amount`` tokens and return the seconds to wait before using them."""
+        with self._lock:
+            self._refill()
+            self._tokens -= amount
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def refund(self, amount: float) -> None:
+        """Return unused tokens (or take more, if ``amount`` is negative)."""
+        with self._lock:
+            self._refill()
+            self._tokens = min(self.capacity, self._tokens + amount)
+
+    def _refill(self) -> None:
+        """Add the tokens accrued since the last update (caller holds the lock)."""
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+
+class RateLimiter:
+    """Requests-per-minute and tokens-per-minute limits for one provider key.
+
+    Each request reserves one request and an estimate of its tokens (the
+    prompt's length plus ``max_tokens``); once the response reports its
+    usage, the difference is settled. Either limit may be None.
+
+    Attributes:
+        requests_per_minute: Request ceiling (None for no limit).
+        tokens_per_minute: Token ceiling (None for no limit).
+
+    Example:
+        >>> limiter = RateLimiter(requests_per_minute=60)
+        >>> limiter.reserve(tokens=100)
+        0.0
+    """
+
+    def __init__(self, requests_per_minute: float | None = None, tokens_per_minute: float | None = None) -> None:
+        """Create the buckets, each starting with a full minute's allowance.
+
+        Args:
+            requests_per_minute: Request ceiling (None for no limit).
+            tokens_per_minute: Token ceiling (None for no limit).
+        """
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self._requests = (
+            None if requests_per_minute is None else TokenBucket(requests_per_minute / 60.0, requests_per_minute)
+        )
+        self._tokens = None if tokens_per_minute is None else TokenBucket(tokens_per_minute / 60.0, tokens_per_minute)
+
+    def reserve(self, tokens: int) -> float:
+        """Reserve one request and ``tokens`` tokens; return the seconds to wait."""
+        wait = 0.0
+        if self._requests is not None:
+            wait = self._requests.reserve(1)
+        if self._tokens is not None:
+            wait = max(wait, self._tokens.reserve(tokens))
+        return wait
+
+    def settle(self, reserved: int, used: int | None) -> None:
+        """Correct a reservation once the actual token usage is known."""
+        if self._tokens is not None and used is not None:
+            self._tokens.refund(reserved - used)
+
+
+def get_rate_limiter(
+    provider: str,
+    key: str = "default",
+    *,
+    requests_per_minute: float | None = None,
+    tokens_per_minute: float | None = None,
+) -> RateLimiter:
+    """Get the limiter shared by every caller of one provider key.
+
+    The limits given when a key's limiter is first created apply to it
+    from then on.
+
+    Args:
+        provider: Provider name.
+        key: API key identifier (a digest, never the key itself).
+        requests_per_minute: Request ceiling (None for no limit).
+        tokens_per_minute: Token ceiling (None for no limit).
+
+    Returns:
+        The shared RateLimiter.
+    """
+    with _limiters_lock:
+        limiter = _limiters.get((provider, key))
+        if limiter is None:
+            limiter = RateLimiter(requests_per_minute, tokens_per_minute)
+            _limiters[(provider, key)] = limiter
+        return limiter
+
+
+def is_retryable(error: BaseException) -> bool:
+    """Whether a failed request may succeed if tried again.
+
+    Rate-limit errors are; authentication and invalid-request errors are
+    not. Other errors are retried if they, or an error they were raised
+    from, carry a transient HTTP status (408, 409, 429, 5xx) or are a
+    timeout or connection failure.
+    """
+    if isinstance(error, RateLimitError):
+        return True
+    if isinstance(error, (AuthenticationError, InvalidRequestError)):
+        return False
+    for cause in _causes(error):
+        if _status_code(cause) in _TRANSIENT_STATUSES or isinstance(cause, (TimeoutError, ConnectionError)):
+            return True
+        name = type(cause).__name__.lower()
+        if any(fragment in name for fragment in _TRANSIENT_NAMES):
+            return True
+    return False
+
+
+def retry_after(error: BaseException) -> float | None:
+    """Seconds the provider asked to wait, from ``retry-after-ms`` or ``Retry-After``.
+
+    Looks at the HTTP response attached to the error or any error it was
+    raised from (OpenAI, Anthropic and httpx errors carry one; botocore
+    errors carry its headers). ``Retry-After`` may be seconds or an HTTP
+    date.
+
+    Returns:
+        The delay in seconds, or None if no response asked for one.
+    """
+    for cause in _causes(error):
+        headers = _headers(cause)
+        if not headers:
+            continue
+        value = headers.get("retry-after-ms")
+        if value is not None:
+            try:
+                return max(0.0, float(value) / 1000.0)
+            except ValueError:
+                pass
+        value = headers.get("retry-after")
+        if value is not None:
+            try:
+                return max(0.0, float(value))
+            except ValueError:
+                try:
+                    return max(0.0, email.utils.parsedate_to_datetime(value).timestamp() - time.time())
+                except (TypeError, ValueError):
+                    pass
+    return None
+
+
+def _causes(error: BaseException) -> Iterator[BaseException]:
+    """The error followed by the errors it was raised from."""
+    seen: set[int] = set()
+    current: BaseException | None = error
+    while current is not None and id(current) not in seen:
+        seen.add(id(current))
+        yield current
+        current = getattr(current, "cause", None) or current.__cause__
+
+
+def _status_code(error: BaseException) -> int | None:
+    """HTTP status carried by an SDK, httpx or botocore error."""
+    for value in (getattr(error, "status_code", None), getattr(error, "code", None)):
+        if isinstance(value, int):
+            return value
+    response = getattr(error, "response", None)
+    if isinstance(response, dict):
+        status = response.get("ResponseMetadata", {}).get("HTTPStatusCode")
+        return status if isinstance(status, int) else None
+    status = getattr(response, "status_code", None)
+    return status if isinstance(status, int) else None
+
+
+def _headers(error: BaseException) -> Any:
+    """HTTP response headers carried by an error, or None."""
+    response = getattr(error, "response", None)
+    if isinstance(response, dict):
+        return {k.lower(): v for k, v in response.get("ResponseMetadata", {}).get("HTTPHeaders", {}).items()}
+    headers = getattr(response, "headers", None)
+    return headers if hasattr(headers, "get") else None
+
+
+def _credential_key(model: object) -> str:
+    """Identify a model's API key by a short digest ("default" without one)."""
+    api_key = getattr(model, "api_key", None)
+    if not isinstance(api_key, str) or not api_key:
+        return "default"
+    return hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:16]
+
+
+class _RateLimitedBase:
+    """Reservation and retry bookkeeping shared by the sync and async wrappers."""
+
+    model: Model | AsyncModel
+
+    def __init__(
+        self,
+        model: Model | AsyncModel,
+        requests_per_minute: float | None,
+        tokens_per_minute: float | None,
+        key: str | None,
+        limiter: RateLimiter | None,
+        retry: RetryPolicy | None,
+    ) -> None:
+        if limiter is None and (requests_per_minute is not None or tokens_per_minute is not None):
+            limiter = get_rate_limiter(
+                model.provider,
+                key or _credential_key(model),
+                requests_per_minute=requests_per_minute,
+                tokens_per_minute=tokens_per_minute,
+            )
+        self.limiter = limiter
+        self.retry = retry or RetryPolicy()
+        self.retries = 0
+        self.throttled_seconds = 0.0
+        self._stats_lock = threading.Lock()
+
+    def _estimate_tokens(self, prompt: str, max_tokens: int | None, system: str | None) -> int:
+        """Tokens to reserve for a request: its text's estimate plus the output limit."""
+        if max_tokens is None:
+            max_tokens = getattr(getattr(self.model, "config", None), "max_tokens", None) or 0
+        text = len(prompt) + len(system or "")
+        return text // _CHARS_PER_TOKEN + 1 + max_tokens
+
+    def _reserve(self, tokens: int) -> float:
+        """Reserve capacity and return the seconds to wait for it."""
+        if self.limiter is None:
+            return 0.0
+        wait = self.limiter.reserve(tokens)
+        if wait > 0:
+            with self._stats_lock:
+                self.throttled_seconds += wait
+        return wait
+
+    def _settle(self, reserved: int, result: object) -> None:
+        """Correct the token reservation from a result's reported usage."""
+        if self.limiter is None:
+            return
+        usage = getattr(result, "usage", None) or {}
+        used = usage.get("total_tokens")
+        if used is None and ("prompt_tokens" in usage or "completion_tokens" in usage):
+            used = usage.get("prompt_tokens", 0) + usage.get("completion_tokens", 0)
+        self.limiter.settle(reserved, used)
+
+    def _retry_delay(self, attempt: int, error: Exception) -> float | None:
+        """Delay before the next attempt, counting and logging the retry."""
+        delay = self.retry.delay(attempt, error)
+        if delay is not None:
+            with self._stats_lock:
+                self.retries += 1
+            logger.warning(
+                "Retrying %s request in %.1fs (retry %d/%d): %s",
+                self.model.provider,
+                delay,
+                attempt + 1,
+                self.retry.max_retries,
+                error,
+            )
+        return delay
+
+
+class RateLimitedModel(_RateLimitedBase, Model):
+    """Model wrapper that paces requests and retries failed ones.
+
+    Every call first reserves one request and its estimated tokens from
+    the limiter shared by the wrapped model's provider and API key, and
+    sleeps if the budget is spent. :meth:`generate` and
+    :meth:`generate_structured` are retried after rate-limit and
+    transient errors with the delays of ``retry``; other errors, and
+    errors once retries are exhausted, are raised unchanged.
+    :meth:`generate_stream` is paced but not retried, since chunks may
+    already have been yielded.
+
+    The instance is safe to share between threads.
+
+    Attributes:
+        model: The wrapped model.
+        limiter: The shared RateLimiter (None for retries only).
+        retry: The retry policy.
+        retries: Retries made so far.
+        throttled_seconds: Total time callers were held back by the limiter.
+
+    Example:
+        >>> llm = RateLimitedModel(OpenAIModel(), requests_per_minute=500, tokens_per_minute=200_000)
+        >>> llm = CachedModel(llm, "llm_cache.db")  # wrappers compose
+    """
+
+    def __init__(
+        self,
+        model: Model,
+        requests_per_minute: float | None = None,
+        tokens_per_minute: float | None = None,
+        *,
+        key: str | None = None,
+        limiter: RateLimiter | None = None,
+        retry: RetryPolicy | None = None,
+    ) -> None:
+        """Wrap a model.
+
+        Args:
+            model: The model to pace and retry.
+            requests_per_minute: Request ceiling for the provider key.
+            tokens_per_minute: Token ceiling for the provider key.
+            key: Name of the limiter to share (defaults to a digest of the
+                model's ``api_key``).
+            limiter: An explicit limiter, overriding the limits and key.
+            retry: Retry policy (defaults to :class:`RetryPolicy`).
+        """
+        self.model: Model = model
+        super().__init__(model, requests_per_minute, tokens_per_minute, key, limiter, retry)
+
+    @property
+    def model_name(self) -> str:
+        """The name/identifier of the wrapped model."""
+        return self.model.model_name
+
+    @property
+    def provider(self) -> str:
+        """The provider name of the wrapped model."""
+        return self.model.provider
+
+    def generate(
+        self,
+        prompt: str,
+        *,
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+        stop_sequences: list[str] | None = None,
+        **kwargs: Any,
+    ) -> GenerationResult:
+        """Generate text within the rate limits, retrying transient failures.
+
+        Args:
+            prompt: The input prompt.
+            temperature: Override default temperature.
+            max_tokens: Override default max tokens.
+            stop_sequences: Sequences that stop generation.
+            **kwargs: Additional provider-specific options.
+
+        Returns:
+            GenerationResult with the generated text.
+
+        Raises:
+            ModelError: If generation fails and is not retried.
+        """
+        tokens = self._estimate_tokens(prompt, max_tokens, kwargs.get("system"))
+        attempt = 0
+        while True:
+            time.sleep(self._reserve(tokens))
+            try:
+                result = self.model.generate(
+                    prompt, temperature=temperature, max_tokens=max_tokens, stop_sequences=stop_sequences, **kwargs
+                )
+            except Exception as e:
+                delay = self._retry_delay(attempt, e)
+                if delay is None:
+                    raise
+                time.sleep(delay)
+                attempt += 1
+                continue
+            self._settle(tokens, result)
+            return result
+
+    def generate_structured(
+        self,
+        prompt: str,
+        schema: type[T],
+        *,
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+        **kwargs: Any,
+    ) -> T:
+        """Generate structured output within the rate limits, retrying transient failures."""
+        tokens = self._estimate_tokens(prompt, max_tokens, kwargs.get("system"))
+        attempt = 0
+        while True:
+            time.sleep(self._reserve(tokens))
+            try:
+                return self.model.generate_structured(
+                    prompt, schema, temperature=temperature, max_tokens=max_tokens, **kwargs
+                )
+            except Exception as e:
+                delay = self._retry_delay(attempt, e)
+                if delay is None:
+                    raise
+                time.sleep(delay)
+                attempt += 1
+
+    def generate_stream(
+        self,
+        prompt: str,
+        *,
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+        **kwargs: Any,
+    ) -> Iterator[str]:
+        """Stream text from the wrapped model within the rate limits (not retried)."""
+        time.sleep(self._reserve(self._estimate_tokens(prompt, max_tokens, kwargs.get("system"))))
+        yield from self.model.generate_stream(prompt, temperature=temperature, max_tokens=max_tokens, **kwargs)
+
+
+class AsyncRateLimitedModel(_RateLimitedBase, AsyncModel):
+    """Async model wrapper that paces requests and retries failed ones.
+
+    Behaves like :class:`RateLimitedModel`, but waits with
+    ``asyncio.sleep`` so the event loop keeps running. Limiters are
+    shared with sync wrappers of the same provider key.
+
+    Attributes:
+        model: The wrapped async model.
+        limiter: The shared RateLimiter (None for retries only).
+        retry: The retry policy.
+        retries: Retries made so far.
+        throttled_seconds: Total time callers were held back by the limiter.
+
+    Example:
+        >>> async with AsyncRateLimitedModel(get_async_llm(), requests_per_minute=500) as llm:
+        ...     results = await asyncio.gather(*(llm.generate(p) for p in prompts))
+    """
+
+    def __init__(
+        self,
+        model: AsyncModel,
+        requests_per_minute: float | None = None,
+        tokens_per_minute: float | None = None,
+        *,
+        key: str | None = None,
+        limiter: RateLimiter | None = None,
+        retry: RetryPolicy | None = None,
+    ) -> None:
+        """Wrap an async model.
+
+        Args:
+            model: The async model to pace and retry.
+            requests_per_minute: Request ceiling for the provider key.
+            tokens_per_minute: Token ceiling for the provider key.
+            key: Name of the limiter to share (defaults to a digest of the
+                model's ``api_key``).
+            limiter: An explicit limiter, overriding the limits and key.
+            retry: Retry policy (defaults to :class:`RetryPolicy`).
+        """
+        self.model: AsyncModel = model
+        super().__init__(model, requests_per_minute, tokens_per_minute, key, limiter, retry)
+
+    @property
+    def model_name(self) -> str:
+        """The name/identifier of the wrapped model."""
+        return self.model.model_name
+
+    @property
+    def provider(self) -> str:
+        """The provider name of the wrapped model."""
+        return self.model.provider
+
+    async def generate(
+        self,
+        prompt: str,
+        *,
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+        stop_sequences: list[str] | None = None,
+        **kwargs: Any,
+    ) -> GenerationResult:
+        """Generate text within the rate limits, retrying transient failures."""
+        tokens = self._estimate_tokens(prompt, max_tokens, kwargs.get("system"))
+        attempt = 0
+        while True:
+            await asyncio.sleep(self._reserve(tokens))
+            try:
+                result = await self.model.generate(
+                    prompt, temperature=temperature, max_tokens=max_tokens, stop_sequences=stop_sequences, **kwargs
+                )
+            except Exception as e:
+                delay = self._retry_delay(attempt, e)
+                if delay is None:
+                    raise
+                await asyncio.sleep(delay)
+                attempt += 1
+                continue
+            self._settle(tokens, result)
+            return result
+
+    async def generate_structured(
+        self,
+        prompt: str,
+        schema: type[T],
+        *,
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+        **kwargs: Any,
+    ) -> T:
+        """Generate structured output within the rate limits, retrying transient failures."""
+        tokens = self._estimate_tokens(prompt, max_tokens, kwargs.get("system"))
+        attempt = 0
+        while True:
+            await asyncio.sleep(self._reserve(tokens))
+            try:
+                return await self.model.generate_structured(
+                    prompt, schema, temperature=temperature, max_tokens=max_tokens, **kwargs
+                )
+            except Exception as e:
+                delay = self._retry_delay(attempt, e)
+                if delay is None:
+                    raise
+                await asyncio.sleep(delay)
+                attempt += 1
+
+    async def generate_stream(
+        self,
+        prompt: str,
+        *,
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[str]:
+        """Stream text from the wrapped model within the rate limits (not retried)."""
+        await asyncio.sleep(self._reserve(self._estimate_tokens(prompt, max_tokens, kwargs.get("system"))))
+        async for chunk in self.model.generate_stream(prompt, temperature=temperature, max_tokens=max_tokens, **kwargs):
+            yield chunk
+
+    async def aclose(self) -> None:
+        """Close the wrapped model."""
+        await self.model.aclose()
+
+
+__all__ = [
+    "DEFAULT_INITIAL_DELAY",
+    "DEFAULT_MAX_DELAY",
+    "DEFAULT_MAX_RETRIES",
+    "AsyncRateLimitedModel",
+    "RateLimitedModel",
+    "RateLimiter",
+    "RetryPolicy",
+    "TokenBucket",
+    "get_rate_limiter",
+    "is_retryable",
+    "retry_after",
+]
@@ -25,7 +25,8 @@ from enum import Enum
 from typing import Any
 
 from personaut.models.embeddings import EmbeddingModel
-from personaut.models.model import Model, ModelError
+from personaut.models.model import AsyncModel, Model, ModelError
+from personaut.models.response_cache import CachedModel, SQLiteResponseCache
 
 
 logger = logging.getLogger(__name__)
@@ -45,6 +46,9 @@ class Provider(str, Enum):
 ENV_LLM_PROVIDER = "PERSONAUT_LLM_PROVIDER"
 ENV_LLM_MODEL = "PERSONAUT_LLM_MODEL"
 ENV_EMBEDDING_MODEL = "PERSONAUT_EMBEDDING_MODEL"
+ENV_EMBEDDING_CACHE = "PERSONAUT_EMBEDDING_CACHE"
+ENV_EMBEDDING_WORKERS = "PERSONAUT_EMBEDDING_WORKERS"
+ENV_LLM_CACHE = "PERSONAUT_LLM_CACHE"
 
 # Default provider priority (checked in order)
 DEFAULT_PROVIDER_PRIORITY = [
@@ -69,6 +73,10 @@ class ModelRegistry:
     Attributes:
         default_provider: Preferred LLM provider.
         embedding_model: Embedding model name/path.
+        embedding_cache: Path of the persistent embedding cache (optional).
+        embedding_workers: Worker processes to embed in (None or 0 to
+            embed in-process).
+        llm_cache: Path of the persistent LLM response cache (optional).
         models: Cache of initialized models.
 
     Example:
@@ -79,10 +87,16 @@ class ModelRegistry:
 
     default_provider: Provider | str | None = None
     embedding_model: str | None = None
+    embedding_cache: str | None = None
+    embedding_workers: int | None = None
+    llm_cache: str | None = None
 
     # Cached models
     _embedding: EmbeddingModel | None = field(default=None, repr=False)
     _llms: dict[str, Model] = field(default_factory=dict, repr=False)
+    _response_cache: SQLiteResponseCache | None = field(default=None, repr=False)
+    # id(model) → its CachedModel, so repeated wrapping keeps one set of counters
+    _cached_llms: dict[int, CachedModel] = field(default_factory=dict, repr=False)
 
     def __post_init__(self) -> None:
         """Initialize from environment variables."""
@@ -99,6 +113,20 @@ class ModelRegistry:
         if self.embedding_model is None:
             self.embedding_model = os.environ.get(ENV_EMBEDDING_MODEL)
 
+        if self.embedding_cache is None:
+            self.embedding_cache = os.environ.get(ENV_EMBEDDING_CACHE)
+
+        if self.embedding_workers is None:
+            env_workers = os.environ.get(ENV_EMBEDDING_WORKERS)
+            if env_workers:
+                try:
+                    self.embedding_workers = int(env_workers)
+                except ValueError:
+                    logger.warning(f"Invalid embedding worker count: {env_workers}")
+
+        if self.llm_cache is None:
+            self.llm_cache = os.environ.get(ENV_LLM_CACHE)
+
     def get_llm(
         self,
         provider: Provider | str | None = None,
@@ -144,6 +172,94 @@ class ModelRegistry:
         self._llms[cache_key] = llm
         return llm
 
+    def get_cached_llm(
+        self,
+        provider: Provider | str | None = None,
+        model: str | None = None,
+        **kwargs: Any,
+    ) -> Model:
+        """Get an LLM model whose low-temperature responses are cached.
+
+        Use this at call sites that send repeatable analysis prompts; keep
+        :meth:`get_llm` for everything else. Without ``llm_cache`` this is
+        the same model :meth:`get_llm` returns.
+
+        Args:
+            provider: Provider to use (or detect automatically).
+            model: Specific model name (optional).
+            **kwargs: Additional provider-specific options.
+
+        Returns:
+            A :class:`CachedModel`, or the plain model if no cache is configured.
+
+        Example:
+            >>> llm = registry.get_cached_llm()
+            >>> result = llm.generate(prompt, temperature=0.2)
+        """
+        return self.with_response_cache(self.get_llm(provider, model, **kwargs))
+
+    def with_response_cache(self, llm: Model) -> Model:
+        """Wrap a model in the registry's shared response cache.
+
+        The cache file named by ``llm_cache`` is opened once and shared
+        by every wrapped model, so its statistics cover all of them.
+        Wrapping the same model again returns the same :class:`CachedModel`.
+
+        Args:
+            llm: The model to wrap.
+
+        Returns:
+            A :class:`CachedModel`, or ``llm`` itself if no cache is configured.
+        """
+        if not self.llm_cache:
+            return llm
+        cached = self._cached_llms.get(id(llm))
+        if cached is not None and cached.model is llm:
+            return cached
+        if self._response_cache is None:
+            self._response_cache = SQLiteResponseCache(self.llm_cache)
+        cached = self._cached_llms[id(llm)] = CachedModel(llm, self._response_cache)
+        return cached
+
+    def get_async_llm(
+        self,
+        provider: Provider | str | None = None,
+        model: str | None = None,
+        **kwargs: Any,
+    ) -> AsyncModel:
+        """Get an async LLM model built on the provider's async client.
+
+        Provider and model are resolved as in :meth:`get_llm`. Each call
+        returns a new model because async clients are bound to the event
+        loop they first run on; share one model across the coroutines of
+        a loop and close it with ``aclose()`` when done.
+
+        Args:
+            provider: Provider to use (or detect automatically).
+            model: Specific model name (optional).
+            **kwargs: Additional provider-specific options.
+
+        Returns:
+            Configured AsyncModel instance.
+
+        Raises:
+            ModelError: If no provider is available.
+
+        Example:
+            >>> async with registry.get_async_llm("openai") as llm:
+            ...     results = await asyncio.gather(*(llm.generate(p) for p in prompts))
+        """
+        if provider is None:
+            provider = self.default_provider or self._detect_provider()
+
+        if isinstance(provider, str):
+            provider = Provider(provider.lower())
+
+        if model is None:
+            model = os.environ.get(ENV_LLM_MODEL)
+
+        return self._create_async_llm(provider, model, **kwargs)
+
     def get_embedding(
         self,
         model: str | None = None,
@@ -152,7 +268,8 @@ class ModelRegistry:
         """Get the embedding model.
 
         The embedding model is always local (sentence-transformers) to
-        ensure consistent vector representations.
+        ensure consistent vector representations. With
+        ``embedding_workers`` set it runs in a :class:`ProcessPoolEmbedding`.
 
         Args:
             model: Specific model name (optional).
@@ -166,17 +283,23 @@ class ModelRegistry:
             >>> vector = embed.embed("Hello, world!")
         """
         # Return cached if model matches
-        if self._embedding is not None and model is None and not kwargs:
+        is_default = model is None and not kwargs
+        if self._embedding is not None and is_default:
             return self._embedding
 
         from personaut.models.local_embedding import LocalEmbedding
+        from personaut.models.process_embedding import ProcessPoolEmbedding
+
+        if self.embedding_cache:
+            kwargs.setdefault("disk_cache", self.embedding_cache)
+        model_path = model or self.embedding_model or "sentence-transformers/all-MiniLM-L6-v2"
+        embed: EmbeddingModel
+        if self.embedding_workers:
+            embed = ProcessPoolEmbedding(model_path=model_path, workers=self.embedding_workers, **kwargs)
+        else:
+            embed = LocalEmbedding(model_path=model_path, **kwargs)
 
-        embed = LocalEmbedding(
-            model_path=model or self.embedding_model or "sentence-transformers/all-MiniLM-L6-v2",
-            **kwargs,
-        )
-
-        if model is None and not kwargs:
+        if is_default:
             self._embedding = embed
 
         return embed
@@ -216,7 +339,11 @@ class ModelRegistry:
             try:
                 from personaut.models.ollama import OllamaModel
 
-                return OllamaModel().is_available()
+                probe = OllamaModel()
+                try:
+                    return probe.is_available()
+                finally:
+                    probe.close()
             except Exception:
                 return False
         return False
@@ -267,6 +394,52 @@ class ModelRegistry:
             msg = f"Unknown provider: {provider}"
             raise ModelError(msg, provider=str(provider))
 
+    def _create_async_llm(
+        self,
+        provider: Provider,
+        model: str | None = None,
+        **kwargs: Any,
+    ) -> AsyncModel:
+        """Create an async LLM model for the given provider."""
+        if provider == Provider.GEMINI:
+            from personaut.models.gemini import DEFAULT_GEMINI_MODEL, AsyncGeminiModel
+
+            return AsyncGeminiModel(
+                model=model or DEFAULT_GEMINI_MODEL,
+                **kwargs,
+            )
+        elif provider == Provider.OPENAI:
+            from personaut.models.openai import DEFAULT_OPENAI_MODEL, AsyncOpenAIModel
+
+            return AsyncOpenAIModel(
+                model=model or DEFAULT_OPENAI_MODEL,
+                **kwargs,
+            )
+        elif provider == Provider.ANTHROPIC:
+            from personaut.models.anthropic import DEFAULT_ANTHROPIC_MODEL, AsyncAnthropicModel
+
+            return AsyncAnthropicModel(
+                model=model or DEFAULT_ANTHROPIC_MODEL,
+                **kwargs,
+            )
+        elif provider == Provider.BEDROCK:
+            from personaut.models.bedrock import DEFAULT_BEDROCK_MODEL, AsyncBedrockModel
+
+            return AsyncBedrockModel(
+                model=model or DEFAULT_BEDROCK_MODEL,
+                **kwargs,
+            )
+        elif provider == Provider.OLLAMA:
+            from personaut.models.ollama import DEFAULT_OLLAMA_MODEL, AsyncOllamaModel
+
+            return AsyncOllamaModel(
+                model=model or DEFAULT_OLLAMA_MODEL,
+                **kwargs,
+            )
+        else:
+            msg = f"Unknown provider: {provider}"
+            raise ModelError(msg, provider=str(provider))
+
     def list_providers(self) -> list[tuple[Provider, bool]]:
         """List all providers and their availability.
 
@@ -314,6 +487,66 @@ def get_llm(
     return get_registry().get_llm(provider, model, **kwargs)
 
 
+def get_cached_llm(
+    provider: Provider | str | None = None,
+    model: str | None = None,
+    **kwargs: Any,
+) -> Model:
+    """Get an LLM model with response caching from the global registry.
+
+    Args:
+        provider: Provider to use (or auto-detect).
+        model: Specific model name.
+        **kwargs: Additional options.
+
+    Returns:
+        A CachedModel when ``PERSONAUT_LLM_CACHE`` is set, else the plain model.
+
+    Example:
+        >>> llm = get_cached_llm()
+        >>> result = llm.generate(prompt, temperature=0.2)
+    """
+    return get_registry().get_cached_llm(provider, model, **kwargs)
+
+
+def with_response_cache(llm: Model) -> Model:
+    """Wrap a model in the global registry's shared response cache.
+
+    Args:
+        llm: The model to wrap.
+
+    Returns:
+        A CachedModel when ``PERSONAUT_LLM_CACHE`` is set, else ``llm``.
+
+    Example:
+        >>> llm = with_response_cache(my_model)
+        >>> result = llm.generate(prompt, temperature=0.2)
+    """
+    return get_registry().with_response_cache(llm)
+
+
+def get_async_llm(
+    provider: Provider | str | None = None,
+    model: str | None = None,
+    **kwargs: Any,
+) -> AsyncModel:
+    """Get a new async LLM model from the global registry.
+
+    Args:
+        provider: Provider to use (or auto-detect).
+        model: Specific model name.
+        **kwargs: Additional options.
+
+    Returns:
+        Configured AsyncModel instance.
+
+    Example:
+        >>> async with get_async_llm() as llm:
+        ...     result = await llm.generate("Hello!")
+    """
+    return get_registry().get_async_llm(provider, model, **kwargs)
+
+
 def get_embedding(
     model: str | None = None,
     **kwargs: Any,
@@ -342,10 +575,16 @@ __all__ = [
     "get_registry",
     # Convenience functions
     "get_llm",
+    "get_cached_llm",
+    "with_response_cache",
+    "get_async_llm",
     "get_embedding",
     # Constants
     "Provider",
     "ENV_LLM_PROVIDER",
     "ENV_LLM_MODEL",
     "ENV_EMBEDDING_MODEL",
+    "ENV_EMBEDDING_CACHE",
+    "ENV_EMBEDDING_WORKERS",
+    "ENV_LLM_CACHE",
 ]
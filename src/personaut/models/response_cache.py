@@ -0,0 +1,474 @@
+"""Persistent LLM response cache for Personaut PDK.
+
+Low-temperature analysis calls (emotion analysis at 0.3, outcome
+evaluation at 0.2) send the same prompts again and again, and re-running
+an identical simulation re-pays every one of them. This module provides:
+
+- :class:`SQLiteResponseCache`: generation results stored in a WAL-mode
+  SQLite file, keyed by a SHA-256 of the request, with a time-to-live and
+  least-recently-used eviction beyond ``max_entries``.
+- :class:`CachedModel`: a :class:`Model` wrapper that answers repeated
+  requests from the cache. Only calls at or below ``max_temperature``
+  are cached, so creative generations stay fresh.
+
+Caching is opt-in per call site: wrap the model only where repeated
+answers are wanted and keep using the plain model elsewhere.
+
+Example:
+    >>> from personaut.models import CachedModel, get_llm
+    >>>
+    >>> llm = CachedModel(get_llm(), "data/llm_cache.db")
+    >>> llm.generate(prompt, temperature=0.2)  # calls the provider
+    >>> llm.generate(prompt, temperature=0.2)  # read from disk
+    >>> llm.cache_stats.hit_rate
+    0.5
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from personaut.models.model import GenerationResult, Model
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Seconds a cached response stays valid (7 days)
+DEFAULT_RESPONSE_CACHE_TTL = 7 * 24 * 3600.0
+
+# Responses kept before the least recently used are evicted
+DEFAULT_RESPONSE_CACHE_MAX_ENTRIES = 100_000
+
+# Highest temperature whose responses are cached
+DEFAULT_CACHE_MAX_TEMPERATURE = 0.5
+
+# Fraction of max_entries freed by each eviction pass, so the table is counted once per that many inserts
+_EVICTION_HEADROOM = 0.1
+
+
+@dataclass(frozen=True)
+class ResponseCacheStats:
+    """Snapshot of a :class:`SQLiteResponseCache`'s counters.
+
+    Counters cover lookups made through this instance; ``entries`` counts
+    every response in the file.
+
+    Attributes:
+        hits: Lookups answered from the cache.
+        misses: Lookups that found nothing (including expired entries).
+        expirations: Entries dropped because they outlived the TTL.
+        evictions: Entries dropped to stay within ``max_entries``.
+        entries: Responses currently stored.
+        max_entries: Entry bound (None if unbounded).
+        ttl: Seconds an entry stays valid (None if it never expires).
+    """
+
+    hits: int
+    misses: int
+    expirations: int
+    evictions: int
+    entries: int
+    max_entries: int | None
+    ttl: float | None
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups that hit (0.0 before any lookup)."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+def response_cache_key(
+    provider: str,
+    model: str,
+    prompt: str,
+    *,
+    temperature: float | None,
+    max_tokens: int | None,
+    stop_sequences: list[str] | None,
+    system: str | None,
+    **options: Any,
+) -> bytes:
+    """SHA-256 key of a generation request.
+
+    Args:
+        provider: Provider name.
+        model: Model name.
+        prompt: The input prompt.
+        temperature: Effective sampling temperature.
+        max_tokens: Effective token limit.
+        stop_sequences: Stop sequences.
+        system: System prompt.
+        **options: Any further provider options passed to ``generate``.
+
+    Returns:
+        The 32-byte digest.
+    """
+    request = [provider, model, prompt, temperature, max_tokens, stop_sequences or [], system, options]
+    encoded = json.dumps(request, sort_keys=True, default=str, ensure_ascii=False)
+    return hashlib.sha256(encoded.encode("utf-8")).digest()
+
+
+class SQLiteResponseCache:
+    """LLM response cache stored in a SQLite database.
+
+    Each row holds the text, finish reason, usage and model of one
+    :class:`GenerationResult` under the request's key, with its creation
+    and last-access times. Entries older than ``ttl`` seconds are treated
+    as misses and deleted; once the table holds more than ``max_entries``
+    rows, the least recently read ones are evicted down to 90% of the
+    bound. Rows are only counted when the instance's running estimate
+    passes the bound, so an insert does not scan the table. The database
+    uses WAL journaling, so several processes can share one file; each
+    enforces the bound when its own writes take its estimate past it.
+
+    The instance is safe to share between threads.
+
+    Attributes:
+        path: Path to the database file.
+        ttl: Seconds an entry stays valid (None to keep entries forever).
+        max_entries: Most entries kept (None for no bound).
+
+    Example:
+        >>> cache = SQLiteResponseCache("llm_cache.db", ttl=3600)
+        >>> cache.put(key, GenerationResult(text="Yes"))
+        >>> cache.get(key).text
+        'Yes'
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        ttl: float | None = DEFAULT_RESPONSE_CACHE_TTL,
+        max_entries: int | None = DEFAULT_RESPONSE_CACHE_MAX_ENTRIES,
+        timeout: float = 30.0,
+    ) -> None:
+        """Open (or create) the cache database.
+
+        Args:
+            path: Path to the database file. Parent directories are created.
+            ttl: Seconds an entry stays valid (None to keep entries forever).
+            max_entries: Most entries kept (None for no bound).
+            timeout: Seconds to wait for another process's write lock.
+
+        Raises:
+            ValueError: If ``ttl`` is not positive or ``max_entries`` is below 1.
+        """
+        if ttl is not None and ttl <= 0:
+            msg = f"ttl must be positive, got {ttl}"
+            raise ValueError(msg)
+        if max_entries is not None and max_entries < 1:
+            msg = f"max_entries must be at least 1, got {max_entries}"
+            raise ValueError(msg)
+        self.path = Path(path)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._expirations = 0
+        self._evictions = 0
+        self._conn = sqlite3.connect(str(self.path), timeout=timeout, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                key BLOB PRIMARY KEY,
+                text TEXT NOT NULL,
+                finish_reason TEXT NOT NULL,
+                usage TEXT NOT NULL,
+                model TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            ) WITHOUT ROWID
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS responses_created ON responses (created_at)")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed_at)")
+        self._conn.commit()
+        # Upper bound on this connection's view of the row count, re-counted once it passes max_entries
+        self._size_estimate = self._count()
+
+    def __enter__(self) -> SQLiteResponseCache:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def get(self, key: bytes) -> GenerationResult | None:
+        """Look up a response, counting a hit or miss and refreshing its recency.
+
+        Args:
+            key: Request key from :func:`response_cache_key`.
+
+        Returns:
+            The cached result (without ``raw_response``), or None.
+        """
+        now = time.time()
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT text, finish_reason, usage, model, created_at FROM responses WHERE key = ?", [key]
+            ).fetchone()
+            if row is not None and self.ttl is not None and now - row[4] > self.ttl:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", [key])
+                self._expirations += 1
+                self._size_estimate -= 1
+                row = None
+            if row is None:
+                self._misses += 1
+                return None
+            self._conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", [now, key])
+            self._hits += 1
+        text, finish_reason, usage, model, _ = row
+        return GenerationResult(text=text, finish_reason=finish_reason, usage=json.loads(usage), model=model)
+
+    def put(self, key: bytes, result: GenerationResult) -> None:
+        """Store a response, then drop expired and least recently used entries.
+
+        Args:
+            key: Request key from :func:`response_cache_key`.
+            result: The generation result to store.
+        """
+        now = time.time()
+        row = (key, result.text, result.finish_reason, json.dumps(result.usage), result.model, now, now)
+        with self._lock, self._conn:
+            self._conn.execute("INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)", row)
+            # Replacements over-count, which only brings the next exact count forward
+            self._size_estimate += 1
+            if self.ttl is not None:
+                cursor = self._conn.execute("DELETE FROM responses WHERE created_at < ?", [now - self.ttl])
+                self._expirations += cursor.rowcount
+                self._size_estimate -= cursor.rowcount
+            if self.max_entries is not None and self._size_estimate > self.max_entries:
+                self._evict(self.max_entries)
+
+    def count(self) -> int:
+        """Count stored responses."""
+        with self._lock:
+            return self._count()
+
+    def clear(self) -> None:
+        """Delete every stored response; the counters are kept."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM responses")
+            self._size_estimate = 0
+
+    def stats(self) -> ResponseCacheStats:
+        """Get a snapshot of the cache's counters."""
+        with self._lock:
+            return ResponseCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                expirations=self._expirations,
+                evictions=self._evictions,
+                entries=self._count(),
+                max_entries=self.max_entries,
+                ttl=self.ttl,
+            )
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def _count(self) -> int:
+        """Count stored responses (caller holds the lock)."""
+        return int(self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0])
+
+    def _evict(self, max_entries: int) -> None:
+        """Count the rows and, if over the bound, evict the least recently read (caller holds the lock)."""
+        entries = self._count()
+        if entries > max_entries:
+            excess = entries - (max_entries - int(max_entries * _EVICTION_HEADROOM))
+            self._conn.execute(
+                "DELETE FROM responses WHERE key IN (SELECT key FROM responses ORDER BY accessed_at LIMIT ?)",
+                [excess],
+            )
+            self._evictions += excess
+            entries -= excess
+        self._size_estimate = entries
+
+
+class CachedModel(Model):
+    """Model wrapper that serves repeated low-temperature requests from a cache.
+
+    :meth:`generate` resolves the effective temperature and token limit
+    (falling back to the wrapped model's ``config``) and, if the
+    temperature is at most ``max_temperature``, looks the request up by
+    (provider, model, prompt, temperature, max_tokens, stop sequences,
+    system prompt and any other options). Misses call the wrapped model
+    and store its result. Hotter calls, calls whose temperature cannot be
+    determined, and calls made with ``cache=False`` go straight to the
+    model. Cache read or write failures are logged and never fail a call.
+
+    :meth:`generate_structured` and :meth:`generate_stream` are passed
+    through uncached.
+
+    Attributes:
+        model: The wrapped model.
+        cache: The response cache.
+        max_temperature: Highest temperature whose responses are cached.
+        bypassed: Calls that skipped the cache.
+
+    Example:
+        >>> llm = CachedModel(get_llm(), SQLiteResponseCache("llm_cache.db"))
+        >>> llm.generate(prompt, temperature=0.8)  # creative: never cached
+        >>> llm.generate(prompt, temperature=0.2, cache=False)  # this call opts out
+    """
+
+    def __init__(
+        self,
+        model: Model,
+        cache: SQLiteResponseCache | str | Path,
+        max_temperature: float = DEFAULT_CACHE_MAX_TEMPERATURE,
+    ) -> None:
+        """Wrap a model.
+
+        Args:
+            model: The model whose responses to cache.
+            cache: A response cache, which may be shared with other
+                wrappers, or the path of one to open for this wrapper.
+            max_temperature: Highest temperature whose responses are cached.
+        """
+        self.model = model
+        self._owns_cache = not isinstance(cache, SQLiteResponseCache)
+        self.cache = cache if isinstance(cache, SQLiteResponseCache) else SQLiteResponseCache(cache)
+        self.max_temperature = max_temperature
+        self.bypassed = 0
+
+    @property
+    def model_name(self) -> str:
+        """The name/identifier of the wrapped model."""
+        return self.model.model_name
+
+    @property
+    def provider(self) -> str:
+        """The provider name of the wrapped model."""
+        return self.model.provider
+
+    @property
+    def cache_stats(self) -> ResponseCacheStats:
+        """Hit, miss and eviction counters of the response cache."""
+        return self.cache.stats()
+
+    def generate(
+        self,
+        prompt: str,
+        *,
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+        stop_sequences: list[str] | None = None,
+        **kwargs: Any,
+    ) -> GenerationResult:
+        """Generate text, answering repeated requests from the cache.
+
+        Args:
+            prompt: The input prompt.
+            temperature: Override default temperature.
+            max_tokens: Override default max tokens.
+            stop_sequences: Sequences that stop generation.
+            **kwargs: Additional provider-specific options. ``cache=False``
+                skips the cache for this call.
+
+        Returns:
+            GenerationResult with the generated text (``raw_response`` is
+            None on a hit).
+
+        Raises:
+            ModelError: If generation fails.
+        """
+        use_cache = kwargs.pop("cache", True)
+        config = getattr(self.model, "config", None)
+        effective_temperature = temperature if temperature is not None else getattr(config, "temperature", None)
+        if not use_cache or effective_temperature is None or effective_temperature > self.max_temperature:
+            self.bypassed += 1
+            return self.model.generate(
+                prompt, temperature=temperature, max_tokens=max_tokens, stop_sequences=stop_sequences, **kwargs
+            )
+
+        options = dict(kwargs)
+        key = response_cache_key(
+            self.provider,
+            self.model_name,
+            prompt,
+            temperature=effective_temperature,
+            max_tokens=max_tokens if max_tokens is not None else getattr(config, "max_tokens", None),
+            stop_sequences=stop_sequences,
+            system=options.pop("system", None),
+            **options,
+        )
+        try:
+            cached = self.cache.get(key)
+        except sqlite3.Error as e:
+            logger.warning("LLM response cache lookup failed: %s", e)
+            cached = None
+        if cached is not None:
+            return cached
+
+        result = self.model.generate(
+            prompt, temperature=temperature, max_tokens=max_tokens, stop_sequences=stop_sequences, **kwargs
+        )
+        try:
+            self.cache.put(key, result)
+        except sqlite3.Error as e:
+            logger.warning("LLM response cache write failed: %s", e)
+        return result
+
+    def generate_structured(
+        self,
+        prompt: str,
+        schema: type[T],
+        *,
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+        **kwargs: Any,
+    ) -> T:
+        """Generate structured output with the wrapped model (not cached)."""
+        return self.model.generate_structured(prompt, schema, temperature=temperature, max_tokens=max_tokens, **kwargs)
+
+    def generate_stream(
+        self,
+        prompt: str,
+        *,
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+        **kwargs: Any,
+    ) -> Iterator[str]:
+        """Stream text from the wrapped model (not cached)."""
+        return self.model.generate_stream(prompt, temperature=temperature, max_tokens=max_tokens, **kwargs)
+
+    def close(self) -> None:
+        """Close the response cache if this wrapper opened it.
+
+        A cache passed in as an instance, such as the registry's shared
+        one, stays open for the other wrappers using it.
+        """
+        if self._owns_cache:
+            self.cache.close()
+
+
+__all__ = [
+    "DEFAULT_CACHE_MAX_TEMPERATURE",
+    "DEFAULT_RESPONSE_CACHE_MAX_ENTRIES",
+    "DEFAULT_RESPONSE_CACHE_TTL",
+    "CachedModel",
+    "ResponseCacheStats",
+    "SQLiteResponseCache",
+    "response_cache_key",
+]
@@ -13,6 +13,7 @@ from typing import Any
 from fastapi import APIRouter, HTTPException, Query, status
 
 from personaut.server.api.app import get_app_state
+from personaut.server.api.routes.memories import evict_search_index
 from personaut.server.api.schemas import (
     IndividualCreate,
     IndividualListResponse,
@@ -221,6 +222,7 @@ async def delete_individual(
         )
 
     del state.individuals[individual_id]
+    evict_search_index(individual_id)
 
     # Persist delete
     if state.persistence:
@@ -1,6 +1,6 @@
 """Memory management API routes.
 
-Provides CRUD endpoints for individual memories, plus text-based search.
+Provides CRUD endpoints for individual memories, plus BM25 keyword search.
 Memories are stored as dicts in the individual's dict under a 'memories'
 key, consistent with the dict-based storage pattern used across the API.
 """
@@ -9,10 +9,12 @@ from __future__ import annotations
 
 import logging
 import uuid
+from dataclasses import dataclass, field
 from typing import Any
 
 from fastapi import APIRouter, HTTPException, status
 
+from personaut.memory.lexical import BM25Index
 from personaut.server.api.app import get_app_state
 from personaut.server.api.schemas import (
     MemoryCreate,
@@ -28,6 +30,24 @@ logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
+@dataclass
+class _SearchIndex:
+    """An individual's keyword index and the memories list it covers."""
+
+    index: BM25Index
+    memories: list[dict[str, Any]]
+    size: int
+    by_id: dict[str, dict[str, Any]] = field(default_factory=dict)
+
+    def covers(self, memories: list[dict[str, Any]], added: int = 0) -> bool:
+        """Check, in O(1), that ``memories`` is the indexed list grown by ``added`` since the last sync."""
+        return self.memories is memories and self.size + added == len(memories)
+
+
+# Individual ID → keyword index, kept in step by the create and delete routes
+_search_indexes: dict[str, _SearchIndex] = {}
+
+
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
@@ -54,6 +74,70 @@ def _ensure_memories_list(ind: dict[str, Any]) -> list[dict[str, Any]]:
     return memories
 
 
+def _memory_text(memory: dict[str, Any]) -> str:
+    """Return the text indexed for a memory: its description and metadata."""
+    return f"{memory.get('description', '')} {memory.get('metadata') or ''}"
+
+
+def _get_search_index(individual_id: str, memories: list[dict[str, Any]]) -> _SearchIndex:
+    """Return the individual's keyword index, building it on first use.
+
+    The create and delete routes update the index as they change the
+    list, so a search only checks that the list is the same object with
+    the same length. A list replaced or resized elsewhere (e.g. hydrated
+    from the database) is re-indexed in full; descriptions edited in
+    place outside the routes are not picked up.
+    """
+    entry = _search_indexes.get(individual_id)
+    if entry is not None and entry.covers(memories):
+        return entry
+    entry = _SearchIndex(BM25Index(), memories, len(memories))
+    for memory in memories:
+        memory_id = memory.get("id", "")
+        entry.index.add(memory_id, _memory_text(memory))
+        entry.by_id[memory_id] = memory
+    _search_indexes[individual_id] = entry
+    return entry
+
+
+def _index_added(individual_id: str, memories: list[dict[str, Any]], memory: dict[str, Any]) -> None:
+    """Add a memory just appended to ``memories`` to the individual's index."""
+    entry = _search_indexes.get(individual_id)
+    if entry is None:
+        return  # Built from the list on the first search
+    if not entry.covers(memories, added=1):
+        evict_search_index(individual_id)
+        return
+    memory_id = memory.get("id", "")
+    entry.index.add(memory_id, _memory_text(memory))
+    entry.by_id[memory_id] = memory
+    entry.size += 1
+
+
+def _index_removed(
+    individual_id: str,
+    old: list[dict[str, Any]],
+    new: list[dict[str, Any]],
+    memory_id: str,
+) -> None:
+    """Remove a memory from the index as ``old`` is replaced by ``new``."""
+    entry = _search_indexes.get(individual_id)
+    if entry is None:
+        return
+    if not entry.covers(old):
+        evict_search_index(individual_id)
+        return
+    entry.index.remove(memory_id)
+    entry.by_id.pop(memory_id, None)
+    entry.memories = new
+    entry.size = len(new)
+
+
+def evict_search_index(individual_id: str) -> None:
+    """Drop an individual's keyword index, e.g. when the individual is deleted."""
+    _search_indexes.pop(individual_id, None)
+
+
 def _memory_dict_to_response(mem: dict[str, Any], owner_id: str) -> MemoryResponse:
     """Convert a memory dict to a MemoryResponse schema."""
     return MemoryResponse(
@@ -114,6 +198,7 @@ async def create_memory(
     }
 
     memories.append(memory)
+    _index_added(individual_id, memories, memory)
 
     # Persist to DB if available
     state = get_app_state()
@@ -171,6 +256,7 @@ async def delete_memory(individual_id: str, memory_id: str) -> None:
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Memory {memory_id} not found",
         )
+    _index_removed(individual_id, memories, ind["memories"], memory_id)
 
     logger.info("Deleted memory %s from %s", memory_id, individual_id)
 
@@ -184,24 +270,19 @@ async def search_memories(
     individual_id: str,
     body: MemorySearchRequest,
 ) -> MemorySearchResponse:
-    """Simple keyword search across an individual's memories.
+    """Keyword search across an individual's memories.
 
-    Searches the description field for substring matches
-    (case-insensitive). For vector-based semantic search,
-    use the PDK's search_memories() with an embedding function.
+    Ranks memories whose description or metadata share a whole word with
+    the query by BM25 (case-insensitive). Punctuation is ignored and
+    partial words do not match. For vector-based semantic search,
+    use the PDK's search_memories() or hybrid_search() with an
+    embedding function.
     """
     ind = _get_individual(individual_id)
     memories = _ensure_memories_list(ind)
 
-    query_lower = body.query.lower()
-    matched = []
-    for m in memories:
-        desc = m.get("description", "")
-        meta_str = str(m.get("metadata", {}))
-        if query_lower in desc.lower() or query_lower in meta_str.lower():
-            matched.append(m)
-
-    matched = matched[: body.limit]
+    entry = _get_search_index(individual_id, memories)
+    matched = [entry.by_id[memory_id] for memory_id, _ in entry.index.search(body.query, body.limit)]
 
     return MemorySearchResponse(
         query=body.query,
@@ -63,6 +63,14 @@ def create_ui_app(
     # Register blueprints
     _register_blueprints(app)
 
+    # Start embedding worker processes in the background, off the request path
+    if os.environ.get("PERSONAUT_EMBEDDING_WORKERS"):
+        import threading
+
+        from personaut.server.ui.views.chat_engine import preload_embedding_model
+
+        threading.Thread(target=preload_embedding_model, name="personaut-embedding-preload", daemon=True).start()
+
     # ── Serve generated data (portraits, videos) from the data dir ───
     @app.route("/data/<path:filepath>")
     def serve_data(filepath: str) -> Any:
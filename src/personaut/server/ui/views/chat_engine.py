@@ -8,18 +8,22 @@ only Flask route handlers that delegate to this engine.
 
 from __future__ import annotations
 
+import importlib.util
 import json
 import logging
+import os
 import re
+import threading
 from typing import Any
 
 from personaut.emotions import CATEGORY_EMOTIONS, EmotionalState, EmotionCategory
 
 # ── PDK imports ──
-from personaut.individuals import Individual, create_individual
+from personaut.individuals import Individual, MemoryChanges, create_individual
 from personaut.masks.mask import Mask
 from personaut.memory import search_memories as pdk_search_memories
-from personaut.memory.vector_store import InMemoryVectorStore
+from personaut.memory.lexical import BM25Index
+from personaut.memory.matrix_store import MatrixVectorStore
 from personaut.prompts import PromptBuilder
 from personaut.server.ui.views.api_helpers import api_get as _api_get
 from personaut.situations import Situation, create_situation
@@ -62,12 +66,20 @@ individual_cache: dict[str, Individual] = {}
 # Session → cumulative token usage
 session_token_usage: dict[str, dict[str, int]] = {}
 
-# Individual → InMemoryVectorStore (for semantic memory search)
-_individual_vector_stores: dict[str, InMemoryVectorStore] = {}
+# Individual → MatrixVectorStore (for semantic memory search)
+_individual_vector_stores: dict[str, MatrixVectorStore] = {}
 
-# Embedding model singleton (lazy-init)
+# Individual → BM25Index (for keyword memory search without embeddings)
+_individual_text_indexes: dict[str, BM25Index] = {}
+
+# Individual → (memory log ID, memory version) each index has applied
+_vector_store_versions: dict[str, tuple[str, int]] = {}
+_text_index_versions: dict[str, tuple[str, int]] = {}
+
+# Embedding model singleton (lazy-init, under a lock since preload runs on a background thread)
 _embedding_model: Any = None
 _embedding_checked: bool = False
+_embedding_lock = threading.Lock()
 
 # LLM singleton (lazy-init once)
 _llm_instance: Any = None
@@ -97,20 +109,75 @@ def get_llm() -> Any:
 
 
 def _get_embedding_model() -> Any:
-    """Get the embedding model, or None if sentence-transformers is unavailable."""
+    """Get the embedding model, or None if it cannot be created.
+
+    Without sentence-transformers (and without worker processes) this is
+    a :class:`HashingEmbedding`, so memory search still uses vectors.
+    A request arriving while another thread creates the model waits for it.
+    """
     global _embedding_model, _embedding_checked
     if _embedding_checked:
         return _embedding_model
-    _embedding_checked = True
+    with _embedding_lock:
+        if not _embedding_checked:
+            _embedding_model = _create_embedding_model()
+            _embedding_checked = True
+    return _embedding_model
+
+
+def _create_embedding_model() -> Any:
+    """Create the embedding model, or return None if none is available."""
     try:
+        from personaut.models.batching_embedding import BatchingEmbedding
+        from personaut.models.embeddings import EmbeddingModel
+        from personaut.models.hashing_embedding import HashingEmbedding
         from personaut.models.local_embedding import create_local_embedding
-
-        _embedding_model = create_local_embedding()
-        logger.info("Embedding model loaded: %s", _embedding_model.model_name)
+        from personaut.models.process_embedding import ProcessPoolEmbedding
+        from personaut.models.registry import ENV_EMBEDDING_CACHE, ENV_EMBEDDING_WORKERS
+
+        disk_cache = os.environ.get(ENV_EMBEDDING_CACHE)
+        workers = int(os.environ.get(ENV_EMBEDDING_WORKERS) or 0)
+        model: EmbeddingModel
+        if workers > 0:
+            # Worker processes keep model loading and forward passes off the server's GIL
+            model = ProcessPoolEmbedding(workers=workers, disk_cache=disk_cache)
+        elif importlib.util.find_spec("sentence_transformers") is None:
+            # NumPy-only hashed n-grams keep vector search working without a model
+            hashing = HashingEmbedding()
+            logger.info("sentence-transformers not installed — using %s", hashing.model_name)
+            return hashing
+        else:
+            model = create_local_embedding(disk_cache=disk_cache)
+        # Concurrent chat requests share forward passes instead of embedding one message each
+        batching = BatchingEmbedding(model)
+        logger.info("Embedding model loaded: %s", batching.model_name)
+        return batching
     except Exception as e:
         logger.info("No embedding model available (%s) — using keyword fallback", e)
-        _embedding_model = None
-    return _embedding_model
+        return None
+
+
+def preload_embedding_model() -> None:
+    """Load the embedding model ahead of the first chat request.
+
+    With ``PERSONAUT_EMBEDDING_WORKERS`` set this starts the worker
+    processes and waits until each has loaded its model; otherwise it
+    loads the in-process model with one warm-up embedding. Failures are
+    logged, leaving the keyword fallback in place.
+    """
+    from personaut.models.process_embedding import ProcessPoolEmbedding
+
+    embed_model = _get_embedding_model()
+    if embed_model is None:
+        return
+    model = getattr(embed_model, "model", embed_model)
+    try:
+        if isinstance(model, ProcessPoolEmbedding):
+            model.preload()
+        else:
+            model.embed_array("warm-up")
+    except Exception as e:
+        logger.warning("Embedding model warm-up failed: %s", e)
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -118,41 +185,87 @@ def _get_embedding_model() -> Any:
 # ═══════════════════════════════════════════════════════════════════════════
 
 
-def _get_vector_store(individual_id: str) -> InMemoryVectorStore:
-    """Get or create the InMemoryVectorStore for an individual."""
+def _get_vector_store(individual_id: str) -> MatrixVectorStore:
+    """Get or create the MatrixVectorStore for an individual."""
     if individual_id not in _individual_vector_stores:
-        _individual_vector_stores[individual_id] = InMemoryVectorStore()
+        _individual_vector_stores[individual_id] = MatrixVectorStore()
     return _individual_vector_stores[individual_id]
 
 
+def _pending_memory_changes(
+    individual: Individual,
+    versions: dict[str, tuple[str, int]],
+) -> MemoryChanges | None:
+    """Get the memory changes an index has not applied yet.
+
+    Returns None when the index has never seen this Individual object's
+    change log (e.g. after ``individual_cache`` was invalidated and the
+    individual re-hydrated) or fell behind its pruned removals, so the
+    caller must reconcile the whole index.
+    """
+    applied = versions.get(individual.id)
+    if applied is None or applied[0] != individual.memory_log_id:
+        return None
+    changes = individual.memory_changes(since=applied[1])
+    return None if changes.resync else changes
+
+
 def _ensure_memories_indexed(individual: Individual) -> None:
-    """Ensure all of an individual's memories are indexed in the vector store.
+    """Apply an individual's memory changes to its vector store.
 
-    Uses the embedding model to embed memory descriptions. Only indexes
-    memories that haven't been indexed yet (checks by ID).
+    Consumes the individual's memory change feed, so only memories added
+    or replaced since the last call are embedded and removed ones are
+    deleted. A re-hydrated individual is reconciled against the store
+    once, reusing the embeddings of memories whose description is unchanged.
     """
     embed_model = _get_embedding_model()
     if embed_model is None:
         return
 
     store = _get_vector_store(individual.id)
-    memories = individual.get_memories()
-    if not memories:
-        return
+    changes = _pending_memory_changes(individual, _vector_store_versions)
+    if changes is None:
+        changes = individual.memory_changes()
+        current = {m.id for m in changes.upserted}
+        changes.removed = [m.id for m in store.get_all() if m.id not in current]
+        pending = []
+        for memory in changes.upserted:
+            indexed = store.get(memory.id)
+            if indexed is not None and indexed.embedding is not None and indexed.description == memory.description:
+                store.store(memory, indexed.embedding)
+            else:
+                pending.append(memory)
+    else:
+        pending = changes.upserted
 
-    # Only embed memories not already in the store
-    new_memories = [m for m in memories if store.get(m.id) is None]
-    if not new_memories:
-        return
+    for memory_id in changes.removed:
+        store.delete(memory_id)
 
-    try:
-        texts = [m.description for m in new_memories]
-        embeddings = embed_model.embed_batch(texts)
-        for memory, embedding in zip(new_memories, embeddings):
-            store.store(memory, embedding)
-        logger.info("Indexed %d new memories for %s (total: %d)", len(new_memories), individual.name, store.count())
-    except Exception as e:
-        logger.warning("Failed to index memories: %s", e)
+    if pending:
+        try:
+            embeddings = embed_model.embed_batch_array([m.description for m in pending])
+            for memory, embedding in zip(pending, embeddings):
+                store.store(memory, embedding)
+            logger.info("Indexed %d new memories for %s (total: %d)", len(pending), individual.name, store.count())
+        except Exception as e:
+            logger.warning("Failed to index memories: %s", e)
+            return
+    _vector_store_versions[individual.id] = (individual.memory_log_id, changes.version)
+
+
+def _get_text_index(individual: Individual) -> BM25Index:
+    """Get the BM25 index of an individual's memories, applying pending changes."""
+    index = _individual_text_indexes.get(individual.id)
+    changes = _pending_memory_changes(individual, _text_index_versions)
+    if index is None or changes is None:
+        index = _individual_text_indexes[individual.id] = BM25Index()
+        changes = individual.memory_changes()
+    for memory_id in changes.removed:
+        index.remove(memory_id)
+    for memory in changes.upserted:
+        index.add(memory.id, memory.description)
+    _text_index_versions[individual.id] = (individual.memory_log_id, changes.version)
+    return index
 
 
 def search_relevant_memories(
@@ -163,12 +276,11 @@ def search_relevant_memories(
     """Search for memories most relevant to the current message.
 
     Uses the PDK's ``search_memories()`` for vector similarity when an
-    embedding model is available, otherwise falls back to keyword matching.
+    embedding model is available, otherwise falls back to BM25 keyword ranking.
 
     Returns a list of Memory objects sorted by relevance.
     """
-    memories = individual.get_memories()
-    if not memories:
+    if not individual.memories:
         return []
 
     embed_model = _get_embedding_model()
@@ -181,7 +293,7 @@ def search_relevant_memories(
             results = pdk_search_memories(
                 store=store,
                 query=message,
-                embed_func=embed_model.embed,
+                embed_func=embed_model.embed_array,
                 limit=limit,
                 owner_id=individual.id,
             )
@@ -190,7 +302,7 @@ def search_relevant_memories(
                 results = pdk_search_memories(
                     store=store,
                     query=message,
-                    embed_func=embed_model.embed,
+                    embed_func=embed_model.embed_array,
                     limit=limit,
                 )
             relevant = [mem for mem, score in results if score > 0.15]
@@ -204,16 +316,13 @@ def search_relevant_memories(
         except Exception as e:
             logger.warning("PDK search_memories failed, falling back to keywords: %s", e)
 
-    # Keyword fallback: score memories by word overlap with the message
-    msg_words = set(message.lower().split())
-    scored: list[tuple[Any, int]] = []
-    for mem in memories:
-        desc_words = set(mem.description.lower().split())
-        overlap = len(msg_words & desc_words)
-        if overlap > 0:
-            scored.append((mem, overlap))
-    scored.sort(key=lambda x: x[1], reverse=True)
-    return [mem for mem, _ in scored[:limit]] if scored else memories[:limit]
+    # Keyword fallback: rank memories by BM25 against the message
+    ranked = [
+        memory
+        for memory_id, _ in _get_text_index(individual).search(message, limit)
+        if (memory := individual.get_memory(memory_id)) is not None
+    ]
+    return ranked or individual.memories[:limit]
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -947,6 +1056,10 @@ def analyze_emotions(
     llm = get_llm()
     if llm is None:
         return {}
+    # Repeatable low-temperature analysis, served from the response cache when one is configured
+    from personaut.models.registry import with_response_cache
+
+    llm = with_response_cache(llm)
 
     prompt = _build_emotion_analysis_prompt(individual, user_message, reply)
 
@@ -478,6 +478,10 @@ def evaluate_outcome(
     llm = get_llm()
     if llm is None:
         return {"achieved": False, "confidence": 0.0, "reasoning": "No LLM available"}
+    # Repeatable low-temperature analysis, served from the response cache when one is configured
+    from personaut.models.registry import with_response_cache
+
+    llm = with_response_cache(llm)
 
     conv_text = "\n".join(f"{t['speaker']}: {t['content']}" for t in conversation_history)
 
@@ -787,6 +791,29 @@ def generate_llm_response(prompt: str, max_tokens: int = 200) -> str | None:
         return None
 
 
+def generate_llm_responses(prompts: list[str], max_tokens: int = 200) -> list[str | None]:
+    """Generate responses for independent prompts, issuing them in parallel.
+
+    Returns one entry per prompt, in order: the response text, or None
+    where the LLM is unavailable or the prompt failed.
+    """
+    from personaut.models.model import Model
+
+    llm = get_llm()
+    if llm is None:
+        return [None] * len(prompts)
+    if not isinstance(llm, Model):
+        return [generate_llm_response(prompt, max_tokens=max_tokens) for prompt in prompts]
+
+    batch = llm.generate_many(prompts, temperature=0.8, max_tokens=max_tokens)
+    responses: list[str | None] = []
+    for text, error in zip(batch.texts, batch.errors):
+        if error is not None:
+            logger.warning("LLM generation failed: %s", error)
+        responses.append((text or "").strip() or None)
+    return responses
+
+
 def generate_llm_response_multimodal(
     prompt: str,
     image_base64: str | None = None,
@@ -829,6 +856,34 @@ def generate_llm_response_multimodal(
         return generate_llm_response(prompt, max_tokens=max_tokens)
 
 
+def generate_llm_responses_multimodal(
+    prompts: list[str],
+    image_base64: str | None = None,
+    image_mime: str = "image/png",
+    max_tokens: int = 300,
+) -> list[str | None]:
+    """Generate responses for independent prompts about one image, in parallel.
+
+    Runs :func:`generate_llm_response_multimodal` for each prompt on a
+    thread pool bounded like ``Model.generate_many``; returns one entry
+    per prompt, in order.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    from personaut.models.model import DEFAULT_MAX_CONCURRENCY
+
+    def generate_one(prompt: str) -> str | None:
+        return generate_llm_response_multimodal(
+            prompt, image_base64=image_base64, image_mime=image_mime, max_tokens=max_tokens
+        )
+
+    workers = min(DEFAULT_MAX_CONCURRENCY, len(prompts))
+    if workers <= 1:
+        return [generate_one(prompt) for prompt in prompts]
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="survey-multimodal") as pool:
+        return list(pool.map(generate_one, prompts))
+
+
 def survey_fallback(individual: Individual, question: dict[str, Any]) -> str:
     """Simple fallback when LLM is unavailable for survey."""
     q_type = question.get("type", "open_ended")
@@ -368,7 +368,34 @@ def _run_survey(
     image_description = config.get("image_description", "")
     has_image = bool(image_base64)
 
+    # Every (variation, respondent, question) prompt is independent
+    prompts = [
+        engine.build_survey_prompt(
+            individual,
+            question,
+            situation,
+            has_image=has_image,
+            image_description=image_description,
+        )
+        for _var_idx in range(num_variations)
+        for individual in individuals
+        for question in survey_questions
+    ]
+
+    # Generate in parallel — multimodal if image, else text-only
+    responses: list[str | None]
+    if has_image:
+        responses = engine.generate_llm_responses_multimodal(
+            prompts,
+            image_base64=image_base64,
+            image_mime=image_mime,
+            max_tokens=300,
+        )
+    else:
+        responses = engine.generate_llm_responses(prompts, max_tokens=250)
+
     all_variations = []
+    response_iter = iter(responses)
 
     for _var_idx in range(num_variations):
         respondents_data = []
@@ -377,26 +404,7 @@ def _run_survey(
             answers = []
 
             for question in survey_questions:
-                # Build prompt (with image context if available)
-                prompt = engine.build_survey_prompt(
-                    individual,
-                    question,
-                    situation,
-                    has_image=has_image,
-                    image_description=image_description,
-                )
-
-                # Generate — use multimodal if image, else text-only
-                if has_image:
-                    response = engine.generate_llm_response_multimodal(
-                        prompt,
-                        image_base64=image_base64,
-                        image_mime=image_mime,
-                        max_tokens=300,
-                    )
-                else:
-                    response = engine.generate_llm_response(prompt, max_tokens=250)
-
+                response = next(response_iter)
                 q_type = question.get("type", "open_ended")
                 answer: dict[str, Any] = {
                     "question": question.get("text", ""),
@@ -479,7 +487,7 @@ def _run_outcome_tracking(
     fixed_traits = None if vary_by == "traits" else dict.fromkeys(ALL_TRAITS, 0.5)
     fixed_emotions = None if vary_by == "emotions" else {"content": 0.5, "thoughtful": 0.4}
 
-    all_trials = []
+    trials = []
 
     for trial_idx in range(num_trials):
         customer = engine.generate_random_individual(
@@ -506,16 +514,16 @@ def _run_outcome_tracking(
             outcome_desc,
             scenario_context,
         )
+        trials.append((customer, enhanced_sit, grounded_sit, situation_params))
 
-        history = _run_trial_conversation(
-            [agent, customer],
-            enhanced_sit,
-            grounded_sit,
-            agent,
-            max_turns,
-        )
+    histories = _run_trial_conversations(
+        [([agent, customer], enhanced_sit, grounded_sit) for customer, enhanced_sit, grounded_sit, _ in trials],
+        agent,
+        max_turns,
+    )
 
-        trial_data = _collect_trial_data(
+    all_trials = [
+        _collect_trial_data(
             trial_idx,
             customer,
             history,
@@ -523,7 +531,8 @@ def _run_outcome_tracking(
             vary_by,
             situation_params,
         )
-        all_trials.append(trial_data)
+        for trial_idx, ((customer, _, _, situation_params), history) in enumerate(zip(trials, histories))
+    ]
 
     return jsonify(
         _build_outcome_response(
@@ -573,37 +582,45 @@ def _build_trial_situations(
     return enhanced, grounded
 
 
-def _run_trial_conversation(
-    trial_individuals: list[Individual],
-    enhanced_situation: Situation,
-    grounded_situation: Situation,
+def _run_trial_conversations(
+    trials: list[tuple[list[Individual], Situation, Situation]],
     agent: Individual,
     max_turns: int,
-) -> list[dict[str, Any]]:
-    """Run a multi-turn conversation for one outcome trial."""
-    history: list[dict[str, Any]] = []
-    speaker_idx = 0
+) -> list[list[dict[str, Any]]]:
+    """Run the multi-turn conversations of all outcome trials.
+
+    Each trial is a (participants, enhanced situation, grounded situation)
+    triple. Turns within a trial depend on each other, but trials do not,
+    so every turn's prompts for all trials are generated in parallel.
+    """
+    histories: list[list[dict[str, Any]]] = [[] for _ in trials]
 
     for turn_num in range(max_turns):
-        speaker = trial_individuals[speaker_idx]
-        prompt = engine.build_conversation_prompt(
-            trial_individuals,
-            enhanced_situation if speaker == agent else grounded_situation,
-            turn_num,
-            speaker,
-            history,
-        )
-        response = engine.generate_llm_response(prompt, max_tokens=200)
+        # Speakers alternate, agent first
+        speakers = [trial_individuals[turn_num % 2] for trial_individuals, _, _ in trials]
+        prompts = [
+            engine.build_conversation_prompt(
+                trial_individuals,
+                enhanced_situation if speaker == agent else grounded_situation,
+                turn_num,
+                speaker,
+                history,
+            )
+            for (trial_individuals, enhanced_situation, grounded_situation), speaker, history in zip(
+                trials, speakers, histories
+            )
+        ]
+        responses = engine.generate_llm_responses(prompts, max_tokens=200)
 
-        if response is None:
-            response = f"Hi there, I'm {speaker.name}." if turn_num == 0 else "Tell me more about that."
+        for (trial_individuals, _, _), speaker, history, response in zip(trials, speakers, histories, responses):
+            if response is None:
+                response = f"Hi there, I'm {speaker.name}." if turn_num == 0 else "Tell me more about that."
 
-        # Clean response
-        response = _clean_speaker_response(response, speaker.name, trial_individuals)
-        history.append({"speaker": speaker.name, "content": response, "turn": turn_num})
-        speaker_idx = (speaker_idx + 1) % 2
+            # Clean response
+            response = _clean_speaker_response(response, speaker.name, trial_individuals)
+            history.append({"speaker": speaker.name, "content": response, "turn": turn_num})
 
-    return history
+    return histories
 
 
 def _clean_speaker_response(response: str, speaker_name: str, all_individuals: list[Individual]) -> str:
@@ -19,6 +19,7 @@ import logging
 from dataclasses import dataclass, field
 from typing import Any
 
+from personaut.models.model import DEFAULT_MAX_CONCURRENCY, Model
 from personaut.simulations.simulation import Simulation
 from personaut.simulations.styles import SimulationStyle
 
@@ -39,6 +40,8 @@ class ConversationSimulation(Simulation):
         include_actions: Whether to include physical actions/gestures.
         update_emotions: Whether to update emotional states during conversation.
         create_memories: Whether to create memories from the interaction.
+        max_concurrency: Most LLM requests in flight when several runs
+            are generated together.
 
     Example:
         >>> simulation = ConversationSimulation(
@@ -54,6 +57,7 @@ class ConversationSimulation(Simulation):
     include_actions: bool = True
     update_emotions: bool = True
     create_memories: bool = True
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY
 
     # Internal state
     _prompt_manager: Any = field(default=None, repr=False)
@@ -110,6 +114,69 @@ class ConversationSimulation(Simulation):
         # Format output
         return self._format_conversation(turns)
 
+    def _generate_runs(self, num: int, **options: Any) -> list[str]:
+        """Generate every run's conversation, advancing the runs together.
+
+        Turns within a conversation depend on each other, but separate
+        runs do not. With a :class:`Model` as the LLM, each turn's prompts
+        for all runs are built by :meth:`_build_turn_prompt` and sent with
+        one ``generate_many`` call, so ``num`` conversations take about as
+        long as one. Subclasses that override :meth:`_generate`,
+        :meth:`_generate_turn` or :meth:`_generate_llm_turn` get their
+        runs generated one after another instead.
+
+        Args:
+            num: Number of runs.
+            **options: Additional options like max_turns, include_actions.
+
+        Returns:
+            Formatted conversation content of each run, in order.
+        """
+        if not isinstance(self.llm, Model) or not self._uses_default_turns():
+            return super()._generate_runs(num, **options)
+
+        max_turns = options.get("max_turns", self.max_turns)
+        include_actions = options.get("include_actions", self.include_actions)
+        histories: list[list[dict[str, Any]]] = [[] for _ in range(num)]
+
+        for turn_num in range(max_turns):
+            # Sequential and dynamic turn order both alternate for now
+            speaker = self.individuals[turn_num % len(self.individuals)]
+            speaker_name = self._get_individual_name(speaker)
+
+            prompts = [self._build_turn_prompt(speaker, history, include_actions) for history in histories]
+            batch = self.llm.generate_many(
+                prompts, max_concurrency=self.max_concurrency, temperature=0.8, max_tokens=256
+            )
+
+            for history, result, error in zip(histories, batch.results, batch.errors):
+                if result is None:
+                    logger.warning("LLM generation failed for %s, falling back to placeholder: %s", speaker_name, error)
+                    content = self._fallback_turn(
+                        speaker_name,
+                        self._get_emotional_state(speaker),
+                        self._build_history_context(history),
+                        turn_num,
+                        include_actions,
+                        history=history,
+                    )
+                else:
+                    content = result.text.strip()
+                history.append({"speaker": speaker_name, "content": content, "turn": turn_num})
+
+        # Leave the last run's turns behind, as sequential runs do
+        if histories:
+            self._conversation_history = histories[-1]
+        return [self._format_conversation(history) for history in histories]
+
+    def _uses_default_turns(self) -> bool:
+        """Check that no subclass replaced how a run's turns are generated."""
+        cls = type(self)
+        return all(
+            getattr(cls, name) is getattr(ConversationSimulation, name)
+            for name in ("_generate", "_generate_turn", "_generate_llm_turn")
+        )
+
     def _generate_turn(
         self,
         speaker: Any,
@@ -180,6 +247,66 @@ class ConversationSimulation(Simulation):
         Returns:
             LLM-generated response text.
         """
+        prompt = self._build_turn_prompt(speaker, self._conversation_history, include_actions)
+
+        try:
+            assert self.llm is not None  # Caller gates on self.llm
+            result = self.llm.generate(prompt, temperature=0.8, max_tokens=256)
+            return result.text.strip()  # type: ignore[no-any-return]
+        except Exception as exc:
+            logger.warning("LLM generation failed for %s, falling back to placeholder: %s", speaker_name, exc)
+            return self._fallback_turn(speaker_name, emotional_state, history_context, turn_number, include_actions)
+
+    def _build_turn_prompt(
+        self,
+        speaker: Any,
+        history: list[dict[str, Any]],
+        include_actions: bool,
+    ) -> str:
+        """Build the LLM prompt for a speaker's next line after ``history``.
+
+        Both single and batched runs build their prompts here, so
+        subclasses can override it to change the prompt.
+
+        Args:
+            speaker: The speaking individual.
+            history: Turns of the conversation so far.
+            include_actions: Whether to include actions.
+
+        Returns:
+            The prompt text.
+        """
+        return self._build_llm_prompt(
+            speaker,
+            self._get_individual_name(speaker),
+            self._get_emotional_state(speaker),
+            self._get_traits(speaker),
+            self._build_history_context(history),
+            include_actions,
+        )
+
+    def _build_llm_prompt(
+        self,
+        speaker: Any,
+        speaker_name: str,
+        emotional_state: Any,
+        traits: Any,
+        history_context: str,
+        include_actions: bool,
+    ) -> str:
+        """Build the LLM prompt for a speaker's next line.
+
+        Args:
+            speaker: The speaking individual.
+            speaker_name: Name of the speaker.
+            emotional_state: Speaker's emotional state.
+            traits: Speaker's trait profile.
+            history_context: Summary of conversation so far.
+            include_actions: Whether to include actions.
+
+        Returns:
+            The prompt text.
+        """
         # Build persona prompt
         situation_desc = getattr(self.situation, "description", "a conversation")
         location = getattr(self.situation, "location", None)
@@ -240,18 +367,21 @@ class ConversationSimulation(Simulation):
                 "Respond with ONLY the dialogue line, no speaker label."
             )
 
-        prompt = "\n".join(prompt_parts)
+        return "\n".join(prompt_parts)
 
-        try:
-            assert self.llm is not None  # Caller gates on self.llm
-            result = self.llm.generate(prompt, temperature=0.8, max_tokens=256)
-            return result.text.strip()  # type: ignore[no-any-return]
-        except Exception as exc:
-            logger.warning("LLM generation failed for %s, falling back to placeholder: %s", speaker_name, exc)
-            # Fall back to placeholder on error
-            if turn_number == 0:
-                return self._generate_opening(speaker_name, emotional_state, include_actions)
-            return self._generate_continuation(speaker_name, emotional_state, history_context, include_actions)
+    def _fallback_turn(
+        self,
+        speaker_name: str,
+        emotional_state: Any,
+        history_context: str,
+        turn_number: int,
+        include_actions: bool,
+        history: list[dict[str, Any]] | None = None,
+    ) -> str:
+        """Placeholder line used when LLM generation fails."""
+        if turn_number == 0:
+            return self._generate_opening(speaker_name, emotional_state, include_actions)
+        return self._generate_continuation(speaker_name, emotional_state, history_context, include_actions, history)
 
     def _generate_opening(
         self,
@@ -294,6 +424,7 @@ class ConversationSimulation(Simulation):
         emotional_state: Any,
         history_context: str,
         include_actions: bool,
+        history: list[dict[str, Any]] | None = None,
     ) -> str:
         """Generate a continuation line.
 
@@ -302,12 +433,15 @@ class ConversationSimulation(Simulation):
             emotional_state: Speaker's emotional state.
             history_context: Summary of conversation so far.
             include_actions: Whether to include actions.
+            history: Turns so far (defaults to the current conversation).
 
         Returns:
             Continuation line text.
         """
+        if history is None:
+            history = self._conversation_history
         # Get the last speaker's message to respond to
-        last_turn = self._conversation_history[-1] if self._conversation_history else {}
+        last_turn = history[-1] if history else {}
         last_turn.get("speaker", "")
         last_turn.get("content", "")
 
@@ -324,17 +458,22 @@ class ConversationSimulation(Simulation):
 
         return f"{action}That's interesting. Tell me more about that."
 
-    def _build_history_context(self) -> str:
+    def _build_history_context(self, history: list[dict[str, Any]] | None = None) -> str:
         """Build a context string from conversation history.
 
+        Args:
+            history: Turns to summarize (defaults to the current conversation).
+
         Returns:
             Summary of conversation history.
         """
-        if not self._conversation_history:
+        if history is None:
+            history = self._conversation_history
+        if not history:
             return ""
 
         lines = []
-        for turn in self._conversation_history[-5:]:  # Last 5 turns
+        for turn in history[-5:]:  # Last 5 turns
             speaker = turn.get("speaker", "Unknown")
             content = turn.get("content", "")
             lines.append(f"{speaker}: {content}")
@@ -152,12 +152,9 @@ class Simulation(ABC):
         output_dir.mkdir(parents=True, exist_ok=True)
 
         results = []
-        for i in range(num):
+        for content in self._generate_runs(num, **options):
             simulation_id = f"{self.simulation_type.value}_{uuid.uuid4().hex[:8]}"
 
-            # Generate content
-            content = self._generate(run_index=i, **options)
-
             # Determine output path
             extension = self.style.extension if self.style else "txt"
             output_path = output_dir / f"{simulation_id}.{extension}"
@@ -177,6 +174,21 @@ class Simulation(ABC):
 
         return results
 
+    def _generate_runs(self, num: int, **options: Any) -> list[str]:
+        """Generate the content of every run.
+
+        Runs are generated one after another. Subclasses whose runs are
+        independent can override this to generate them together.
+
+        Args:
+            num: Number of runs.
+            **options: Simulation-specific options.
+
+        Returns:
+            Generated content of each run, in order.
+        """
+        return [self._generate(run_index=i, **options) for i in range(num)]
+
     @abstractmethod
     def _generate(self, run_index: int = 0, **options: Any) -> str:
         """Generate simulation content.
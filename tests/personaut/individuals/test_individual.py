@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from datetime import datetime
 
+import pytest
+
 from personaut.emotions import EmotionalState
 from personaut.individuals import (
     Individual,
@@ -248,6 +250,72 @@ class TestMemoryMethods:
         # Verify memories were added
         assert individual.memory_count() == 3
 
+    def test_memory_changes_since_version(self) -> None:
+        """Test that the change feed reports only later mutations."""
+        from personaut.memory import create_individual_memory
+
+        first = create_individual_memory(owner_id="test", description="First")
+        individual = Individual(name="Test", memories=[first])
+        assert individual.memory_version == 1
+        assert individual.get_memory(first.id) is first
+
+        second = create_individual_memory(owner_id="test", description="Second")
+        individual.add_memory(second)
+        changes = individual.memory_changes(since=1)
+        assert changes.version == 2
+        assert changes.upserted == [second]
+        assert changes.removed == []
+
+        edited = create_individual_memory(owner_id="test", description="First, edited")
+        edited.id = first.id
+        individual.add_memory(edited)
+        individual.remove_memory(second.id)
+        changes = individual.memory_changes(since=2)
+        assert changes.version == 4
+        assert changes.upserted == [edited]
+        assert changes.removed == [second.id]
+        assert individual.get_memory(second.id) is None
+        assert individual.memory_changes(since=4).upserted == []
+
+    def test_memory_removals_are_pruned(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that old removals are dropped and stale readers get a resync."""
+        from personaut.memory import create_individual_memory
+
+        monkeypatch.setattr(Individual, "MAX_LOGGED_REMOVALS", 4)
+        kept = create_individual_memory(owner_id="test", description="Kept")
+        individual = Individual(name="Test", memories=[kept])
+        for i in range(10):
+            memory = create_individual_memory(owner_id="test", description=f"Temp {i}")
+            individual.add_memory(memory)
+            individual.remove_memory(memory.id)
+
+        assert len(individual._memory_log) <= 5
+        stale = individual.memory_changes(since=1)
+        assert stale.resync is True
+        assert stale.upserted == [kept]
+        assert stale.removed == []
+        recent = individual.memory_changes(since=individual.memory_version - 1)
+        assert recent.resync is False
+        assert len(recent.removed) == 1
+
+    def test_memory_changes_from_start(self) -> None:
+        """Test that a full read only reports each memory's latest state."""
+        from personaut.memory import create_individual_memory
+
+        individual = Individual(name="Test")
+        kept = create_individual_memory(owner_id="test", description="Kept")
+        dropped = create_individual_memory(owner_id="test", description="Dropped")
+        individual.add_memory(kept)
+        individual.add_memory(dropped)
+        individual.remove_memory(dropped.id)
+        individual.remove_memory("nonexistent")
+
+        changes = individual.memory_changes()
+
+        assert changes.version == 3
+        assert changes.upserted == [kept]
+        assert changes.removed == [dropped.id]
+
 
 class TestMaskMethods:
     """Tests for mask methods."""
@@ -0,0 +1,185 @@
+"""Tests for IVFVectorStore."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from personaut.memory import (
+    IVFVectorStore,
+    Memory,
+    PrivateMemory,
+    SharedMemory,
+    create_individual_memory,
+)
+
+
+def _clustered_embeddings(n: int, dims: int = 16, clusters: int = 20, seed: int = 0) -> np.ndarray:
+    """Create embeddings drawn around a set of random cluster centres."""
+    rng = np.random.default_rng(seed)
+    centres = rng.normal(size=(clusters, dims))
+    labels = rng.integers(0, clusters, size=n)
+    return (centres[labels] + 0.3 * rng.normal(size=(n, dims))).astype(np.float32)
+
+
+def _filled_store(n: int = 600, **kwargs: int) -> tuple[IVFVectorStore, np.ndarray]:
+    """Create a trained store holding n clustered memories."""
+    store = IVFVectorStore(train_size=n, **kwargs)
+    embeddings = _clustered_embeddings(n)
+    for i, embedding in enumerate(embeddings):
+        store.store(create_individual_memory(owner_id=f"owner_{i % 3}", description=f"M{i}"), embedding.tolist())
+    return store, embeddings
+
+
+class TestIVFVectorStoreTraining:
+    """Tests for training and incremental inserts."""
+
+    def test_exact_until_trained(self) -> None:
+        """Searches before training should match MatrixVectorStore."""
+        store = IVFVectorStore(train_size=100)
+        memory = Memory(description="Only")
+        store.store(memory, [1.0, 0.0])
+
+        assert not store.is_trained
+        assert store.search([1.0, 0.0]) == [(memory, pytest.approx(1.0))]
+
+    def test_trains_at_train_size(self) -> None:
+        """Reaching train_size should train sqrt(n) clusters."""
+        store, _ = _filled_store(400)
+
+        assert store.is_trained
+        assert store._centroids is not None
+        assert len(store._centroids) == 20
+        assert sum(len(rows) for rows in store._lists) == 400
+
+    def test_incremental_insert_is_searchable(self) -> None:
+        """Memories stored after training should be filed and found."""
+        store, embeddings = _filled_store()
+        memory = Memory(description="Late arrival")
+        store.store(memory, embeddings[0].tolist())
+
+        results = store.search(embeddings[0].tolist(), limit=2)
+
+        assert memory.id in {m.id for m, _ in results}
+        assert sum(len(rows) for rows in store._lists) == 601
+
+    def test_update_embedding_moves_cluster(self) -> None:
+        """Updating an embedding should refile the row under its new cluster."""
+        store, embeddings = _filled_store()
+        memory = store.search(embeddings[0].tolist(), limit=1)[0][0]
+
+        store.update_embedding(memory.id, (-embeddings[0]).tolist())
+
+        assert store.search((-embeddings[0]).tolist(), limit=1)[0][0].id == memory.id
+        assert sum(len(rows) for rows in store._lists) == 600
+
+    def test_delete_and_compact(self) -> None:
+        """Deleted memories should vanish and compaction should keep the index valid."""
+        store, embeddings = _filled_store()
+        victims = store.get_all()[::2]
+        for memory in victims:
+            store.delete(memory.id)
+
+        results = store.search(embeddings[5].tolist(), limit=10)
+
+        assert store.count() == 300
+        assert not {m.id for m, _ in results} & {m.id for m in victims}
+        store.compact()
+        assert sum(len(rows) for rows in store._lists) == 300
+        assert [m.id for m, _ in store.search(embeddings[5].tolist(), limit=10)] == [m.id for m, _ in results]
+
+
+class TestIVFVectorStoreSearch:
+    """Tests for approximate search quality and filters."""
+
+    def test_recall_report(self) -> None:
+        """Probing six of sixteen clusters should keep recall high."""
+        store, _ = _filled_store(n_lists=16, n_probe=6)
+        queries = _clustered_embeddings(30, seed=1)
+
+        report = store.recall_at_k(queries, k=10)
+
+        assert report.queries == 30
+        assert report.k == 10
+        assert report.recall >= 0.9
+        assert report.exact_ms > 0
+
+    def test_probing_every_list_is_exact(self) -> None:
+        """With n_probe covering all clusters, recall should be perfect."""
+        store, _ = _filled_store(n_lists=8, n_probe=8)
+
+        report = store.recall_at_k(_clustered_embeddings(10, seed=2), k=10)
+
+        assert report.recall == 1.0
+
+    def test_search_batch_matches_search(self) -> None:
+        """Batched searches on a trained index should probe like single searches."""
+        store, _ = _filled_store(n_lists=16, n_probe=2)
+        queries = _clustered_embeddings(4, seed=4)
+        owners = [None, "owner_0", None, "owner_2"]
+
+        batches = store.search_batch(queries, limit=5, owner_ids=owners)
+
+        for query, owner_id, batch in zip(queries, owners, batches):
+            assert batch == store.search(query, limit=5, owner_id=owner_id)
+
+    def test_owner_filter(self) -> None:
+        """Owner-filtered searches should only return that owner's memories."""
+        store, embeddings = _filled_store(n_lists=4, n_probe=1)
+
+        results = store.search(embeddings[0].tolist(), limit=10, owner_id="owner_1")
+
+        assert results
+        assert all(m.owner_id == "owner_1" for m, _ in results)
+
+    def test_unowned_memories_visible_to_owner_search(self) -> None:
+        """Shared memories should match owner filters like the exact stores."""
+        store, embeddings = _filled_store(n_lists=4, n_probe=4)
+        shared = SharedMemory(participant_ids=["owner_1"], description="Shared")
+        store.store(shared, embeddings[0].tolist())
+
+        results = store.search(embeddings[0].tolist(), limit=3, owner_id="owner_1")
+
+        assert shared.id in {m.id for m, _ in results}
+
+
+class TestIVFVectorStorePersistence:
+    """Tests for save/load."""
+
+    def test_save_load_round_trip(self, tmp_path: Path) -> None:
+        """A loaded store should return the same results as the saved one."""
+        store, _ = _filled_store(n_lists=10, n_probe=3)
+        private = PrivateMemory(owner_id="owner_0", description="Secret", trust_threshold=0.7)
+        store.store(private, _clustered_embeddings(1, seed=5)[0].tolist())
+        path = tmp_path / "index.npz"
+
+        store.save(path)
+        loaded = IVFVectorStore.load(path)
+
+        assert loaded.count() == store.count()
+        assert loaded.n_probe == 3
+        assert loaded.is_trained
+        restored = loaded.get(private.id)
+        assert isinstance(restored, PrivateMemory)
+        assert restored.trust_threshold == 0.7
+        for query in _clustered_embeddings(5, seed=3):
+            expected = store.search(query.tolist(), limit=5)
+            actual = loaded.search(query.tolist(), limit=5)
+            assert [m.id for m, _ in actual] == [m.id for m, _ in expected]
+
+    def test_save_load_untrained(self, tmp_path: Path) -> None:
+        """Untrained and empty stores should round-trip."""
+        store = IVFVectorStore(train_size=10)
+        store.store(Memory(description="One"), [1.0, 0.0])
+        path = tmp_path / "small.npz"
+
+        store.save(path)
+        loaded = IVFVectorStore.load(path)
+
+        assert not loaded.is_trained
+        assert loaded.search([1.0, 0.0])[0][0].description == "One"
+
+        IVFVectorStore().save(path)
+        assert IVFVectorStore.load(path).count() == 0
@@ -0,0 +1,162 @@
+"""Tests for BM25Index, reciprocal rank fusion and store keyword search."""
+
+from __future__ import annotations
+
+import pytest
+
+from personaut.memory import (
+    BM25Index,
+    InMemoryVectorStore,
+    IVFVectorStore,
+    LexicalSearch,
+    MatrixVectorStore,
+    SharedMemory,
+    SQLiteVectorStore,
+    create_individual_memory,
+    reciprocal_rank_fusion,
+)
+from personaut.memory.lexical import tokenize
+
+
+class TestTokenize:
+    """Tests for tokenize."""
+
+    def test_lowercases_and_splits_on_punctuation(self) -> None:
+        """Tokens should be lowercase runs of letters and digits."""
+        assert tokenize("Coffee at Joe's, 9am") == ["coffee", "at", "joe", "s", "9am"]
+
+    def test_underscores_separate_tokens(self) -> None:
+        """Underscores should split tokens like SQLite's unicode61 tokenizer."""
+        assert tokenize("snake_case") == ["snake", "case"]
+
+
+class TestBM25Index:
+    """Tests for the in-memory BM25 index."""
+
+    def test_rare_terms_outrank_common_ones(self) -> None:
+        """A document matching a rare term should beat one matching a common term."""
+        index = BM25Index()
+        index.add("a", "the park at noon")
+        index.add("b", "the beach at dawn")
+        index.add("c", "the museum at dusk")
+
+        results = index.search("the beach")
+
+        assert [doc_id for doc_id, _ in results][0] == "b"
+        assert len(results) == 3
+
+    def test_unmatched_documents_are_not_returned(self) -> None:
+        """Documents sharing no term with the query should be skipped."""
+        index = BM25Index()
+        index.add("a", "coffee with Mike")
+        index.add("b", "walk in the park")
+
+        assert [doc_id for doc_id, _ in index.search("coffee")] == ["a"]
+        assert index.search("") == []
+        assert index.search("coffee", limit=0) == []
+
+    def test_term_frequency_and_length(self) -> None:
+        """Repeated terms should score higher and long documents lower."""
+        index = BM25Index()
+        index.add("once", "coffee and tea")
+        index.add("twice", "coffee coffee and tea")
+        index.add("long", "coffee and a very long description about many other things")
+
+        assert [doc_id for doc_id, _ in index.search("coffee")] == ["twice", "once", "long"]
+
+    def test_add_replaces_and_remove_drops(self) -> None:
+        """Re-adding a document should replace its terms; removal should forget it."""
+        index = BM25Index()
+        index.add("a", "coffee")
+        index.add("a", "tea")
+
+        assert index.search("coffee") == []
+        assert [doc_id for doc_id, _ in index.search("tea")] == ["a"]
+        assert index.remove("a") is True
+        assert index.remove("a") is False
+        assert "a" not in index
+        assert len(index) == 0
+        assert index._postings == {}
+
+    def test_owner_filter_keeps_unowned_documents(self) -> None:
+        """Owner-filtered searches should include unowned documents."""
+        index = BM25Index()
+        index.add("alice", "coffee", owner_id="alice")
+        index.add("bob", "coffee", owner_id="bob")
+        index.add("shared", "coffee")
+
+        results = index.search("coffee", owner_id="alice")
+
+        assert {doc_id for doc_id, _ in results} == {"alice", "shared"}
+
+
+class TestReciprocalRankFusion:
+    """Tests for reciprocal_rank_fusion."""
+
+    def test_items_in_both_rankings_win(self) -> None:
+        """An item ranked by both lists should beat items ranked once."""
+        fused = reciprocal_rank_fusion([["a", "b"], ["b", "c"]], k=60)
+
+        assert [item for item, _ in fused] == ["b", "a", "c"]
+        assert fused[0][1] == pytest.approx(1 / 62 + 1 / 61)
+
+    def test_weights(self) -> None:
+        """Weights should scale each ranking's contribution."""
+        fused = reciprocal_rank_fusion([["a"], ["b"]], weights=[1.0, 2.0])
+
+        assert [item for item, _ in fused] == ["b", "a"]
+
+    def test_misaligned_weights(self) -> None:
+        """Weights must match the number of rankings."""
+        with pytest.raises(ValueError, match="weights"):
+            reciprocal_rank_fusion([["a"]], weights=[1.0, 2.0])
+
+
+class TestStoreKeywordSearch:
+    """Tests for search_text on the vector stores."""
+
+    @pytest.fixture(params=["in_memory", "matrix", "ivf", "sqlite"])
+    def store(self, request: pytest.FixtureRequest, tmp_path):
+        """Create each store that implements keyword search."""
+        if request.param == "in_memory":
+            yield InMemoryVectorStore()
+        elif request.param == "matrix":
+            yield MatrixVectorStore()
+        elif request.param == "ivf":
+            yield IVFVectorStore()
+        else:
+            store = SQLiteVectorStore(tmp_path / "fts.db", dimensions=2)
+            yield store
+            store.close()
+
+    def test_ranks_and_filters(self, store) -> None:
+        """Stores should rank descriptions by BM25 and honor owner filters."""
+        coffee = create_individual_memory(owner_id="alice", description="Coffee with Mike downtown")
+        park = create_individual_memory(owner_id="alice", description="Walk in the park")
+        other = create_individual_memory(owner_id="bob", description="Coffee alone")
+        for memory in (coffee, park, other):
+            store.store(memory, [1.0, 0.0])
+
+        assert isinstance(store, LexicalSearch)
+        assert [m.id for m, _ in store.search_text("coffee downtown")] == [coffee.id, other.id]
+        assert [m.id for m, _ in store.search_text("coffee", owner_id="alice")] == [coffee.id]
+        assert store.search_text("tennis") == []
+
+    def test_follows_writes(self, store) -> None:
+        """Deleting or re-storing a memory should update the keyword index."""
+        memory = create_individual_memory(owner_id="alice", description="Coffee")
+        store.store(memory, [1.0, 0.0])
+        memory.description = "Tea"
+        store.store(memory, [1.0, 0.0])
+
+        assert store.search_text("coffee") == []
+        assert [m.id for m, _ in store.search_text("tea")] == [memory.id]
+        store.delete(memory.id)
+        assert store.search_text("tea") == []
+
+    def test_unowned_memories(self, store) -> None:
+        """Shared memories should be found by unfiltered keyword searches."""
+        shared = SharedMemory(participant_ids=["alice", "bob"], description="Road trip")
+        store.store(shared, [0.0, 1.0])
+
+        assert [m.id for m, _ in store.search_text("trip")] == [shared.id]
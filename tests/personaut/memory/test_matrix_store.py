@@ -0,0 +1,190 @@
+"""Tests for MatrixVectorStore."""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from personaut.memory import (
+    InMemoryVectorStore,
+    MatrixVectorStore,
+    Memory,
+    SharedMemory,
+    create_individual_memory,
+)
+
+
+def _random_embedding(rng: random.Random, dims: int = 8) -> list[float]:
+    """Create a random test embedding."""
+    return [rng.uniform(-1.0, 1.0) for _ in range(dims)]
+
+
+class TestMatrixVectorStore:
+    """Tests for MatrixVectorStore CRUD operations."""
+
+    def test_create_empty_store(self) -> None:
+        """Should create an empty store."""
+        store = MatrixVectorStore()
+
+        assert store.count() == 0
+        assert store.get_all() == []
+        assert store.search([1.0, 0.0]) == []
+
+    def test_store_infers_dimensions(self) -> None:
+        """First stored embedding should fix the dimensionality."""
+        store = MatrixVectorStore()
+        memory = Memory(description="Test memory")
+        embedding = [0.1, 0.2, 0.3, 0.4]
+
+        store.store(memory, embedding)
+
+        assert store.dimensions == 4
+        assert memory.embedding == embedding
+
+    def test_store_rejects_wrong_dimensions(self) -> None:
+        """Should reject embeddings of a different dimensionality."""
+        store = MatrixVectorStore(dimensions=3)
+
+        with pytest.raises(ValueError, match="dimensions"):
+            store.store(Memory(description="Bad"), [1.0, 0.0])
+
+    def test_restore_overwrites_in_place(self) -> None:
+        """Re-storing a memory ID should not add a row."""
+        store = MatrixVectorStore()
+        memory = Memory(description="Test")
+        store.store(memory, [1.0, 0.0])
+        store.store(memory, [0.0, 1.0])
+
+        results = store.search([0.0, 1.0], limit=5)
+
+        assert store.count() == 1
+        assert len(results) == 1
+        assert results[0][1] == pytest.approx(1.0)
+
+    def test_growth_beyond_initial_capacity(self) -> None:
+        """Should grow the matrix as rows are appended."""
+        store = MatrixVectorStore(initial_capacity=2)
+
+        for i in range(10):
+            store.store(Memory(description=f"M{i}"), [float(i + 1), 1.0])
+
+        assert store.count() == 10
+        assert len(store.search([1.0, 1.0], limit=20)) == 10
+
+    def test_delete_memory(self) -> None:
+        """Deleted memories should disappear from search and counts."""
+        store = MatrixVectorStore()
+        memory = Memory(description="Deletable")
+        store.store(memory, [1.0, 0.0])
+
+        assert store.delete(memory.id) is True
+        assert store.delete(memory.id) is False
+        assert store.count() == 0
+        assert store.get(memory.id) is None
+        assert store.search([1.0, 0.0]) == []
+
+    def test_compaction_preserves_results(self) -> None:
+        """Compaction should keep the surviving rows searchable."""
+        store = MatrixVectorStore(compact_ratio=0.5)
+        memories = [Memory(description=f"M{i}") for i in range(8)]
+        for i, memory in enumerate(memories):
+            store.store(memory, [float(i), 1.0])
+
+        for memory in memories[:5]:
+            store.delete(memory.id)
+
+        assert store._tombstones < 5
+        results = store.search([7.0, 1.0], limit=10)
+        assert {m.id for m, _ in results} == {m.id for m in memories[5:]}
+        assert results[0][0].id == memories[7].id
+
+    def test_update_embedding(self) -> None:
+        """Should update a memory's embedding."""
+        store = MatrixVectorStore()
+        memory = Memory(description="Test")
+        store.store(memory, [1.0, 0.0])
+
+        assert store.update_embedding(memory.id, [0.0, 1.0]) is True
+        assert memory.embedding == [0.0, 1.0]
+        assert store.search([0.0, 1.0])[0][1] == pytest.approx(1.0)
+        assert store.update_embedding("nonexistent", [0.0, 1.0]) is False
+
+    def test_clear(self) -> None:
+        """Should clear all memories."""
+        store = MatrixVectorStore()
+        for i in range(5):
+            store.store(Memory(description=f"M{i}"), [float(i), 1.0])
+
+        store.clear()
+
+        assert store.count() == 0
+        assert store.search([1.0, 1.0]) == []
+
+
+class TestMatrixVectorStoreSearch:
+    """Tests for MatrixVectorStore similarity search."""
+
+    def test_search_by_owner(self) -> None:
+        """Should only score the owner's rows."""
+        store = MatrixVectorStore()
+        store.store(create_individual_memory(owner_id="alice", description="A1"), [1.0, 0.0])
+        store.store(create_individual_memory(owner_id="bob", description="B1"), [1.0, 0.0])
+        store.store(create_individual_memory(owner_id="alice", description="A2"), [0.9, 0.1])
+
+        results = store.search([1.0, 0.0], limit=10, owner_id="alice")
+
+        assert len(results) == 2
+        assert all(m.owner_id == "alice" for m, _ in results)
+        assert store.count(owner_id="alice") == 2
+        assert store.count(owner_id="bob") == 1
+
+    def test_unowned_memories_visible_to_owner_search(self) -> None:
+        """Memories without an owner should match owner filters like InMemoryVectorStore."""
+        store = MatrixVectorStore()
+        shared = SharedMemory(participant_ids=["alice", "bob"], description="Shared")
+        store.store(shared, [1.0, 0.0])
+
+        results = store.search([1.0, 0.0], owner_id="alice")
+
+        assert [m.id for m, _ in results] == [shared.id]
+
+    def test_matches_in_memory_store(self) -> None:
+        """Top-k results and scores should match the brute-force store."""
+        rng = random.Random(42)
+        exact = InMemoryVectorStore()
+        matrix = MatrixVectorStore()
+
+        for i in range(200):
+            memory = create_individual_memory(owner_id=f"owner_{i % 3}", description=f"M{i}")
+            embedding = _random_embedding(rng)
+            exact.store(memory, embedding)
+            matrix.store(memory, embedding)
+
+        for owner_id in (None, "owner_1"):
+            query = _random_embedding(rng)
+            expected = exact.search(query, limit=10, owner_id=owner_id)
+            actual = matrix.search(query, limit=10, owner_id=owner_id)
+
+            assert [m.id for m, _ in actual] == [m.id for m, _ in expected]
+            for (_, a), (_, e) in zip(actual, expected):
+                assert a == pytest.approx(e, abs=1e-5)
+
+    def test_search_batch_matches_search(self) -> None:
+        """Batched results should match single searches, including tombstoned rows."""
+        rng = random.Random(8)
+        store = MatrixVectorStore(compact_ratio=1.0)
+        memories = [create_individual_memory(owner_id=f"owner_{i % 2}", description=f"M{i}") for i in range(50)]
+        for memory in memories:
+            store.store(memory, _random_embedding(rng))
+        store.store(SharedMemory(participant_ids=["owner_1"], description="Shared"), _random_embedding(rng))
+        for memory in memories[:10]:
+            store.delete(memory.id)
+        queries = [_random_embedding(rng) for _ in range(3)]
+        owners = [None, "owner_1", "owner_0"]
+
+        batches = store.search_batch(queries, limit=7, owner_ids=owners)
+
+        for query, owner_id, batch in zip(queries, owners, batches):
+            expected = store.search(query, limit=7, owner_id=owner_id)
+            assert [m.id for m, _ in batch] == [m.id for m, _ in expected]
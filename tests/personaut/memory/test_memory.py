@@ -4,7 +4,8 @@ from __future__ import annotations
 
 from datetime import datetime
 
-from personaut.memory import Memory, MemoryType, create_memory
+from personaut.memory import IndividualMemory, Memory, MemoryType, PrivateMemory, SharedMemory, create_memory
+from personaut.memory.memory import memory_from_dict
 
 
 class TestMemoryType:
@@ -301,6 +302,50 @@ class TestCreateMemory:
         assert memory.metadata == {"tags": ["important", "work"]}
 
 
+class TestMemoryFromDict:
+    """Tests for memory_from_dict."""
+
+    def test_individual_type(self) -> None:
+        """Should create IndividualMemory for 'individual' type."""
+        data = {
+            "memory_type": "individual",
+            "description": "Test",
+            "owner_id": "o1",
+        }
+        result = memory_from_dict(data)
+        assert isinstance(result, IndividualMemory)
+
+    def test_shared_type(self) -> None:
+        """Should create SharedMemory for 'shared' type."""
+        data = {
+            "memory_type": "shared",
+            "description": "Test",
+            "participant_ids": ["p1", "p2"],
+        }
+        result = memory_from_dict(data)
+        assert isinstance(result, SharedMemory)
+
+    def test_private_type(self) -> None:
+        """Should create PrivateMemory for 'private' type."""
+        data = {
+            "memory_type": "private",
+            "description": "Test",
+            "owner_id": "o1",
+            "trust_threshold": 0.8,
+        }
+        result = memory_from_dict(data)
+        assert isinstance(result, PrivateMemory)
+
+    def test_missing_type_defaults_to_individual(self) -> None:
+        """Missing memory_type should default to individual."""
+        data = {
+            "description": "Test",
+            "owner_id": "o1",
+        }
+        result = memory_from_dict(data)
+        assert isinstance(result, IndividualMemory)
+
+
 class TestValueToIntensity:
     """Tests for value to intensity mapping."""
 
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import random
+import zlib
+
 from personaut.memory import (
     InMemoryVectorStore,
     Memory,
@@ -10,7 +13,9 @@ from personaut.memory import (
     extract_and_search,
     filter_accessible_memories,
     get_relevant_memories,
+    hybrid_search,
     search_memories,
+    search_memories_batch,
 )
 
 
@@ -110,6 +115,37 @@ class TestSearchMemories:
         high_descriptions = [r[0].description for r in results_high]
         assert "Public memory" in high_descriptions
 
+    def test_trust_filter_keeps_limit_full(self) -> None:
+        """Private memories nearest the query should not crowd out visible ones."""
+        store = InMemoryVectorStore()
+        for i in range(5):
+            secret = create_private_memory(owner_id="alice", description=f"Secret {i}", trust_threshold=0.8)
+            store.store(secret, [1.0, 0.01 * i, 0.0])
+        for i in range(5):
+            store.store(Memory(description=f"Public {i}"), [0.5, 1.0, 0.01 * i])
+
+        results = search_memories(store, "query", lambda _: [1.0, 0.0, 0.0], limit=4, trust_level=0.5)
+
+        assert len(results) == 4
+        assert all(m.description.startswith("Public") for m, _ in results)
+
+    def test_store_without_trust_level_is_filtered_after_search(self) -> None:
+        """Stores whose search takes no trust_level should still be trust-filtered."""
+
+        class LegacyStore(InMemoryVectorStore):
+            def search(self, query_embedding, limit=10, owner_id=None):  # type: ignore[no-untyped-def,override]
+                return super().search(query_embedding, limit, owner_id)
+
+        store = LegacyStore()
+        secret = create_private_memory(owner_id="alice", description="Secret", trust_threshold=0.8)
+        store.store(secret, [1.0, 0.0, 0.0])
+        for i in range(3):
+            store.store(Memory(description=f"Public {i}"), [0.5, 1.0, 0.01 * i])
+
+        results = search_memories(store, "query", lambda _: [1.0, 0.0, 0.0], limit=2, trust_level=0.5)
+
+        assert [m.description for m, _ in results] == ["Public 0", "Public 1"]
+
     def test_search_respects_limit(self) -> None:
         """Should respect result limit."""
         store = InMemoryVectorStore()
@@ -128,6 +164,106 @@ class TestSearchMemories:
         assert len(results) <= 3
 
 
+def seeded_embed(text: str) -> list[float]:
+    """Deterministic random embedding, stable across hash seeds."""
+    rng = random.Random(zlib.crc32(text.encode()))
+    return [rng.uniform(-1.0, 1.0) for _ in range(4)]
+
+
+class TestSearchMemoriesBatch:
+    """Tests for search_memories_batch function."""
+
+    def test_embeds_once_and_matches_single_search(self) -> None:
+        """All queries should be embedded in one call and match search_memories."""
+        store = InMemoryVectorStore()
+        for owner_id in ("alice", "bob"):
+            for i in range(5):
+                m = create_individual_memory(owner_id=owner_id, description=f"{owner_id} memory {i}")
+                store.store(m, seeded_embed(m.to_embedding_text()))
+        calls: list[list[str]] = []
+
+        def embed_batch(texts: list[str]) -> list[list[float]]:
+            calls.append(texts)
+            return [seeded_embed(t) for t in texts]
+
+        queries = ["coffee", "dinner"]
+        results = search_memories_batch(
+            store=store,
+            queries=queries,
+            embed_batch_func=embed_batch,
+            limit=3,
+            owner_ids=["alice", "bob"],
+        )
+
+        assert calls == [queries]
+        assert [r[0].owner_id for r in results[0]] == ["alice"] * 3
+        for query, owner_id, batch in zip(queries, ["alice", "bob"], results):
+            expected = search_memories(store, query, seeded_embed, limit=3, owner_id=owner_id)
+            assert [m.id for m, _ in batch] == [m.id for m, _ in expected]
+
+    def test_filters_private_by_trust(self) -> None:
+        """Private memories should be filtered per query like search_memories."""
+        store = InMemoryVectorStore()
+        secret = create_private_memory(owner_id="alice", description="Secret", trust_threshold=0.8)
+        store.store(secret, seeded_embed("Secret"))
+
+        results = search_memories_batch(
+            store=store,
+            queries=["Secret"],
+            embed_batch_func=lambda texts: [seeded_embed(t) for t in texts],
+            trust_level=0.2,
+        )
+
+        assert results == [[]]
+
+    def test_no_queries(self) -> None:
+        """An empty query list should not call the embedding function."""
+        store = InMemoryVectorStore()
+
+        def fail(texts: list[str]) -> list[list[float]]:
+            raise AssertionError("should not embed")
+
+        assert search_memories_batch(store, [], fail) == []
+
+
+class TestHybridSearch:
+    """Tests for hybrid_search function."""
+
+    def test_keyword_only_without_embeddings(self) -> None:
+        """Without an embedding function, results should follow BM25."""
+        store = InMemoryVectorStore()
+        coffee = create_individual_memory(owner_id="alice", description="Coffee with Mike")
+        store.store(coffee, seeded_embed("a"))
+        store.store(create_individual_memory(owner_id="alice", description="Walk in the park"), seeded_embed("b"))
+
+        results = hybrid_search(store, "coffee", limit=5)
+
+        assert [m.id for m, _ in results] == [coffee.id]
+
+    def test_fuses_keyword_and_vector_rankings(self) -> None:
+        """Memories ranked by both retrievers should come first."""
+        store = InMemoryVectorStore()
+        both = Memory(description="coffee")
+        vector_only = Memory(description="tea")
+        keyword_only = Memory(description="coffee coffee cake")
+        store.store(both, [1.0, 0.1, 0.0])
+        store.store(vector_only, [1.0, 0.0, 0.0])
+        store.store(keyword_only, [0.0, 0.0, 1.0])
+
+        results = hybrid_search(store, "coffee", embed_func=lambda _: [1.0, 0.0, 0.0], limit=3)
+
+        assert results[0][0].id == both.id
+        assert {m.id for m, _ in results} == {both.id, vector_only.id, keyword_only.id}
+
+    def test_filters_private_by_trust(self) -> None:
+        """Private memories should be gated by trust level."""
+        store = InMemoryVectorStore()
+        store.store(create_private_memory(owner_id="alice", description="Secret", trust_threshold=0.8), [1.0])
+
+        assert hybrid_search(store, "secret", trust_level=0.2) == []
+        assert len(hybrid_search(store, "secret", trust_level=0.9)) == 1
+
+
 class TestGetRelevantMemories:
     """Tests for get_relevant_memories function."""
 
@@ -0,0 +1,268 @@
+"""Tests for MemmapVectorStore and write_snapshot."""
+
+from __future__ import annotations
+
+import json
+import mmap
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from personaut.memory import (
+    MatrixVectorStore,
+    MemmapVectorStore,
+    PrivateMemory,
+    SharedMemory,
+    create_individual_memory,
+    write_snapshot,
+)
+from personaut.types.exceptions import MemoryError as MemoryStoreError
+
+
+def _corpus(n: int = 50, dims: int = 8, seed: int = 0) -> MatrixVectorStore:
+    """Create a matrix store with n random memories across two owners."""
+    rng = np.random.default_rng(seed)
+    store = MatrixVectorStore()
+    for i in range(n):
+        memory = create_individual_memory(owner_id=f"owner_{i % 2}", description=f"M{i}")
+        store.store(memory, rng.normal(size=dims).tolist())
+    return store
+
+
+class TestWriteSnapshot:
+    """Tests for the snapshot file layout."""
+
+    def test_writes_npy_and_sidecar(self, tmp_path: Path) -> None:
+        """Snapshots should hold a float32 .npy, a JSON-lines file and an offset sidecar."""
+        source = _corpus(10)
+
+        written = write_snapshot(tmp_path / "snap", source.get_all())
+
+        matrix = np.load(written)
+        index = json.loads((tmp_path / "snap" / "index.json").read_text())
+        assert matrix.dtype == np.float32
+        assert matrix.shape == (10, 8)
+        assert np.allclose(np.linalg.norm(matrix, axis=1), 1.0)
+        assert index["ids"] == [m.id for m in source.get_all()]
+        assert index["generation"] == 1
+        records = (tmp_path / "snap" / index["memories"]).read_bytes()
+        first = json.loads(records[index["offsets"][0] : index["offsets"][1]])
+        assert first["id"] == index["ids"][0]
+        assert "embedding" not in first
+        assert index["offsets"][-1] == len(records)
+
+    def test_rejects_missing_embeddings(self, tmp_path: Path) -> None:
+        """Memories without an embedding cannot be written."""
+        memory = create_individual_memory(owner_id="a", description="No vector")
+
+        with pytest.raises(ValueError, match="without embeddings"):
+            write_snapshot(tmp_path / "snap", [memory])
+
+    def test_keeps_previous_generation_only(self, tmp_path: Path) -> None:
+        """Rewriting a snapshot should keep the previous generation and drop older ones."""
+        first = write_snapshot(tmp_path / "snap", _corpus(5).get_all())
+        second = write_snapshot(tmp_path / "snap", _corpus(6).get_all())
+
+        assert second.name == "embeddings-2.npy"
+        assert first.exists()
+
+        write_snapshot(tmp_path / "snap", _corpus(7).get_all())
+
+        assert sorted(p.name for p in (tmp_path / "snap").iterdir()) == [
+            "embeddings-2.npy",
+            "embeddings-3.npy",
+            "index.json",
+            "index.lock",
+            "memories-2.jsonl",
+            "memories-3.jsonl",
+        ]
+
+    def test_failed_write_leaves_no_partial_generation(self, tmp_path: Path) -> None:
+        """A write that dies midway should leave the published generation untouched."""
+        write_snapshot(tmp_path / "snap", _corpus(5).get_all())
+
+        with (
+            patch("personaut.memory.snapshot_store.json.dumps", side_effect=OSError("disk full")),
+            pytest.raises(OSError, match="disk full"),
+        ):
+            write_snapshot(tmp_path / "snap", [], np.zeros((0, 8)))
+
+        with patch("personaut.memory.snapshot_store.np.save", side_effect=OSError("disk full")):
+            with pytest.raises(OSError, match="disk full"):
+                write_snapshot(tmp_path / "snap", _corpus(6).get_all())
+
+        assert sorted(p.name for p in (tmp_path / "snap").iterdir()) == [
+            "embeddings-1.npy",
+            "index.json",
+            "index.lock",
+            "memories-1.jsonl",
+        ]
+        assert MemmapVectorStore(tmp_path / "snap").count() == 5
+
+    def test_concurrent_writers_get_distinct_generations(self, tmp_path: Path) -> None:
+        """Writers racing on one directory should each publish a whole generation."""
+        corpora = [_corpus(3 + i, seed=i).get_all() for i in range(6)]
+
+        with ThreadPoolExecutor(max_workers=6) as pool:
+            written = list(pool.map(lambda memories: write_snapshot(tmp_path / "snap", memories), corpora))
+
+        assert sorted(p.name for p in written) == [f"embeddings-{g}.npy" for g in range(1, 7)]
+        store = MemmapVectorStore(tmp_path / "snap")
+        assert store.generation == 6
+        assert store.count() in {3 + i for i in range(6)}
+
+
+class TestMemmapVectorStore:
+    """Tests for searching a mapped snapshot with a delta segment."""
+
+    def test_matches_matrix_store(self, tmp_path: Path) -> None:
+        """Snapshot search should return the same ranking as the source store."""
+        source = _corpus(200)
+        write_snapshot(tmp_path / "snap", source.get_all())
+        store = MemmapVectorStore(tmp_path / "snap")
+
+        assert isinstance(store._embeddings, np.memmap)
+        assert isinstance(store._records, mmap.mmap)
+        assert store._loaded == {}
+        query = np.random.default_rng(9).normal(size=8).tolist()
+        for owner_id in (None, "owner_1"):
+            expected = source.search(query, limit=10, owner_id=owner_id)
+            actual = store.search(query, limit=10, owner_id=owner_id)
+            assert [m.id for m, _ in actual] == [m.id for m, _ in expected]
+            assert [s for _, s in actual] == pytest.approx([s for _, s in expected], abs=1e-5)
+
+    def test_search_batch_matches_search(self, tmp_path: Path) -> None:
+        """Batched searches should merge snapshot and delta like single searches."""
+        source = _corpus(60)
+        write_snapshot(tmp_path / "snap", source.get_all())
+        store = MemmapVectorStore(tmp_path / "snap")
+        store.delete(source.get_all()[3].id)
+        store.store(create_individual_memory(owner_id="owner_1", description="Delta"), [1.0] * 8)
+        rng = np.random.default_rng(2)
+        queries = rng.normal(size=(3, 8)).astype(np.float32)
+        owners = ["owner_1", None, "owner_0"]
+
+        batches = store.search_batch(queries, limit=6, owner_ids=owners)
+
+        for query, owner_id, batch in zip(queries, owners, batches):
+            expected = store.search(query.tolist(), limit=6, owner_id=owner_id)
+            assert [m.id for m, _ in batch] == [m.id for m, _ in expected]
+
+    def test_missing_snapshot_opens_empty(self, tmp_path: Path) -> None:
+        """A directory without a snapshot should behave as an empty store."""
+        store = MemmapVectorStore(tmp_path / "nothing")
+
+        assert store.count() == 0
+        assert store.generation == 0
+        assert store.search([1.0, 0.0]) == []
+
+    def test_delta_writes_merge_with_snapshot(self, tmp_path: Path) -> None:
+        """New memories should be searchable alongside snapshot rows."""
+        write_snapshot(tmp_path / "snap", _corpus(20).get_all())
+        store = MemmapVectorStore(tmp_path / "snap")
+        target = [1.0] + [0.0] * 7
+        new = create_individual_memory(owner_id="owner_0", description="Fresh")
+
+        store.store(new, target)
+
+        assert store.delta_size == 1
+        assert store.count() == 21
+        assert store.count(owner_id="owner_0") == 11
+        assert store.search(target, limit=1)[0][0].id == new.id
+        assert store.get(new.id) is new
+
+    def test_delete_and_update_snapshot_rows(self, tmp_path: Path) -> None:
+        """Deleted rows should be hidden and updated rows moved to the delta."""
+        source = _corpus(20)
+        write_snapshot(tmp_path / "snap", source.get_all())
+        store = MemmapVectorStore(tmp_path / "snap")
+        victim, moved = source.get_all()[:2]
+        target = [0.0] * 7 + [1.0]
+
+        assert store.delete(victim.id) is True
+        assert store.delete(victim.id) is False
+        assert store.update_embedding(moved.id, target) is True
+
+        assert store.get(victim.id) is None
+        assert store.count() == 19
+        assert store.delta_size == 1
+        results = store.search(target, limit=20)
+        assert results[0][0].id == moved.id
+        assert victim.id not in {m.id for m, _ in results}
+        assert [m.id for m, _ in results].count(moved.id) == 1
+
+    def test_unowned_memories_visible_to_owner_search(self, tmp_path: Path) -> None:
+        """Shared memories in the snapshot should match any owner filter."""
+        shared = SharedMemory(participant_ids=["a", "b"], description="Shared")
+        shared.embedding = [1.0, 0.0]
+        write_snapshot(tmp_path / "snap", [shared])
+
+        results = MemmapVectorStore(tmp_path / "snap").search([1.0, 0.0], owner_id="a")
+
+        assert [m.id for m, _ in results] == [shared.id]
+
+    def test_merge_writes_next_generation(self, tmp_path: Path) -> None:
+        """Merging should fold the delta and deletions into a new snapshot."""
+        source = _corpus(10)
+        write_snapshot(tmp_path / "snap", source.get_all())
+        store = MemmapVectorStore(tmp_path / "snap")
+        private = PrivateMemory(owner_id="owner_0", description="Secret", trust_threshold=0.8)
+        store.store(private, [0.5] * 8)
+        store.delete(source.get_all()[0].id)
+
+        store.merge()
+
+        assert store.generation == 2
+        assert store.delta_size == 0
+        assert store.count() == 10
+        reopened = MemmapVectorStore(tmp_path / "snap")
+        restored = reopened.get(private.id)
+        assert isinstance(restored, PrivateMemory)
+        assert restored.trust_threshold == 0.8
+        assert reopened.get(source.get_all()[0].id) is None
+
+    def test_refresh_picks_up_other_writer(self, tmp_path: Path) -> None:
+        """A reader should remap a generation written by another store."""
+        write_snapshot(tmp_path / "snap", _corpus(5).get_all())
+        reader = MemmapVectorStore(tmp_path / "snap")
+        writer = MemmapVectorStore(tmp_path / "snap")
+        writer.store(create_individual_memory(owner_id="c", description="New"), [1.0] * 8)
+        writer.merge()
+
+        assert reader.count() == 5
+        assert reader.refresh() is True
+        assert reader.count() == 6
+        assert reader.refresh() is False
+
+    def test_merge_rejects_stale_generation(self, tmp_path: Path) -> None:
+        """A second merger should not overwrite a generation it has not seen."""
+        write_snapshot(tmp_path / "snap", _corpus(5).get_all())
+        first = MemmapVectorStore(tmp_path / "snap")
+        second = MemmapVectorStore(tmp_path / "snap")
+        first.store(create_individual_memory(owner_id="a", description="First"), [1.0] * 8)
+        second.store(create_individual_memory(owner_id="b", description="Second"), [1.0] * 8)
+        first.merge()
+
+        with pytest.raises(MemoryStoreError, match="generation 2, expected 1"):
+            second.merge()
+
+        second.refresh()
+        second.merge()
+        assert second.generation == 3
+        assert MemmapVectorStore(tmp_path / "snap").count() == 7
+
+    def test_open_retries_removed_generation(self, tmp_path: Path) -> None:
+        """A reader holding a sidecar whose files were removed should re-read it."""
+        write_snapshot(tmp_path / "snap", _corpus(5).get_all())
+        store = MemmapVectorStore(tmp_path / "snap")
+        stale = json.loads((tmp_path / "snap" / "index.json").read_text())
+        write_snapshot(tmp_path / "snap", _corpus(6).get_all())
+        write_snapshot(tmp_path / "snap", _corpus(7).get_all())
+
+        store._open(stale)
+
+        assert store.generation == 3
+        assert store.count() == 7
@@ -2,14 +2,41 @@
 
 from __future__ import annotations
 
+import random
+import sqlite3
+import struct
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from unittest.mock import patch
 
+import numpy as np
 import pytest
 
+from personaut.memory import sqlite_store
 from personaut.memory.individual import IndividualMemory
+from personaut.memory.memory import MemoryType
 from personaut.memory.private import PrivateMemory
 from personaut.memory.shared import SharedMemory
 from personaut.memory.sqlite_store import SQLiteVectorStore
+from personaut.types.exceptions import MemoryError as PersonautMemoryError
+
+
+def _vec_available() -> bool:
+    """Check whether this Python's sqlite3 can load sqlite-vec."""
+    try:
+        import sqlite_vec
+
+        conn = sqlite3.connect(":memory:")
+        conn.enable_load_extension(True)
+        sqlite_vec.load(conn)
+        conn.close()
+    except Exception:
+        return False
+    return True
+
+
+requires_vec = pytest.mark.skipif(not _vec_available(), reason="sqlite-vec extension cannot be loaded")
 
 
 @pytest.fixture
@@ -31,6 +58,11 @@ def _embedding(vals: list[float] | None = None) -> list[float]:
     return vals or [0.1, 0.2, 0.3, 0.4]
 
 
+def _random_embedding(rng: random.Random) -> list[float]:
+    """Create a random 4-dimensional test embedding."""
+    return [rng.uniform(-1.0, 1.0) for _ in range(4)]
+
+
 def _individual_memory(
     owner_id: str = "owner_1",
     description: str = "Test memory",
@@ -144,6 +176,96 @@ class TestSQLiteVectorStoreStore:
         assert store.count() == 5
 
 
+class TestSQLiteVectorStoreBulkWrites:
+    """Tests for store_many(), update_embeddings_many() and delete_many()."""
+
+    def test_store_many(self, store: SQLiteVectorStore) -> None:
+        """Should store all memories and report throughput."""
+        memories = [_individual_memory(description=f"Mem {i}") for i in range(20)]
+        embeddings = [[float(i), 1.0, 0.0, 0.0] for i in range(20)]
+
+        stats = store.store_many(memories, embeddings)
+
+        assert stats.rows == 20
+        assert stats.rows_per_second > 0
+        assert store.count() == 20
+        assert memories[3].embedding == [3.0, 1.0, 0.0, 0.0]
+
+    def test_store_many_numpy_matches_store(self, store: SQLiteVectorStore) -> None:
+        """A NumPy batch should produce the same rows as single stores."""
+        single = _individual_memory(description="Single")
+        bulk = _individual_memory(description="Bulk")
+        store.store(single, [0.1, 0.2, 0.3, 0.4])
+        store.store_many([bulk], np.array([[0.1, 0.2, 0.3, 0.4]]))
+
+        conn = store._get_connection()
+        blobs = {row["id"]: row["embedding_blob"] for row in conn.execute("SELECT id, embedding_blob FROM memories")}
+        assert blobs[single.id] == blobs[bulk.id]
+        assert isinstance(bulk.embedding, np.ndarray)
+        assert bulk.embedding.tolist() == pytest.approx([0.1, 0.2, 0.3, 0.4])
+
+    def test_store_many_copies_rows_after_commit(self, store: SQLiteVectorStore) -> None:
+        """Memories should get their own rows only once the batch is committed."""
+        memories = [_individual_memory(description=f"Mem {i}") for i in range(2)]
+        matrix = np.array([[1.0, 0.0, 0.0, 0.0], [0.0, 1.0, 0.0, 0.0]], dtype=np.float32)
+
+        with (
+            patch.object(store, "_write_vectors", side_effect=sqlite3.OperationalError("boom")),
+            pytest.raises(sqlite3.OperationalError),
+        ):
+            store.store_many(memories, matrix)
+        assert [m.embedding for m in memories] == [None, None]
+        assert store.count() == 0
+
+        store.store_many(memories, matrix)
+        matrix[0, 0] = 9.0
+        assert memories[0].embedding.tolist() == [1.0, 0.0, 0.0, 0.0]
+
+    def test_store_many_length_mismatch(self, store: SQLiteVectorStore) -> None:
+        """Should reject mismatched memory and embedding counts."""
+        with pytest.raises(ValueError, match="embeddings"):
+            store.store_many([_individual_memory()], [_embedding(), _embedding()])
+        assert store.count() == 0
+
+    def test_store_many_empty(self, store: SQLiteVectorStore) -> None:
+        """An empty batch should be a no-op."""
+        assert store.store_many([], []).rows == 0
+
+    def test_update_embeddings_many(self, store: SQLiteVectorStore) -> None:
+        """Should update existing embeddings and skip unknown IDs."""
+        mem = _individual_memory()
+        store.store(mem, [1.0, 0.0, 0.0, 0.0])
+
+        stats = store.update_embeddings_many([mem.id, "missing"], np.array([[0.0, 1.0, 0.0, 0.0]] * 2))
+
+        assert stats.rows == 1
+        results = store.search([0.0, 1.0, 0.0, 0.0])
+        assert results[0][1] == pytest.approx(1.0)
+
+    def test_update_embeddings_many_large_batch(self, store: SQLiteVectorStore) -> None:
+        """Batches larger than one existence query should update every stored row."""
+        memories = [_individual_memory(description=f"Mem {i}") for i in range(700)]
+        store.store_many(memories, np.tile([1.0, 0.0, 0.0, 0.0], (700, 1)))
+        ids = [m.id for m in memories] + ["missing"]
+
+        stats = store.update_embeddings_many(ids, np.tile([0.0, 0.0, 1.0, 0.0], (701, 1)))
+
+        assert stats.rows == 700
+        conn = store._get_connection()
+        blobs = {row[0] for row in conn.execute("SELECT DISTINCT embedding_blob FROM memories")}
+        assert blobs == {struct.pack("4f", 0.0, 0.0, 1.0, 0.0)}
+
+    def test_delete_many(self, store: SQLiteVectorStore) -> None:
+        """Should delete all given memories in one call."""
+        memories = [_individual_memory(description=f"Mem {i}") for i in range(5)]
+        store.store_many(memories, [_embedding()] * 5)
+
+        stats = store.delete_many([m.id for m in memories[:3]] + ["missing"])
+
+        assert stats.rows == 3
+        assert store.count() == 2
+
+
 class TestSQLiteVectorStoreGet:
     """Tests for the get() method."""
 
@@ -299,6 +421,18 @@ class TestSQLiteVectorStoreSearch:
         results = store.search(_embedding(), limit=2)
         assert len(results) == 2
 
+    def test_search_with_memory_type_filter(self, store: SQLiteVectorStore) -> None:
+        """Search with memory_type should filter results."""
+        store.store(_individual_memory(owner_id="a", description="Plain"), [1.0, 0.0, 0.0, 0.0])
+        store.store(
+            PrivateMemory(owner_id="a", description="Secret", trust_threshold=0.5),
+            [0.5, 0.5, 0.0, 0.0],
+        )
+
+        results = store.search([1.0, 0.0, 0.0, 0.0], owner_id="a", memory_type=MemoryType.PRIVATE)
+
+        assert [m.description for m, _ in results] == ["Secret"]
+
     def test_search_skips_null_embeddings(self, store: SQLiteVectorStore) -> None:
         """Brute force search should skip memories with null embeddings."""
         # Store a memory then manually null its embedding
@@ -316,78 +450,542 @@ class TestSQLiteVectorStoreSearch:
         assert len(results) == 0
 
 
-class TestSQLiteVectorStoreMemoryFromDict:
-    """Tests for _memory_from_dict static method."""
+class TestSQLiteVectorStoreSearchBatch:
+    """Tests for batched multi-query search."""
 
-    def test_individual_type(self) -> None:
-        """Should create IndividualMemory for 'individual' type."""
-        data = {
-            "memory_type": "individual",
-            "description": "Test",
-            "owner_id": "o1",
-        }
-        result = SQLiteVectorStore._memory_from_dict(data)
-        assert isinstance(result, IndividualMemory)
+    def test_matches_single_searches(self, store: SQLiteVectorStore) -> None:
+        """Each batch result should equal the corresponding single search."""
+        rng = random.Random(4)
+        for i in range(40):
+            store.store(_individual_memory(owner_id=f"o{i % 3}", description=f"M{i}"), _random_embedding(rng))
+        queries = [_random_embedding(rng) for _ in range(5)]
+        owners = ["o0", None, "o1", "o0", "missing"]
 
-    def test_shared_type(self) -> None:
-        """Should create SharedMemory for 'shared' type."""
-        data = {
-            "memory_type": "shared",
-            "description": "Test",
-            "participant_ids": ["p1", "p2"],
-        }
-        result = SQLiteVectorStore._memory_from_dict(data)
-        assert isinstance(result, SharedMemory)
-
-    def test_private_type(self) -> None:
-        """Should create PrivateMemory for 'private' type."""
-        data = {
-            "memory_type": "private",
-            "description": "Test",
-            "owner_id": "o1",
-            "trust_threshold": 0.8,
-        }
-        result = SQLiteVectorStore._memory_from_dict(data)
-        assert isinstance(result, PrivateMemory)
-
-    def test_missing_type_defaults_to_individual(self) -> None:
-        """Missing memory_type should default to individual."""
-        data = {
-            "description": "Test",
-            "owner_id": "o1",
+        batches = store.search_batch(queries, limit=4, owner_ids=owners)
+
+        assert len(batches) == 5
+        for query, owner_id, batch in zip(queries, owners, batches):
+            expected = store.search(query, limit=4, owner_id=owner_id)
+            assert [m.id for m, _ in batch] == [m.id for m, _ in expected]
+            assert [s for _, s in batch] == pytest.approx([s for _, s in expected], abs=1e-5)
+
+    def test_shared_results_deserialized_once(self, store: SQLiteVectorStore) -> None:
+        """A memory returned by several queries should be decoded once."""
+        store.store(_individual_memory(description="Only"), [1.0, 0.0, 0.0, 0.0])
+
+        first, second = store.search_batch([[1.0, 0.0, 0.0, 0.0], [0.5, 0.5, 0.0, 0.0]], limit=1)
+
+        assert first[0][0] is second[0][0]
+
+    def test_quantized_batch(self, db_path: str) -> None:
+        """Quantized stores should rank each query with re-ranking."""
+        with SQLiteVectorStore(db_path, dimensions=8, quantization="binary") as store:
+            memory = _individual_memory()
+            store.store(memory, [1.0, -1.0] * 4)
+
+            batches = store.search_batch([[1.0, -1.0] * 4], limit=3)
+
+            assert batches[0][0][0].id == memory.id
+            assert batches[0][0][1] == pytest.approx(1.0)
+
+
+class TestSQLiteVectorStoreBruteForce:
+    """Tests for the vectorized, cached brute-force search."""
+
+    def test_only_top_k_deserialized(self, store: SQLiteVectorStore, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Only the returned rows should have their JSON decoded."""
+        for i in range(20):
+            store.store(_individual_memory(description=f"Mem {i}"), [float(i), 1.0, 0.0, 0.0])
+
+        calls: list[dict[str, object]] = []
+        original = sqlite_store.memory_from_dict
+        monkeypatch.setattr(sqlite_store, "memory_from_dict", lambda d: calls.append(d) or original(d))
+
+        results = store._brute_force_search(store._get_connection(), [1.0, 0.0, 0.0, 0.0], 3, None)
+
+        assert len(results) == 3
+        assert len(calls) == 3
+        assert results[0][0].description == "Mem 19"
+
+    def test_cache_reused_between_searches(self, store: SQLiteVectorStore) -> None:
+        """Repeated searches for the same owner should reuse the decoded matrix."""
+        store.store(_individual_memory(owner_id="a"), [1.0, 0.0, 0.0, 0.0])
+        conn = store._get_connection()
+
+        store._brute_force_search(conn, [1.0, 0.0, 0.0, 0.0], 5, "a")
+        cached = store._matrix_cache[("a", None, 4)]
+        store._brute_force_search(conn, [0.0, 1.0, 0.0, 0.0], 5, "a")
+
+        assert store._matrix_cache[("a", None, 4)] is cached
+
+    def test_cache_invalidated_by_writes(self, store: SQLiteVectorStore) -> None:
+        """Stores and deletes should be visible to the next search."""
+        conn = store._get_connection()
+        first = _individual_memory(owner_id="a", description="First")
+        store.store(first, [0.0, 1.0, 0.0, 0.0])
+        store._brute_force_search(conn, [1.0, 0.0, 0.0, 0.0], 5, "a")
+
+        second = _individual_memory(owner_id="a", description="Second")
+        store.store(second, [1.0, 0.0, 0.0, 0.0])
+        results = store._brute_force_search(conn, [1.0, 0.0, 0.0, 0.0], 5, "a")
+        assert [m.description for m, _ in results] == ["Second", "First"]
+
+        store.delete(second.id)
+        results = store._brute_force_search(conn, [1.0, 0.0, 0.0, 0.0], 5, "a")
+        assert [m.description for m, _ in results] == ["First"]
+
+    def test_cache_sees_other_connections(self, store: SQLiteVectorStore, db_path: str) -> None:
+        """Writes committed by another connection should invalidate the cache."""
+        conn = store._get_connection()
+        store._brute_force_search(conn, [1.0, 0.0, 0.0, 0.0], 5, None)
+
+        with SQLiteVectorStore(db_path, dimensions=4) as other:
+            other.store(_individual_memory(description="From elsewhere"), [1.0, 0.0, 0.0, 0.0])
+
+        results = store._brute_force_search(conn, [1.0, 0.0, 0.0, 0.0], 5, None)
+        assert [m.description for m, _ in results] == ["From elsewhere"]
+
+    def test_skips_other_dimensions(self, store: SQLiteVectorStore) -> None:
+        """Stored embeddings of another dimension should not be scored."""
+        store.store(_individual_memory(description="Four"), [1.0, 0.0, 0.0, 0.0])
+        store.store(_individual_memory(description="Two"), [1.0, 0.0])
+
+        results = store._brute_force_search(store._get_connection(), [1.0, 0.0], 5, None)
+
+        assert [m.description for m, _ in results] == ["Two"]
+
+    def test_scores_match_cosine(self, store: SQLiteVectorStore) -> None:
+        """Vectorized scores should agree with the scalar cosine."""
+        rng = random.Random(3)
+        embeddings = [[rng.uniform(-1, 1) for _ in range(4)] for _ in range(10)]
+        for i, emb in enumerate(embeddings):
+            store.store(_individual_memory(description=str(i)), emb)
+        query = [rng.uniform(-1, 1) for _ in range(4)]
+
+        for memory, score in store._brute_force_search(store._get_connection(), query, 10, None):
+            stored = np.asarray(embeddings[int(memory.description)])
+            expected = float(stored @ query / (np.linalg.norm(stored) * np.linalg.norm(query)))
+            assert score == pytest.approx(expected, abs=1e-6)
+
+
+class TestSQLiteVectorStoreSearchHits:
+    """Tests for search_hits() lazy results."""
+
+    def test_hits_carry_indexed_fields(self, store: SQLiteVectorStore) -> None:
+        """Hits should expose columns without loading the memory."""
+        secret = PrivateMemory(owner_id="a", description="Secret", trust_threshold=0.8)
+        store.store(secret, [1.0, 0.0, 0.0, 0.0])
+        store.store(_individual_memory(owner_id="a", description="Plain"), [0.0, 1.0, 0.0, 0.0])
+
+        hits = store.search_hits([1.0, 0.0, 0.0, 0.0], owner_id="a")
+
+        assert [h.description for h in hits] == ["Secret", "Plain"]
+        assert hits[0].id == secret.id
+        assert hits[0].score == pytest.approx(1.0)
+        assert hits[0].memory_type == MemoryType.PRIVATE
+        assert hits[0].owner_id == "a"
+        assert hits[0].trust_threshold == pytest.approx(0.8)
+        assert hits[1].trust_threshold is None
+        assert not hits[0].can_access(0.5)
+        assert hits[1].can_access(0.0)
+
+    def test_memory_loaded_on_access(self, store: SQLiteVectorStore, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Only accessed hits should be deserialized, and only once."""
+        for i in range(5):
+            store.store(_individual_memory(description=f"Mem {i}"), [float(i), 1.0, 0.0, 0.0])
+
+        calls: list[dict[str, object]] = []
+        original = sqlite_store.memory_from_dict
+        monkeypatch.setattr(sqlite_store, "memory_from_dict", lambda d: calls.append(d) or original(d))
+
+        hits = store.search_hits([1.0, 0.0, 0.0, 0.0], limit=5)
+        assert calls == []
+
+        memory = hits[0].memory
+        assert hits[0].memory is memory
+        assert isinstance(memory, IndividualMemory)
+        assert memory.description == hits[0].description
+        assert len(calls) == 1
+
+    def test_deleted_memory_raises(self, store: SQLiteVectorStore) -> None:
+        """Accessing a hit whose memory was deleted should raise MemoryError."""
+        mem = _individual_memory()
+        store.store(mem, _embedding())
+        hit = store.search_hits(_embedding())[0]
+        store.delete(mem.id)
+
+        with pytest.raises(PersonautMemoryError, match=mem.id):
+            _ = hit.memory
+
+
+class TestSQLiteVectorStoreVectorIndex:
+    """Tests for the sqlite-vec cosine index."""
+
+    @pytest.mark.parametrize(
+        ("version", "supported"),
+        [("v0.1.6", True), ("v0.1.7-alpha.2", True), ("v0.2.0", True), ("v0.1.5", False), ("v0.0.9", False)],
+    )
+    def test_vec_version_gate(self, version: str, supported: bool) -> None:
+        """Only sqlite-vec releases with partition keys and metadata columns should be used."""
+        assert sqlite_store._vec_version_supported(version) is supported
+
+    def test_old_vec_version_is_rejected(self, store: SQLiteVectorStore) -> None:
+        """The startup check should reject an sqlite-vec that predates the index schema."""
+        conn = sqlite3.connect(":memory:")
+        conn.create_function("vec_version", 0, lambda: "v0.1.3")
+
+        assert store._check_vec_version(conn) is False
+        conn.close()
+
+    def test_embedding_blob_is_float32(self, store: SQLiteVectorStore) -> None:
+        """embedding_blob should hold packed float32 values."""
+        mem = _individual_memory()
+        store.store(mem, [0.1, 0.2, 0.3, 0.4])
+
+        row = store._get_connection().execute("SELECT embedding_blob FROM memories").fetchone()
+        assert row["embedding_blob"] == struct.pack("4f", 0.1, 0.2, 0.3, 0.4)
+
+    @requires_vec
+    def test_vector_scores_match_brute_force(self, store: SQLiteVectorStore) -> None:
+        """Index results should match the brute-force cosine exactly."""
+        rng = random.Random(7)
+        for i in range(50):
+            store.store(_individual_memory(description=f"Mem {i}"), [rng.uniform(-1, 1) for _ in range(4)])
+        query = [rng.uniform(-1, 1) for _ in range(4)]
+
+        conn = store._get_connection()
+        indexed = store._vector_search(conn, query, 10, None)
+        exact = store._brute_force_search(conn, query, 10, None)
+
+        assert [(m.id, score) for m, score in indexed] == [(m.id, score) for m, score in exact]
+
+    @requires_vec
+    def test_restore_replaces_vector(self, store: SQLiteVectorStore) -> None:
+        """Re-storing a memory should replace its indexed vector."""
+        mem = _individual_memory()
+        store.store(mem, [1.0, 0.0, 0.0, 0.0])
+        store.store(mem, [0.0, 1.0, 0.0, 0.0])
+
+        conn = store._get_connection()
+        assert conn.execute("SELECT COUNT(*) FROM memory_embeddings").fetchone()[0] == 1
+        assert store.search([0.0, 1.0, 0.0, 0.0])[0][1] == pytest.approx(1.0)
+
+    @requires_vec
+    def test_owner_partition_fills_limit(self, store: SQLiteVectorStore) -> None:
+        """Owner-filtered KNN should not lose results to closer vectors of other owners."""
+        for i in range(20):
+            store.store(_individual_memory(owner_id="crowd", description=f"Crowd {i}"), [1.0, 0.0, 0.0, 0.0])
+        for i in range(3):
+            store.store(_individual_memory(owner_id="alice", description=f"Alice {i}"), [0.0, 1.0, 0.0, float(i)])
+
+        results = store._vector_search(store._get_connection(), [1.0, 0.0, 0.0, 0.0], 3, "alice")
+
+        assert len(results) == 3
+        assert all(m.owner_id == "alice" for m, _ in results)
+
+    @requires_vec
+    def test_vector_index_carries_owner_and_type(self, store: SQLiteVectorStore) -> None:
+        """Indexed rows should mirror the memory's owner and type."""
+        mem = PrivateMemory(owner_id="alice", description="Secret", trust_threshold=0.8)
+        store.store(mem, _embedding())
+        store.update_embedding(mem.id, [0.4, 0.3, 0.2, 0.1])
+
+        row = store._get_connection().execute("SELECT owner_id, memory_type FROM memory_embeddings").fetchone()
+        assert tuple(row) == ("alice", "private")
+
+    @requires_vec
+    def test_rebuilds_legacy_index(self, db_path: str) -> None:
+        """An index without the cosine metric should be rebuilt from embedding_blob."""
+        store = SQLiteVectorStore(db_path, dimensions=4)
+        mem = _individual_memory()
+        store.store(mem, [1.0, 0.0, 0.0, 0.0])
+        conn = store._get_connection()
+        conn.execute("DROP TABLE memory_embeddings")
+        conn.execute(
+            "CREATE VIRTUAL TABLE memory_embeddings USING vec0(memory_id TEXT PRIMARY KEY, embedding FLOAT[4])"
+        )
+        conn.commit()
+        store.close()
+
+        store = SQLiteVectorStore(db_path, dimensions=4)
+        conn = store._get_connection()
+        sql = conn.execute("SELECT sql FROM sqlite_master WHERE name = 'memory_embeddings'").fetchone()[0]
+        assert "distance_metric=cosine" in sql
+        assert "PARTITION KEY" in sql
+        row = conn.execute("SELECT memory_id, owner_id FROM memory_embeddings").fetchone()
+        assert tuple(row) == (mem.id, "owner_1")
+        store.close()
+
+
+class TestSQLiteVectorStoreQuantization:
+    """Tests for int8 and binary quantized search with exact re-ranking."""
+
+    @staticmethod
+    def _fill(store: SQLiteVectorStore, n: int = 200) -> np.ndarray:
+        rng = np.random.default_rng(11)
+        embeddings = rng.normal(size=(n, store.dimensions)).astype(np.float32)
+        memories = [_individual_memory(owner_id=f"o{i % 2}", description=str(i)) for i in range(n)]
+        store.store_many(memories, embeddings)
+        return embeddings
+
+    def test_rejects_unknown_quantization(self, db_path: str) -> None:
+        """Unknown encodings and unpackable binary dimensions should be rejected."""
+        with pytest.raises(ValueError, match="quantization"):
+            SQLiteVectorStore(db_path, dimensions=8, quantization="pq")
+        with pytest.raises(ValueError, match="divisible by 8"):
+            SQLiteVectorStore(db_path, dimensions=12, quantization="binary")
+
+    @pytest.mark.parametrize("quantization", ["int8", "binary"])
+    def test_cache_holds_codes(self, db_path: str, quantization: str) -> None:
+        """The brute-force cache should hold compact codes instead of float32."""
+        with SQLiteVectorStore(db_path, dimensions=32, quantization=quantization) as store:
+            self._fill(store)
+            store._brute_force_search(store._get_connection(), [1.0] * 32, 5, None)
+            matrix = store._matrix_cache[(None, None, 32)].matrix
+
+            expected = (200, 32) if quantization == "int8" else (200, 4)
+            assert matrix.shape == expected
+            assert matrix.itemsize == 1
+
+    @pytest.mark.parametrize("quantization", ["int8", "binary"])
+    def test_reranked_scores_are_exact(self, db_path: str, quantization: str) -> None:
+        """Returned scores should be full-precision cosines, with high recall."""
+        with SQLiteVectorStore(db_path, dimensions=32, quantization=quantization, rerank_factor=8) as store:
+            embeddings = self._fill(store)
+            conn = store._get_connection()
+            query = embeddings[7] + 0.1
+
+            ranked = store._brute_force_ranking(conn, query.tolist(), 10, None)
+            store.quantization = None
+            store._matrix_cache.clear()
+            exact = store._brute_force_ranking(conn, query.tolist(), 10, None)
+
+            assert ranked[0] == pytest.approx(exact[0])
+            assert len({i for i, _ in ranked} & {i for i, _ in exact}) >= 8
+            exact_scores = dict(exact)
+            for memory_id, score in ranked:
+                if memory_id in exact_scores:
+                    assert score == pytest.approx(exact_scores[memory_id], abs=1e-6)
+
+    @requires_vec
+    @pytest.mark.parametrize("quantization", ["int8", "binary"])
+    def test_vec_index_uses_quantized_column(self, db_path: str, quantization: str) -> None:
+        """The vec0 index should store codes and re-rank owner-filtered KNN results."""
+        with SQLiteVectorStore(db_path, dimensions=32, quantization=quantization) as store:
+            embeddings = self._fill(store)
+            conn = store._get_connection()
+            sql = conn.execute("SELECT sql FROM sqlite_master WHERE name = 'memory_embeddings'").fetchone()[0]
+            assert ("BIT[32]" if quantization == "binary" else "INT8[32]") in sql
+
+            results = store.search(embeddings[4].tolist(), limit=5, owner_id="o0")
+
+            assert len(results) == 5
+            assert results[0][0].description == "4"
+            assert results[0][1] == pytest.approx(1.0, abs=1e-6)
+            assert all(m.owner_id == "o0" for m, _ in results)
+
+    @requires_vec
+    def test_switching_quantization_rebuilds_index(self, db_path: str) -> None:
+        """Reopening with another encoding should migrate the index."""
+        with SQLiteVectorStore(db_path, dimensions=32) as store:
+            embeddings = self._fill(store, n=20)
+
+        with SQLiteVectorStore(db_path, dimensions=32, quantization="binary") as store:
+            conn = store._get_connection()
+            assert conn.execute("SELECT count(*) FROM memory_embeddings").fetchone()[0] == 20
+            assert store.search(embeddings[3].tolist(), limit=1)[0][0].description == "3"
+
+
+class TestSQLiteVectorStorePooled:
+    """Tests for WAL mode with per-thread connections."""
+
+    def test_enables_wal(self, db_path: str) -> None:
+        """Pooled stores should switch the database to WAL journaling."""
+        with SQLiteVectorStore(db_path, dimensions=4, pooled=True) as store:
+            mode = store._get_connection().execute("PRAGMA journal_mode").fetchone()[0]
+            assert mode == "wal"
+
+    def test_connection_per_thread(self, db_path: str) -> None:
+        """Each thread should get its own connection, reused across calls."""
+        store = SQLiteVectorStore(db_path, dimensions=4, pooled=True)
+        main_conn = store._get_connection()
+        assert store._get_connection() is main_conn
+
+        other: list[sqlite3.Connection] = []
+        thread = threading.Thread(target=lambda: other.append(store._get_connection()))
+        thread.start()
+        thread.join()
+
+        assert other[0] is not main_conn
+        assert len(store._pool) == 2
+        store.close()
+        assert store._pool == []
+
+    def test_concurrent_searches_during_writes(self, db_path: str) -> None:
+        """Readers in other threads should run while a writer commits."""
+        rng = random.Random(3)
+        store = SQLiteVectorStore(db_path, dimensions=4, pooled=True)
+        seed = [_individual_memory(description=f"Seed {i}") for i in range(20)]
+        store.store_many(seed, [[rng.random() for _ in range(4)] for _ in seed])
+
+        def write() -> None:
+            for i in range(20):
+                store.store(_individual_memory(description=f"New {i}"), [rng.random() for _ in range(4)])
+
+        def read(_: int) -> int:
+            return len(store.search([0.5, 0.5, 0.5, 0.5], limit=5, owner_id="owner_1"))
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            writer = pool.submit(write)
+            counts = list(pool.map(read, range(40)))
+            writer.result()
+
+        assert counts == [5] * 40
+        assert store.count() == 40
+        assert len(store.search([0.5, 0.5, 0.5, 0.5], limit=100)) == 40
+        store.close()
+
+    def test_sees_writes_from_other_threads(self, db_path: str) -> None:
+        """A thread's cached matrix should be refreshed after another thread writes."""
+        store = SQLiteVectorStore(db_path, dimensions=4, pooled=True)
+        store.store(_individual_memory(), [1.0, 0.0, 0.0, 0.0])
+        assert len(store._brute_force_search(store._get_connection(), [1.0, 0.0, 0.0, 0.0], 10, None)) == 1
+
+        thread = threading.Thread(target=lambda: store.store(_individual_memory(), [0.0, 1.0, 0.0, 0.0]))
+        thread.start()
+        thread.join()
+
+        assert len(store._brute_force_search(store._get_connection(), [1.0, 0.0, 0.0, 0.0], 10, None)) == 2
+        store.close()
+
+    def test_new_connection_sees_earlier_outside_commit(self, db_path: str) -> None:
+        """A thread's first search should not trust a matrix cached before an outside commit."""
+        store = SQLiteVectorStore(db_path, dimensions=4, pooled=True)
+        store.store(_individual_memory(), [1.0, 0.0, 0.0, 0.0])
+        assert len(store._brute_force_search(store._get_connection(), [1.0, 0.0, 0.0, 0.0], 10, None)) == 1
+
+        with SQLiteVectorStore(db_path, dimensions=4) as other:
+            other.store(_individual_memory(), [0.0, 1.0, 0.0, 0.0])
+
+        counts: list[int] = []
+        thread = threading.Thread(
+            target=lambda: counts.append(
+                len(store._brute_force_search(store._get_connection(), [1.0, 0.0, 0.0, 0.0], 10, None))
+            )
+        )
+        thread.start()
+        thread.join()
+
+        assert counts == [2]
+        assert set(store._data_versions) == set(store._pool)
+        store.close()
+
+
+class TestSQLiteVectorStoreTrust:
+    """Tests for the persisted trust_threshold column."""
+
+    def test_column_holds_private_thresholds(self, store: SQLiteVectorStore) -> None:
+        """Only private memories should have a trust threshold in the column."""
+        store.store(_individual_memory(), _embedding())
+        store.store_many([PrivateMemory(owner_id="owner_1", description="Secret", trust_threshold=0.7)], [_embedding()])
+
+        rows = store._get_connection().execute("SELECT memory_type, trust_threshold FROM memories").fetchall()
+
+        assert {(row["memory_type"], row["trust_threshold"]) for row in rows} == {
+            ("individual", None),
+            ("private", 0.7),
         }
-        result = SQLiteVectorStore._memory_from_dict(data)
-        assert isinstance(result, IndividualMemory)
 
+    def test_old_database_is_migrated(self, db_path: str) -> None:
+        """Databases without the column should gain it, filled from the JSON data."""
+        with SQLiteVectorStore(db_path, dimensions=4) as s:
+            secret = PrivateMemory(owner_id="owner_1", description="Secret", trust_threshold=0.9)
+            s.store(secret, _embedding())
+            s.store(_individual_memory(), _embedding())
+            conn = s._get_connection()
+            conn.execute("DROP INDEX idx_memories_trust")
+            conn.execute("ALTER TABLE memories DROP COLUMN trust_threshold")
+            conn.commit()
+
+        with SQLiteVectorStore(db_path, dimensions=4) as reopened:
+            results = reopened.search(_embedding(), limit=5, trust_level=0.5)
+            assert [m.description for m, _ in results] == ["Test memory"]
+            assert {h.trust_threshold for h in reopened.search_hits(_embedding(), limit=5)} == {0.9, None}
+
+    def test_hits_and_keyword_search_filter(self, store: SQLiteVectorStore) -> None:
+        """search_hits and search_text should apply the trust filter too."""
+        store.store(PrivateMemory(owner_id="owner_1", description="Coffee secret", trust_threshold=0.8), _embedding())
+        store.store(_individual_memory(description="Coffee"), _embedding())
+
+        hits = store.search_hits(_embedding(), limit=1, trust_level=0.5)
+
+        assert [h.description for h in hits] == ["Coffee"]
+        assert [m.description for m, _ in store.search_text("coffee secret", trust_level=0.5)] == ["Coffee"]
+        store._fts_enabled = False
+        assert [m.description for m, _ in store.search_text("coffee secret", trust_level=0.5)] == ["Coffee"]
+
+    @pytest.mark.parametrize("quantization", [None, "int8", "binary"])
+    def test_quantized_stores_filter(self, db_path: str, quantization: str | None) -> None:
+        """Quantized candidate retrieval should skip gated memories before re-ranking."""
+        with SQLiteVectorStore(db_path, dimensions=8, quantization=quantization) as s:
+            for i in range(5):
+                private = PrivateMemory(owner_id="owner_1", description=f"Secret {i}", trust_threshold=0.8)
+                s.store(private, [1.0, 0.1 * i, 0, 0, 0, 0, 0, 0])
+            for i in range(5):
+                s.store(_individual_memory(description=f"Public {i}"), [0.5, 0, 1.0, 0.1 * i, 0, 0, 0, 0])
+
+            results = s.search([1.0, 0, 0, 0, 0, 0, 0, 0], limit=3, trust_level=0.5)
+
+            assert len(results) == 3
+            assert all(m.description.startswith("Public") for m, _ in results)
+
+
+class TestSQLiteVectorStoreKeywordSearch:
+    """Tests for the FTS5 keyword index."""
+
+    def test_query_syntax_is_literal(self, store: SQLiteVectorStore) -> None:
+        """FTS5 operators and quotes in user text should not raise."""
+        mem = _individual_memory(description='She said "NEAR" OR maybe not')
+        store.store(mem, _embedding())
+
+        assert [m.id for m, _ in store.search_text('"near" OR (AND* -')] == [mem.id]
+        assert store.search_text("!!!") == []
+
+    def test_filters_by_type(self, store: SQLiteVectorStore) -> None:
+        """memory_type should filter keyword results."""
+        individual = _individual_memory(description="Coffee at home")
+        private = PrivateMemory(owner_id="owner_1", description="Coffee secret")
+        store.store(individual, _embedding())
+        store.store(private, _embedding())
+
+        results = store.search_text("coffee", memory_type=MemoryType.PRIVATE)
+
+        assert [m.id for m, _ in results] == [private.id]
+
+    def test_bulk_writes_update_index(self, store: SQLiteVectorStore) -> None:
+        """store_many and delete_many should keep the keyword index in sync."""
+        memories = [_individual_memory(description=f"Trip {i}") for i in range(5)]
+        store.store_many(memories, [_embedding()] * 5)
+        store.delete_many([m.id for m in memories[:3]])
+
+        assert {m.id for m, _ in store.search_text("trip")} == {m.id for m in memories[3:]}
+
+    def test_existing_database_is_indexed_on_open(self, db_path: str) -> None:
+        """Databases without a keyword index should get one built from their rows."""
+        with SQLiteVectorStore(db_path, dimensions=4) as s:
+            mem = _individual_memory(description="Old coffee memory")
+            s.store(mem, _embedding())
+            s._get_connection().execute("DROP TABLE memories_fts")
+            s._get_connection().commit()
+
+        with SQLiteVectorStore(db_path, dimensions=4) as reopened:
+            assert [m.id for m, _ in reopened.search_text("coffee")] == [mem.id]
+
+    def test_scan_fallback_without_fts(self, store: SQLiteVectorStore) -> None:
+        """Without FTS5 the descriptions should be ranked by an in-memory BM25 scan."""
+        coffee = _individual_memory(description="Coffee downtown")
+        store.store(coffee, _embedding())
+        store.store(_individual_memory(owner_id="owner_2", description="Coffee uptown"), _embedding())
+        store._fts_enabled = False
 
-class TestSQLiteVectorStoreCosineSimilarity:
-    """Tests for _cosine_similarity static method."""
-
-    def test_identical_vectors(self) -> None:
-        """Identical vectors should have similarity 1.0."""
-        a = [1.0, 0.0, 0.0]
-        assert SQLiteVectorStore._cosine_similarity(a, a) == pytest.approx(1.0)
-
-    def test_orthogonal_vectors(self) -> None:
-        """Orthogonal vectors should have similarity 0.0."""
-        a = [1.0, 0.0, 0.0]
-        b = [0.0, 1.0, 0.0]
-        assert SQLiteVectorStore._cosine_similarity(a, b) == pytest.approx(0.0)
-
-    def test_opposite_vectors(self) -> None:
-        """Opposite vectors should have similarity -1.0."""
-        a = [1.0, 0.0, 0.0]
-        b = [-1.0, 0.0, 0.0]
-        assert SQLiteVectorStore._cosine_similarity(a, b) == pytest.approx(-1.0)
-
-    def test_zero_vector(self) -> None:
-        """Zero vector should return 0."""
-        a = [0.0, 0.0, 0.0]
-        b = [1.0, 0.0, 0.0]
-        assert SQLiteVectorStore._cosine_similarity(a, b) == 0.0
-
-    def test_different_lengths(self) -> None:
-        """Different length vectors should return 0."""
-        a = [1.0, 0.0]
-        b = [1.0, 0.0, 0.0]
-        assert SQLiteVectorStore._cosine_similarity(a, b) == 0.0
+        assert [m.id for m, _ in store.search_text("downtown coffee", owner_id="owner_1")] == [coffee.id]
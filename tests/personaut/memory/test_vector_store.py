@@ -2,10 +2,22 @@
 
 from __future__ import annotations
 
+import random
+
+import numpy as np
+import pytest
+
 from personaut.memory import (
     InMemoryVectorStore,
+    IVFVectorStore,
+    MatrixVectorStore,
+    MemmapVectorStore,
     Memory,
+    PrivateMemory,
+    SQLiteVectorStore,
+    VectorStore,
     create_individual_memory,
+    write_snapshot,
 )
 
 
@@ -202,6 +214,149 @@ class TestInMemoryVectorStore:
         assert {m.id for m in all_memories} == {m.id for m in memories}
 
 
+class TestInMemoryVectorStoreSearchBatch:
+    """Tests for batched multi-query search."""
+
+    def test_matches_single_searches(self) -> None:
+        """Each batch result should equal the corresponding single search."""
+        rng = random.Random(5)
+        store = InMemoryVectorStore()
+        for i in range(30):
+            memory = create_individual_memory(owner_id=f"owner_{i % 3}", description=f"M{i}")
+            store.store(memory, [rng.uniform(-1, 1) for _ in range(4)])
+        queries = [[rng.uniform(-1, 1) for _ in range(4)] for _ in range(4)]
+        owners = [None, "owner_0", "owner_2", "missing"]
+
+        batches = store.search_batch(queries, limit=5, owner_ids=owners)
+
+        assert len(batches) == 4
+        for query, owner_id, batch in zip(queries, owners, batches):
+            expected = store.search(query, limit=5, owner_id=owner_id)
+            assert [m.id for m, _ in batch] == [m.id for m, _ in expected]
+            assert [s for _, s in batch] == pytest.approx([s for _, s in expected], abs=1e-5)
+
+    def test_empty_inputs(self) -> None:
+        """No queries or an empty store should give empty results."""
+        store = InMemoryVectorStore()
+
+        assert store.search_batch([]) == []
+        assert store.search_batch([[1.0, 0.0]]) == [[]]
+
+    def test_rejects_misaligned_owner_ids(self) -> None:
+        """owner_ids must have one entry per query."""
+        store = InMemoryVectorStore()
+        store.store(Memory(description="M"), [1.0, 0.0])
+
+        with pytest.raises(ValueError, match="owner_ids"):
+            store.search_batch([[1.0, 0.0], [0.0, 1.0]], owner_ids=["alice"])
+
+    @pytest.mark.parametrize("store_cls", [InMemoryVectorStore, MatrixVectorStore, IVFVectorStore])
+    def test_implements_protocol(self, store_cls: type) -> None:
+        """Bundled stores should satisfy the VectorStore protocol."""
+        assert isinstance(store_cls(), VectorStore)
+
+
+class TestTrustFilteredSearch:
+    """Tests for the trust_level filter shared by every bundled store."""
+
+    @pytest.fixture(params=["in_memory", "matrix", "ivf", "memmap", "sqlite"])
+    def store(self, request: pytest.FixtureRequest, tmp_path):
+        """Fill each store with private memories closest to the query, then public ones."""
+        rng = random.Random(11)
+        memories: list[tuple[Memory, list[float]]] = []
+        for i in range(6):
+            private = PrivateMemory(owner_id="alice", description=f"Secret {i}", trust_threshold=0.8)
+            memories.append((private, [1.0, 0.01 * i, 0.0, 0.0]))
+        for i in range(20):
+            public = create_individual_memory(owner_id=f"owner_{i % 2}", description=f"Public {i}")
+            memories.append((public, [rng.uniform(-1, 0.5), rng.uniform(-1, 1), 1.0, 0.0]))
+        memories.append((PrivateMemory(owner_id="alice", description="Open", trust_threshold=0.2), [0.9, 0.5, 0, 0]))
+
+        if request.param == "sqlite":
+            store = SQLiteVectorStore(tmp_path / "trust.db", dimensions=4)
+        elif request.param == "memmap":
+            for memory, embedding in memories:
+                memory.embedding = embedding
+            write_snapshot(tmp_path / "snap", [m for m, _ in memories[:-1]])
+            store = MemmapVectorStore(tmp_path / "snap")
+            memories = memories[-1:]
+        else:
+            store = {"in_memory": InMemoryVectorStore, "matrix": MatrixVectorStore, "ivf": IVFVectorStore}[
+                request.param
+            ]()
+        if request.param == "ivf":
+            store.train_size = 10
+        for memory, embedding in memories:
+            store.store(memory, embedding)
+        yield store
+        if request.param == "sqlite":
+            store.close()
+
+    def test_filter_applies_before_top_k(self, store) -> None:
+        """Low trust should skip gated memories and still fill the limit."""
+        results = store.search([1.0, 0.0, 0.0, 0.0], limit=5, trust_level=0.5)
+
+        assert len(results) == 5
+        assert results[0][0].description == "Open"
+        assert not any(m.description.startswith("Secret") for m, _ in results)
+
+    def test_high_trust_and_no_filter_see_everything(self, store) -> None:
+        """Enough trust, or no trust_level, should return gated memories."""
+        for trust_level in (0.8, None):
+            results = store.search([1.0, 0.0, 0.0, 0.0], limit=3, trust_level=trust_level)
+            assert [m.description for m, _ in results] == ["Secret 0", "Secret 1", "Secret 2"]
+
+    def test_owner_and_batch_filters(self, store) -> None:
+        """Trust filtering should combine with owner filters and batched queries."""
+        single = store.search([1.0, 0.0, 0.0, 0.0], limit=4, owner_id="alice", trust_level=0.5)
+        batch = store.search_batch([[1.0, 0.0, 0.0, 0.0]] * 2, limit=4, owner_ids=["alice", None], trust_level=0.5)
+
+        assert [m.description for m, _ in single] == ["Open"]
+        assert [m.id for m, _ in batch[0]] == [m.id for m, _ in single]
+        assert len(batch[1]) == 4
+        assert not any(isinstance(m, PrivateMemory) and m.trust_threshold > 0.5 for m, _ in batch[1])
+
+
+class TestArrayEmbeddings:
+    """Tests for storing and searching with NumPy arrays."""
+
+    @pytest.fixture(params=["in_memory", "matrix", "ivf", "sqlite"])
+    def store(self, request: pytest.FixtureRequest, tmp_path):
+        """Create each writable store."""
+        if request.param == "sqlite":
+            store = SQLiteVectorStore(tmp_path / "arrays.db", dimensions=3)
+            yield store
+            store.close()
+        else:
+            yield {"in_memory": InMemoryVectorStore, "matrix": MatrixVectorStore, "ivf": IVFVectorStore}[
+                request.param
+            ]()
+
+    def test_array_round_trip(self, store) -> None:
+        """Arrays should be stored as float32 arrays and searchable with arrays."""
+        near = create_individual_memory(owner_id="alice", description="Near")
+        far = create_individual_memory(owner_id="alice", description="Far")
+        store.store(near, np.array([1.0, 0.1, 0.0]))
+        store.store(far, np.array([0.0, 1.0, 0.0], dtype=np.float32))
+
+        results = store.search(np.array([1.0, 0.0, 0.0], dtype=np.float32), limit=2)
+        batch = store.search_batch(np.array([[0.0, 1.0, 0.0]], dtype=np.float32), limit=1)
+
+        assert [m.id for m, _ in results] == [near.id, far.id]
+        assert [m.id for m, _ in batch[0]] == [far.id]
+        assert isinstance(near.embedding, np.ndarray)
+        assert near.embedding.dtype == np.float32
+        assert near.to_dict()["embedding"] == pytest.approx([1.0, 0.1, 0.0])
+
+    def test_update_embedding_with_array(self, store) -> None:
+        """update_embedding should accept an array."""
+        memory = create_individual_memory(owner_id="alice", description="Moved")
+        store.store(memory, [1.0, 0.0, 0.0])
+
+        assert store.update_embedding(memory.id, np.array([0.0, 0.0, 1.0])) is True
+        assert store.search(np.array([0.0, 0.0, 1.0]), limit=1)[0][1] == pytest.approx(1.0)
+
+
 class TestCosineSimilarity:
     """Tests for cosine similarity calculation."""
 
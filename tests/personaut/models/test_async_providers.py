@@ -0,0 +1,251 @@
+"""Tests for the async LLM provider implementations."""
+
+from __future__ import annotations
+
+import asyncio
+import io
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+
+from personaut.models.anthropic import AsyncAnthropicModel
+from personaut.models.bedrock import AsyncBedrockModel
+from personaut.models.gemini import AsyncGeminiModel, GeminiModel
+from personaut.models.model import AsyncModel, InvalidRequestError, ModelError, RateLimitError
+from personaut.models.ollama import AsyncOllamaModel
+from personaut.models.openai import AsyncOpenAIModel
+from personaut.models.registry import ModelRegistry
+
+
+@dataclass
+class _Mood:
+    mood: str
+    intensity: int
+
+
+def _ollama_client(handler: Any) -> httpx.AsyncClient:
+    """An httpx.AsyncClient answering every request with ``handler``."""
+    return httpx.AsyncClient(base_url="http://ollama.test", transport=httpx.MockTransport(handler))
+
+
+class TestAsyncOpenAIModel:
+    """Tests for AsyncOpenAIModel."""
+
+    async def test_generate_awaits_async_client(self) -> None:
+        """generate() should await the SDK's async create with the sync request shape."""
+        response = MagicMock()
+        response.choices = [MagicMock()]
+        response.choices[0].message.content = "Hello!"
+        response.choices[0].finish_reason = "stop"
+        response.usage.prompt_tokens = 3
+        response.usage.completion_tokens = 2
+        response.usage.total_tokens = 5
+        response.model = "gpt-4o-mini"
+        model = AsyncOpenAIModel(api_key="test-key")
+        model._client = MagicMock()
+        model._client.chat.completions.create = AsyncMock(return_value=response)
+
+        result = await model.generate("Hi", system="Be brief")
+
+        kwargs = model._client.chat.completions.create.await_args.kwargs
+        assert kwargs["messages"][0] == {"role": "system", "content": "Be brief"}
+        assert result.text == "Hello!"
+        assert result.usage["total_tokens"] == 5
+        assert isinstance(model, AsyncModel)
+
+    async def test_errors_are_converted(self) -> None:
+        """SDK errors should surface as ModelError subclasses."""
+        model = AsyncOpenAIModel(api_key="test-key")
+        model._client = MagicMock()
+        model._client.chat.completions.create = AsyncMock(side_effect=Exception("Rate limit exceeded"))
+
+        with pytest.raises(RateLimitError):
+            await model.generate("Hi")
+
+    async def test_aclose_closes_client(self) -> None:
+        """Leaving the async context should close the client."""
+        client = MagicMock()
+        client.close = AsyncMock()
+        async with AsyncOpenAIModel(api_key="test-key") as model:
+            model._client = client
+
+        client.close.assert_awaited_once()
+        assert model._client is None
+
+
+class TestAsyncAnthropicModel:
+    """Tests for AsyncAnthropicModel."""
+
+    async def test_generate_structured_parses_fenced_json(self) -> None:
+        """Structured output should be parsed from a fenced JSON reply."""
+        response = MagicMock()
+        response.content = [MagicMock(text='```json\n{"mood": "calm", "intensity": 3}\n```')]
+        response.usage.input_tokens = 10
+        response.usage.output_tokens = 5
+        response.stop_reason = "end_turn"
+        model = AsyncAnthropicModel(api_key="test-key")
+        model._client = MagicMock()
+        model._client.messages.create = AsyncMock(return_value=response)
+
+        mood = await model.generate_structured("How do you feel?", _Mood)
+
+        assert mood == _Mood(mood="calm", intensity=3)
+        assert model._client.messages.create.await_args.kwargs["temperature"] == 0.3
+
+
+class TestAsyncGeminiModel:
+    """Tests for AsyncGeminiModel."""
+
+    async def test_generate_uses_aio_interface(self) -> None:
+        """generate() should await client.aio.models.generate_content."""
+        response = MagicMock(text="Haiku", usage_metadata=None, candidates=[])
+        model = AsyncGeminiModel(api_key="test-key")
+        model._client = MagicMock()
+        model._client.models.generate_content = AsyncMock(return_value=response)
+
+        with patch.object(GeminiModel, "_generation_config", return_value="config"):
+            result = await model.generate("Write a haiku")
+
+        assert result.text == "Haiku"
+        assert model._client.models.generate_content.await_args.kwargs["config"] == "config"
+
+
+class TestAsyncOllamaModel:
+    """Tests for AsyncOllamaModel."""
+
+    async def test_hundreds_of_concurrent_generations(self) -> None:
+        """One event loop should keep many requests in flight at once."""
+        in_flight = 0
+        peak = 0
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            body = json.loads(request.content)
+            return httpx.Response(200, json={"response": body["prompt"].upper(), "done": True, "eval_count": 1})
+
+        model = AsyncOllamaModel()
+        model._client = _ollama_client(handler)
+        async with model:
+            results = await asyncio.gather(*(model.generate(f"prompt {i}") for i in range(200)))
+
+        assert [r.text for r in results] == [f"PROMPT {i}" for i in range(200)]
+        assert peak > 1
+
+    async def test_missing_model_error(self) -> None:
+        """A 404 should explain how to pull the model."""
+        model = AsyncOllamaModel(model="missing")
+        model._client = _ollama_client(lambda _request: httpx.Response(404, json={"error": "not found"}))
+
+        with pytest.raises(InvalidRequestError, match="ollama pull missing"):
+            await model.generate("Hi")
+
+    async def test_generate_stream(self) -> None:
+        """Streaming should yield each NDJSON chunk's text."""
+        lines = [{"response": "Hel", "done": False}, {"response": "lo", "done": True}]
+        content = "\n".join(json.dumps(line) for line in lines).encode()
+        model = AsyncOllamaModel()
+        model._client = _ollama_client(lambda _request: httpx.Response(200, content=content))
+
+        chunks = [chunk async for chunk in model.generate_stream("Hi")]
+
+        assert chunks == ["Hel", "lo"]
+
+    async def test_is_available_reprobes_after_failure(self) -> None:
+        """Availability should be cached like the sync model's and re-probed after the interval."""
+        state = {"up": False, "probes": 0}
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/api/version":
+                state["probes"] += 1
+                return httpx.Response(200 if state["up"] else 503, json={})
+            msg = "connection refused"
+            raise httpx.ConnectError(msg, request=request)
+
+        model = AsyncOllamaModel(health_check_interval=0.0)
+        model._client = _ollama_client(handler)
+
+        assert await model.is_available() is False
+        state["up"] = True
+        assert await model.is_available() is True
+        assert await model.is_available() is True
+        assert state["probes"] == 2
+
+        # A connection failure forgets the healthy status
+        with pytest.raises(ModelError, match="request failed"):
+            await model.generate("Hello")
+        assert await model.is_available() is True
+        assert state["probes"] == 3
+
+    async def test_unreachable_server_is_not_reprobed_immediately(self) -> None:
+        """Within the interval, an unreachable server should not be probed again."""
+        probes: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            probes.append(request.url.path)
+            return httpx.Response(503)
+
+        model = AsyncOllamaModel(health_check_interval=60.0)
+        model._client = _ollama_client(handler)
+
+        assert await model.is_available() is False
+        assert await model.is_available() is False
+        assert len(probes) == 1
+
+    def test_invalid_max_connections(self) -> None:
+        """max_connections below 1 should be rejected."""
+        with pytest.raises(ValueError, match="max_connections"):
+            AsyncOllamaModel(max_connections=0)
+
+
+class TestAsyncBedrockModel:
+    """Tests for AsyncBedrockModel."""
+
+    async def test_blocking_calls_run_concurrently_off_loop(self) -> None:
+        """invoke_model calls should overlap on worker threads, not the event loop."""
+        loop_thread = threading.get_ident()
+        threads: set[int] = set()
+
+        def invoke_model(**kwargs: Any) -> dict[str, Any]:
+            threads.add(threading.get_ident())
+            time.sleep(0.05)
+            payload = {"content": [{"text": "ok"}], "usage": {"input_tokens": 1, "output_tokens": 1}}
+            return {"body": io.BytesIO(json.dumps(payload).encode())}
+
+        model = AsyncBedrockModel(model="claude-3-5-haiku", max_concurrency=8)
+        model._client = MagicMock(invoke_model=invoke_model)
+        model._executor = ThreadPoolExecutor(max_workers=8)
+        async with model:
+            start = time.perf_counter()
+            results = await asyncio.gather(*(model.generate("Hi") for _ in range(8)))
+            elapsed = time.perf_counter() - start
+
+        assert [r.text for r in results] == ["ok"] * 8
+        assert loop_thread not in threads
+        assert elapsed < 8 * 0.05
+
+
+class TestRegistryAsync:
+    """Tests for ModelRegistry.get_async_llm."""
+
+    def test_returns_async_models(self) -> None:
+        """get_async_llm should build the provider's async class."""
+        registry = ModelRegistry()
+
+        ollama = registry.get_async_llm("ollama", model="mistral")
+        openai = registry.get_async_llm("openai", api_key="test-key")
+
+        assert isinstance(ollama, AsyncOllamaModel)
+        assert ollama.model == "mistral"
+        assert isinstance(openai, AsyncOpenAIModel)
+        assert registry.get_async_llm("ollama") is not registry.get_async_llm("ollama")
@@ -0,0 +1,112 @@
+"""Tests for the micro-batching embedding front-end."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from personaut.models.batching_embedding import BatchingEmbedding
+from personaut.models.embeddings import EmbeddingError, EmbeddingModel
+
+
+class _RecordingEmbedding(EmbeddingModel):
+    """Embedding model stub that records every batch it is given."""
+
+    dimension = 2
+    model_name = "recording"
+
+    def __init__(self, fail: bool = False) -> None:
+        self.batches: list[list[str]] = []
+        self.fail = fail
+
+    def embed(self, text: str) -> list[float]:
+        return self.embed_batch([text])[0]
+
+    def embed_batch(self, texts: list[str]) -> list[list[float]]:
+        self.batches.append(list(texts))
+        if self.fail:
+            msg = "model failed"
+            raise RuntimeError(msg)
+        return [[float(len(text)), 1.0] for text in texts]
+
+
+class TestBatchingEmbedding:
+    """Tests for BatchingEmbedding."""
+
+    def test_concurrent_threads_share_batches(self) -> None:
+        """Calls made together from many threads should reach the model together."""
+        model = _RecordingEmbedding()
+        texts = [f"message {'x' * i}" for i in range(16)]
+        barrier = threading.Barrier(len(texts))
+
+        def call(text: str) -> list[float]:
+            barrier.wait()
+            return embed.embed(text)
+
+        with BatchingEmbedding(model, max_wait=0.2) as embed, ThreadPoolExecutor(len(texts)) as pool:
+            vectors = list(pool.map(call, texts))
+
+        assert vectors == [[float(len(text)), 1.0] for text in texts]
+        assert len(model.batches) < len(texts)
+        assert embed.stats().requests == len(texts)
+        assert embed.stats().mean_batch_size > 1
+
+    async def test_coroutines_share_one_batch(self) -> None:
+        """Concurrent coroutines should be served by one model call."""
+        model = _RecordingEmbedding()
+        with BatchingEmbedding(model, max_wait=0.2) as embed:
+            vectors = await asyncio.gather(*(embed.aembed_array(text) for text in ["a", "bb", "ccc"]))
+
+        assert [v.tolist() for v in vectors] == [[1.0, 1.0], [2.0, 1.0], [3.0, 1.0]]
+        assert model.batches == [["a", "bb", "ccc"]]
+
+    def test_max_batch_size_and_duplicates(self) -> None:
+        """Batches should not exceed max_batch_size, and repeated texts are embedded once."""
+        model = _RecordingEmbedding()
+        with BatchingEmbedding(model, max_batch_size=2, max_wait=0.2) as embed:
+            futures = [embed.submit(text) for text in ["a", "a", "b", "c"]]
+            vectors = [future.result() for future in futures]
+
+        assert model.batches == [["a"], ["b", "c"]]
+        assert vectors[0] is vectors[1]
+
+    def test_errors_reach_every_caller(self) -> None:
+        """A failing batch should fail each of its requests with the model's error."""
+        with BatchingEmbedding(_RecordingEmbedding(fail=True), max_wait=0.2) as embed:
+            futures = [embed.submit(text) for text in ["a", "b"]]
+
+            for future in futures:
+                with pytest.raises(RuntimeError, match="model failed"):
+                    future.result()
+
+    def test_batch_calls_pass_through(self) -> None:
+        """embed_batch should go straight to the wrapped model."""
+        model = _RecordingEmbedding()
+        embed = BatchingEmbedding(model)
+
+        matrix = embed.embed_batch_array(["a", "bb"])
+
+        assert matrix.dtype == np.float32
+        assert model.batches == [["a", "bb"]]
+        assert embed._worker is None
+        assert (embed.dimension, embed.model_name) == (2, "recording")
+
+    def test_closed_rejects_requests(self) -> None:
+        """Requests after close() should fail instead of hanging."""
+        embed = BatchingEmbedding(_RecordingEmbedding())
+        assert embed.embed("a") == [1.0, 1.0]
+        embed.close()
+
+        with pytest.raises(EmbeddingError, match="closed"):
+            embed.embed("b")
+
+    def test_invalid_settings(self) -> None:
+        """Non-positive batch sizes and negative waits should be rejected."""
+        with pytest.raises(ValueError, match="max_batch_size"):
+            BatchingEmbedding(_RecordingEmbedding(), max_batch_size=0)
+        with pytest.raises(ValueError, match="max_wait"):
+            BatchingEmbedding(_RecordingEmbedding(), max_wait=-1)
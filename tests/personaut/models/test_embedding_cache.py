@@ -0,0 +1,180 @@
+"""Tests for the embedding caches and their use by LocalEmbedding."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from personaut.models.embedding_cache import LRUEmbeddingCache, SQLiteEmbeddingCache, _entry_bytes
+from personaut.models.local_embedding import LocalEmbedding
+from personaut.models.registry import ENV_EMBEDDING_CACHE, ModelRegistry
+
+
+def _mock_model(rows: list[list[float]]) -> MagicMock:
+    """Create a sentence-transformers stand-in returning the given rows."""
+    model = MagicMock()
+    model.encode.return_value = np.array(rows, dtype=np.float32)
+    return model
+
+
+class TestLRUEmbeddingCache:
+    """Tests for the in-process LRU tier."""
+
+    def test_hits_refresh_recency(self) -> None:
+        """A recently read entry should outlive one inserted after it."""
+        cache = LRUEmbeddingCache(max_entries=2, max_bytes=None)
+        cache.put("hot", [0.1])
+        cache.put("cold", [0.2])
+        assert cache.get("hot") == [0.1]
+
+        cache.put("new", [0.3])
+
+        assert "hot" in cache
+        assert "cold" not in cache
+
+    def test_byte_bound(self) -> None:
+        """Entries should be evicted once their bytes exceed max_bytes."""
+        size = _entry_bytes("a", np.zeros(100))
+        cache = LRUEmbeddingCache(max_entries=100, max_bytes=2 * size)
+        for key in "abc":
+            cache.put(key, [0.0] * 100)
+
+        assert list(cache._entries) == ["b", "c"]
+        assert cache.stats().bytes == 2 * size
+        cache.put("huge", [0.0] * 1000)
+        assert "huge" not in cache
+        assert len(cache) == 2
+
+    def test_stats(self) -> None:
+        """Hits, misses, evictions and sizes should be counted."""
+        cache = LRUEmbeddingCache(max_entries=1, max_bytes=None)
+        cache.put("a", [0.1])
+        cache.get("a")
+        cache.get("b")
+        cache.put("b", [0.2])
+        cache.put("b", [0.3])
+
+        stats = cache.stats()
+
+        assert (stats.hits, stats.misses, stats.evictions, stats.entries) == (1, 1, 1, 1)
+        assert stats.bytes == _entry_bytes("b", np.array([0.3]))
+        assert stats.hit_rate == 0.5
+        cache.clear()
+        assert cache.stats().bytes == 0
+        assert cache.stats().hits == 1
+
+
+class TestSQLiteEmbeddingCache:
+    """Tests for the cache table itself."""
+
+    def test_round_trip_and_misses(self, tmp_path: Path) -> None:
+        """Stored vectors should come back as float32 values; others miss."""
+        with SQLiteEmbeddingCache(tmp_path / "cache.db") as cache:
+            cache.put_many("model", True, ["a", "b"], [[0.5, 0.25], [1.0, 0.0]])
+
+            assert cache.get_many("model", True, ["b", "missing", "a", "b"]) == [
+                [1.0, 0.0],
+                None,
+                [0.5, 0.25],
+                [1.0, 0.0],
+            ]
+            assert cache.count() == 2
+
+    def test_keyed_by_model_and_normalize(self, tmp_path: Path) -> None:
+        """The same text under another model or normalize flag should miss."""
+        with SQLiteEmbeddingCache(tmp_path / "cache.db") as cache:
+            cache.put_many("model", True, ["a"], [[1.0]])
+
+            assert cache.get_many("model", False, ["a"]) == [None]
+            assert cache.get_many("other", True, ["a"]) == [None]
+            cache.clear("other")
+            assert cache.count("model") == 1
+            cache.clear()
+            assert cache.count() == 0
+
+    def test_shared_between_connections(self, tmp_path: Path) -> None:
+        """A second cache on the same file should see the first one's writes."""
+        writer = SQLiteEmbeddingCache(tmp_path / "cache.db")
+        reader = SQLiteEmbeddingCache(tmp_path / "cache.db")
+        writer.put_many("model", True, ["a"], [[0.5]])
+
+        assert reader.get_many("model", True, ["a"]) == [[0.5]]
+        writer.close()
+        reader.close()
+
+    def test_large_lookups_are_chunked(self, tmp_path: Path) -> None:
+        """Lookups beyond the bound-parameter limit should still resolve."""
+        texts = [f"text {i}" for i in range(1200)]
+        with SQLiteEmbeddingCache(tmp_path / "cache.db") as cache:
+            cache.put_many("model", True, texts, [[float(i)] for i in range(1200)])
+
+            assert cache.get_many("model", True, texts)[1100] == [1100.0]
+
+    def test_misaligned_embeddings(self, tmp_path: Path) -> None:
+        """Every text needs exactly one vector."""
+        with SQLiteEmbeddingCache(tmp_path / "cache.db") as cache, pytest.raises(ValueError, match="embeddings"):
+            cache.put_many("model", True, ["a", "b"], [[1.0]])
+
+
+class TestLocalEmbeddingCaches:
+    """Tests for the cache tiers in LocalEmbedding."""
+
+    def test_batch_reads_disk_before_model(self, tmp_path: Path) -> None:
+        """Only texts missing from disk should reach the model, and be written back."""
+        cache = SQLiteEmbeddingCache(tmp_path / "cache.db")
+        cache.put_many("m", True, ["known"], [[0.5, 0.5]])
+        embed = LocalEmbedding(model_path="m", cache_size=0, disk_cache=cache)
+        embed._model = _mock_model([[0.25, 0.75]])
+
+        assert embed.embed_batch(["known", "new"]) == [[0.5, 0.5], [0.25, 0.75]]
+        assert embed._model.encode.call_args.args[0] == ["new"]
+        assert cache.get_many("m", True, ["new"]) == [[0.25, 0.75]]
+
+    def test_warm_start_from_path(self, tmp_path: Path) -> None:
+        """A new instance on the same file should not touch the model."""
+        first = LocalEmbedding(model_path="m", disk_cache=tmp_path / "cache.db")
+        first._model = _mock_model([0.5, 0.25])
+        vector = first.embed("hello")
+
+        second = LocalEmbedding(model_path="m", disk_cache=str(tmp_path / "cache.db"))
+        second._model = _mock_model([9.0, 9.0])
+
+        assert second.embed("hello") == vector
+        assert second.embed_batch(["hello"]) == [vector]
+        second._model.encode.assert_not_called()
+        assert isinstance(second.disk_cache, SQLiteEmbeddingCache)
+
+    def test_failing_cache_falls_back_to_model(self, tmp_path: Path) -> None:
+        """A broken disk cache should not break embedding."""
+        cache = SQLiteEmbeddingCache(tmp_path / "cache.db")
+        cache.close()
+        embed = LocalEmbedding(model_path="m", cache_size=0, disk_cache=cache)
+        embed._model = _mock_model([[0.5]])
+
+        assert embed.embed_batch(["a"]) == [[0.5]]
+
+    def test_cache_stats(self) -> None:
+        """LocalEmbedding should report its in-process cache counters."""
+        embed = LocalEmbedding(model_path="m", cache_size=10)
+        embed._model = _mock_model([[0.5], [0.25]])
+
+        embed.embed_batch(["a", "b"])
+        embed.embed_batch(["a"])
+
+        stats = embed.cache_stats
+        assert (stats.hits, stats.misses, stats.entries) == (1, 2, 2)
+        assert stats.max_entries == 10
+
+    def test_registry_uses_env_path(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """The registry should open the cache named by the environment."""
+        monkeypatch.setenv(ENV_EMBEDDING_CACHE, str(tmp_path / "env.db"))
+
+        registry = ModelRegistry()
+        embed = registry.get_embedding()
+
+        assert isinstance(embed, LocalEmbedding)
+        assert isinstance(embed.disk_cache, SQLiteEmbeddingCache)
+        assert registry.get_embedding() is embed
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import numpy as np
+import pytest
+
 from personaut.models.embeddings import (
     DEFAULT_MODEL_LARGE,
     DEFAULT_MODEL_SMALL,
@@ -157,3 +160,16 @@ class TestEmbeddingModelProtocol:
         """Test is_loaded default implementation."""
         model = MockEmbeddingModel()
         assert model.is_loaded() is True
+
+    def test_default_array_methods(self) -> None:
+        """The array methods should convert the list methods' output to float32."""
+        model = MockEmbeddingModel(dim=3)
+
+        vector = model.embed_array("Hello")
+        matrix = model.embed_batch_array(["a", "bb"])
+
+        assert vector.dtype == np.float32
+        assert vector.tolist() == pytest.approx(model.embed("Hello"))
+        assert matrix.shape == (2, 3)
+        assert matrix.dtype == np.float32
+        assert model.embed_batch_array([]).shape == (0, 3)
@@ -325,11 +325,11 @@ class TestOllamaGenerate:
     def _model(self):
         from personaut.models.ollama import OllamaModel
 
-        return OllamaModel()
+        model = OllamaModel()
+        model._client = MagicMock()
+        return model
 
     def test_generate_basic(self) -> None:
-        import httpx
-
         model = self._model()
         mock_resp = MagicMock()
         mock_resp.json.return_value = {
@@ -338,41 +338,35 @@ class TestOllamaGenerate:
             "prompt_eval_count": 10,
             "eval_count": 5,
         }
-        with patch.object(httpx, "post", return_value=mock_resp):
+        with patch.object(model._client, "post", return_value=mock_resp):
             result = model.generate("Hi")
         assert result.text == "Hello!"
         assert result.finish_reason == "stop"
 
     def test_generate_with_system(self) -> None:
-        import httpx
-
         model = self._model()
         mock_resp = MagicMock()
         mock_resp.json.return_value = {"response": "Reply", "done": True}
-        with patch.object(httpx, "post", return_value=mock_resp) as mock_post:
+        with patch.object(model._client, "post", return_value=mock_resp) as mock_post:
             model.generate("Hi", system="Be brief")
             body = mock_post.call_args.kwargs["json"]
             assert body["system"] == "Be brief"
 
     def test_generate_with_overrides(self) -> None:
-        import httpx
-
         model = self._model()
         mock_resp = MagicMock()
         mock_resp.json.return_value = {"response": "X", "done": True}
-        with patch.object(httpx, "post", return_value=mock_resp) as mock_post:
+        with patch.object(model._client, "post", return_value=mock_resp) as mock_post:
             model.generate("Hi", max_tokens=500, stop_sequences=["END"])
             body = mock_post.call_args.kwargs["json"]
             assert body["options"]["num_predict"] == 500
             assert body["options"]["stop"] == ["END"]
 
     def test_generate_not_done(self) -> None:
-        import httpx
-
         model = self._model()
         mock_resp = MagicMock()
         mock_resp.json.return_value = {"response": "partial", "done": False}
-        with patch.object(httpx, "post", return_value=mock_resp):
+        with patch.object(model._client, "post", return_value=mock_resp):
             result = model.generate("Hi")
         assert result.finish_reason == "length"
 
@@ -384,57 +378,47 @@ class TestOllamaGenerate:
         mock_resp.raise_for_status.side_effect = httpx.HTTPStatusError(
             "404 not found", request=MagicMock(), response=MagicMock()
         )
-        with patch.object(httpx, "post", return_value=mock_resp):
+        with patch.object(model._client, "post", return_value=mock_resp):
             with pytest.raises(InvalidRequestError, match="not found"):
                 model.generate("Hi")
 
     def test_generate_generic_error(self) -> None:
-        import httpx
-
         model = self._model()
-        with patch.object(httpx, "post", side_effect=ConnectionError("refused")):
+        with patch.object(model._client, "post", side_effect=ConnectionError("refused")):
             with pytest.raises(ModelError, match="Ollama request failed"):
                 model.generate("Hi")
 
     def test_generate_structured(self) -> None:
-        import httpx
-
         model = self._model()
         json_str = json.dumps({"name": "test", "value": 42})
         mock_resp = MagicMock()
         mock_resp.json.return_value = {"response": json_str, "done": True}
-        with patch.object(httpx, "post", return_value=mock_resp):
+        with patch.object(model._client, "post", return_value=mock_resp):
             result = model.generate_structured("make", _SampleSchema)
         assert result.name == "test"
 
     def test_generate_structured_fenced(self) -> None:
-        import httpx
-
         model = self._model()
         json_str = f"```json\n{json.dumps({'name': 'x', 'value': 1})}\n```"
         mock_resp = MagicMock()
         mock_resp.json.return_value = {"response": json_str, "done": True}
-        with patch.object(httpx, "post", return_value=mock_resp):
+        with patch.object(model._client, "post", return_value=mock_resp):
             result = model.generate_structured("make", _SampleSchema)
         assert result.name == "x"
 
     def test_generate_structured_parse_fail(self) -> None:
-        import httpx
-
         model = self._model()
         mock_resp = MagicMock()
         mock_resp.json.return_value = {"response": "not json", "done": True}
-        with patch.object(httpx, "post", return_value=mock_resp):
+        with patch.object(model._client, "post", return_value=mock_resp):
             with pytest.raises(InvalidRequestError, match="parse"):
                 model.generate_structured("make", _SampleSchema)
 
     def test_is_available_success(self) -> None:
-        import httpx
-
         model = self._model()
         mock_resp = MagicMock()
         mock_resp.status_code = 200
-        with patch.object(httpx, "get", return_value=mock_resp):
+        with patch.object(model._client, "get", return_value=mock_resp):
             assert model.is_available() is True
 
     def test_is_available_cached(self) -> None:
@@ -443,33 +427,25 @@ class TestOllamaGenerate:
         assert model.is_available() is True
 
     def test_is_available_fail(self) -> None:
-        import httpx
-
         model = self._model()
-        with patch.object(httpx, "get", side_effect=ConnectionError("refused")):
+        with patch.object(model._client, "get", side_effect=ConnectionError("refused")):
             assert model.is_available() is False
 
     def test_list_models(self) -> None:
-        import httpx
-
         model = self._model()
         mock_resp = MagicMock()
         mock_resp.json.return_value = {"models": [{"name": "llama3"}, {"name": "mistral"}]}
-        with patch.object(httpx, "get", return_value=mock_resp):
+        with patch.object(model._client, "get", return_value=mock_resp):
             models = model.list_models()
         assert models == ["llama3", "mistral"]
 
     def test_list_models_error(self) -> None:
-        import httpx
-
         model = self._model()
-        with patch.object(httpx, "get", side_effect=Exception("connection failed")):
+        with patch.object(model._client, "get", side_effect=Exception("connection failed")):
             with pytest.raises(ModelError, match="Failed to list"):
                 model.list_models()
 
     def test_generate_stream(self) -> None:
-        import httpx
-
         model = self._model()
         stream_resp = MagicMock()
         stream_resp.__enter__ = MagicMock(return_value=stream_resp)
@@ -479,13 +455,11 @@ class TestOllamaGenerate:
             json.dumps({"response": " world", "done": False}),
             json.dumps({"response": "", "done": True}),
         ]
-        with patch.object(httpx, "stream", return_value=stream_resp):
+        with patch.object(model._client, "stream", return_value=stream_resp):
             result = list(model.generate_stream("Hi"))
         assert result == ["Hello", " world"]
 
     def test_generate_stream_with_opts(self) -> None:
-        import httpx
-
         model = self._model()
         stream_resp = MagicMock()
         stream_resp.__enter__ = MagicMock(return_value=stream_resp)
@@ -493,7 +467,7 @@ class TestOllamaGenerate:
         stream_resp.iter_lines.return_value = [
             json.dumps({"response": "Hi", "done": True}),
         ]
-        with patch.object(httpx, "stream", return_value=stream_resp) as mock_stream:
+        with patch.object(model._client, "stream", return_value=stream_resp) as mock_stream:
             list(model.generate_stream("Hi", max_tokens=100, system="Sys"))
             call_args = mock_stream.call_args
             body = call_args.kwargs["json"]
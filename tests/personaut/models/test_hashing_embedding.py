@@ -0,0 +1,77 @@
+"""Tests for the NumPy-only hashing embedding model."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from personaut.memory import MatrixVectorStore, create_individual_memory
+from personaut.models.hashing_embedding import HashingEmbedding
+
+
+class TestHashingEmbedding:
+    """Tests for HashingEmbedding."""
+
+    def test_unit_rows_of_fixed_dimension(self) -> None:
+        """Rows should be unit-length float32 vectors; empty texts give zeros."""
+        embed = HashingEmbedding(dimension=64)
+
+        matrix = embed.embed_batch_array(["Coffee with Alex", "", "Walk in the park"])
+
+        assert matrix.shape == (3, 64)
+        assert matrix.dtype == np.float32
+        assert np.linalg.norm(matrix, axis=1) == pytest.approx([1.0, 0.0, 1.0])
+        assert embed.dimension == 64
+        assert embed.model_name == "hashing-64"
+
+    def test_deterministic_across_instances(self) -> None:
+        """The same text should always map to the same vector."""
+        first = HashingEmbedding().embed("Met Alex at the cafe")
+
+        assert HashingEmbedding().embed("Met Alex at the cafe") == first
+        assert HashingEmbedding().embed_batch(["Met Alex at the cafe"]) == [first]
+
+    def test_shared_words_and_spellings_score_higher(self) -> None:
+        """Texts sharing words or word pieces should be closer than unrelated ones."""
+        embed = HashingEmbedding()
+        query, near, far = embed.embed_batch_array(["coffee with Alex", "coffees with alex", "walk in the park"])
+
+        assert query @ near > 0.5
+        assert query @ far < 0.2
+
+    def test_idf_downweights_common_terms(self) -> None:
+        """After fitting, a rare shared term should count more than a common one."""
+        corpus = ["the park", "the beach", "the museum", "the cafe", "a park bench"]
+        embed = HashingEmbedding(char_ngrams=None, word_ngrams=1)
+        common, rare, query = embed.embed_batch_array(["the lake", "park lake", "the park"])
+        assert query @ common == pytest.approx(query @ rare)
+
+        embed.fit(corpus)
+        common, rare, query = embed.embed_batch_array(["the lake", "park lake", "the park"])
+
+        assert embed.is_fitted
+        assert query @ rare > query @ common
+
+    def test_vector_store_search(self) -> None:
+        """Hashed vectors should drive an ordinary vector store search."""
+        embed = HashingEmbedding()
+        store = MatrixVectorStore()
+        memories = [
+            create_individual_memory(owner_id="alice", description=text)
+            for text in ["Coffee with Mike downtown", "Walk in the park", "Beach trip with family"]
+        ]
+        for memory, row in zip(memories, embed.embed_batch_array([m.description for m in memories])):
+            store.store(memory, row)
+
+        results = store.search(embed.embed_array("family trip to the beach"), limit=1)
+
+        assert results[0][0].description == "Beach trip with family"
+
+    def test_invalid_settings(self) -> None:
+        """Sizes below 1 and reversed n-gram ranges should be rejected."""
+        with pytest.raises(ValueError, match="dimension"):
+            HashingEmbedding(dimension=0)
+        with pytest.raises(ValueError, match="word_ngrams"):
+            HashingEmbedding(word_ngrams=0)
+        with pytest.raises(ValueError, match="char_ngrams"):
+            HashingEmbedding(char_ngrams=(4, 3))
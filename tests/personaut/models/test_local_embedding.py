@@ -207,6 +207,43 @@ class TestLocalEmbeddingEmbedBatch:
             embed.embed_batch(["text1"])
 
 
+class TestLocalEmbeddingArrays:
+    """Tests for embed_array and embed_batch_array."""
+
+    def test_embed_array_shares_cache_with_embed(self) -> None:
+        """Both paths should read the same cache entries."""
+        embed = LocalEmbedding(cache_size=10)
+        mock_model = MagicMock()
+        mock_model.encode.return_value = np.array([0.6, 0.8], dtype=np.float32)
+        embed._model = mock_model
+
+        vector = embed.embed_array("hello")
+
+        assert vector.dtype == np.float32
+        assert embed.embed("hello") == pytest.approx([0.6, 0.8])
+        mock_model.encode.assert_called_once()
+
+    def test_embed_batch_array(self) -> None:
+        """The batch should come back as one float32 matrix in input order."""
+        embed = LocalEmbedding(cache_size=10)
+        embed._cache[_hash_text("cached")] = [1.0, 0.0]
+        mock_model = MagicMock()
+        mock_model.encode.return_value = np.array([[0.0, 1.0]])
+        embed._model = mock_model
+
+        matrix = embed.embed_batch_array(["new", "cached"])
+
+        assert matrix.dtype == np.float32
+        assert matrix.tolist() == [[0.0, 1.0], [1.0, 0.0]]
+        assert mock_model.encode.call_args.args[0] == ["new"]
+
+    def test_embed_batch_array_empty(self) -> None:
+        """An empty batch should be a (0, dimension) matrix."""
+        embed = LocalEmbedding()
+
+        assert embed.embed_batch_array([]).shape == (0, 384)
+
+
 class TestLocalEmbeddingUnload:
     """Tests for unload method."""
 
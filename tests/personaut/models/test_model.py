@@ -2,11 +2,18 @@
 
 from __future__ import annotations
 
+import asyncio
+import threading
+import time
 from dataclasses import dataclass
 from typing import Any, TypeVar
 
+import pytest
+
 from personaut.models.model import (
+    AsyncModel,
     AuthenticationError,
+    BatchGenerationResult,
     GenerationResult,
     InvalidRequestError,
     Model,
@@ -201,3 +208,96 @@ class TestModelProtocol:
         assert isinstance(result, TestSchema)
         assert result.name == "default"
         assert result.value == 0
+
+
+class EchoModel(MockModel):
+    """Echoes prompts, failing on "fail" and tracking peak concurrency."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def generate(self, prompt: str, **kwargs: Any) -> GenerationResult:  # type: ignore[override]
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            time.sleep(0.01)
+            if prompt == "fail":
+                raise ModelError("boom", provider="mock")
+            return GenerationResult(text=prompt.upper(), usage={"total_tokens": 3})
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+class AsyncEchoModel(AsyncModel):
+    """Async counterpart of EchoModel."""
+
+    def __init__(self) -> None:
+        self.active = 0
+        self.peak = 0
+
+    @property
+    def model_name(self) -> str:
+        return "mock-model"
+
+    @property
+    def provider(self) -> str:
+        return "mock"
+
+    async def generate(self, prompt: str, **kwargs: Any) -> GenerationResult:  # type: ignore[override]
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(0.01)
+            if prompt == "fail":
+                raise ModelError("boom", provider="mock")
+            return GenerationResult(text=prompt.upper(), usage={"total_tokens": 3})
+        finally:
+            self.active -= 1
+
+    async def generate_structured(self, prompt: str, schema: type[T], **kwargs: Any) -> T:  # type: ignore[override]
+        return schema()  # type: ignore
+
+
+class TestGenerateMany:
+    """Tests for Model.generate_many and AsyncModel.generate_many."""
+
+    def test_results_keep_prompt_order(self) -> None:
+        """Results should line up with prompts, with failures isolated."""
+        model = EchoModel()
+        batch = model.generate_many(["a", "fail", "b", "c"], max_concurrency=3)
+
+        assert isinstance(batch, BatchGenerationResult)
+        assert len(batch) == 4
+        assert batch.texts == ["A", None, "B", "C"]
+        assert batch.failed == 1
+        assert isinstance(batch.errors[1], ModelError)
+        assert batch.usage == {"total_tokens": 9}
+
+    def test_concurrency_is_bounded(self) -> None:
+        """No more than max_concurrency calls should run at once."""
+        model = EchoModel()
+        model.generate_many([f"p{i}" for i in range(12)], max_concurrency=3)
+        assert 1 < model.peak <= 3
+
+        serial = EchoModel()
+        serial.generate_many(["a", "b", "c"], max_concurrency=1)
+        assert serial.peak == 1
+
+    def test_invalid_concurrency(self) -> None:
+        """A concurrency below one should be rejected."""
+        with pytest.raises(ValueError, match="max_concurrency"):
+            EchoModel().generate_many(["a"], max_concurrency=0)
+
+    async def test_async_generate_many(self) -> None:
+        """The async variant should bound concurrency with a semaphore."""
+        model = AsyncEchoModel()
+        batch = await model.generate_many([f"p{i}" for i in range(6)] + ["fail"], max_concurrency=2)
+
+        assert batch.texts == [f"P{i}" for i in range(6)] + [None]
+        assert batch.failed == 1
+        assert model.peak == 2
@@ -0,0 +1,109 @@
+"""Tests for the out-of-process embedding worker pool."""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Iterator
+
+import numpy as np
+import pytest
+
+from personaut.models.embeddings import EmbeddingError, EmbeddingModel
+from personaut.models.process_embedding import ProcessPoolEmbedding
+from personaut.models.registry import ENV_EMBEDDING_WORKERS, ModelRegistry
+
+
+class _PidEmbedding(EmbeddingModel):
+    """Picklable embedding stub: [text length, worker pid, 1.0]."""
+
+    dimension = 3
+    model_name = "pid"
+
+    def embed(self, text: str) -> list[float]:
+        if text == "boom":
+            msg = "worker failed"
+            raise RuntimeError(msg)
+        return [float(len(text)), float(os.getpid()), 1.0]
+
+    def embed_batch(self, texts: list[str]) -> list[list[float]]:
+        return [self.embed(text) for text in texts]
+
+
+class _BrokenEmbedding(_PidEmbedding):
+    """Picklable embedding stub whose construction fails in the worker."""
+
+    def __init__(self) -> None:
+        msg = "no model here"
+        raise RuntimeError(msg)
+
+
+@pytest.fixture(scope="module")
+def pool() -> Iterator[ProcessPoolEmbedding]:
+    """A started two-worker pool shared by the tests in this module."""
+    embed = ProcessPoolEmbedding(workers=2, batch_size=4, model_factory=_PidEmbedding)
+    embed.preload()
+    yield embed
+    embed.close()
+
+
+class TestProcessPoolEmbedding:
+    """Tests for ProcessPoolEmbedding."""
+
+    def test_batch_is_computed_in_workers(self, pool: ProcessPoolEmbedding) -> None:
+        """Vectors should come back in input order from other processes."""
+        texts = ["x" * i for i in range(10)]
+
+        matrix = pool.embed_batch_array(texts)
+
+        assert matrix.dtype == np.float32
+        assert matrix.shape == (10, 3)
+        assert matrix[:, 0].tolist() == [float(i) for i in range(10)]
+        assert os.getpid() not in set(matrix[:, 1].tolist())
+        assert pool.is_loaded()
+
+    def test_single_and_list_methods(self, pool: ProcessPoolEmbedding) -> None:
+        """embed() and embed_batch() should wrap the array path."""
+        assert pool.embed("abc")[0] == 3.0
+        assert [row[0] for row in pool.embed_batch(["a", "bb"])] == [1.0, 2.0]
+        assert pool.embed_batch_array([]).shape == (0, 3)
+        assert pool.dimension == 3
+
+    def test_worker_errors(self, pool: ProcessPoolEmbedding) -> None:
+        """A failing worker task should surface as an EmbeddingError."""
+        with pytest.raises(EmbeddingError, match="worker process"):
+            pool.embed_batch(["fine", "boom"])
+
+        assert pool.embed("still fine")[0] == 10.0
+
+    def test_preload_waits_for_every_worker(self, pool: ProcessPoolEmbedding) -> None:
+        """Each worker should report its own load before preload returns."""
+        assert pool._ready_workers == 2
+
+        pool.preload()
+
+        assert pool._ready_workers == 2
+
+    def test_preload_reports_load_failure(self) -> None:
+        """A worker that cannot load its model should fail preload."""
+        with (
+            ProcessPoolEmbedding(workers=2, model_factory=_BrokenEmbedding) as embed,
+            pytest.raises(EmbeddingError, match="no model here"),
+        ):
+            embed.preload()
+
+    def test_invalid_settings(self) -> None:
+        """Worker counts and batch sizes below 1 should be rejected."""
+        with pytest.raises(ValueError, match="workers"):
+            ProcessPoolEmbedding(workers=0)
+        with pytest.raises(ValueError, match="batch_size"):
+            ProcessPoolEmbedding(batch_size=0)
+
+    def test_registry_uses_env_workers(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """The registry should build a worker pool when workers are configured."""
+        monkeypatch.setenv(ENV_EMBEDDING_WORKERS, "3")
+
+        embed = ModelRegistry().get_embedding()
+
+        assert isinstance(embed, ProcessPoolEmbedding)
+        assert embed.workers == 3
+        assert not embed.is_loaded()
@@ -7,6 +7,7 @@ import os
 from dataclasses import dataclass
 from unittest.mock import MagicMock, patch
 
+import httpx
 import pytest
 
 from personaut.models.model import (
@@ -253,6 +254,80 @@ class TestOllamaModel:
         assert model.model == "llama3"
         assert model.config.temperature == 0.8
 
+    def test_requests_share_one_pooled_client(self) -> None:
+        from personaut.models.ollama import OllamaModel
+
+        paths: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            paths.append(request.url.path)
+            if request.url.path == "/api/tags":
+                return httpx.Response(200, json={"models": [{"name": "llama3.2"}]})
+            return httpx.Response(200, json={"response": "Hi", "done": True})
+
+        model = OllamaModel(max_connections=4, keepalive_expiry=10.0)
+        client = model._ensure_client()
+        assert model._ensure_client() is client
+        model._client = httpx.Client(base_url=model.host, transport=httpx.MockTransport(handler))
+
+        assert model.generate("Hello").text == "Hi"
+        assert model.generate("Again").text == "Hi"
+        assert model.list_models() == ["llama3.2"]
+        assert paths == ["/api/generate", "/api/generate", "/api/tags"]
+
+        model.close()
+        assert model._client is None
+        client.close()
+
+    def test_is_available_reprobes_after_failure(self) -> None:
+        from personaut.models.ollama import OllamaModel
+
+        state = {"up": False, "probes": 0}
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/api/version":
+                state["probes"] += 1
+                return httpx.Response(200 if state["up"] else 503, json={})
+            msg = "connection refused"
+            raise httpx.ConnectError(msg, request=request)
+
+        model = OllamaModel(health_check_interval=0.0)
+        model._client = httpx.Client(base_url=model.host, transport=httpx.MockTransport(handler))
+
+        assert model.is_available() is False
+        state["up"] = True
+        assert model.is_available() is True
+        assert model.is_available() is True
+        assert state["probes"] == 2
+
+        # A connection failure forgets the healthy status
+        with pytest.raises(ModelError, match="request failed"):
+            model.generate("Hello")
+        assert model.is_available() is True
+        assert state["probes"] == 3
+
+    def test_unreachable_server_is_not_reprobed_immediately(self) -> None:
+        from personaut.models.ollama import OllamaModel
+
+        probes: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            probes.append(request.url.path)
+            return httpx.Response(503)
+
+        model = OllamaModel(health_check_interval=60.0)
+        model._client = httpx.Client(base_url=model.host, transport=httpx.MockTransport(handler))
+
+        assert model.is_available() is False
+        assert model.is_available() is False
+        assert len(probes) == 1
+
+    def test_invalid_max_connections(self) -> None:
+        from personaut.models.ollama import OllamaModel
+
+        with pytest.raises(ValueError, match="max_connections"):
+            OllamaModel(max_connections=0)
+
 
 # ── Bedrock ─────────────────────────────────────────────────────────
 
@@ -0,0 +1,202 @@
+"""Tests for the rate-limiting and retry model wrappers."""
+
+from __future__ import annotations
+
+import threading
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+
+from personaut.models.model import AuthenticationError, GenerationResult, ModelConfig, ModelError, RateLimitError
+from personaut.models.rate_limit import (
+    AsyncRateLimitedModel,
+    RateLimitedModel,
+    RateLimiter,
+    RetryPolicy,
+    TokenBucket,
+    get_rate_limiter,
+    is_retryable,
+    retry_after,
+)
+
+
+def _mock_llm(*outcomes: Any) -> MagicMock:
+    """A Model stand-in raising or returning each outcome in turn."""
+    llm = MagicMock()
+    llm.provider = "openai"
+    llm.model_name = "gpt-4o-mini"
+    llm.api_key = "sk-test"
+    llm.config = ModelConfig(model_name="gpt-4o-mini", max_tokens=100)
+    llm.generate.side_effect = list(outcomes)
+    return llm
+
+
+def _status_error(status: int, headers: dict[str, str] | None = None) -> ModelError:
+    """A ModelError raised from an httpx error with the given response."""
+    request = httpx.Request("POST", "http://llm.test/v1")
+    response = httpx.Response(status, headers=headers, request=request)
+    cause = httpx.HTTPStatusError("error", request=request, response=response)
+    return ModelError(str(cause), provider="openai", cause=cause)
+
+
+class TestTokenBucket:
+    """Tests for TokenBucket and RateLimiter."""
+
+    def test_waits_grow_with_debt(self) -> None:
+        """Reservations beyond the balance should queue behind each other."""
+        with patch("personaut.models.rate_limit.time.monotonic", return_value=100.0):
+            bucket = TokenBucket(rate=10.0, capacity=10.0)
+            waits = [bucket.reserve(5) for _ in range(4)]
+
+        assert waits == [0.0, 0.0, pytest.approx(0.5), pytest.approx(1.0)]
+
+    def test_refills_over_time(self) -> None:
+        """Elapsed time should restore tokens up to the capacity."""
+        clock = iter([0.0, 0.0, 0.5, 100.0])
+        with patch("personaut.models.rate_limit.time.monotonic", side_effect=lambda: next(clock)):
+            bucket = TokenBucket(rate=10.0, capacity=10.0)
+            assert bucket.reserve(10) == 0.0
+            assert bucket.reserve(5) == 0.0
+            assert bucket.reserve(20) == pytest.approx(1.0)
+
+    def test_settle_refunds_unused_tokens(self) -> None:
+        """Reported usage below the reservation should return tokens."""
+        with patch("personaut.models.rate_limit.time.monotonic", return_value=0.0):
+            limiter = RateLimiter(tokens_per_minute=600)
+            assert limiter.reserve(tokens=600) == 0.0
+            limiter.settle(reserved=600, used=100)
+            assert limiter.reserve(tokens=500) == 0.0
+            assert limiter.reserve(tokens=10) == pytest.approx(1.0)
+
+    def test_shared_by_provider_key(self) -> None:
+        """Wrappers of the same provider key should share one limiter."""
+        first = RateLimitedModel(_mock_llm(), requests_per_minute=60, key="shared-key-test")
+        second = RateLimitedModel(_mock_llm(), requests_per_minute=60, key="shared-key-test")
+
+        assert first.limiter is second.limiter
+        assert first.limiter is get_rate_limiter("openai", "shared-key-test")
+        assert get_rate_limiter("openai", "other-key-test") is not first.limiter
+
+
+class TestRetryClassification:
+    """Tests for is_retryable and retry_after."""
+
+    def test_retryable_errors(self) -> None:
+        """Rate limits, transient statuses and connection failures should retry."""
+        assert is_retryable(RateLimitError("slow down"))
+        assert is_retryable(_status_error(503))
+        assert is_retryable(ModelError("failed", cause=httpx.ConnectError("refused")))
+        assert is_retryable(ModelError("failed", cause=TimeoutError()))
+        assert not is_retryable(AuthenticationError("bad key"))
+        assert not is_retryable(_status_error(400))
+        assert not is_retryable(ModelError("parse failed", cause=ValueError("not JSON")))
+
+    def test_retry_after_headers(self) -> None:
+        """Retry-After seconds, HTTP dates and retry-after-ms should be read."""
+        assert retry_after(_status_error(429, {"retry-after": "7"})) == 7.0
+        assert retry_after(_status_error(429, {"retry-after-ms": "250", "retry-after": "1"})) == 0.25
+        assert retry_after(_status_error(429, {"retry-after": "Wed, 21 Oct 2015 07:28:00 GMT"})) == 0.0
+        assert retry_after(_status_error(429)) is None
+
+    def test_botocore_style_errors(self) -> None:
+        """Status and headers in a botocore-style response dict should be read."""
+        cause = Exception("ThrottlingException")
+        cause.response = {  # type: ignore[attr-defined]
+            "ResponseMetadata": {"HTTPStatusCode": 429, "HTTPHeaders": {"Retry-After": "3"}}
+        }
+        error = ModelError("throttled", cause=cause)
+
+        assert is_retryable(error)
+        assert retry_after(error) == 3.0
+
+    def test_backoff_is_bounded_and_jittered(self) -> None:
+        """Delays should stay within the exponential bound."""
+        policy = RetryPolicy(initial_delay=1.0, max_delay=5.0)
+
+        assert RetryPolicy(jitter=False, initial_delay=1.0).backoff(3) == 8.0
+        assert all(0.0 <= policy.backoff(attempt) <= min(5.0, 2.0**attempt) for attempt in range(6))
+        assert policy.delay(0, _status_error(429, {"retry-after": "9"})) == 9.0
+        assert RetryPolicy(max_retries=2).delay(2, RateLimitError("slow down")) is None
+
+
+class TestRateLimitedModel:
+    """Tests for RateLimitedModel and AsyncRateLimitedModel."""
+
+    def test_retries_until_success(self) -> None:
+        """Rate-limit and transient errors should be retried with the policy's delays."""
+        result = GenerationResult(text="ok", usage={"total_tokens": 12})
+        llm = _mock_llm(RateLimitError("slow down"), _status_error(502, {"retry-after": "2"}), result)
+        model = RateLimitedModel(llm, retry=RetryPolicy(jitter=False, initial_delay=0.5))
+
+        with patch("personaut.models.rate_limit.time.sleep") as sleep:
+            assert model.generate("Hi", temperature=0.2) is result
+
+        assert [c.args[0] for c in sleep.call_args_list if c.args[0] > 0] == [0.5, 2.0]
+        assert llm.generate.call_count == 3
+        assert model.retries == 2
+
+    def test_gives_up_on_permanent_errors(self) -> None:
+        """Non-retryable errors and exhausted retries should be raised unchanged."""
+        auth = AuthenticationError("bad key")
+        model = RateLimitedModel(_mock_llm(auth))
+        with pytest.raises(AuthenticationError):
+            model.generate("Hi")
+
+        limited = RateLimitedModel(_mock_llm(*[RateLimitError("slow down")] * 3), retry=RetryPolicy(max_retries=2))
+        with patch("personaut.models.rate_limit.time.sleep"), pytest.raises(RateLimitError):
+            limited.generate("Hi")
+        assert limited.retries == 2
+
+    def test_paces_requests_per_minute(self) -> None:
+        """Requests beyond the per-minute budget should wait their turn."""
+        limiter = RateLimiter(requests_per_minute=60)
+        llm = _mock_llm(*[GenerationResult(text="ok")] * 3)
+        model = RateLimitedModel(llm, limiter=limiter)
+        limiter._requests._tokens = 1  # type: ignore[union-attr]
+
+        with (
+            patch("personaut.models.rate_limit.time.monotonic", return_value=limiter._requests._updated),  # type: ignore[union-attr]
+            patch("personaut.models.rate_limit.time.sleep") as sleep,
+        ):
+            for _ in range(3):
+                model.generate("Hi")
+
+        assert [c.args[0] for c in sleep.call_args_list] == [0.0, pytest.approx(1.0), pytest.approx(2.0)]
+        assert model.throttled_seconds == pytest.approx(3.0)
+
+    def test_thread_safe_under_contention(self) -> None:
+        """Concurrent callers should all succeed and be counted once each."""
+        llm = _mock_llm()
+        llm.generate.side_effect = lambda *_args, **_kwargs: GenerationResult(text="ok", usage={"total_tokens": 5})
+        model = RateLimitedModel(llm, requests_per_minute=10_000, tokens_per_minute=10_000_000, key="contention-test")
+        results: list[str] = []
+
+        def worker() -> None:
+            for _ in range(50):
+                results.append(model.generate("Hi").text)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results == ["ok"] * 400
+
+    async def test_async_retries(self) -> None:
+        """The async wrapper should retry with asyncio.sleep."""
+        result = GenerationResult(text="ok")
+        llm = MagicMock()
+        llm.provider = "anthropic"
+        llm.generate = AsyncMock(side_effect=[RateLimitError("slow down"), result])
+        llm.aclose = AsyncMock()
+        model = AsyncRateLimitedModel(llm, retry=RetryPolicy(jitter=False, initial_delay=0.25))
+
+        with patch("personaut.models.rate_limit.asyncio.sleep", new=AsyncMock()) as sleep:
+            async with model:
+                assert await model.generate("Hi") is result
+
+        assert [c.args[0] for c in sleep.await_args_list if c.args[0] > 0] == [0.25]
+        llm.aclose.assert_awaited_once()
@@ -0,0 +1,192 @@
+"""Tests for the persistent LLM response cache and CachedModel."""
+
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from personaut.models.model import GenerationResult, ModelConfig
+from personaut.models.registry import ENV_LLM_CACHE, ModelRegistry
+from personaut.models.response_cache import CachedModel, SQLiteResponseCache, response_cache_key
+
+
+def _mock_llm(temperature: float = 0.7) -> MagicMock:
+    """A Model stand-in numbering its responses."""
+    llm = MagicMock()
+    llm.provider = "ollama"
+    llm.model_name = "llama3.2"
+    llm.config = ModelConfig(model_name="llama3.2", temperature=temperature)
+    llm.generate.side_effect = lambda prompt, **_kwargs: GenerationResult(
+        text=f"{prompt} #{llm.generate.call_count}", usage={"total_tokens": 7}, model="llama3.2"
+    )
+    return llm
+
+
+def _key(prompt: str, **overrides: object) -> bytes:
+    params: dict[str, object] = {"temperature": 0.2, "max_tokens": 200, "stop_sequences": None, "system": None}
+    params.update(overrides)
+    return response_cache_key("ollama", "llama3.2", prompt, **params)  # type: ignore[arg-type]
+
+
+class TestSQLiteResponseCache:
+    """Tests for SQLiteResponseCache."""
+
+    def test_round_trip_across_connections(self, tmp_path: Path) -> None:
+        """A stored result should be readable from another connection to the file."""
+        path = tmp_path / "llm.db"
+        with SQLiteResponseCache(path) as writer:
+            writer.put(_key("Hi"), GenerationResult(text="Hello", usage={"total_tokens": 3}, model="llama3.2"))
+
+        with SQLiteResponseCache(path) as reader:
+            result = reader.get(_key("Hi"))
+            assert reader.get(_key("Bye")) is None
+            stats = reader.stats()
+
+        assert result == GenerationResult(text="Hello", usage={"total_tokens": 3}, model="llama3.2")
+        assert (stats.hits, stats.misses, stats.entries, stats.hit_rate) == (1, 1, 1, 0.5)
+
+    def test_key_covers_generation_parameters(self) -> None:
+        """Changing any keyed parameter should change the key."""
+        base = _key("Hi")
+
+        assert _key("Hi") == base
+        for override in (
+            {"temperature": 0.3},
+            {"max_tokens": 100},
+            {"stop_sequences": ["\n"]},
+            {"system": "Be brief"},
+            {"top_p": 0.5},
+        ):
+            assert _key("Hi", **override) != base
+
+    def test_expired_entries_are_misses(self, tmp_path: Path) -> None:
+        """Entries older than the TTL should be dropped on lookup."""
+        cache = SQLiteResponseCache(tmp_path / "llm.db", ttl=60)
+        with patch("personaut.models.response_cache.time.time", return_value=1000.0):
+            cache.put(_key("Hi"), GenerationResult(text="Hello"))
+        with patch("personaut.models.response_cache.time.time", return_value=1061.0):
+            assert cache.get(_key("Hi")) is None
+
+        stats = cache.stats()
+        assert (stats.expirations, stats.misses, stats.entries) == (1, 1, 0)
+
+    def test_least_recently_read_entries_are_evicted(self, tmp_path: Path) -> None:
+        """Beyond max_entries, the entries read longest ago should go first."""
+        cache = SQLiteResponseCache(tmp_path / "llm.db", ttl=None, max_entries=2)
+        with patch("personaut.models.response_cache.time.time", side_effect=[1.0, 2.0, 3.0, 4.0]):
+            cache.put(_key("a"), GenerationResult(text="A"))
+            cache.put(_key("b"), GenerationResult(text="B"))
+            cache.get(_key("a"))
+            cache.put(_key("c"), GenerationResult(text="C"))
+
+        assert cache.get(_key("b")) is None
+        assert cache.get(_key("a")) is not None
+        assert cache.get(_key("c")) is not None
+        assert cache.stats().evictions == 1
+
+    def test_bound_is_enforced_without_counting_every_insert(self, tmp_path: Path) -> None:
+        """Rows should be counted only when the running estimate passes max_entries."""
+        cache = SQLiteResponseCache(tmp_path / "llm.db", ttl=None, max_entries=100)
+        counts = 0
+        count = cache._count
+
+        def counting() -> int:
+            nonlocal counts
+            counts += 1
+            return count()
+
+        with patch.object(cache, "_count", side_effect=counting):
+            for i in range(250):
+                cache.put(_key(f"p{i}"), GenerationResult(text=str(i)))
+
+        stats = cache.stats()
+        assert counts < 20
+        assert stats.entries <= 100
+        assert stats.evictions == 250 - stats.entries
+
+    def test_invalid_settings(self, tmp_path: Path) -> None:
+        """A non-positive TTL or entry bound should be rejected."""
+        with pytest.raises(ValueError, match="ttl"):
+            SQLiteResponseCache(tmp_path / "llm.db", ttl=0)
+        with pytest.raises(ValueError, match="max_entries"):
+            SQLiteResponseCache(tmp_path / "llm.db", max_entries=0)
+
+
+class TestCachedModel:
+    """Tests for CachedModel."""
+
+    def test_repeated_low_temperature_calls_hit(self, tmp_path: Path) -> None:
+        """An identical analysis call should be answered from the cache."""
+        llm = _mock_llm()
+        cached = CachedModel(llm, tmp_path / "llm.db")
+
+        first = cached.generate("Analyze", temperature=0.2, max_tokens=200)
+        second = cached.generate("Analyze", temperature=0.2, max_tokens=200)
+        other = cached.generate("Analyze", temperature=0.2, max_tokens=200, system="Be brief")
+
+        assert second.text == first.text == "Analyze #1"
+        assert other.text == "Analyze #2"
+        assert llm.generate.call_count == 2
+        assert cached.cache_stats.hit_rate == pytest.approx(1 / 3)
+
+    def test_creative_and_opted_out_calls_bypass(self, tmp_path: Path) -> None:
+        """Hot temperatures, hot defaults and cache=False should skip the cache."""
+        llm = _mock_llm(temperature=0.9)
+        cached = CachedModel(llm, tmp_path / "llm.db", max_temperature=0.5)
+
+        cached.generate("Write", temperature=0.8)
+        cached.generate("Write", temperature=0.8)
+        cached.generate("Write")
+        cached.generate("Analyze", temperature=0.2, cache=False)
+
+        assert llm.generate.call_count == 4
+        assert "cache" not in llm.generate.call_args.kwargs
+        assert cached.bypassed == 4
+        assert cached.cache_stats.entries == 0
+
+    def test_cache_failure_falls_back_to_model(self) -> None:
+        """A broken cache should not fail generation."""
+        llm = _mock_llm()
+        cache = MagicMock(spec=SQLiteResponseCache)
+        cache.get.side_effect = sqlite3.OperationalError("disk I/O error")
+        cache.put.side_effect = sqlite3.OperationalError("disk I/O error")
+
+        result = CachedModel(llm, cache).generate("Analyze", temperature=0.2)
+
+        assert result.text == "Analyze #1"
+
+    def test_registry_wraps_only_when_configured(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """with_response_cache should share one cache opened from the environment."""
+        llm = _mock_llm()
+        assert ModelRegistry(llm_cache="").with_response_cache(llm) is llm
+
+        monkeypatch.setenv(ENV_LLM_CACHE, str(tmp_path / "env.db"))
+        registry = ModelRegistry()
+        first = registry.with_response_cache(llm)
+        second = registry.with_response_cache(llm)
+
+        assert isinstance(first, CachedModel)
+        assert second is first
+        assert first.cache.path == tmp_path / "env.db"
+        other = registry.with_response_cache(_mock_llm())
+        assert isinstance(other, CachedModel)
+        assert other is not first
+        assert other.cache is first.cache
+
+        first.close()
+        other.generate("Still open", temperature=0.2)
+        assert other.cache.stats().entries == 1
+
+    def test_close_only_closes_an_owned_cache(self, tmp_path: Path) -> None:
+        """A wrapper should close a cache it opened, but not one passed in."""
+        shared = SQLiteResponseCache(tmp_path / "shared.db")
+        CachedModel(_mock_llm(), shared).close()
+        assert shared.stats().entries == 0
+
+        owned = CachedModel(_mock_llm(), tmp_path / "owned.db")
+        owned.close()
+        with pytest.raises(sqlite3.ProgrammingError):
+            owned.cache.stats()
@@ -663,6 +663,81 @@ class TestMemoryRoutes:
         assert data["total"] == 1
         assert "coffee" in data["results"][0]["description"]
 
+    @pytest.mark.asyncio
+    async def test_search_memories_ranks_metadata_and_deletes(self, client) -> None:
+        ind_id = await self._create_ind(client)
+        resp = await client.post(
+            f"/api/individuals/{ind_id}/memories",
+            json={"description": "Met a friend", "metadata": {"place": "harbor"}},
+        )
+        mem_id = resp.json()["id"]
+        await client.post(
+            f"/api/individuals/{ind_id}/memories", json={"description": "The harbor at night, harbor lights"}
+        )
+        resp = await client.post(f"/api/individuals/{ind_id}/memories/search", json={"query": "harbor"})
+        assert resp.json()["total"] == 2
+        assert resp.json()["results"][0]["description"].startswith("The harbor")
+
+        await client.delete(f"/api/individuals/{ind_id}/memories/{mem_id}")
+        resp = await client.post(f"/api/individuals/{ind_id}/memories/search", json={"query": "friend harbor"})
+        assert [r["description"] for r in resp.json()["results"]] == ["The harbor at night, harbor lights"]
+
+    @pytest.mark.asyncio
+    async def test_search_memories_follows_replaced_lists(self, client) -> None:
+        from personaut.server.api.app import get_app_state
+        from personaut.server.api.routes import memories as memory_routes
+
+        ind_id = await self._create_ind(client)
+        for description in ("Rain on the pier", "Rain at the station", "Sunny garden"):
+            await client.post(f"/api/individuals/{ind_id}/memories", json={"description": description})
+        await client.post(f"/api/individuals/{ind_id}/memories", json={"description": "Sunny morning"})
+        await client.post(f"/api/individuals/{ind_id}/memories/search", json={"query": "rain"})
+
+        ind = get_app_state().individuals[ind_id]
+        ind["memories"] = [
+            {**m, "description": "Rain in the garden"} if "garden" in m["description"] else m
+            for m in ind["memories"][1:]
+        ]
+        ind["memories"].append({"id": "mem_direct", "description": "Rain on the roof"})
+        resp = await client.post(f"/api/individuals/{ind_id}/memories/search", json={"query": "rain", "limit": 3})
+        assert sorted(r["description"] for r in resp.json()["results"]) == [
+            "Rain at the station",
+            "Rain in the garden",
+            "Rain on the roof",
+        ]
+
+        await client.delete(f"/api/individuals/{ind_id}")
+        assert ind_id not in memory_routes._search_indexes
+
+    @pytest.mark.asyncio
+    async def test_search_memories_matches_whole_words_only(self, client) -> None:
+        ind_id = await self._create_ind(client)
+        await client.post(f"/api/individuals/{ind_id}/memories", json={"description": "Coffee-shop chats, daily!"})
+
+        for query in ("coff", "hop", "chats, daily!"):
+            resp = await client.post(f"/api/individuals/{ind_id}/memories/search", json={"query": query})
+            assert resp.json()["total"] == (1 if query == "chats, daily!" else 0)
+
+    @pytest.mark.asyncio
+    async def test_search_memories_does_not_rescan_memories(self, client) -> None:
+        from personaut.server.api.routes import memories as memory_routes
+
+        ind_id = await self._create_ind(client)
+        await client.post(f"/api/individuals/{ind_id}/memories", json={"description": "Walk by the river"})
+        await client.post(f"/api/individuals/{ind_id}/memories/search", json={"query": "river"})
+        index = memory_routes._search_indexes[ind_id].index
+
+        resp = await client.post(f"/api/individuals/{ind_id}/memories", json={"description": "River cruise"})
+        with patch.object(memory_routes, "_memory_text", side_effect=AssertionError("rescanned")):
+            found = await client.post(f"/api/individuals/{ind_id}/memories/search", json={"query": "river"})
+        assert found.json()["total"] == 2
+        assert memory_routes._search_indexes[ind_id].index is index
+
+        await client.delete(f"/api/individuals/{ind_id}/memories/{resp.json()['id']}")
+        with patch.object(memory_routes, "_memory_text", side_effect=AssertionError("rescanned")):
+            found = await client.post(f"/api/individuals/{ind_id}/memories/search", json={"query": "river"})
+        assert [r["description"] for r in found.json()["results"]] == ["Walk by the river"]
+
     @pytest.mark.asyncio
     async def test_search_memories_no_results(self, client) -> None:
         ind_id = await self._create_ind(client)
@@ -14,6 +14,7 @@ Key implementation detail:
 
 from __future__ import annotations
 
+from pathlib import Path
 from typing import Any
 from unittest.mock import patch
 
@@ -268,14 +269,17 @@ def mock_router() -> MockAPIRouter:
 
 
 @pytest.fixture()
-def app(mock_router: MockAPIRouter):
+def app(mock_router: MockAPIRouter, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
     """Create a Flask test application with mocked API backend.
 
     Patches *every* consumer module's local ``_api_get`` / ``_api_post`` /
-    ``_api_patch`` / ``_api_delete`` so that no real HTTP calls are made.
+    ``_api_patch`` / ``_api_delete`` so that no real HTTP calls are made,
+    and points local storage (saved simulations) at ``tmp_path``.
     """
     from personaut.server.ui.app import create_ui_app
 
+    monkeypatch.setenv("PERSONAUT_STORAGE_PATH", str(tmp_path / "personaut.db"))
+
     flask_app = create_ui_app(api_base_url="http://mock:8000/api")
     flask_app.config["TESTING"] = True
 
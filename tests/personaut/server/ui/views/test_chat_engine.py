@@ -7,11 +7,16 @@ evaluation, response generation, and the fallback system.
 
 from __future__ import annotations
 
+import importlib.util
+import threading
+import time
 from unittest.mock import patch
 
 import pytest
 
 from personaut.individuals import create_individual
+from personaut.models.embeddings import EmbeddingModel
+from personaut.models.hashing_embedding import HashingEmbedding
 from personaut.server.ui.views import chat_engine as engine
 from personaut.situations import create_situation
 
@@ -33,6 +38,9 @@ def _reset_singletons():
     engine.session_token_usage.clear()
     engine.session_speaker_contexts.clear()
     engine._individual_vector_stores.clear()
+    engine._individual_text_indexes.clear()
+    engine._vector_store_versions.clear()
+    engine._text_index_versions.clear()
     yield
 
 
@@ -479,6 +487,165 @@ class TestSearchRelevantMemories:
         assert len(result) >= 1
         assert "coffee" in result[0].description.lower()
 
+    def test_keyword_fallback_ranks_by_bm25(self) -> None:
+        """Rare terms should outrank words shared by every memory."""
+        individual = create_individual(name="Test", traits={}, emotional_state={})
+        from personaut.memory import create_individual_memory
+
+        for description in ["The park at noon", "The beach at dawn", "The museum at dusk"]:
+            individual.add_memory(create_individual_memory(owner_id="test", description=description))
+
+        result = engine.search_relevant_memories(individual, "the beach", limit=2)
+
+        assert result[0].description == "The beach at dawn"
+
+    def test_keyword_index_follows_removals(self) -> None:
+        """Removed memories should drop out of the keyword index."""
+        individual = create_individual(name="Test", traits={}, emotional_state={})
+        from personaut.memory import create_individual_memory
+
+        beach = create_individual_memory(owner_id="test", description="The beach at dawn")
+        individual.add_memory(beach)
+        individual.add_memory(create_individual_memory(owner_id="test", description="Coffee at noon"))
+        assert engine.search_relevant_memories(individual, "beach")[0] is beach
+
+        individual.remove_memory(beach.id)
+
+        assert engine.search_relevant_memories(individual, "beach")[0].description == "Coffee at noon"
+        assert beach.id not in engine._individual_text_indexes[individual.id]
+
+    def test_hashing_embedding_without_sentence_transformers(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Without sentence-transformers, memories should be searched with hashed vectors."""
+        find_spec = importlib.util.find_spec
+        monkeypatch.setattr(
+            importlib.util,
+            "find_spec",
+            lambda name, *args: None if name == "sentence_transformers" else find_spec(name, *args),
+        )
+        individual = create_individual(name="Test", traits={}, emotional_state={})
+        from personaut.memory import create_individual_memory
+
+        individual.add_memory(create_individual_memory(owner_id="test", description="Walked along the beach"))
+        individual.add_memory(create_individual_memory(owner_id="test", description="Coffee at noon"))
+
+        result = engine.search_relevant_memories(individual, "beaches")
+
+        assert isinstance(engine._get_embedding_model(), HashingEmbedding)
+        assert result[0].description == "Walked along the beach"
+        assert individual.id not in engine._individual_text_indexes
+
+    def test_concurrent_first_requests_wait_for_model(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """A request racing the background preload should get the model, not None."""
+        created: list[HashingEmbedding] = []
+        started = threading.Event()
+
+        def slow_create() -> HashingEmbedding:
+            started.set()
+            time.sleep(0.05)
+            created.append(HashingEmbedding())
+            return created[-1]
+
+        monkeypatch.setattr(engine, "_create_embedding_model", slow_create)
+        preload = threading.Thread(target=engine._get_embedding_model)
+        preload.start()
+        started.wait()
+
+        model = engine._get_embedding_model()
+        preload.join()
+
+        assert len(created) == 1
+        assert model is created[0]
+
+
+class _CountingEmbedding(EmbeddingModel):
+    """Embedding model stub that records the texts it embeds."""
+
+    dimension = 3
+    model_name = "counting"
+
+    def __init__(self) -> None:
+        self.embedded: list[str] = []
+
+    def embed(self, text: str) -> list[float]:
+        return self.embed_batch([text])[0]
+
+    def embed_batch(self, texts: list[str]) -> list[list[float]]:
+        self.embedded.extend(texts)
+        return [[1.0, float(len(text)), 0.5] for text in texts]
+
+
+class TestEnsureMemoriesIndexed:
+    @pytest.fixture()
+    def model(self) -> _CountingEmbedding:
+        model = _CountingEmbedding()
+        engine._embedding_model = model
+        engine._embedding_checked = True
+        return model
+
+    def test_embeds_only_changes(self, model: _CountingEmbedding) -> None:
+        """Each turn should embed only memories changed since the last one."""
+        individual = create_individual(name="Test", traits={}, emotional_state={})
+        from personaut.memory import create_individual_memory
+
+        first = create_individual_memory(owner_id="test", description="First")
+        individual.add_memory(first)
+        engine._ensure_memories_indexed(individual)
+        engine._ensure_memories_indexed(individual)
+        assert model.embedded == ["First"]
+
+        second = create_individual_memory(owner_id="test", description="Second")
+        individual.add_memory(second)
+        individual.remove_memory(first.id)
+        engine._ensure_memories_indexed(individual)
+
+        store = engine._get_vector_store(individual.id)
+        assert model.embedded == ["First", "Second"]
+        assert store.count() == 1
+        assert store.get(first.id) is None
+
+    def test_rehydrated_individual_reuses_embeddings(self, model: _CountingEmbedding) -> None:
+        """A re-created Individual should only embed new or edited memories."""
+        from personaut.memory import create_individual_memory
+
+        memories = [create_individual_memory(owner_id="test", description=d) for d in ("Kept", "Edited", "Gone")]
+        old = create_individual(name="Test", traits={}, emotional_state={})
+        for memory in memories:
+            old.add_memory(memory)
+        engine._ensure_memories_indexed(old)
+
+        new = create_individual(name="Test", traits={}, emotional_state={})
+        new.id = old.id
+        new.add_memory(memories[0])
+        edited = create_individual_memory(owner_id="test", description="Edited again")
+        edited.id = memories[1].id
+        new.add_memory(edited)
+        engine._ensure_memories_indexed(new)
+
+        store = engine._get_vector_store(old.id)
+        assert model.embedded == ["Kept", "Edited", "Gone", "Edited again"]
+        assert {m.id for m in store.get_all()} == {memories[0].id, memories[1].id}
+        assert store.get(memories[1].id) is edited
+
+    def test_resyncs_after_pruned_removals(self, model: _CountingEmbedding, monkeypatch: pytest.MonkeyPatch) -> None:
+        """An index behind the pruned removal log should be reconciled, not patched."""
+        from personaut.memory import create_individual_memory
+
+        monkeypatch.setattr(engine.Individual, "MAX_LOGGED_REMOVALS", 2)
+        individual = create_individual(name="Test", traits={}, emotional_state={})
+        memories = [create_individual_memory(owner_id="test", description=f"M{i}") for i in range(5)]
+        for memory in memories:
+            individual.add_memory(memory)
+        engine._ensure_memories_indexed(individual)
+        assert engine._vector_store_versions[individual.id] == (individual.memory_log_id, 5)
+
+        for memory in memories[:4]:
+            individual.remove_memory(memory.id)
+        engine._ensure_memories_indexed(individual)
+
+        store = engine._get_vector_store(individual.id)
+        assert [m.id for m in store.get_all()] == [memories[4].id]
+        assert len(model.embedded) == 5
+
 
 # ═══════════════════════════════════════════════════════════════════════════
 # Session state helpers
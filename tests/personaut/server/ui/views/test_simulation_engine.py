@@ -7,6 +7,10 @@ generation, prompt builders, outcome evaluation, and correlation analysis.
 
 from __future__ import annotations
 
+import threading
+from typing import Any
+from unittest.mock import patch
+
 import pytest
 
 from personaut.individuals import create_individual
@@ -324,6 +328,18 @@ class TestGenerateLLMResponse:
         result = engine.generate_llm_response_multimodal("Hello")
         assert result is None
 
+    def test_multimodal_batch_runs_in_parallel_in_order(self) -> None:
+        barrier = threading.Barrier(3, timeout=5)
+
+        def respond(prompt: str, **kwargs: Any) -> str:
+            barrier.wait()
+            return f"{prompt}:{kwargs['image_mime']}"
+
+        with patch.object(engine, "generate_llm_response_multimodal", side_effect=respond):
+            responses = engine.generate_llm_responses_multimodal(["a", "b", "c"], "aW1n", "image/jpeg")
+
+        assert responses == ["a:image/jpeg", "b:image/jpeg", "c:image/jpeg"]
+
 
 # ═══════════════════════════════════════════════════════════════════════════
 # Outcome evaluation
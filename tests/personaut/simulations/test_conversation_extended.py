@@ -3,10 +3,12 @@
 from __future__ import annotations
 
 import json
+from typing import Any
 
 import pytest
 
 from personaut.emotions.state import EmotionalState
+from personaut.models.model import GenerationResult, Model, ModelError
 from personaut.simulations.conversation import ConversationSimulation
 from personaut.simulations.styles import SimulationStyle
 from personaut.simulations.types import SimulationType
@@ -359,3 +361,126 @@ class TestOptionsOverride:
         content = simulation._generate(include_actions=False)
         # Should not have action markers since we overrode
         assert content  # Just verify it ran
+
+
+class _CountingModel(Model):
+    """Records each generate_many batch and fails prompts mentioning "fail"."""
+
+    def __init__(self) -> None:
+        self.batches: list[int] = []
+
+    @property
+    def model_name(self) -> str:
+        return "counting"
+
+    @property
+    def provider(self) -> str:
+        return "mock"
+
+    def generate(self, prompt: str, **kwargs: Any) -> GenerationResult:  # type: ignore[override]
+        if "fail" in prompt:
+            raise ModelError("boom", provider="mock")
+        return GenerationResult(text=f"line {prompt.count(':')}")
+
+    def generate_many(self, prompts: Any, **kwargs: Any) -> Any:
+        self.batches.append(len(prompts))
+        return super().generate_many(prompts, **kwargs)
+
+    def generate_structured(self, prompt: str, schema: Any, **kwargs: Any) -> Any:
+        return schema()
+
+
+class TestBatchedRuns:
+    """Tests for runs advancing together through generate_many."""
+
+    def test_runs_share_one_batch_per_turn(
+        self,
+        mock_situation: MockSituation,
+        mock_individual_sarah: MockIndividual,
+        mock_individual_mike: MockIndividual,
+    ) -> None:
+        """Each turn should send one batch holding a prompt per run."""
+        llm = _CountingModel()
+        simulation = ConversationSimulation(
+            situation=mock_situation,
+            individuals=[mock_individual_sarah, mock_individual_mike],
+            simulation_type=SimulationType.CONVERSATION,
+            max_turns=3,
+            llm=llm,
+        )
+
+        contents = simulation._generate_runs(4)
+
+        assert llm.batches == [4, 4, 4]
+        assert len(contents) == 4
+        assert [turn["speaker"] for turn in simulation._conversation_history] == ["Sarah", "Mike", "Sarah"]
+        assert all(turn["content"].startswith("line") for turn in simulation._conversation_history)
+
+    def test_failed_prompts_fall_back(
+        self,
+        mock_situation: MockSituation,
+        mock_individual_sarah: MockIndividual,
+    ) -> None:
+        """A failed prompt should get a placeholder line instead of failing the run."""
+        mock_individual_sarah.name = "fail"
+        simulation = ConversationSimulation(
+            situation=mock_situation,
+            individuals=[mock_individual_sarah],
+            simulation_type=SimulationType.CONVERSATION,
+            max_turns=2,
+            llm=_CountingModel(),
+        )
+
+        contents = simulation._generate_runs(2)
+
+        assert len(contents) == 2
+        assert len(simulation._conversation_history) == 2
+        assert not simulation._conversation_history[0]["content"].startswith("line")
+
+    def test_batch_prompts_come_from_overridable_hook(
+        self,
+        mock_situation: MockSituation,
+        mock_individual_sarah: MockIndividual,
+    ) -> None:
+        """Batched prompts should be built by _build_turn_prompt from each run's own history."""
+        seen: list[tuple[int, int]] = []
+
+        class TaggedSimulation(ConversationSimulation):
+            def _build_turn_prompt(self, speaker: Any, history: list[dict[str, Any]], include_actions: bool) -> str:
+                seen.append((len(history), len(self._conversation_history)))
+                return "tagged:" * (len(history) + 1)
+
+        simulation = TaggedSimulation(
+            situation=mock_situation,
+            individuals=[mock_individual_sarah],
+            simulation_type=SimulationType.CONVERSATION,
+            max_turns=2,
+            llm=_CountingModel(),
+        )
+
+        simulation._generate_runs(2)
+
+        assert seen == [(0, 0), (0, 0), (1, 0), (1, 0)]
+        assert [turn["content"] for turn in simulation._conversation_history] == ["line 1", "line 2"]
+
+    def test_overridden_generate_is_not_bypassed(
+        self,
+        mock_situation: MockSituation,
+        mock_individual_sarah: MockIndividual,
+    ) -> None:
+        """A subclass with its own _generate should have it called once per run."""
+
+        class ScriptedSimulation(ConversationSimulation):
+            def _generate(self, run_index: int = 0, **options: Any) -> str:
+                return f"run {run_index}"
+
+        llm = _CountingModel()
+        simulation = ScriptedSimulation(
+            situation=mock_situation,
+            individuals=[mock_individual_sarah],
+            simulation_type=SimulationType.CONVERSATION,
+            llm=llm,
+        )
+
+        assert simulation._generate_runs(3) == ["run 0", "run 1", "run 2"]
+        assert llm.batches == []
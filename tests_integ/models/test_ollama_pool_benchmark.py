@@ -0,0 +1,131 @@
+"""Benchmark for OllamaModel's pooled keep-alive HTTP client.
+
+Runs against a local stub of the Ollama API, so no Ollama server or
+credentials are needed. Compares the pooled client with a fresh
+connection per request (the old ``httpx.post`` behaviour) and prints
+the timings; run with ``-s`` to see them.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+
+from personaut.models.ollama import OllamaModel
+
+
+pytestmark = pytest.mark.slow
+
+REQUESTS = 500
+
+
+class _StubOllamaHandler(BaseHTTPRequestHandler):
+    """Answers /api/generate and /api/version like Ollama, with keep-alive."""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    connections = 0
+    lock = threading.Lock()
+
+    def setup(self) -> None:
+        super().setup()
+        with self.lock:
+            type(self).connections += 1
+
+    def do_GET(self) -> None:
+        self._reply({"version": "stub"})
+
+    def do_POST(self) -> None:
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        self._reply({"response": body["prompt"], "done": True, "prompt_eval_count": 1, "eval_count": 1})
+
+    def _reply(self, payload: dict[str, object]) -> None:
+        data = json.dumps(payload).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args: object) -> None:
+        pass
+
+
+class _StubOllamaServer(ThreadingHTTPServer):
+    """Threaded stub server with a listen backlog for concurrent connects."""
+
+    daemon_threads = True
+    request_queue_size = 128
+
+
+@pytest.fixture
+def stub_host() -> Iterator[str]:
+    """Start a stub Ollama server on a free local port."""
+    _StubOllamaHandler.connections = 0
+    server = _StubOllamaServer(("127.0.0.1", 0), _StubOllamaHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def _timed(fn: object, *args: object) -> float:
+    start = time.perf_counter()
+    fn(*args)  # type: ignore[operator]
+    return time.perf_counter() - start
+
+
+class TestOllamaPoolBenchmark:
+    """Pooled client vs a new connection per request."""
+
+    def test_sequential_requests(self, stub_host: str) -> None:
+        """Sequential generations should reuse one connection."""
+        model = OllamaModel(host=stub_host)
+        body = model._request_body("hi", temperature=None, max_tokens=None, stop_sequences=None, system=None)
+
+        def per_request() -> None:
+            for _ in range(REQUESTS):
+                httpx.post(f"{stub_host}/api/generate", json=body, timeout=30.0).raise_for_status()
+
+        def pooled() -> None:
+            for _ in range(REQUESTS):
+                model.generate("hi")
+
+        per_request_time = _timed(per_request)
+        per_request_connections = _StubOllamaHandler.connections
+        _StubOllamaHandler.connections = 0
+        model.generate("warm-up")
+        pooled_time = _timed(pooled)
+        pooled_connections = _StubOllamaHandler.connections
+        model.close()
+
+        print(
+            f"\n{REQUESTS} sequential requests: "
+            f"per-request {per_request_time * 1e3 / REQUESTS:.2f} ms/call ({per_request_connections} connections), "
+            f"pooled {pooled_time * 1e3 / REQUESTS:.2f} ms/call ({pooled_connections} connections)"
+        )
+        assert per_request_connections == REQUESTS
+        assert pooled_connections == 1
+
+    def test_threaded_requests(self, stub_host: str) -> None:
+        """Concurrent generations from threads should stay within the pool."""
+        model = OllamaModel(host=stub_host, max_connections=8)
+
+        with ThreadPoolExecutor(max_workers=16) as pool:
+            elapsed = _timed(lambda: list(pool.map(lambda i: model.generate(f"p{i}"), range(REQUESTS))))
+        model.close()
+
+        print(
+            f"\n{REQUESTS} requests from 16 threads: {elapsed * 1e3 / REQUESTS:.2f} ms/call "
+            f"({_StubOllamaHandler.connections} connections)"
+        )
+        assert _StubOllamaHandler.connections <= 8
+        assert model.is_available() is True